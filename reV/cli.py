@@ -20,6 +20,10 @@ from reV.offshore.cli_offshore import valid_config_keys as offshore_keys
 from reV.pipeline.cli_pipeline import from_config as run_pipeline_from_config
 from reV.pipeline.cli_pipeline import valid_config_keys as pipeline_keys
 from reV.rep_profiles.cli_rep_profiles import from_config as run_rp_from_config
+from reV.supply_curve.cli_exclusions import (from_config
+                                             as run_excl_from_config)
+from reV.supply_curve.cli_exclusions import (valid_config_keys
+                                             as excl_keys)
 from reV.rep_profiles.cli_rep_profiles import (valid_config_keys
                                                as rep_profiles_keys)
 from reV.supply_curve.cli_sc_aggregation import (from_config
@@ -241,6 +245,42 @@ def valid_multi_year_keys(ctx):
     ctx.invoke(my_keys)
 
 
+@main.group(invoke_without_command=True)
+@click.option('-v', '--verbose', is_flag=True,
+              help='Flag to turn on debug logging.')
+@click.pass_context
+def exclusions(ctx, verbose):
+    """Build the persisted reV inclusion mask using the config file."""
+    if ctx.invoked_subcommand is None:
+        config_file = ctx.obj['CONFIG_FILE']
+        verbose = any([verbose, ctx.obj['VERBOSE']])
+        ctx.invoke(run_excl_from_config, config_file=config_file,
+                   verbose=verbose)
+
+
+@exclusions.command()
+@click.option('-v', '--verbose', is_flag=True,
+              help='Flag to turn on debug logging.')
+@click.pass_context
+def build_mask(ctx, verbose):
+    """
+    Build the final inclusion mask once and store it in the exclusions h5
+    """
+    config_file = ctx.obj['CONFIG_FILE']
+    verbose = any([verbose, ctx.obj['VERBOSE']])
+    ctx.invoke(run_excl_from_config, config_file=config_file,
+               verbose=verbose)
+
+
+@exclusions.command()
+@click.pass_context
+def valid_exclusions_keys(ctx):
+    """
+    Valid Exclusions config keys
+    """
+    ctx.invoke(excl_keys)
+
+
 @main.group(invoke_without_command=True)
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging.')
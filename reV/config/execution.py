@@ -86,6 +86,22 @@ class BaseExecutionConfig(BaseConfig):
 
         return mem_util_lim
 
+    @property
+    def h5_chunk_cache(self):
+        """Get the h5 raw data chunk cache and file handle pool settings.
+        Key in the config json is "h5_chunk_cache".
+
+        Returns
+        -------
+        h5_chunk_cache : dict | None
+            Keyword arguments for reV.handlers.h5_pool.H5FilePool.configure,
+            e.g. {"rdcc_nbytes": 268435456, "rdcc_nslots": 10007,
+            "files": {"*exclusions*.h5": {"rdcc_nbytes": 1073741824}},
+            "max_idle": 4}. None uses the h5py defaults and closes read
+            handles as soon as they are released.
+        """
+        return self.get('h5_chunk_cache', None)
+
 
 class HPCConfig(BaseExecutionConfig):
     """Class to handle HPC configuration inputs."""
@@ -51,6 +51,13 @@ class OffshoreConfig(AnalysisConfig):
         """Get the sam files dict"""
         return self['sam_files']
 
+    @property
+    def projection(self):
+        """Get the coordinate space for the nearest neighbor mapping of
+        resource pixels to wind farms (see
+        reV.utilities.coordinates.PROJECTIONS), default is "latlon"."""
+        return self.get('projection', 'latlon')
+
     def parse_gen_fpaths(self):
         """
         Get a list of generation data filepaths
@@ -17,6 +17,62 @@ from reV.pipeline.pipeline import Pipeline
 logger = logging.getLogger(__name__)
 
 
+class ExclusionMaskConfig(AnalysisConfig):
+    """Persisted inclusion mask build config."""
+
+    NAME = 'excl-mask'
+    REQUIREMENTS = ('excl_fpath', 'excl_dict')
+
+    def __init__(self, config):
+        """
+        Parameters
+        ----------
+        config : str | dict
+            File path to config json (str), serialized json object (str),
+            or dictionary with pre-extracted config.
+        """
+        super().__init__(config)
+
+        self._default_area_filter_kernel = 'queen'
+        self._default_tile_size = 1024
+
+    @property
+    def excl_fpath(self):
+        """Get the exclusions filepath the inclusion mask is written to"""
+        return self['excl_fpath']
+
+    @property
+    def excl_dict(self):
+        """Get the exclusions dictionary"""
+        return self['excl_dict']
+
+    @property
+    def area_filter_kernel(self):
+        """Get the minimum area filter kernel name ('queen' or 'rook')."""
+        return self.get('area_filter_kernel', self._default_area_filter_kernel)
+
+    @property
+    def min_area(self):
+        """Get the minimum area filter minimum area in km2."""
+        return self.get('min_area', None)
+
+    @property
+    def tile_size(self):
+        """Get the number of exclusion rows and columns computed on each
+        worker."""
+        return self.get('tile_size', self._default_tile_size)
+
+    @property
+    def max_workers(self):
+        """Get the number of workers to use during computation"""
+        return self.get('max_workers', None)
+
+    @property
+    def overwrite(self):
+        """Get the flag to re-compute an existing inclusion mask."""
+        return self.get('overwrite', False)
+
+
 class SupplyCurveAggregationConfig(AnalysisConfig):
     """SC Aggregation config."""
 
@@ -38,6 +94,13 @@ class SupplyCurveAggregationConfig(AnalysisConfig):
         self._default_resolution = 64
         self._default_area_filter_kernel = 'queen'
         self._default_points_per_worker = 10
+        self._default_engine = 'point'
+        self._default_block_size = 1024
+        self._default_shared_inputs = False
+        self._default_resume = False
+        self._default_tile_cache_size = 128 * 1024 ** 2
+        self._default_use_precomputed_mask = False
+        self._default_techmap_projection = 'latlon'
 
         self._sc_agg_preflight()
 
@@ -136,6 +199,14 @@ class SupplyCurveAggregationConfig(AnalysisConfig):
 
         return res_fpath
 
+    @property
+    def techmap_projection(self):
+        """Get the coordinate space of the nearest neighbor queries if the
+        techmap dset is to be created from res_fpath (see
+        reV.utilities.coordinates.PROJECTIONS)."""
+        return self.get('techmap_projection',
+                        self._default_techmap_projection)
+
     @property
     def tm_dset(self):
         """Get the techmap dataset"""
@@ -239,6 +310,49 @@ class SupplyCurveAggregationConfig(AnalysisConfig):
         """Get the number of sc points to summarize on each worker"""
         return self.get('points_per_worker', None)
 
+    @property
+    def engine(self):
+        """Get the SC point summary engine, "point" summarizes one SC point
+        at a time and "sparse" summarizes blocks of SC points at once with
+        a sparse matrix of inclusion weights."""
+        return self.get('engine', self._default_engine)
+
+    @property
+    def block_size(self):
+        """Get the target number of SC points summarized at once with the
+        "sparse" engine."""
+        return self.get('block_size', self._default_block_size)
+
+    @property
+    def shared_inputs(self):
+        """Get the flag to read the gen/econ input arrays once and share
+        them with the parallel workers as read-only memory-mapped scratch
+        files."""
+        return bool(self.get('shared_inputs', self._default_shared_inputs))
+
+    @property
+    def resume(self):
+        """Get the flag to checkpoint the SC point blocks to an h5 file in
+        the output directory and to resume a killed job from the blocks
+        checkpointed by the previous run. False keeps the summary in memory
+        without a checkpoint."""
+        return bool(self.get('resume', self._default_resume))
+
+    @property
+    def tile_cache_size(self):
+        """Get the byte budget of the exclusion layer tile cache of each
+        worker, None or 0 disables the cache."""
+        return self.get('tile_cache_size', self._default_tile_cache_size)
+
+    @property
+    def use_precomputed_mask(self):
+        """Get the flag to read the inclusion mask persisted by the
+        exclusions build-mask module for these exclusion inputs instead of
+        re-computing it. The mask is not checked against the exclusion
+        layers and must be rebuilt whenever a layer changes."""
+        return bool(self.get('use_precomputed_mask',
+                             self._default_use_precomputed_mask))
+
 
 class SupplyCurveConfig(AnalysisConfig):
     """SC config."""
@@ -360,3 +474,16 @@ class SupplyCurveConfig(AnalysisConfig):
     def max_workers(self):
         """Get the number of workers to use during computation"""
         return self.get('max_workers', None)
+
+    @property
+    def scenarios(self):
+        """Get the supply curve scenario definitions (dict, list, or path
+        to .json). Inputs that are not set in a scenario default to the
+        top-level supply curve config inputs."""
+        return self.get('scenarios', None)
+
+    @property
+    def scenario_cache(self):
+        """Get the .h5 filepath used to cache the merged supply curve
+        tables for scenario sweeps."""
+        return self.get('scenario_cache', None)
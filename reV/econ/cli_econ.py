@@ -15,6 +15,7 @@ from reV.config.project_points import ProjectPoints, PointsControl
 from reV.config.sam_analysis_configs import EconConfig
 from reV.econ.econ import Econ
 from reV.generation.cli_gen import get_node_name_fout, make_fout
+from reV.handlers.h5_pool import H5FilePool
 from reV.pipeline.status import Status
 from reV.utilities.cli_dtypes import SAMFILES, PROJECTPOINTS
 from reV import __version__
@@ -72,6 +73,11 @@ def from_config(ctx, config_file, verbose):
     # Instantiate the config object
     config = EconConfig(config_file)
 
+    # chunk cache and handle pool settings are inherited by the local
+    # workers and the submitted hpc jobs through the environment
+    H5FilePool.configure_from_dict(
+        config.execution_control.h5_chunk_cache)
+
     # take name from config if not default
     if config.name.lower() != 'rev':
         name = config.name
@@ -122,8 +122,9 @@ class Econ(BaseGen):
         if self._meta is None and self.cf_file is not None:
             with Outputs(self.cf_file) as cfh:
                 # only take meta that belongs to this project's site list
-                self._meta = cfh.meta[
-                    cfh.meta['gid'].isin(self.points_control.sites)]
+                rows = np.isin(cfh.get_meta_arr('gid'),
+                               self.points_control.sites)
+                self._meta = cfh['meta', np.where(rows)[0]]
 
             if 'offshore' in self._meta:
                 if self._meta['offshore'].sum() > 1:
@@ -6,6 +6,8 @@ have reduced capital cost.
 import logging
 import copy
 import re
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 
 from reV.econ.utilities import lcoe_fcr
@@ -13,6 +15,12 @@ from rex.utilities.utilities import check_eval_str
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numexpr
+    NUMEXPR = True
+except ImportError:
+    NUMEXPR = False
+
 
 class EconomiesOfScale:
     """Class to calculate economies of scale where power plant capital cost is
@@ -29,7 +37,7 @@ class EconomiesOfScale:
     lcoe : $/MWh
     """
 
-    def __init__(self, eqn, data):
+    def __init__(self, eqn, data, use_numexpr=False):
         """
         Parameters
         ----------
@@ -43,9 +51,15 @@ class EconomiesOfScale:
             in dict or column labels in dataframe should match the Independent
             variables in the eqn input. Should also include variables required
             to calculate LCOE.
+        use_numexpr : bool
+            Flag to evaluate the equation with numexpr if it is installed and
+            the data is array-like. Falls back to python eval if numexpr
+            cannot evaluate the equation.
         """
         self._eqn = eqn
         self._data = data
+        self._use_numexpr = use_numexpr
+        self._scalar = None
         self._preflight()
 
     def _preflight(self):
@@ -104,19 +118,73 @@ class EconomiesOfScale:
         """
         var_names = []
         if self._eqn is not None:
-            delimiters = ('*', '/', '+', '-', ' ', '(', ')', '[', ']')
-            regex_pattern = '|'.join(map(re.escape, delimiters))
-            var_names = [sub for sub in re.split(regex_pattern, str(self._eqn))
-                         if sub
-                         and not self.is_num(sub)
-                         and not self.is_method(sub)]
-            var_names = sorted(list(set(var_names)))
+            var_names = list(self._parse(str(self._eqn))[0])
 
         return var_names
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _parse(cls, eqn):
+        """Parse and compile an equation string that has been validated with
+        check_eval_str. Results are cached so that an equation is only parsed
+        once, e.g. when it is applied to many supply curve points.
+
+        Parameters
+        ----------
+        eqn : str
+            EconomiesOfScale equation string.
+
+        Returns
+        -------
+        var_names : tuple
+            Sorted variable names parsed from the equation string.
+        code : code
+            Compiled equation for python eval.
+        """
+        delimiters = ('*', '/', '+', '-', ' ', '(', ')', '[', ']')
+        regex_pattern = '|'.join(map(re.escape, delimiters))
+        var_names = [sub for sub in re.split(regex_pattern, eqn)
+                     if sub
+                     and not cls.is_num(sub)
+                     and not cls.is_method(sub)]
+        var_names = tuple(sorted(set(var_names)))
+        code = compile(eqn, '<cap_cost_scale>', 'eval')
+
+        return var_names, code
+
+    def _evaluate_numexpr(self, kwargs):
+        """Evaluate the EconomiesOfScale equation with numexpr.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Namespace of the equation variables.
+
+        Returns
+        -------
+        out : np.ndarray | None
+            Evaluated output of the EconomiesOfScale equation. None if
+            numexpr is not requested, not installed, the equation has no
+            array inputs, or numexpr cannot evaluate the equation.
+        """
+        out = None
+        arrays = any(np.ndim(v) for v in kwargs.values())
+        if self._use_numexpr and NUMEXPR and arrays:
+            try:
+                out = numexpr.evaluate(str(self._eqn), local_dict=kwargs,
+                                       global_dict={})
+            except (AttributeError, KeyError, NotImplementedError,
+                    SyntaxError, TypeError, ValueError) as e:
+                logger.debug('Could not evaluate EconomiesOfScale equation '
+                             '"{}" with numexpr, falling back to python '
+                             'eval: {}'.format(self._eqn, e))
+
+        return out
+
     def _evaluate(self):
         """Evaluate the EconomiesOfScale equation with Independent variables
-        parsed into a kwargs dictionary input.
+        parsed into a kwargs dictionary input. The equation is only
+        evaluated once per instance.
 
         Returns
         -------
@@ -124,13 +192,17 @@ class EconomiesOfScale:
             Evaluated output of the EconomiesOfScale equation. Should be
             numeric scalars to apply directly to the capital cost.
         """
-        out = 1
-        if self._eqn is not None:
-            kwargs = {k: self._data[k] for k in self.vars}
-            # pylint: disable=eval-used
-            out = eval(str(self._eqn), globals(), kwargs)
-
-        return out
+        if self._scalar is None:
+            self._scalar = 1
+            if self._eqn is not None:
+                var_names, code = self._parse(str(self._eqn))
+                kwargs = {k: self._data[k] for k in var_names}
+                self._scalar = self._evaluate_numexpr(kwargs)
+                if self._scalar is None:
+                    # pylint: disable=eval-used
+                    self._scalar = eval(code, globals(), kwargs)
+
+        return self._scalar
 
     @staticmethod
     def _get_prioritized_keys(input_dict, key_list):
@@ -15,6 +15,7 @@ from reV.config.cli_project_points import _parse_lat_lons, _parse_regions
 from reV.config.project_points import ProjectPoints, PointsControl
 from reV.config.sam_analysis_configs import GenConfig
 from reV.generation.generation import Gen
+from reV.handlers.h5_pool import H5FilePool
 from reV.pipeline.status import Status
 from reV.utilities.exceptions import ConfigError, ProjectPointsValueError
 from reV.utilities.cli_dtypes import SAMFILES, PROJECTPOINTS
@@ -73,6 +74,11 @@ def from_config(ctx, config_file, verbose):
     # Instantiate the config object
     config = GenConfig(config_file)
 
+    # chunk cache and handle pool settings are inherited by the local
+    # workers and the submitted hpc jobs through the environment
+    H5FilePool.configure_from_dict(
+        config.execution_control.h5_chunk_cache)
+
     # take name from config if not default
     if config.name.lower() != 'rev':
         name = config.name
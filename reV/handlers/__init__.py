@@ -4,5 +4,7 @@ Sub-package of data handlers
 """
 from .collection import Collector
 from .exclusions import ExclusionLayers
+from .h5_pool import H5FilePool, PooledResource
 from .multi_year import MultiYear
 from .outputs import Outputs
+from .tables import ColumnarTable, ColumnarTableSink
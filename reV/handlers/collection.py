@@ -57,10 +57,18 @@ class DatasetCollector:
 
         tot_mem = psutil.virtual_memory().total
         self._mem_avail = mem_util_lim * tot_mem
+
+        # The output write buffer and the source chunks share the memory
+        # budget: the peak is the source chunk, its copy in the write buffer,
+        # the buffer contents, and the concatenated buffer at flush
+        # (3 * chunk + 2 * buffer)
+        self._write_buffer = self._mem_avail / 8
+        self._mem_chunk = (self._mem_avail - 2 * self._write_buffer) / 3
         self._attrs, self._axis, self._site_mem_req = self._pre_collect()
 
-        logger.debug('Available memory for collection is {} bytes'
-                     .format(self._mem_avail))
+        logger.debug('Available memory for collection is {} bytes with '
+                     'a {} byte write buffer'
+                     .format(self._mem_avail, self._write_buffer))
         logger.debug('Site memory requirement is: {} bytes'
                      .format(self._site_mem_req))
 
@@ -176,7 +184,7 @@ class DatasetCollector:
         """
 
         locs = np.where(np.isin(gids_out, source_gids))[0]
-        if not any(locs):
+        if not len(locs):
             e = ('DatasetCollector could not locate source gids in '
                  'output gids. \n\t Source gids: {} \n\t Output gids: {}'
                  .format(source_gids, gids_out))
@@ -214,19 +222,20 @@ class DatasetCollector:
         all_source_gids = f_source.get_meta_arr('gid')
         mem_req = (len(all_source_gids) * self._site_mem_req)
 
-        if mem_req > self._mem_avail:
+        if mem_req > self._mem_chunk:
             n = 2
             while True:
                 source_gid_chunks = np.array_split(all_source_gids, n)
                 new_mem_req = (len(source_gid_chunks[0]) * self._site_mem_req)
-                if new_mem_req > self._mem_avail:
+                if (new_mem_req > self._mem_chunk
+                        and n < len(all_source_gids)):
                     n += 1
                 else:
                     logger.debug('Collecting dataset "{}" in {} chunks with '
                                  'an estimated {} bytes in each chunk '
-                                 '(mem avail limit is {} bytes).'
+                                 '(mem chunk limit is {} bytes).'
                                  .format(self._dset_in, n, new_mem_req,
-                                         self._mem_avail))
+                                         self._mem_chunk))
                     break
         else:
             source_gid_chunks = [all_source_gids]
@@ -283,8 +292,11 @@ class DatasetCollector:
             raise e
 
     def _collect(self):
-        """Simple & robust serial collection optimized for low memory usage."""
-        with Outputs(self._h5_file, mode='a') as f_out:
+        """Simple & robust serial collection optimized for low memory usage.
+        Source chunks are written through the Outputs write-combining buffer
+        so that partially filled output chunks are only written once."""
+        with Outputs(self._h5_file, mode='a',
+                     write_buffer=self._write_buffer) as f_out:
             for fp in self._source_files:
                 with Outputs(fp, mode='r') as f_source:
 
@@ -606,7 +618,7 @@ class Collector:
         """
         with Outputs(self._h5_out, mode='a') as f:
             if 'meta' in f.datasets:
-                self._check_meta(f.meta)
+                self._check_meta(f.get_meta_columns('gid'))
             else:
                 with Outputs(self.h5_files[0], mode='r') as f_in:
                     global_attrs = f_in.get_attrs()
@@ -2,14 +2,15 @@
 """
 Exclusion layers handler
 """
+from collections import OrderedDict
 import logging
 import json
 import numpy as np
 
+from reV.handlers.h5_pool import PooledResource
 from reV.utilities.exceptions import HandlerKeyError
 
 from rex.utilities.parse_keys import parse_keys
-from rex.resource import Resource
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,7 @@ class ExclusionLayers:
     """
     Handler of .h5 file and techmap for Exclusion Layers
     """
-    def __init__(self, h5_file, hsds=False):
+    def __init__(self, h5_file, hsds=False, tile_cache_size=None):
         """
         Parameters
         ----------
@@ -27,11 +28,21 @@ class ExclusionLayers:
         hsds : bool
             Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
             behind HSDS
+        tile_cache_size : int | None
+            Optional byte budget for an LRU cache of exclusion layer tiles
+            keyed by (layer, chunk row, chunk column). Slice requests on
+            chunked layers are assembled from whole-chunk tiles so that
+            adjacent requests (e.g. neighboring supply curve points) do not
+            re-read and decompress the same chunks. None disables the cache.
         """
         self.h5_file = h5_file
-        self._h5 = Resource(h5_file, hsds=hsds)
+        self._h5 = PooledResource(h5_file, hsds=hsds)
 
         self._iarr = None
+        self._tile_cache_size = tile_cache_size
+        self._tiles = OrderedDict()
+        self._tile_bytes = 0
+        self._dset_props = {}
 
     def __repr__(self):
         msg = "{} for {}".format(self.__class__.__name__, self.h5_file)
@@ -67,6 +78,12 @@ class ExclusionLayers:
         Close h5 instance
         """
         self._h5.close()
+        self.clear_tile_cache()
+
+    def clear_tile_cache(self):
+        """Remove all tiles from the layer tile cache."""
+        self._tiles.clear()
+        self._tile_bytes = 0
 
     @property
     def h5(self):
@@ -178,7 +195,7 @@ class ExclusionLayers:
         """
         chunks = self.h5.attrs.get('chunks', None)
         if chunks is None:
-            chunks = self.h5['latitude'].chunks
+            chunks = self._get_dset_properties('latitude')[2]
 
         if isinstance(chunks, dict):
             chunks = tuple(chunks.get('dims', None))
@@ -378,7 +395,56 @@ class ExclusionLayers:
             logger.error(msg)
             raise HandlerKeyError(msg)
 
-        shape = self.h5.get_dset_properties(layer_name)[0]
+        layer_data = None
+        if self._tile_cache_size:
+            layer_data = self._get_cached_layer(layer_name, *ds_slice)
+
+        if layer_data is None:
+            layer_data = self._read_layer(layer_name, *ds_slice)
+
+        return layer_data
+
+    def _get_dset_properties(self, layer_name):
+        """
+        Get (and cache) the shape, dtype, and chunks of a layer
+
+        Parameters
+        ----------
+        layer_name : str
+            Exclusion layer name
+
+        Returns
+        -------
+        shape : tuple
+            Layer shape
+        dtype : np.dtype
+            Layer dtype
+        chunks : tuple | None
+            Layer chunk shape
+        """
+        if layer_name not in self._dset_props:
+            props = self.h5.get_dset_properties(layer_name)
+            self._dset_props[layer_name] = props
+
+        return self._dset_props[layer_name]
+
+    def _read_layer(self, layer_name, *ds_slice):
+        """
+        Read data for given layer directly from the h5 file
+
+        Parameters
+        ----------
+        layer_name : str
+            Exclusion layer to extract
+        ds_slice : tuple of int | list | slice
+            tuple describing slice of layer array to extract
+
+        Returns
+        -------
+        layer_data : ndarray
+            Array of exclusion data
+        """
+        shape = self._get_dset_properties(layer_name)[0]
         if len(shape) == 3:
             ds_slice = (layer_name, 0) + ds_slice
         else:
@@ -387,3 +453,107 @@ class ExclusionLayers:
         layer_data = self.h5[ds_slice]
 
         return layer_data
+
+    def _get_tile(self, layer_name, i, j, chunks, shape):
+        """
+        Get a single chunk-aligned tile of a layer from the LRU tile cache,
+        reading it from disk if needed.
+
+        Parameters
+        ----------
+        layer_name : str
+            Exclusion layer name
+        i : int
+            Chunk row index
+        j : int
+            Chunk column index
+        chunks : tuple
+            2D (row, column) chunk shape of the layer
+        shape : tuple
+            2D (row, column) shape of the layer
+
+        Returns
+        -------
+        tile : ndarray
+            Layer data for the chunk (i, j)
+        """
+        key = (layer_name, i, j)
+        tile = self._tiles.get(key, None)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+        else:
+            rows = slice(i * chunks[0], min((i + 1) * chunks[0], shape[0]))
+            cols = slice(j * chunks[1], min((j + 1) * chunks[1], shape[1]))
+            tile = self._read_layer(layer_name, rows, cols)
+            if tile.nbytes <= self._tile_cache_size:
+                self._tiles[key] = tile
+                self._tile_bytes += tile.nbytes
+                while self._tile_bytes > self._tile_cache_size:
+                    _, old = self._tiles.popitem(last=False)
+                    self._tile_bytes -= old.nbytes
+
+        return tile
+
+    def _get_cached_layer(self, layer_name, *ds_slice):
+        """
+        Extract a 2D slice of a chunked layer by assembling it from cached
+        chunk tiles.
+
+        Parameters
+        ----------
+        layer_name : str
+            Exclusion layer to extract
+        ds_slice : tuple of slice
+            tuple describing slice of layer array to extract
+
+        Returns
+        -------
+        layer_data : ndarray | None
+            Array of exclusion data, None if the slice should not be
+            extracted from the tile cache (non-contiguous slices, contiguous
+            layers, or slices spanning more tiles than fit in the cache).
+        """
+        shape, dtype, chunks = self._get_dset_properties(layer_name)
+        if chunks is None:
+            return None
+
+        shape = shape[-2:]
+        chunks = chunks[-2:]
+        ds_slice = ds_slice + (slice(None), ) * (2 - len(ds_slice))
+        if len(ds_slice) != 2:
+            return None
+
+        bounds = []
+        for s, n in zip(ds_slice, shape):
+            if not isinstance(s, slice) or s.step not in (None, 1):
+                return None
+
+            start, stop, _ = s.indices(n)
+            if stop <= start:
+                return None
+
+            bounds.append((start, stop))
+
+        (r0, r1), (c0, c1) = bounds
+        rows = range(r0 // chunks[0], (r1 - 1) // chunks[0] + 1)
+        cols = range(c0 // chunks[1], (c1 - 1) // chunks[1] + 1)
+        tile_bytes = np.prod(chunks) * np.dtype(dtype).itemsize
+        if len(rows) * len(cols) * tile_bytes > self._tile_cache_size:
+            return None
+
+        layer_data = None
+        for i in rows:
+            for j in cols:
+                tile = self._get_tile(layer_name, i, j, chunks, shape)
+                if layer_data is None:
+                    layer_data = np.empty((r1 - r0, c1 - c0),
+                                          dtype=tile.dtype)
+
+                # intersection of the tile and the requested slice
+                ti0, tj0 = i * chunks[0], j * chunks[1]
+                a0, a1 = max(r0, ti0), min(r1, ti0 + tile.shape[0])
+                b0, b1 = max(c0, tj0), min(c1, tj0 + tile.shape[1])
+                layer_data[a0 - r0:a1 - r0, b0 - c0:b1 - c0] = \
+                    tile[a0 - ti0:a1 - ti0, b0 - tj0:b1 - tj0]
+
+        return layer_data
@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+Process-wide pool of h5py file handles with configurable HDF5 raw data
+chunk cache (rdcc) settings.
+
+The chunk cache configuration is stored as json in the
+``REV_H5_CHUNK_CACHE`` environment variable so that it is inherited by
+worker processes spawned by the reV parallel executors.
+"""
+from collections import OrderedDict
+from fnmatch import fnmatch
+import h5py
+import json
+import logging
+import os
+
+from reV.utilities.exceptions import HandlerValueError
+
+from rex.resource import Resource
+from rex.utilities.utilities import dict_str_load
+
+logger = logging.getLogger(__name__)
+
+
+class H5FilePool:
+    """
+    Pool of read-only h5py file handles shared by the reV handlers. Handles
+    are reference counted so that repeated opens of the same file (e.g. one
+    per supply curve point) re-use a single handle and its warm chunk cache.
+
+    Examples
+    --------
+    Use a 256 MB chunk cache for all files and a 1 GB cache for exclusion
+    files, explicitly keeping up to 4 idle read-only handles open for
+    re-use (by default handles are closed as soon as they are released):
+
+    >>> H5FilePool.configure(rdcc_nbytes=256 * 1024**2, rdcc_nslots=10007,
+    >>>                      files={'*exclusions*.h5':
+    >>>                             {'rdcc_nbytes': 1024**3}},
+    >>>                      max_idle=4)
+    """
+    ENV_VAR = 'REV_H5_CHUNK_CACHE'
+    CACHE_KEYS = ('rdcc_nbytes', 'rdcc_nslots', 'rdcc_w0')
+    # idle read-only handles kept open for re-use if not configured
+    DEFAULT_MAX_IDLE = 0
+
+    _handles = OrderedDict()
+    _counts = {}
+    _stats = {}
+
+    @classmethod
+    def configure(cls, rdcc_nbytes=None, rdcc_nslots=None, rdcc_w0=None,
+                  files=None, max_idle=DEFAULT_MAX_IDLE):
+        """
+        Set the process-wide (and child process) chunk cache configuration.
+
+        Parameters
+        ----------
+        rdcc_nbytes : int | None
+            Default raw data chunk cache size in bytes, None uses the h5py
+            default (1 MB).
+        rdcc_nslots : int | None
+            Default number of chunk slots in the raw data chunk cache hash
+            table. Should be a prime number ~100x the number of chunks that
+            fit in rdcc_nbytes. None uses the h5py default.
+        rdcc_w0 : float | None
+            Default chunk preemption policy (0 to 1), None uses the h5py
+            default.
+        files : dict | None
+            Optional per-file chunk cache settings:
+            {file_pattern: {"rdcc_nbytes": int, ...}} where file_pattern is a
+            unix style pattern matched against the full file path or the file
+            name.
+        max_idle : int
+            Number of idle read-only handles to keep open for re-use after
+            all references have been released so that repeated opens (e.g.
+            one per supply curve point) re-use the handle. Idle handles
+            block other processes and libraries from opening the file in
+            write mode, by default 0 which closes handles as soon as they
+            are released.
+        """
+        config = {'rdcc_nbytes': rdcc_nbytes, 'rdcc_nslots': rdcc_nslots,
+                  'rdcc_w0': rdcc_w0, 'files': files or {},
+                  'max_idle': int(max_idle)}
+
+        for pattern, kwargs in config['files'].items():
+            bad = [k for k in kwargs if k not in cls.CACHE_KEYS]
+            if bad:
+                msg = ('Chunk cache settings for "{}" have invalid keys {}, '
+                       'valid keys are: {}'
+                       .format(pattern, bad, cls.CACHE_KEYS))
+                logger.error(msg)
+                raise HandlerValueError(msg)
+
+        logger.debug('Setting h5 chunk cache configuration: {}'
+                     .format(config))
+        os.environ[cls.ENV_VAR] = json.dumps(config)
+
+    @classmethod
+    def configure_from_dict(cls, h5_chunk_cache):
+        """
+        Set the chunk cache configuration from a config input such as the
+        "h5_chunk_cache" execution control entry.
+
+        Parameters
+        ----------
+        h5_chunk_cache : dict | str | None
+            Kwargs for configure() or a json string representation of the
+            kwargs. None leaves the current configuration unchanged.
+        """
+        if isinstance(h5_chunk_cache, str):
+            h5_chunk_cache = dict_str_load(h5_chunk_cache)
+
+        if h5_chunk_cache is not None:
+            cls.configure(**h5_chunk_cache)
+
+    @classmethod
+    def reset(cls):
+        """Clear the chunk cache configuration and close all idle handles."""
+        os.environ.pop(cls.ENV_VAR, None)
+        cls.close_idle()
+
+    @classmethod
+    def get_config(cls):
+        """
+        Get the current chunk cache configuration
+
+        Returns
+        -------
+        config : dict
+            Chunk cache configuration, empty if not configured.
+        """
+        config = os.environ.get(cls.ENV_VAR, None)
+        if config:
+            config = json.loads(config)
+        else:
+            config = {}
+
+        return config
+
+    @classmethod
+    def chunk_cache_kwargs(cls, h5_file):
+        """
+        Get the h5py.File chunk cache kwargs for a given file
+
+        Parameters
+        ----------
+        h5_file : str
+            Path to .h5 file
+
+        Returns
+        -------
+        kwargs : dict
+            h5py.File chunk cache kwargs (rdcc_nbytes, rdcc_nslots,
+            rdcc_w0), only includes keys that have been configured.
+        """
+        config = cls.get_config()
+        kwargs = {k: config.get(k, None) for k in cls.CACHE_KEYS}
+
+        fname = os.path.basename(h5_file)
+        for pattern, file_kwargs in config.get('files', {}).items():
+            if fnmatch(h5_file, pattern) or fnmatch(fname, pattern):
+                kwargs.update(file_kwargs)
+
+        return {k: v for k, v in kwargs.items() if v is not None}
+
+    @staticmethod
+    def _key(h5_file):
+        """Get the pool key for a given file path."""
+        return os.path.abspath(h5_file)
+
+    @staticmethod
+    def _stat(h5_file):
+        """
+        Get the file identity used to validate pooled handles
+
+        Parameters
+        ----------
+        h5_file : str
+            Path to .h5 file
+
+        Returns
+        -------
+        stat : tuple | None
+            (inode, mtime in ns) of the file, None if the file does not
+            exist.
+        """
+        try:
+            stat = os.stat(h5_file)
+        except OSError:
+            return None
+
+        return (stat.st_ino, stat.st_mtime_ns)
+
+    @classmethod
+    def _is_stale(cls, key):
+        """
+        Check if a pooled handle no longer matches the file on disk (e.g. the
+        file was deleted and re-created or modified since it was opened).
+
+        Parameters
+        ----------
+        key : str
+            Pool key of the handle
+
+        Returns
+        -------
+        stale : bool
+            True if the handle is closed or the file inode or modification
+            time has changed.
+        """
+        h5 = cls._handles[key]
+        if not h5.id.valid:
+            return True
+
+        return cls._stats.get(key, None) != cls._stat(key)
+
+    @classmethod
+    def _evict(cls, key):
+        """
+        Remove a stale handle from the pool. Handles that are still
+        referenced are closed when they are released.
+
+        Parameters
+        ----------
+        key : str
+            Pool key of the handle
+        """
+        if cls._counts[key] <= 0:
+            cls._close(key)
+        else:
+            logger.debug('Pooled h5 handle for {} is stale, opening a new '
+                         'handle'.format(key))
+            cls._handles.pop(key)
+            cls._counts.pop(key)
+            cls._stats.pop(key, None)
+
+    @classmethod
+    def open(cls, h5_file, mode='r'):
+        """
+        Open an h5py.File with the configured chunk cache. Read-only handles
+        are pooled and must be returned to the pool with release(). Pooled
+        handles are only re-used if the file inode and modification time
+        have not changed since the handle was opened.
+
+        Parameters
+        ----------
+        h5_file : str
+            Path to .h5 file
+        mode : str
+            Mode to instantiate h5py.File instance
+
+        Returns
+        -------
+        h5 : h5py.File
+            Open h5py File instance
+        """
+        kwargs = cls.chunk_cache_kwargs(h5_file)
+        key = cls._key(h5_file)
+
+        if mode != 'r':
+            # idle read-only handles would block opening in write mode
+            cls.close_idle(h5_file)
+            return h5py.File(h5_file, mode=mode, **kwargs)
+
+        if key in cls._handles and cls._is_stale(key):
+            cls._evict(key)
+
+        h5 = cls._handles.get(key, None)
+        if h5 is not None:
+            cls._counts[key] += 1
+            cls._handles.move_to_end(key)
+        else:
+            h5 = h5py.File(h5_file, mode='r', **kwargs)
+            cls._handles[key] = h5
+            cls._counts[key] = 1
+            cls._stats[key] = cls._stat(h5_file)
+
+        return h5
+
+    @classmethod
+    def release(cls, h5):
+        """
+        Release a handle opened with open(). Write handles and read-only
+        handles with no remaining references (beyond max_idle) are closed.
+
+        Parameters
+        ----------
+        h5 : h5py.File
+            h5py File instance returned by open()
+        """
+        if not h5.id.valid:
+            return
+
+        key = cls._key(h5.filename)
+        if cls._handles.get(key, None) is not h5:
+            h5.close()
+            return
+
+        cls._counts[key] -= 1
+        if cls._counts[key] <= 0:
+            max_idle = cls.get_config().get('max_idle',
+                                            cls.DEFAULT_MAX_IDLE)
+            idle = [k for k in cls._handles if cls._counts[k] <= 0]
+            for k in idle[:max(len(idle) - max_idle, 0)]:
+                cls._close(k)
+
+    @classmethod
+    def _close(cls, key):
+        """Close and remove a pooled handle."""
+        h5 = cls._handles.pop(key)
+        cls._counts.pop(key)
+        cls._stats.pop(key, None)
+        if h5.id.valid:
+            h5.close()
+
+    @classmethod
+    def close_idle(cls, h5_file=None):
+        """
+        Close idle (un-referenced) read-only handles
+
+        Parameters
+        ----------
+        h5_file : str | None
+            Only close the idle handle for this file, None closes all idle
+            handles.
+        """
+        keys = [k for k, n in cls._counts.items() if n <= 0]
+        if h5_file is not None:
+            keys = [k for k in keys if k == cls._key(h5_file)]
+
+        for key in keys:
+            cls._close(key)
+
+
+class PooledResource(Resource):
+    """
+    rex Resource handler that reads from a pooled h5py file handle with the
+    configured chunk cache settings.
+    """
+
+    def __init__(self, h5_file, unscale=True, hsds=False, str_decode=True,
+                 group=None):
+        """
+        Parameters
+        ----------
+        h5_file : str
+            Path to .h5 resource file
+        unscale : bool
+            Boolean flag to automatically unscale variables on extraction
+        hsds : bool
+            Boolean flag to use h5pyd to handle .h5 'files' hosted on AWS
+            behind HSDS
+        str_decode : bool
+            Boolean flag to decode the bytestring meta data into normal
+            strings. Setting this to False will speed up the meta data read.
+        group : str
+            Group within .h5 resource file to open
+        """
+        self._pooled = not hsds
+        if not self._pooled:
+            super().__init__(h5_file, unscale=unscale, hsds=hsds,
+                             str_decode=str_decode, group=group)
+            return
+
+        # same state as Resource.__init__ but the file is only opened once,
+        # through the pool
+        self.h5_file = h5_file
+        self._h5 = H5FilePool.open(h5_file)
+        self._group = group
+        self._unscale = unscale
+        self._meta = None
+        self._time_index = None
+        self._lat_lon = None
+        self._str_decode = str_decode
+        self._i = 0
+
+    def close(self):
+        """
+        Release h5 instance back to the pool
+        """
+        if self._pooled:
+            H5FilePool.release(self._h5)
+        else:
+            self._h5.close()
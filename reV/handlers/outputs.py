@@ -2,7 +2,6 @@
 """
 Classes to handle reV h5 output files.
 """
-import h5py
 import json
 import logging
 import numpy as np
@@ -10,6 +9,7 @@ import pandas as pd
 import time
 
 from reV.version import __version__
+from reV.handlers.h5_pool import H5FilePool
 from reV.utilities.exceptions import (HandlerRuntimeError, HandlerKeyError,
                                       HandlerValueError)
 
@@ -135,7 +135,7 @@ class Outputs(Resource):
     """
 
     def __init__(self, h5_file, mode='r', unscale=True, str_decode=True,
-                 group=None):
+                 group=None, write_buffer=None):
         """
         Parameters
         ----------
@@ -150,15 +150,25 @@ class Outputs(Resource):
             strings. Setting this to False will speed up the meta data read.
         group : str
             Group within .h5 resource file to open
+        write_buffer : int | float | None
+            Optional write-combining buffer size in bytes. If set, adjacent
+            slice writes along the site (last) axis of chunked datasets are
+            held in memory and written to disk in whole-chunk blocks. Pending
+            data is flushed when the dataset is read, when the buffer is
+            full, and on close. None (default) writes every slice directly.
         """
         self._h5_file = h5_file
-        self._h5 = h5py.File(h5_file, mode=mode)
+        self._h5 = H5FilePool.open(h5_file, mode=mode)
         self._unscale = unscale
         self._mode = mode
         self._meta = None
         self._time_index = None
         self._str_decode = str_decode
         self._group = self._check_group(group)
+        self._write_buffer = write_buffer
+        self._buffers = {}
+        self._meta_cols = {}
+        self._gid_sort = None
 
         if self.writable:
             self.set_version_attr()
@@ -172,6 +182,7 @@ class Outputs(Resource):
 
     def __getitem__(self, keys):
         ds, ds_slice = parse_keys(keys)
+        self.flush(ds)
         if ds in self.datasets:
             if ds.endswith('time_index'):
                 out = self._get_time_index(ds, ds_slice)
@@ -200,6 +211,230 @@ class Outputs(Resource):
             else:
                 self._set_ds_array(ds, arr, ds_slice)
 
+    def close(self):
+        """
+        Flush any buffered writes and close h5 instance (read-only handles
+        are released to the pool)
+        """
+        try:
+            if self._h5.id.valid:
+                self.flush()
+        finally:
+            H5FilePool.release(self._h5)
+
+    def flush(self, ds_name=None):
+        """
+        Write buffered slice data to disk
+
+        Parameters
+        ----------
+        ds_name : str | None
+            Dataset to flush, None flushes all buffered datasets.
+        """
+        if ds_name is None:
+            ds_names = list(self._buffers)
+        else:
+            ds_names = [ds_name]
+
+        for ds in ds_names:
+            buffer = self._buffers.pop(ds, None)
+            if buffer is not None:
+                self._write_buffer_block(ds, buffer, buffer['stop'])
+
+    def _get_meta_column(self, ds_name, column, rows=slice(None)):
+        """
+        Read a single (decoded) meta data column. Full columns are cached so
+        that repeat requests do not go back to disk.
+
+        Parameters
+        ----------
+        ds_name : str
+            Meta dataset name
+        column : str
+            Meta data column (record) name
+        rows : slice | list | ndarray
+            Rows of the column to extract
+
+        Returns
+        -------
+        arr : ndarray
+            Meta data column values
+        """
+        meta = self.h5[ds_name]
+        if column not in meta.dtype.names:
+            msg = ('"{}" is not a valid column in "{}", available columns '
+                   'are: {}'.format(column, ds_name, meta.dtype.names))
+            logger.error(msg)
+            raise HandlerKeyError(msg)
+
+        key = (ds_name, column)
+        full = isinstance(rows, slice) and rows == slice(None)
+        if key not in self._meta_cols:
+            if isinstance(rows, slice) and not full:
+                # only read the requested rows, partial reads are not cached
+                return self._decode_meta_arr(meta[column, rows])
+
+            self._meta_cols[key] = self._decode_meta_arr(meta[column])
+
+        arr = self._meta_cols[key]
+        if not full:
+            arr = arr[rows]
+
+        return arr
+
+    def _decode_meta_arr(self, arr):
+        """
+        Decode a bytestring meta data column if str_decode is True
+
+        Parameters
+        ----------
+        arr : ndarray
+            Meta data column values
+
+        Returns
+        -------
+        arr : ndarray
+            Meta data column values (decoded to str if needed)
+        """
+        if self._str_decode and np.issubdtype(arr.dtype, np.bytes_):
+            arr = np.char.decode(arr, encoding='utf-8')
+
+        return arr
+
+    def get_meta_columns(self, columns, rows=slice(None), ds_name='meta'):
+        """
+        Extract a subset of the meta data columns (and rows) without reading
+        and decoding the full meta data table.
+
+        Parameters
+        ----------
+        columns : str | list
+            Meta data column(s) to extract
+        rows : int | slice | list | ndarray
+            Meta data rows to extract, default is all rows.
+        ds_name : str
+            Meta dataset name
+
+        Returns
+        -------
+        meta : pandas.DataFrame
+            Meta data with the requested columns, indexed by meta row the
+            same way as the full meta data.
+        """
+        if isinstance(columns, str):
+            columns = [columns]
+
+        if isinstance(rows, (int, np.integer)):
+            rows = slice(rows, rows + 1)
+
+        index = np.arange(self.h5[ds_name].shape[0])[rows]
+        meta = {c: self._get_meta_column(ds_name, c, rows=rows)
+                for c in columns}
+        meta = pd.DataFrame(meta, index=index)
+        if 'gid' not in self.h5[ds_name].dtype.names:
+            meta.index.name = 'gid'
+
+        return meta
+
+    def get_meta_arr(self, rec_name, rows=slice(None)):
+        """Get a meta array by name (faster than DataFrame extraction). Full
+        meta columns are cached after the first read.
+
+        Parameters
+        ----------
+        rec_name : str
+            Named record from the meta data to retrieve.
+        rows : slice
+            Rows of the record to extract.
+
+        Returns
+        -------
+        meta_arr : np.ndarray
+            Extracted array from the meta data record name.
+        """
+        if 'meta' not in self.h5:
+            return super().get_meta_arr(rec_name, rows=rows)
+
+        return self._get_meta_column('meta', rec_name, rows=rows)
+
+    def _get_meta(self, ds_name, ds_slice):
+        """
+        Extract and convert meta to a pandas DataFrame. If columns are
+        requested only those columns are read and decoded.
+
+        Parameters
+        ----------
+        ds_name : str
+            Dataset to extract meta from
+        ds_slice : tuple
+            Tuple of (int, slice, list, ndarray, str) of what sites and columns
+            to extract from meta
+
+        Returns
+        -------
+        meta : pandas.Dataframe
+            Dataframe of location meta data
+        """
+        ds_slice = parse_slice(ds_slice)
+        columns = None
+        if len(ds_slice) == 2 and isinstance(ds_slice[1], (str, list, tuple)):
+            columns = ds_slice[1]
+        elif isinstance(ds_slice[0], (list, np.ndarray)) \
+                and not len(ds_slice[0]):
+            columns = list(self.h5[ds_name].dtype.names)
+
+        if columns is not None:
+            meta = self.get_meta_columns(columns, rows=ds_slice[0],
+                                         ds_name=ds_name)
+            if isinstance(columns, str):
+                meta = meta[columns]
+        else:
+            meta = super()._get_meta(ds_name, ds_slice)
+
+        return meta
+
+    def get_gid_index(self, gids):
+        """
+        Get the meta data row indices for a set of resource gids using the
+        "gid" meta column. The gid sort order is computed in memory once per
+        handler, the file is not modified.
+
+        Parameters
+        ----------
+        gids : int | list | ndarray
+            Resource gids to find in the meta data
+
+        Returns
+        -------
+        rows : ndarray
+            Meta data row index for each gid, -1 if the gid is not found.
+        """
+        if self._gid_sort is None:
+            meta_gids = self.get_meta_arr('gid')
+            order = None
+            if not np.all(np.diff(meta_gids) > 0):
+                order = np.argsort(meta_gids, kind='stable')
+
+            if order is not None:
+                meta_gids = meta_gids[order]
+
+            self._gid_sort = (meta_gids, order)
+
+        meta_gids, order = self._gid_sort
+        gids = np.atleast_1d(gids)
+        if not len(meta_gids):
+            return np.full(len(gids), -1, dtype=np.int64)
+
+        rows = np.searchsorted(meta_gids, gids)
+        rows = np.minimum(rows, len(meta_gids) - 1)
+        found = meta_gids[rows] == gids
+        if order is not None:
+            rows = order[rows]
+
+        rows = np.where(found, rows, -1)
+
+        return rows
+
     def set_version_attr(self):
         """Set the version attribute to the h5 file."""
         self.h5.attrs['version'] = __version__
@@ -276,6 +511,22 @@ class Outputs(Resource):
 
         return is_writable
 
+    @property
+    def meta_columns(self):
+        """
+        Names of the meta data columns (read from the dataset dtype without
+        loading the meta data)
+
+        Returns
+        -------
+        list
+        """
+        cols = []
+        if 'meta' in self.h5:
+            cols = list(self.h5['meta'].dtype.names)
+
+        return cols
+
     @Resource.meta.setter  # pylint: disable-msg=E1101
     def meta(self, meta):
         """
@@ -378,6 +629,8 @@ class Outputs(Resource):
             Attributes to add to the meta data dataset
         """
         self._meta = meta
+        self._meta_cols = {}
+        self._gid_sort = None
         if isinstance(meta, pd.DataFrame):
             meta = to_records_array(meta)
 
@@ -507,8 +760,141 @@ class Outputs(Resource):
         dtype = self.h5[ds_name].dtype
         scale_factor = self.get_scale(ds_name)
         ds_slice = parse_slice(ds_slice)
-        self.h5[ds_name][ds_slice] = self._check_data_dtype(arr, dtype,
-                                                            scale_factor)
+        arr = self._check_data_dtype(arr, dtype, scale_factor)
+
+        site_slice = None
+        if self._write_buffer:
+            site_slice = self._get_buffer_slice(ds_name, arr, ds_slice)
+
+        if site_slice is None:
+            self.flush(ds_name)
+            self.h5[ds_name][ds_slice] = arr
+        else:
+            self._buffer_ds_array(ds_name, arr, site_slice)
+
+    def _get_buffer_slice(self, ds_name, arr, ds_slice):
+        """
+        Check if a slice write can be combined in the write buffer. Only
+        contiguous slices along the last (site) axis of chunked datasets that
+        span the full extent of all other axes can be combined.
+
+        Parameters
+        ----------
+        ds_name : str
+            Dataset name
+        arr : ndarray
+            Dataset data array (already scaled to the dataset dtype)
+        ds_slice : tuple
+            Dataset slicing that corresponds to arr
+
+        Returns
+        -------
+        site_slice : tuple | None
+            (start, stop) indices along the last axis or None if the write
+            cannot be buffered.
+        """
+        ds = self.h5[ds_name]
+        if ds.chunks is None or not isinstance(arr, np.ndarray):
+            return None
+
+        ds_slice = ds_slice + (slice(None), ) * (ds.ndim - len(ds_slice))
+        if len(ds_slice) != ds.ndim:
+            return None
+
+        bounds = []
+        for s, n in zip(ds_slice, ds.shape):
+            if not isinstance(s, slice) or s.step not in (None, 1):
+                return None
+
+            start, stop, _ = s.indices(n)
+            bounds.append((start, max(start, stop)))
+
+        if any(b != (0, n) for b, n in zip(bounds[:-1], ds.shape[:-1])):
+            return None
+
+        site_slice = bounds[-1]
+        shape = ds.shape[:-1] + (site_slice[1] - site_slice[0], )
+        if arr.shape != shape:
+            return None
+
+        return site_slice
+
+    def _buffer_ds_array(self, ds_name, arr, site_slice):
+        """
+        Add a slice of data to the write buffer, writing out all whole chunks
+        along the site axis that have been completed.
+
+        Parameters
+        ----------
+        ds_name : str
+            Dataset name
+        arr : ndarray
+            Dataset data array (already scaled to the dataset dtype)
+        site_slice : tuple
+            (start, stop) indices of arr along the last axis
+        """
+        start, stop = site_slice
+        # copy so that callers can re-use arr while the write is pending
+        arr = np.array(arr, copy=True)
+        buffer = self._buffers.get(ds_name, None)
+        if buffer is not None and buffer['stop'] != start:
+            self.flush(ds_name)
+            buffer = None
+
+        if buffer is None:
+            buffer = {'start': start, 'stop': stop, 'data': [arr],
+                      'nbytes': arr.nbytes}
+            self._buffers[ds_name] = buffer
+        else:
+            buffer['stop'] = stop
+            buffer['data'].append(arr)
+            buffer['nbytes'] += arr.nbytes
+
+        ds = self.h5[ds_name]
+        chunk = ds.chunks[-1]
+        aligned = (buffer['stop'] // chunk) * chunk
+        if buffer['stop'] == ds.shape[-1]:
+            aligned = buffer['stop']
+
+        if aligned > buffer['start']:
+            self._write_buffer_block(ds_name, buffer, aligned)
+
+        if not buffer['data']:
+            self._buffers.pop(ds_name)
+        elif buffer['nbytes'] > self._write_buffer:
+            self.flush(ds_name)
+
+    def _write_buffer_block(self, ds_name, buffer, stop):
+        """
+        Write buffered data from the buffer start up to stop to disk and
+        remove it from the buffer.
+
+        Parameters
+        ----------
+        ds_name : str
+            Dataset name
+        buffer : dict
+            Write buffer for ds_name with start, stop, data, and nbytes
+        stop : int
+            Index along the last axis to write buffered data up to.
+        """
+        if not buffer['data']:
+            return
+
+        data = buffer['data']
+        if len(data) > 1:
+            data = np.concatenate(data, axis=-1)
+        else:
+            data = data[0]
+
+        i = stop - buffer['start']
+        ds_slice = (Ellipsis, slice(buffer['start'], stop))
+        self.h5[ds_name][ds_slice] = data[..., :i]
+
+        remainder = data[..., i:].copy()
+        buffer['start'] = stop
+        buffer['data'] = [remainder] if remainder.shape[-1] else []
+        buffer['nbytes'] = remainder.nbytes
 
     def _check_chunks(self, chunks, data=None):
         """
@@ -572,9 +958,11 @@ class Outputs(Resource):
         """
         if self.writable:
             if ds_name in self.datasets and replace:
+                self._buffers.pop(ds_name, None)
                 del self.h5[ds_name]
 
             elif ds_name in self.datasets:
+                self.flush(ds_name)
                 old_shape, old_dtype, _ = self.get_dset_properties(ds_name)
                 if old_shape != shape or old_dtype != dtype:
                     e = ('Trying to create dataset "{}", but already exists '
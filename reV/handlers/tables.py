@@ -0,0 +1,714 @@
+# -*- coding: utf-8 -*-
+"""
+Module to handle columnar storage of reV tables (supply curve points,
+transmission tables, etc...)
+"""
+import json
+import logging
+import numpy as np
+import os
+import pandas as pd
+import h5py
+
+from reV.handlers.outputs import Outputs
+from reV.utilities.exceptions import HandlerKeyError, HandlerValueError
+
+from rex.utilities.utilities import parse_table
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnarTable:
+    """
+    Read and write DataFrames column-by-column so that tables can be
+    re-loaded (or partially re-loaded) without re-parsing text files.
+
+    The native format is .h5: each table is stored in its own group with
+    one dataset per column. Columns are stored under positional dataset
+    names ("c0", "c1", ...) with the original column label stored as an
+    attribute so that arbitrary labels round trip. Object columns are
+    stored as variable length utf-8 strings with a separate null mask
+    dataset. reV .h5 files without a table group are read from their
+    "meta" dataset via Outputs. Parquet and feather files are handled by
+    pandas and require pyarrow.
+    """
+    DEFAULT_GROUP = 'table'
+    PANDAS_FORMATS = ('.parquet', '.feather')
+
+    @staticmethod
+    def _ext(fpath):
+        """Get the lower case file extension of fpath"""
+        return os.path.splitext(fpath)[1].lower()
+
+    @classmethod
+    def is_columnar(cls, fpath):
+        """Check if fpath is a columnar table file
+
+        Parameters
+        ----------
+        fpath : str
+            Table file path.
+
+        Returns
+        -------
+        bool
+        """
+        return (isinstance(fpath, str)
+                and cls._ext(fpath) in ('.h5',) + cls.PANDAS_FORMATS)
+
+    @classmethod
+    def output_ext(cls, fpath, default='.csv'):
+        """Get the output file extension matching an input table
+
+        Parameters
+        ----------
+        fpath : str | pandas.DataFrame
+            Input table file path or DataFrame.
+        default : str, optional
+            Extension used for non-columnar inputs, by default '.csv'
+
+        Returns
+        -------
+        str
+        """
+        if cls.is_columnar(fpath):
+            return cls._ext(fpath)
+
+        return default
+
+    @staticmethod
+    def _write_column(group, i, label, values):
+        """Write a single table column to an h5 group"""
+        name = 'c{}'.format(i)
+        if values.dtype.kind == 'O':
+            null = pd.isna(values)
+            strings = np.array(['' if n else str(v)
+                                for v, n in zip(values, null)], dtype=object)
+            ds = group.create_dataset(name, data=strings,
+                                      dtype=h5py.string_dtype())
+            group.create_dataset('null_' + name, data=null)
+        elif values.dtype.kind == 'M':
+            ds = group.create_dataset(name, data=values.astype('int64'))
+            ds.attrs['datetime'] = str(values.dtype)
+        else:
+            ds = group.create_dataset(name, data=values)
+
+        ds.attrs['label'] = json.dumps(label)
+
+    @staticmethod
+    def _read_column(group, name):
+        """Read a single table column from an h5 group"""
+        ds = group[name]
+        if h5py.check_string_dtype(ds.dtype) is not None:
+            values = ds.asstr()[...].astype(object)
+            values[group['null_' + name][...]] = np.nan
+        elif 'datetime' in ds.attrs:
+            values = ds[...].astype(ds.attrs['datetime'])
+        else:
+            values = ds[...]
+
+        return values
+
+    @classmethod
+    def write(cls, table, fpath, group=None, mode='a'):
+        """Write a table to disk in columnar format
+
+        Parameters
+        ----------
+        table : pandas.DataFrame
+            Table to write. The index is preserved.
+        fpath : str
+            Output filepath (.h5, .parquet, or .feather).
+        group : str, optional
+            h5 group to write the table to, by default None which writes to
+            DEFAULT_GROUP. Overwrites an existing group of the same name.
+            Ignored for parquet/feather files.
+        mode : str, optional
+            h5 file mode, by default 'a'
+        """
+        ext = cls._ext(fpath)
+        if ext in cls.PANDAS_FORMATS:
+            table = table.copy()
+            table.columns = [str(c) for c in table.columns]
+            if ext == '.parquet':
+                table.to_parquet(fpath)
+            else:
+                table.reset_index(drop=True).to_feather(fpath)
+            return
+
+        if ext != '.h5':
+            msg = ('Cannot write columnar table to "{}", must be one of '
+                   '.h5, .parquet, or .feather'.format(fpath))
+            logger.error(msg)
+            raise HandlerValueError(msg)
+
+        group = group or cls.DEFAULT_GROUP
+        with h5py.File(fpath, mode=mode) as f:
+            if group in f:
+                del f[group]
+
+            g = f.create_group(group)
+            for i, label in enumerate(table.columns):
+                cls._write_column(g, i, label, table[label].values)
+
+            g.attrs['n_columns'] = len(table.columns)
+            g.create_dataset('index', data=table.index.values)
+
+        logger.debug('Wrote {} table with shape {} to: {}'
+                     .format(group, table.shape, fpath))
+
+    @staticmethod
+    def _column_map(g):
+        """Get a mapping of column label to dataset name for an h5 group"""
+        names = ['c{}'.format(i) for i in range(g.attrs['n_columns'])]
+
+        return {json.loads(g[n].attrs['label']): n for n in names}
+
+    @classmethod
+    def columns(cls, fpath, group=None):
+        """Get the column labels of a columnar table without reading data
+
+        Parameters
+        ----------
+        fpath : str
+            Columnar table filepath.
+        group : str, optional
+            h5 group the table is stored in, by default None (DEFAULT_GROUP)
+
+        Returns
+        -------
+        list
+        """
+        ext = cls._ext(fpath)
+        if ext == '.parquet':
+            import pyarrow.parquet as pq
+            return list(pq.read_schema(fpath).names)
+        elif ext == '.feather':
+            import pyarrow.ipc as ipc
+            with ipc.open_file(fpath) as reader:
+                return list(reader.schema.names)
+
+        if cls._is_meta_table(fpath, group):
+            with Outputs(fpath, mode='r') as f:
+                return f.meta_columns
+
+        with h5py.File(fpath, mode='r') as f:
+            return list(cls._column_map(f[group or cls.DEFAULT_GROUP]))
+
+    @classmethod
+    def _is_meta_table(cls, fpath, group):
+        """Check if a table should be read from the meta data of a reV .h5
+        file (no group requested and no default table group present)"""
+        if group is not None:
+            return False
+
+        with h5py.File(fpath, mode='r') as f:
+            return cls.DEFAULT_GROUP not in f and 'meta' in f
+
+    @classmethod
+    def read(cls, fpath, columns=None, group=None):
+        """Read a columnar table from disk
+
+        Parameters
+        ----------
+        fpath : str
+            Columnar table filepath (.h5, .parquet, or .feather).
+        columns : list, optional
+            Subset of columns to read, by default None (all columns).
+        group : str, optional
+            h5 group the table is stored in, by default None (DEFAULT_GROUP)
+
+        Returns
+        -------
+        table : pandas.DataFrame
+        """
+        ext = cls._ext(fpath)
+        if ext == '.parquet':
+            return pd.read_parquet(fpath, columns=columns)
+        elif ext == '.feather':
+            return pd.read_feather(fpath, columns=columns)
+
+        if cls._is_meta_table(fpath, group):
+            with Outputs(fpath, mode='r') as f:
+                if columns is None:
+                    columns = f.meta_columns
+
+                return f.get_meta_columns(columns)
+
+        group = group or cls.DEFAULT_GROUP
+        with h5py.File(fpath, mode='r') as f:
+            if group not in f:
+                msg = ('Table "{}" not found in {}, available groups: {}'
+                       .format(group, fpath, list(f)))
+                logger.error(msg)
+                raise HandlerKeyError(msg)
+
+            g = f[group]
+            col_map = cls._column_map(g)
+            if columns is None:
+                columns = list(col_map)
+
+            missing = [c for c in columns if c not in col_map]
+            if missing:
+                msg = ('Columns {} not found in table "{}" in {}'
+                       .format(missing, group, fpath))
+                logger.error(msg)
+                raise HandlerKeyError(msg)
+
+            data = {c: cls._read_column(g, col_map[c]) for c in columns}
+            index = g['index'][...]
+
+        return pd.DataFrame(data, index=index, columns=columns)
+
+    @classmethod
+    def parse(cls, table, columns=None):
+        """Parse a table from any supported source with optional column
+        projection.
+
+        Parameters
+        ----------
+        table : str | pandas.DataFrame
+            DataFrame or path to .csv, .json, .h5, .parquet, or .feather
+            table file.
+        columns : list | callable, optional
+            Columns to load, either a list of column labels or a function
+            that returns True for column labels to load. Columns that are
+            not in the table are ignored. By default None (all columns).
+
+        Returns
+        -------
+        table : pandas.DataFrame
+        """
+        keep = columns
+        if columns is not None and not callable(columns):
+            columns = set(columns)
+            keep = columns.__contains__
+
+        if cls.is_columnar(table):
+            if keep is not None:
+                keep = [c for c in cls.columns(table) if keep(c)]
+
+            table = cls.read(table, columns=keep)
+        elif (keep is not None and isinstance(table, str)
+              and table.endswith('.csv')):
+            table = pd.read_csv(table, usecols=keep)
+        else:
+            try:
+                table = parse_table(table)
+            except ValueError as ex:
+                logger.error(ex)
+                raise
+
+            if keep is not None:
+                table = table[[c for c in table if keep(c)]]
+
+        return table
+
+    @classmethod
+    def save(cls, table, fpath):
+        """Save a table to disk, the format is determined by the file
+        extension (.csv, .json, .h5, .parquet, or .feather).
+
+        Parameters
+        ----------
+        table : pandas.DataFrame
+            Table to save.
+        fpath : str
+            Output filepath.
+        """
+        ext = cls._ext(fpath)
+        if ext == '.csv':
+            table.to_csv(fpath, index=False)
+        elif ext == '.json':
+            table.to_json(fpath)
+        else:
+            cls.write(table.reset_index(drop=True), fpath, mode='w')
+
+
+class ColumnarTableSink:
+    """
+    Stream records (e.g. parallel worker results) to a columnar .h5 table
+    on disk as they arrive.
+
+    Records are buffered until batch_rows rows are pending and then written
+    as a new ColumnarTable group ("batches/b000000", "batches/b000001",
+    ...) so that memory is bounded by the batch size and every completed
+    batch is on disk if the job is killed. Object columns holding lists or
+    dicts (e.g. "res_gids", "gid_counts") are json encoded and decoded
+    again by read(), which consolidates all batches into a single table.
+
+    Each batch can also record the ids of the tasks that it completes and
+    companion arrays with one row per record (e.g. aggregated profiles), so
+    that a sink file doubles as a checkpoint for resuming a killed job.
+    Batches that were not completely written are discarded. A signature of
+    the job inputs can be stored with the checkpoint so that a resumed job
+    can verify that it was written with the same inputs.
+    """
+    BATCH_GROUP = 'batches'
+
+    def __init__(self, fpath, batch_rows=10000, mode='w', signature=None):
+        """
+        Parameters
+        ----------
+        fpath : str
+            .h5 filepath to stream the record batches to.
+        batch_rows : int, optional
+            Number of pending records that triggers a write to disk, by
+            default 10000
+        mode : str, optional
+            "w" to start a new sink file or "a" to append batches to the
+            batches already in an existing sink file, by default "w"
+        signature : str | None, optional
+            Signature of the job inputs to store in a new sink file (see
+            read_signature), by default None
+        """
+        if ColumnarTable._ext(fpath) != '.h5':
+            msg = ('Columnar table sink must be an .h5 file but received: '
+                   '{}'.format(fpath))
+            logger.error(msg)
+            raise HandlerValueError(msg)
+
+        if mode not in ('w', 'a'):
+            msg = ('Columnar table sink mode must be "w" or "a" but '
+                   'received: "{}"'.format(mode))
+            logger.error(msg)
+            raise HandlerValueError(msg)
+
+        self._fpath = fpath
+        self._batch_rows = batch_rows
+        self._pending = []
+        self._pending_ids = []
+        self._pending_arrays = {}
+        self._n_rows = 0
+
+        with h5py.File(fpath, mode=mode) as f:
+            if mode == 'w' and signature is not None:
+                f.attrs['signature'] = signature
+
+            batches = f.require_group(self.BATCH_GROUP)
+            for name in list(batches):
+                if 'json_columns' not in batches[name].attrs:
+                    logger.warning('Discarding incomplete batch "{}" in {}'
+                                   .format(name, fpath))
+                    del batches[name]
+                else:
+                    self._n_rows += len(batches[name]['index'])
+
+            self._n_batches = len(batches)
+            self._next_batch = 1 + max([int(name[1:]) for name in batches],
+                                       default=-1)
+
+    def __repr__(self):
+        msg = ('{} with {} rows in {} batches streamed to {}'
+               .format(self.__class__.__name__, self._n_rows,
+                       self._n_batches, self._fpath))
+
+        return msg
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.flush()
+
+        if type is not None:
+            raise
+
+    @property
+    def fpath(self):
+        """Sink .h5 filepath
+
+        Returns
+        -------
+        str
+        """
+        return self._fpath
+
+    @property
+    def n_batches(self):
+        """Number of batches written to disk
+
+        Returns
+        -------
+        int
+        """
+        return self._n_batches
+
+    @property
+    def n_rows(self):
+        """Number of rows written to disk (excluding pending records)
+
+        Returns
+        -------
+        int
+        """
+        return self._n_rows
+
+    @property
+    def completed(self):
+        """Ids of the tasks completed by the batches written to disk
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self.read_completed(self._fpath)
+
+    @staticmethod
+    def _json_default(obj):
+        """Convert numpy objects in records for json encoding"""
+        if isinstance(obj, np.generic):
+            return obj.item()
+        elif isinstance(obj, np.ndarray):
+            return obj.tolist()
+
+        raise TypeError('Cannot json encode {}'.format(type(obj)))
+
+    @staticmethod
+    def _to_records(table):
+        """Convert a DataFrame to a list of records, unlike
+        DataFrame.to_dict() this keeps the numpy dtypes of numeric values.
+        Null values in object columns are None."""
+        columns = []
+        for label in table.columns:
+            values = table[label].values
+            if values.dtype.kind == 'O':
+                values = np.where(pd.isna(values), None, values)
+
+            columns.append(values)
+
+        labels = list(table.columns)
+
+        return [dict(zip(labels, row)) for row in zip(*columns)]
+
+    @classmethod
+    def _encode(cls, table):
+        """json encode object columns that contain containers
+
+        Returns
+        -------
+        table : pandas.DataFrame
+            Table with container columns converted to json strings.
+        json_columns : list
+            Labels of the json encoded columns.
+        """
+        json_columns = []
+        for label in table.columns:
+            values = table[label]
+            if values.dtype.kind != 'O':
+                continue
+
+            is_container = values.map(lambda v: isinstance(
+                v, (list, tuple, dict, np.ndarray)))
+            if is_container.any():
+                table[label] = [json.dumps(v, default=cls._json_default)
+                                if c else v
+                                for v, c in zip(values, is_container)]
+                json_columns.append(label)
+
+        return table, json_columns
+
+    def append(self, records, task_ids=None, arrays=None):
+        """Append records to the sink, writing a batch to disk once
+        batch_rows records are pending.
+
+        Parameters
+        ----------
+        records : list | pandas.DataFrame
+            List of dictionaries (one per row) or a DataFrame of rows.
+        task_ids : list | np.ndarray, optional
+            Integer ids of the tasks completed by these records, recorded
+            once the records are written to disk, by default None
+        arrays : dict, optional
+            Companion arrays keyed by name, each with one entry along the
+            first axis per record, by default None
+        """
+        if isinstance(records, pd.DataFrame):
+            records = self._to_records(records)
+
+        records = list(records)
+        arrays = {k: np.asarray(v) for k, v in (arrays or {}).items()}
+        for name, values in arrays.items():
+            if len(values) != len(records):
+                msg = ('Sink array "{}" has {} entries but {} records were '
+                       'appended'.format(name, len(values), len(records)))
+                logger.error(msg)
+                raise HandlerValueError(msg)
+
+        self._pending += records
+        if task_ids is not None:
+            self._pending_ids.append(np.asarray(task_ids, dtype=np.int64))
+
+        for name, values in arrays.items():
+            self._pending_arrays.setdefault(name, []).append(values)
+
+        if len(self._pending) >= self._batch_rows:
+            self.flush()
+
+    def flush(self):
+        """Write all pending records to disk as a new batch."""
+        if not self._pending and not self._pending_ids:
+            return
+
+        table, json_columns = self._encode(pd.DataFrame(self._pending))
+        group = '{}/b{:06d}'.format(self.BATCH_GROUP, self._next_batch)
+        ColumnarTable.write(table, self._fpath, group=group)
+        with h5py.File(self._fpath, mode='a') as f:
+            g = f[group]
+            task_ids = np.concatenate(self._pending_ids or [[]])
+            g.create_dataset('task_ids', data=task_ids.astype(np.int64))
+            for name, values in self._pending_arrays.items():
+                g.create_dataset('arrays/' + name,
+                                 data=np.concatenate(values))
+
+            # written last to mark the batch as complete
+            g.attrs['json_columns'] = json.dumps(json_columns)
+
+        self._n_batches += 1
+        self._next_batch += 1
+        self._n_rows += len(table)
+        self._pending = []
+        self._pending_ids = []
+        self._pending_arrays = {}
+        logger.debug('Streamed batch {} to {}, {} rows written in total.'
+                     .format(group, self._fpath, self._n_rows))
+
+    @classmethod
+    def _batch_names(cls, f):
+        """Get the names of the complete batches in an open sink file in
+        the order they were written"""
+        batches = f.get(cls.BATCH_GROUP, {})
+        names = [name for name in batches
+                 if 'json_columns' in batches[name].attrs]
+
+        return sorted(names, key=lambda name: int(name[1:]))
+
+    @staticmethod
+    def read_signature(fpath):
+        """Read the signature of the job inputs stored in a sink file.
+
+        Parameters
+        ----------
+        fpath : str
+            Sink .h5 filepath.
+
+        Returns
+        -------
+        signature : str | None
+            Signature stored when the sink file was started, None if there
+            is none.
+        """
+        with h5py.File(fpath, mode='r') as f:
+            signature = f.attrs.get('signature', None)
+
+        return signature
+
+    @classmethod
+    def read_completed(cls, fpath):
+        """Read the ids of the tasks completed by the batches in a sink
+        file.
+
+        Parameters
+        ----------
+        fpath : str
+            Sink .h5 filepath.
+
+        Returns
+        -------
+        task_ids : np.ndarray
+        """
+        with h5py.File(fpath, mode='r') as f:
+            task_ids = [f[cls.BATCH_GROUP][name]['task_ids'][...]
+                        for name in cls._batch_names(f)]
+
+        return np.concatenate(task_ids or [[]]).astype(np.int64)
+
+    @classmethod
+    def read_arrays(cls, fpath):
+        """Read and concatenate the companion arrays of all of the batches
+        in a sink file.
+
+        Parameters
+        ----------
+        fpath : str
+            Sink .h5 filepath.
+
+        Returns
+        -------
+        arrays : dict
+            Companion arrays keyed by name, with rows in the same order as
+            the table from read().
+        """
+        arrays = {}
+        with h5py.File(fpath, mode='r') as f:
+            for name in cls._batch_names(f):
+                g = f[cls.BATCH_GROUP][name]
+                for key, ds in g.get('arrays', {}).items():
+                    arrays.setdefault(key, []).append(ds[...])
+
+        return {k: np.concatenate(v) for k, v in arrays.items()}
+
+    @classmethod
+    def read(cls, fpath, out_fpath=None):
+        """Consolidate all of the batches in a sink file into a single
+        table. This can be used to recover partial results.
+
+        Parameters
+        ----------
+        fpath : str
+            Sink .h5 filepath.
+        out_fpath : str, optional
+            Optional filepath to save the consolidated table to (.csv,
+            .json, .h5, .parquet, or .feather), by default None
+
+        Returns
+        -------
+        table : pandas.DataFrame
+            Consolidated table with a fresh range index. json encoded
+            columns are decoded.
+        """
+        with h5py.File(fpath, mode='r') as f:
+            batches = cls._batch_names(f)
+            json_columns = {
+                name: json.loads(f[cls.BATCH_GROUP][name]
+                                 .attrs.get('json_columns', '[]'))
+                for name in batches}
+
+        tables = []
+        for name in batches:
+            group = '{}/{}'.format(cls.BATCH_GROUP, name)
+            table = ColumnarTable.read(fpath, group=group)
+            for label in json_columns[name]:
+                table[label] = table[label].map(
+                    lambda v: json.loads(v) if isinstance(v, str) else v)
+
+            if len(table):
+                tables.append(table)
+
+        if tables:
+            table = pd.concat(tables, ignore_index=True)
+        else:
+            table = pd.DataFrame()
+
+        if out_fpath is not None:
+            ColumnarTable.save(table, out_fpath)
+
+        return table
+
+    @classmethod
+    def read_records(cls, fpath):
+        """Consolidate all of the batches in a sink file into a list of
+        records, the inverse of append().
+
+        Parameters
+        ----------
+        fpath : str
+            Sink .h5 filepath.
+
+        Returns
+        -------
+        records : list
+            List of dictionaries, one per row. Numeric values keep their
+            numpy dtype and null values in object columns are None.
+        """
+        return cls._to_records(cls.read(fpath))
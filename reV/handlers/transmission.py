@@ -9,10 +9,10 @@ import os
 import pandas as pd
 from warnings import warn
 
-from reV.utilities.exceptions import (HandlerWarning, HandlerKeyError,
-                                      HandlerRuntimeError)
+from reV.handlers.tables import ColumnarTable
+from reV.utilities.exceptions import HandlerWarning, HandlerKeyError
 
-from rex.utilities.utilities import parse_table, safe_json_load
+from rex.utilities.utilities import safe_json_load
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,15 @@ logger = logging.getLogger(__name__)
 class TransmissionFeatures:
     """
     Class to handle Supply Curve Transmission features
+
+    Feature state is stored in flat arrays: feature gids are mapped to a
+    dense feature index, substation lines are stored in CSR format
+    (line pointers and dense line indices) and the available capacity of
+    all features is a single float vector (NaN for features without a
+    capacity of their own, i.e. substations and synthetic load centers).
     """
+    FEATURE_TYPES = ('transline', 'substation', 'loadcen', 'pcaloadcen')
+
     def __init__(self, trans_table, line_tie_in_cost=14000, line_cost=3667,
                  station_tie_in_cost=0, center_tie_in_cost=0,
                  sink_tie_in_cost=14000, available_capacity=0.1,
@@ -69,12 +77,25 @@ class TransmissionFeatures:
         self._sink_tie_in_cost = sink_tie_in_cost
         self._available_capacity_frac = available_capacity
 
-        self._features = self._get_features(trans_table)
-        self._check_feature_dependencies()
+        features = self._get_features(trans_table)
+        self._gids = features['gid']
+        self._type_names = features['type']
+        self._types = self._type_codes(self._type_names)
+        self._avail_cap = features['avail_cap']
+        self._index = np.full(int(1 + self._gids.max()), -1, dtype=np.int64)
+        self._index[self._gids] = np.arange(len(self._gids))
+
+        # substations without a pre-computed capacity derive it from their
+        # lines, any other feature without a capacity is unlimited
+        substation = self._types == self.FEATURE_TYPES.index('substation')
+        self._from_lines = substation & np.isnan(self._avail_cap)
+        self._unlimited = np.isnan(self._avail_cap) & ~self._from_lines
+
+        self._line_ptr, line_gids = self._lines_to_csr(features['lines'])
+        self._check_feature_dependencies(line_gids)
+        self._line_idx = self._index[line_gids]
 
-        self._feature_gid_list = list(self._features.keys())
-        self._available_mask = np.ones(
-            (int(1 + max(list(self._features.keys()))), ), dtype=bool)
+        self._available_mask = np.ones(len(self._index), dtype=bool)
 
         self._line_limited = line_limited
 
@@ -83,15 +104,166 @@ class TransmissionFeatures:
         return msg
 
     def __len__(self):
-        return len(self._features)
+        return len(self._gids)
 
     def __getitem__(self, gid):
-        if gid not in self._features:
+        i = self._get_index(gid)
+        feature = {'type': self._type_names[i]}
+        if self._from_lines[i]:
+            feature['lines'] = self._gids[self._get_lines(i)].tolist()
+        else:
+            feature['avail_cap'] = self._available_capacity(i)
+
+        return feature
+
+    @property
+    def feature_gids(self):
+        """
+        Transmission feature gids in dense index order
+
+        Returns
+        -------
+        ndarray
+        """
+        return self._gids
+
+    @property
+    def line_limited(self):
+        """
+        Flag for substation connections limited by the capacity of the
+        largest transmission line
+
+        Returns
+        -------
+        bool
+        """
+        return self._line_limited
+
+    @property
+    def connection_arrays(self):
+        """
+        Feature arrays in dense index order used by the array based
+        connection kernels in reV.supply_curve.full_sort. The available
+        capacity array is not a copy and is updated in place by the kernels.
+
+        Returns
+        -------
+        arrays : tuple
+            types, avail_cap, from_lines, unlimited, line_ptr, line_idx
+        """
+        return (self._types, self._avail_cap, self._from_lines,
+                self._unlimited, self._line_ptr, self._line_idx)
+
+    @property
+    def available_mask(self):
+        """
+        Feature availability in feature_gids order
+
+        Returns
+        -------
+        ndarray
+        """
+        return self._available_mask[self._gids]
+
+    @available_mask.setter
+    def available_mask(self, available):
+        """
+        Set the feature availability
+
+        Parameters
+        ----------
+        available : ndarray
+            Boolean availability of each feature in feature_gids order
+        """
+        self._available_mask[self._gids] = available
+
+    def _get_index(self, gid):
+        """
+        Get the dense feature index for a feature gid
+
+        Parameters
+        ----------
+        gid : int
+            Unique id of feature of interest
+
+        Returns
+        -------
+        i : int
+            Dense index of feature in the feature arrays
+        """
+        gid = int(gid)
+        i = self._index[gid] if 0 <= gid < len(self._index) else -1
+        if i < 0:
             msg = "Invalid feature gid {}".format(gid)
             logger.error(msg)
             raise HandlerKeyError(msg)
 
-        return self._features[gid]
+        return i
+
+    def _get_lines(self, i):
+        """
+        Get the dense indices of the lines connected to a substation
+
+        Parameters
+        ----------
+        i : int
+            Dense index of substation
+
+        Returns
+        -------
+        line_idx : ndarray
+            Dense indices of the substation's transmission lines
+        """
+        return self._line_idx[self._line_ptr[i]:self._line_ptr[i + 1]]
+
+    @classmethod
+    def _type_codes(cls, type_names):
+        """
+        Convert feature type names to integer codes
+
+        Parameters
+        ----------
+        type_names : ndarray
+            Lower case feature type names
+
+        Returns
+        -------
+        codes : ndarray
+            Index of each type in FEATURE_TYPES, -1 for unknown types
+        """
+        codes = pd.Categorical(type_names, categories=cls.FEATURE_TYPES)
+
+        return np.asarray(codes.codes, dtype=np.int8)
+
+    @staticmethod
+    def _lines_to_csr(lines):
+        """
+        Convert the substation line gids of all features to CSR format
+
+        Parameters
+        ----------
+        lines : list
+            List of line gid lists for every feature (empty for features
+            without lines)
+
+        Returns
+        -------
+        line_ptr : ndarray
+            Pointers into line_gids, lines of feature i are
+            line_gids[line_ptr[i]:line_ptr[i + 1]]
+        line_gids : ndarray
+            Concatenated line gids
+        """
+        counts = np.array([len(f_lines) for f_lines in lines], dtype=np.int64)
+        line_ptr = np.zeros(len(lines) + 1, dtype=np.int64)
+        line_ptr[1:] = np.cumsum(counts)
+        if line_ptr[-1]:
+            line_gids = np.concatenate([f_lines for f_lines in lines
+                                        if len(f_lines)]).astype(np.int64)
+        else:
+            line_gids = np.zeros(0, dtype=np.int64)
+
+        return line_ptr, line_gids
 
     @staticmethod
     def _parse_dictionary(features):
@@ -135,7 +307,8 @@ class TransmissionFeatures:
         Parameters
         ----------
         trans_table : str | pandas.DataFrame
-            Path to .csv or .json containing supply curve transmission mapping
+            Path to .csv, .json, .h5, .parquet, or .feather
+            containing supply curve transmission mapping
 
         Returns
         -------
@@ -143,7 +316,7 @@ class TransmissionFeatures:
             DataFrame of transmission features
         """
         try:
-            trans_table = parse_table(trans_table)
+            trans_table = ColumnarTable.parse(trans_table)
         except ValueError as ex:
             logger.error(ex)
             raise
@@ -163,40 +336,40 @@ class TransmissionFeatures:
         Returns
         -------
         features : dict
-            Nested dictionary of features (lines, substations, loadcenters)
-            lines : {capacity}
-            substations : {lines}
-            loadcenters : {capacity}
+            Dictionary of feature arrays:
+            gid : feature gids
+            type : feature type names
+            avail_cap : available capacity of lines and load centers
+            (NaN for substations and synthetic load centers)
+            lines : list of line gids connected to each substation
         """
-
-        features = {}
-
         cap_frac = self._available_capacity_frac
         trans_features = trans_table.groupby('trans_line_gid').first()
+        names = trans_features['category'].str.lower().values
+
+        unknown = self._type_codes(names) < 0
+        if unknown.any():
+            pos = np.where(unknown)[0][0]
+            msg = ('Cannot not recognize feature type "{}" '
+                   'for trans gid {}!'
+                   .format(names[pos], trans_features.index[pos]))
+            logger.error(msg)
+            raise HandlerKeyError(msg)
 
-        for gid, feature in trans_features.iterrows():
-            name = feature['category'].lower()
-            feature_dict = {'type': name}
-
-            if name == 'transline':
-                feature_dict['avail_cap'] = feature['ac_cap'] * cap_frac
-
-            elif name == 'substation':
-                feature_dict['lines'] = json.loads(feature['trans_gids'])
-
-            elif name == 'loadcen':
-                feature_dict['avail_cap'] = feature['ac_cap'] * cap_frac
-
-            elif name == 'pcaloadcen':
-                feature_dict['avail_cap'] = None
+        avail_cap = np.full(len(names), np.nan)
+        has_cap = np.isin(names, ('transline', 'loadcen'))
+        if has_cap.any():
+            ac_cap = trans_features['ac_cap'].values[has_cap]
+            avail_cap[has_cap] = ac_cap.astype(np.float64) * cap_frac
 
-            else:
-                msg = ('Cannot not recognize feature type "{}" '
-                       'for trans gid {}!'.format(name, gid))
-                logger.error(msg)
-                raise HandlerKeyError(msg)
+        lines = [[]] * len(names)
+        for pos in np.where(names == 'substation')[0]:
+            lines[pos] = json.loads(trans_features['trans_gids'].iloc[pos])
 
-            features[gid] = feature_dict
+        features = {'gid': trans_features.index.values.astype(np.int64),
+                    'type': names,
+                    'avail_cap': avail_cap,
+                    'lines': lines}
 
         return features
 
@@ -208,15 +381,13 @@ class TransmissionFeatures:
         Parameters
         ----------
         trans_table : str
-            Path to .csv or .json containing supply curve transmission mapping
+            Path to .csv, .json, .h5, .parquet, or .feather
+            containing supply curve transmission mapping
 
         Returns
         -------
         features : dict
-            Nested dictionary of features (lines, substations, loadcenters)
-            lines : {capacity}
-            substations : {lines}
-            loadcenters : {capacity}
+            Dictionary of feature arrays (gid, type, avail_cap, lines)
         """
 
         trans_table = self._parse_table(trans_table)
@@ -224,15 +395,23 @@ class TransmissionFeatures:
 
         return features
 
-    def _check_feature_dependencies(self):
-        """Check features for dependencies that are missing and raise error."""
+    def _check_feature_dependencies(self, line_gids):
+        """
+        Check features for dependencies that are missing and raise error.
+
+        Parameters
+        ----------
+        line_gids : ndarray
+            Concatenated substation line gids in CSR format (see
+            _lines_to_csr)
+        """
+        bad = ((line_gids < 0) | (line_gids >= len(self._index)))
+        bad[~bad] = self._index[line_gids[~bad]] < 0
+
         missing = {}
-        for gid, feature_dict in self._features.items():
-            for line_gid in feature_dict.get('lines', []):
-                if line_gid not in self._features:
-                    if gid not in missing:
-                        missing[gid] = []
-                    missing[gid].append(line_gid)
+        parents = np.repeat(self._gids, np.diff(self._line_ptr))
+        for gid, line_gid in zip(parents[bad], line_gids[bad]):
+            missing.setdefault(int(gid), []).append(int(line_gid))
 
         if any(missing):
             emsg = ('Transmission feature table has {} parent features that '
@@ -267,32 +446,93 @@ class TransmissionFeatures:
 
         return cost
 
-    def _substation_capacity(self, line_gids):
+    def _substation_capacity(self, line_idx):
         """
         Get capacity of a substation from its tranmission lines
 
         Parameters
         ----------
-        line_gids : list
-            List of transmission line gids connected to the substation
-
+        line_idx : ndarray
+            Dense indices of transmission lines connected to the substation
 
         Returns
         -------
         avail_cap : float
             Substation available capacity
         """
+        line_caps = self._avail_cap[line_idx]
+        if not len(line_caps):
+            return 0
 
-        line_caps = [self[gid]['avail_cap'] for gid in line_gids]
-        avail_cap = sum(line_caps) / 2
+        # cumsum adds sequentially, matching a python sum of the line caps
+        avail_cap = line_caps.cumsum()[-1] / 2
 
         if self._line_limited:
-            max_cap = max(line_caps) / 2
+            max_cap = line_caps.max() / 2
             if max_cap < avail_cap:
                 avail_cap = max_cap
 
         return avail_cap
 
+    def _substation_capacities(self, sub_idx):
+        """
+        Get capacity of many substations from their tranmission lines
+
+        Parameters
+        ----------
+        sub_idx : ndarray
+            Dense indices of substations
+
+        Returns
+        -------
+        avail_cap : ndarray
+            Substations available capacity
+        """
+        counts = np.diff(self._line_ptr)[sub_idx]
+        n_lines = counts.max() if len(counts) else 0
+
+        # pad line capacities into a (substations, max lines) matrix
+        rows = np.repeat(np.arange(len(sub_idx)), counts)
+        cols = (np.arange(counts.sum())
+                - np.repeat(np.cumsum(counts) - counts, counts))
+        line_caps = np.zeros((len(sub_idx), n_lines))
+        line_caps[rows, cols] = self._avail_cap[
+            self._line_idx[self._line_ptr[sub_idx][rows] + cols]]
+
+        # add lines sequentially to match _substation_capacity exactly
+        avail_cap = np.zeros(len(sub_idx))
+        for col in range(n_lines):
+            avail_cap = avail_cap + line_caps[:, col]
+
+        avail_cap /= 2
+        if self._line_limited and n_lines:
+            avail_cap = np.minimum(avail_cap, line_caps.max(axis=1) / 2)
+
+        return avail_cap
+
+    def _available_capacity(self, i):
+        """
+        Get available capacity for the feature with the given dense index
+
+        Parameters
+        ----------
+        i : int
+            Dense index of feature of interest
+
+        Returns
+        -------
+        avail_cap : float | None
+            Available capacity, None if capacity is unlimited
+        """
+        if self._from_lines[i]:
+            avail_cap = self._substation_capacity(self._get_lines(i))
+        elif self._unlimited[i]:
+            avail_cap = None
+        else:
+            avail_cap = float(self._avail_cap[i])
+
+        return avail_cap
+
     def available_capacity(self, gid):
         """
         Get available capacity for given line
@@ -309,19 +549,21 @@ class TransmissionFeatures:
             default = 10%
         """
 
-        feature = self[gid]
-
-        if 'avail_cap' in feature:
-            avail_cap = feature['avail_cap']
+        return self._available_capacity(self._get_index(gid))
 
-        elif 'lines' in feature:
-            avail_cap = self._substation_capacity(feature['lines'])
+    def available_capacities(self):
+        """
+        Get available capacity for all features
 
-        else:
-            msg = ('Could not parse available capacity from feature: {}'
-                   .format(feature))
-            logger.error(msg)
-            raise HandlerRuntimeError(msg)
+        Returns
+        -------
+        avail_cap : ndarray
+            Available capacity of every feature in feature_gids order,
+            NaN indicates unlimited capacity
+        """
+        avail_cap = self._avail_cap.copy()
+        sub_idx = np.where(self._from_lines)[0]
+        avail_cap[sub_idx] = self._substation_capacities(sub_idx)
 
         return avail_cap
 
@@ -354,40 +596,40 @@ class TransmissionFeatures:
         """
         return self._available_mask[gid]
 
-    def _connect(self, gid, capacity):
+    def _connect(self, idx, capacity):
         """
-        Connect to a standalone transmission feature (not a substation)
-        and decrement the feature's available capacity.
+        Connect to standalone transmission feature(s) (not a substation)
+        and decrement the features' available capacity.
         Raise exception if not able to connect.
 
         Parameters
         ----------
-        gid : int
-            Feature gid to connect to
-        capacity : float
+        idx : int | ndarray
+            Dense index of feature(s) to connect to
+        capacity : float | ndarray
             Capacity needed in MW
         """
-        avail_cap = self[gid]['avail_cap']
+        avail_cap = self._avail_cap[idx]
 
-        if avail_cap < capacity:
+        if np.any(avail_cap < capacity):
             msg = ("Cannot connect to {}: "
                    "needed capacity({} MW) > "
                    "available capacity({} MW)"
-                   .format(gid, capacity, avail_cap))
+                   .format(self._gids[idx], capacity, avail_cap))
             logger.error(msg)
             raise RuntimeError(msg)
 
-        self[gid]['avail_cap'] -= capacity
+        self._avail_cap[idx] = avail_cap - capacity
 
-    def _fill_lines(self, line_gids, line_caps, capacity):
+    def _fill_lines(self, line_idx, line_caps, capacity):
         """
         Fill any lines that cannot handle equal portion of capacity and
         remove from lines to be filled and capacity needed
 
         Parameters
         ----------
-        line_gids : ndarray
-            Vector of transmission line gids connected to the substation
+        line_idx : ndarray
+            Dense indices of transmission lines connected to the substation
         line_caps : ndarray
             Vector of available capacity of the transmission lines
         capacity : float
@@ -395,72 +637,63 @@ class TransmissionFeatures:
 
         Returns
         ----------
-        line_gids : ndarray
+        line_idx : ndarray
             Transmission lines with available capacity
         line_caps : ndarray
             Capacity of lines with available capacity
         capacity : float
             Updated capacity needed to be applied to substation in MW
         """
-        apply_cap = capacity / len(line_gids)
-        mask = line_caps < apply_cap
-        for pos in np.where(line_caps < apply_cap)[0]:
-            gid = line_gids[pos]
-            apply_cap = line_caps[pos]
-            self._connect(gid, apply_cap)
-            capacity -= apply_cap
+        mask = line_caps < capacity / len(line_idx)
+        if mask.any():
+            self._connect(line_idx[mask], line_caps[mask])
+            # subtract.reduce is sequential, matching per-line subtraction
+            capacity = np.subtract.reduce(np.append(capacity,
+                                                    line_caps[mask]))
 
-        return line_gids[~mask], line_caps[~mask], capacity
+        return line_idx[~mask], line_caps[~mask], capacity
 
-    def _spread_substation_load(self, line_gids, line_caps, capacity):
+    def _spread_substation_load(self, line_idx, line_caps, capacity):
         """
         Spread needed capacity over all lines connected to substation
 
         Parameters
         ----------
-        line_gids : ndarray
-            Vector of transmission line gids connected to the substation
+        line_idx : ndarray
+            Dense indices of transmission lines connected to the substation
         line_caps : ndarray
             Vector of available capacity of the transmission lines
         capacity : float
             Capacity needed to be applied to substation in MW
         """
         while True:
-            lines, line_caps, capacity = self._fill_lines(line_gids, line_caps,
+            lines, line_caps, capacity = self._fill_lines(line_idx, line_caps,
                                                           capacity)
-            if len(lines) < len(line_gids):
-                line_gids = lines
+            if len(lines) < len(line_idx):
+                line_idx = lines
             else:
                 break
 
-        apply_cap = capacity / len(lines)
-        for gid in lines:
-            self._connect(gid, apply_cap)
+        self._connect(lines, capacity / len(lines))
 
-    def _connect_to_substation(self, line_gids, capacity):
+    def _connect_to_substation(self, line_idx, capacity):
         """
-        Connect to substation and update internal dictionary accordingly
+        Connect to substation and update the line capacities accordingly
 
         Parameters
         ----------
-        line_gids : list
-            List of transmission line gids connected to the substation
+        line_idx : ndarray
+            Dense indices of transmission lines connected to the substation
         capacity : float
             Capacity needed in MW
-        line_lmited : bool
-            Substation connection is limited by maximum capacity of the
-            attached lines
         """
-        line_caps = np.array([self[gid]['avail_cap']
-                              for gid in line_gids])
+        line_caps = self._avail_cap[line_idx]
         if self._line_limited:
-            gid = line_gids[np.argmax(line_caps)]
-            self._connect(gid, capacity)
+            self._connect(line_idx[np.argmax(line_caps)], capacity)
         else:
             non_zero = np.nonzero(line_caps)[0]
-            line_gids = np.array([line_gids[i] for i in non_zero])
-            line_caps = line_caps[non_zero]
-            self._spread_substation_load(line_gids, line_caps, capacity)
+            self._spread_substation_load(line_idx[non_zero],
+                                         line_caps[non_zero], capacity)
 
     def connect(self, gid, capacity, apply=True):
         """
@@ -483,20 +716,19 @@ class TransmissionFeatures:
             Flag as to whether connection is possible or not
         """
         if self.check_availability(gid):
-            avail_cap = self.available_capacity(gid)
+            i = self._get_index(gid)
+            avail_cap = self._available_capacity(i)
             if avail_cap is not None and capacity > avail_cap:
                 connected = False
             else:
                 connected = True
                 if apply:
-                    feature_type = self[gid]['type']
-                    if feature_type == 'transline':
-                        self._connect(gid, capacity)
+                    feature_type = self._type_names[i]
+                    if feature_type in ('transline', 'loadcen'):
+                        self._connect(i, capacity)
                     elif feature_type == 'substation':
-                        lines = self[gid]['lines']
-                        self._connect_to_substation(lines, capacity)
-                    elif feature_type == 'loadcen':
-                        self._connect(gid, capacity)
+                        self._connect_to_substation(self._get_lines(i),
+                                                    capacity)
 
                     self._update_availability(gid)
         else:
@@ -528,7 +760,7 @@ class TransmissionFeatures:
             Cost of transmission in $/MW, if None indicates connection is
             NOT possible
         """
-        feature_type = self[gid]['type']
+        feature_type = self._type_names[self._get_index(gid)]
         line_cost = self._line_cost
         if feature_type == 'transline':
             tie_in_cost = self._line_tie_in_cost
@@ -554,6 +786,83 @@ class TransmissionFeatures:
 
         return cost
 
+    def feature_indices(self, gids):
+        """
+        Get the dense feature indices for an array of feature gids
+
+        Parameters
+        ----------
+        gids : ndarray
+            Feature gids
+
+        Returns
+        -------
+        idx : ndarray
+            Dense indices of features in the feature arrays
+        """
+        gids = np.asarray(gids).astype(np.int64)
+        bad = (gids < 0) | (gids >= len(self._index))
+        idx = np.full(len(gids), -1, dtype=np.int64)
+        idx[~bad] = self._index[gids[~bad]]
+        if np.any(idx < 0):
+            msg = ("Invalid feature gids {}"
+                   .format(np.unique(gids[idx < 0]).tolist()))
+            logger.error(msg)
+            raise HandlerKeyError(msg)
+
+        return idx
+
+    def costs(self, gids, distances, transmission_multiplier=1,
+              capacity=None):
+        """
+        Vectorized transmission costs for connecting to many features, gives
+        the same results as calling cost() for each connection.
+
+        Parameters
+        ----------
+        gids : ndarray
+            Feature gids to connect to
+        distances : ndarray
+            Distance to each feature in miles
+        transmission_multiplier : float | ndarray
+            Multiplier for region specific line cost increases
+        capacity : float | ndarray
+            Capacity needed in MW, if None DO NOT check if connection is
+            possible
+
+        Returns
+        -------
+        costs : ndarray
+            Cost of transmission in $/MW, NaN indicates connection is
+            NOT possible
+        """
+        idx = self.feature_indices(gids)
+        types = self._types[idx]
+        # tie-in costs in FEATURE_TYPES order, unknown types (-1) get 0
+        tie_in_costs = np.array([self._line_tie_in_cost,
+                                 self._station_tie_in_cost,
+                                 self._center_tie_in_cost,
+                                 self._sink_tie_in_cost, 0],
+                                dtype=np.float64)
+        if np.any(types < 0):
+            msg = ("Do not recognize feature types {}, tie_in_cost set to 0"
+                   .format(np.unique(self._type_names[idx[types < 0]])))
+            logger.warning(msg)
+            warn(msg, HandlerWarning)
+
+        tm = transmission_multiplier
+        distances = np.asarray(distances, dtype=np.float64)
+        costs = self._calc_cost(distances, line_cost=self._line_cost,
+                                tie_in_cost=tie_in_costs[types],
+                                transmission_multiplier=tm)
+        if capacity is not None:
+            avail_cap = self.available_capacities()[idx]
+            connectable = self._available_mask[self._gids[idx]]
+            connectable &= ~(np.asarray(capacity) > avail_cap)
+            costs[~connectable] = np.nan
+
+        return costs
+
     @classmethod
     def feature_capacity(cls, trans_table, available_capacity=0.1):
         """
@@ -562,7 +871,8 @@ class TransmissionFeatures:
         Parameters
         ----------
         trans_table : str | pandas.DataFrame
-            Path to .csv or .json containing supply curve transmission mapping
+            Path to .csv, .json, .h5, .parquet, or .feather
+            containing supply curve transmission mapping
         line_tie_in_cost : float
             Cost of connecting to a transmission line in $/MW
         line_cost : float
@@ -584,19 +894,14 @@ class TransmissionFeatures:
         """
         try:
             feature = cls(trans_table, available_capacity=available_capacity)
-
-            feature_cap = {}
-            for gid, _ in feature._features.items():
-                feature_cap[gid] = feature.available_capacity(gid)
+            feature_cap = feature.available_capacities()
         except Exception:
             logger.exception("Error computing available capacity for all "
                              "features in {}".format(cls))
             raise
 
-        feature_cap = pd.Series(feature_cap)
-        feature_cap.name = 'avail_cap'
-        feature_cap.index.name = 'trans_line_gid'
-        feature_cap = feature_cap.to_frame().reset_index()
+        feature_cap = pd.DataFrame({'trans_line_gid': feature.feature_gids,
+                                    'avail_cap': feature_cap})
 
         return feature_cap
 
@@ -618,14 +923,12 @@ class TransmissionCosts(TransmissionFeatures):
         Returns
         -------
         features : dict
-            Nested dictionary of features (lines, substations, loadcenters)
-            lines : {capacity}
-            substations : {lines}
-            loadcenters : {capacity}
+            Dictionary of feature arrays:
+            gid : feature gids
+            type : feature type names
+            avail_cap : pre-computed available capacity
+            lines : empty line lists (capacity is already computed)
         """
-
-        features = {}
-
         if 'avail_cap' not in trans_table:
             kwargs = {'available_capacity': self._available_capacity_frac}
             fc = TransmissionFeatures.feature_capacity(trans_table,
@@ -633,31 +936,15 @@ class TransmissionCosts(TransmissionFeatures):
             trans_table = trans_table.merge(fc, on='trans_line_gid')
 
         trans_features = trans_table.groupby('trans_line_gid').first()
-        for gid, feature in trans_features.iterrows():
-            name = feature['category'].lower()
-            feature_dict = {'type': name, 'avail_cap': feature['avail_cap']}
-            features[gid] = feature_dict
+        names = trans_features['category'].str.lower().values
+        avail_cap = trans_features['avail_cap'].values.astype(np.float64)
+        features = {'gid': trans_features.index.values.astype(np.int64),
+                    'type': names,
+                    'avail_cap': avail_cap,
+                    'lines': [[]] * len(names)}
 
         return features
 
-    def available_capacity(self, gid):
-        """
-        Get available capacity for given line
-
-        Parameters
-        ----------
-        gid : int
-            Unique id of feature of interest
-
-        Returns
-        -------
-        avail_cap : float
-            Available capacity = capacity * available fraction
-            default = 10%
-        """
-
-        return self[gid]['avail_cap']
-
     @classmethod
     def feature_costs(cls, trans_table, capacity=None, line_tie_in_cost=14000,
                       line_cost=3667, station_tie_in_cost=0,
@@ -669,10 +956,11 @@ class TransmissionCosts(TransmissionFeatures):
         Parameters
         ----------
         trans_table : str | pandas.DataFrame
-            Path to .csv or .json containing supply curve transmission mapping
-        capacity : float
-            Capacity needed in MW, if None DO NOT check if connection is
-            possible
+            Path to .csv, .json, .h5, .parquet, or .feather
+            containing supply curve transmission mapping
+        capacity : float | ndarray
+            Capacity needed in MW (scalar or one value per trans_table row),
+            if None DO NOT check if connection is possible
         line_tie_in_cost : float
             Cost of connecting to a transmission line in $/MW
         line_cost : float
@@ -693,9 +981,10 @@ class TransmissionCosts(TransmissionFeatures):
         Returns
         -------
         cost : ndarray
-            Cost of transmission in $/MW, if None indicates connection is
+            Cost of transmission in $/MW, if NaN indicates connection is
             NOT possible
         """
+        trans_table = cls._parse_table(trans_table)
         try:
             feature = cls(trans_table,
                           line_tie_in_cost=line_tie_in_cost,
@@ -706,12 +995,14 @@ class TransmissionCosts(TransmissionFeatures):
                           available_capacity=available_capacity,
                           line_limited=line_limited)
 
-            costs = []
-            for _, row in trans_table.iterrows():
-                tm = row.get('transmission_multiplier', 1)
-                costs.append(feature.cost(row['trans_line_gid'],
-                                          row['dist_mi'], capacity=capacity,
-                                          transmission_multiplier=tm))
+            tm = 1
+            if 'transmission_multiplier' in trans_table:
+                tm = trans_table['transmission_multiplier'].values
+
+            costs = feature.costs(trans_table['trans_line_gid'].values,
+                                  trans_table['dist_mi'].values,
+                                  transmission_multiplier=tm,
+                                  capacity=capacity)
         except Exception:
             logger.exception("Error computing costs for all connections in {}"
                              .format(cls))
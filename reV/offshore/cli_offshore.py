@@ -109,6 +109,7 @@ def from_config(ctx, config_file, verbose):
                            offshore_fpath=config.offshore_fpath,
                            points=config.project_points,
                            sam_files=config.sam_files,
+                           projection=config.projection,
                            logdir=config.logdir,
                            verbose=verbose)
 
@@ -119,6 +120,7 @@ def from_config(ctx, config_file, verbose):
             ctx.obj['OFFSHORE_FPATH'] = config.offshore_fpath
             ctx.obj['PROJECT_POINTS'] = config.project_points
             ctx.obj['SAM_FILES'] = config.sam_files
+            ctx.obj['PROJECTION'] = config.projection
             ctx.obj['OUT_DIR'] = config.dirout
             ctx.obj['LOG_DIR'] = config.logdir
             ctx.obj['VERBOSE'] = verbose
@@ -143,19 +145,24 @@ def from_config(ctx, config_file, verbose):
                     'Default is slice(0, 100)'))
 @click.option('--sam_files', '-sf', required=True, type=SAMFILES,
               help='SAM config files (required) (str, dict, or list).')
+@click.option('--projection', '-pr', type=STR, default='latlon',
+              help='Coordinate space for the nearest neighbor mapping of '
+              'resource pixels to wind farms: "latlon", "ecef" or '
+              '"equal_area". Default is "latlon".')
 @click.option('--log_dir', '-ld', type=STR, default='./logs/',
               help='Directory to save offshore logs.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
 @click.pass_context
 def direct(ctx, gen_fpath, offshore_fpath, points, sam_files,
-           log_dir, verbose):
+           projection, log_dir, verbose):
     """Main entry point to run offshore wind aggregation"""
     name = ctx.obj['NAME']
     ctx.obj['GEN_FPATH'] = gen_fpath
     ctx.obj['OFFSHORE_FPATH'] = offshore_fpath
     ctx.obj['POINTS'] = points
     ctx.obj['SAM_FILES'] = sam_files
+    ctx.obj['PROJECTION'] = projection
     ctx.obj['OUT_DIR'] = os.path.dirname(gen_fpath)
     ctx.obj['LOG_DIR'] = log_dir
     ctx.obj['VERBOSE'] = verbose
@@ -169,7 +176,7 @@ def direct(ctx, gen_fpath, offshore_fpath, points, sam_files,
 
         try:
             Offshore.run(gen_fpath, offshore_fpath, points, sam_files,
-                         fpath_out=fpath_out)
+                         fpath_out=fpath_out, projection=projection)
         except Exception as e:
             logger.exception('Offshore module failed, received the '
                              'following exception:\n{}'.format(e))
@@ -186,13 +193,14 @@ def direct(ctx, gen_fpath, offshore_fpath, points, sam_files,
 
 
 def get_node_cmd(name, gen_fpath, offshore_fpath, points, sam_files,
-                 log_dir, verbose):
+                 projection, log_dir, verbose):
     """Get a CLI call command for the offshore aggregation cli."""
 
     args = ['-gf {}'.format(SLURM.s(gen_fpath)),
             '-of {}'.format(SLURM.s(offshore_fpath)),
             '-pp {}'.format(SLURM.s(points)),
             '-sf {}'.format(SLURM.s(sam_files)),
+            '-pr {}'.format(SLURM.s(projection)),
             '-ld {}'.format(SLURM.s(log_dir)),
             ]
 
@@ -232,6 +240,7 @@ def slurm(ctx, alloc, feature, memory, walltime, module, conda_env,
     offshore_fpath = ctx.obj['OFFSHORE_FPATH']
     project_points = ctx.obj['PROJECT_POINTS']
     sam_files = ctx.obj['SAM_FILES']
+    projection = ctx.obj['PROJECTION']
     log_dir = ctx.obj['LOG_DIR']
     out_dir = ctx.obj['OUT_DIR']
     verbose = ctx.obj['VERBOSE']
@@ -240,7 +249,7 @@ def slurm(ctx, alloc, feature, memory, walltime, module, conda_env,
         stdout_path = os.path.join(log_dir, 'stdout/')
 
     cmd = get_node_cmd(name, gen_fpath, offshore_fpath, project_points,
-                       sam_files, log_dir, verbose)
+                       sam_files, projection, log_dir, verbose)
     slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
     if slurm_manager is None:
         slurm_manager = SLURM()
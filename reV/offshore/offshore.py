@@ -20,6 +20,9 @@ from reV.generation.generation import Gen
 from reV.handlers.collection import DatasetCollector
 from reV.handlers.outputs import Outputs
 from reV.offshore.orca import ORCA_LCOE
+from reV.utilities.coordinates import (check_projection,
+                                       get_projection_center,
+                                       project_lat_lon, projected_to_km)
 from reV.utilities.exceptions import (OffshoreWindInputWarning,
                                       NearestNeighborError)
 
@@ -40,7 +43,7 @@ class Offshore:
     def __init__(self, gen_fpath, offshore_fpath, project_points,
                  max_workers=None, offshore_gid_adder=1e7,
                  farm_gid_label='wfarm_id', small_farm_limit=7,
-                 offshore_meta_cols=None):
+                 offshore_meta_cols=None, projection='latlon'):
         """
         Parameters
         ----------
@@ -65,8 +68,17 @@ class Offshore:
             Column labels from offshore_fpath to preserve in the output
             meta data. None will use class variable DEFAULT_META_COLS, and any
             additional requested cols will be added to DEFAULT_META_COLS.
+        projection : str
+            Coordinate space for the nearest neighbor mapping of resource
+            pixels to wind farms. "latlon" (default) uses un-projected
+            coordinates in decimal degrees, "ecef" uses 3D earth-centered
+            coordinates on a sphere and "equal_area" uses a lambert azimuthal
+            equal area projection centered on the wind farms. Distances for
+            "ecef" and "equal_area" are in km.
         """
 
+        check_projection(projection)
+        self._projection = projection
         self._gen_fpath = gen_fpath
         self._offshore_fpath = offshore_fpath
         self._project_points = project_points
@@ -215,21 +227,34 @@ class Offshore:
         -------
         d : np.ndarray
             Distance between offshore resource pixel and offshore wind farm.
+            Decimal degrees for the "latlon" projection and km otherwise.
         i : np.ndarray
             Offshore farm row numbers corresponding to resource pixels
             (length is number of offshore resource pixels in gen_fpath).
         d_lim : float
             Maximum distance limit between wind farm points and resouce pixels.
         """
-        # pylint: disable=not-callable
-        tree = cKDTree(self._farm_coords)
+        farm_coords = self._farm_coords.values
         lat_lon_cols = get_lat_lon_cols(self.meta_source_offshore)
-        d, i = tree.query(self.meta_source_offshore[lat_lon_cols])
+        res_coords = self.meta_source_offshore[lat_lon_cols].values
+
+        center = None
+        if self._projection == 'equal_area':
+            center = get_projection_center(farm_coords)
+
+        farm_coords = project_lat_lon(farm_coords, self._projection, center)
+        res_coords = project_lat_lon(res_coords, self._projection, center)
+
+        # pylint: disable=not-callable
+        tree = cKDTree(farm_coords)
+        d, i = tree.query(res_coords)
+        d = projected_to_km(d, self._projection)
 
         d_lim = 0
-        if len(self._farm_coords) > 1:
-            d_lim, _ = tree.query(self._farm_coords, k=2)
-            d_lim = 0.5 * np.median(d_lim[:, 1])
+        if len(farm_coords) > 1:
+            d_lim, _ = tree.query(farm_coords, k=2)
+            d_lim = 0.5 * np.median(projected_to_km(d_lim[:, 1],
+                                                    self._projection))
             i[(d > d_lim)] = -1
 
         return d, i, d_lim
@@ -798,7 +823,8 @@ class Offshore:
     @classmethod
     def run(cls, gen_fpath, offshore_fpath, points, sam_files, fpath_out=None,
             max_workers=None, offshore_gid_adder=1e7, small_farm_limit=7,
-            farm_gid_label='wfarm_id', sub_dir='chunk_files'):
+            farm_gid_label='wfarm_id', sub_dir='chunk_files',
+            projection='latlon'):
         """Run the offshore aggregation methods.
 
         Parameters
@@ -830,6 +856,9 @@ class Offshore:
             Label in offshore_fpath for the wind farm gid unique identifier.
         sub_dir : str | None
             Sub directory name to move chunks to. None to not move files.
+        projection : str
+            Coordinate space for the nearest neighbor mapping of resource
+            pixels to wind farms, see reV.utilities.coordinates.PROJECTIONS.
 
         Returns
         -------
@@ -843,7 +872,8 @@ class Offshore:
                        offshore_gid_adder=offshore_gid_adder,
                        small_farm_limit=small_farm_limit,
                        farm_gid_label=farm_gid_label,
-                       max_workers=max_workers)
+                       max_workers=max_workers,
+                       projection=projection)
 
         if any(offshore.offshore_gids):
             offshore._run()
@@ -31,6 +31,7 @@ class Pipeline:
                 'offshore',
                 'collect',
                 'multi-year',
+                'exclusions',
                 'supply-curve-aggregation',
                 'supply-curve',
                 'rep-profiles',
@@ -478,7 +479,9 @@ class Pipeline:
         out = []
         if target == 'fpath':
             for status in job_statuses:
-                out.append(os.path.join(status['dirout'], status['fout']))
+                fout = status['fout']
+                fout = [fout] if isinstance(fout, str) else fout
+                out += [os.path.join(status['dirout'], fn) for fn in fout]
         else:
             for status in job_statuses:
                 out.append(status[target])
@@ -15,6 +15,7 @@ from rex.utilities.loggers import init_logger, init_mult
 from rex.utilities.utilities import dict_str_load, get_class_properties
 
 from reV.config.qa_qc_config import QaQcConfig
+from reV.handlers.h5_pool import H5FilePool
 from reV.pipeline.status import Status
 from reV.qa_qc.qa_qc import QaQc
 from reV.qa_qc.summary import (SummarizeH5, SummarizeSupplyCurve,
@@ -394,6 +395,11 @@ def from_config(ctx, config_file, verbose):
     # Instantiate the config object
     config = QaQcConfig(config_file)
 
+    # chunk cache and handle pool settings are inherited by the local
+    # workers and the submitted hpc jobs through the environment
+    H5FilePool.configure_from_dict(
+        config.execution_control.h5_chunk_cache)
+
     # take name from config if not default
     if config.name.lower() != 'rev':
         name = config.name
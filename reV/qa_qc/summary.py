@@ -9,6 +9,8 @@ import pandas as pd
 import plotting as mplt
 import plotly.express as px
 
+from reV.handlers.h5_pool import PooledResource
+
 from rex import Resource
 from rex.utilities import SpawnProcessPool, parse_table
 
@@ -72,7 +74,7 @@ class SummarizeH5:
         if sites is None:
             sites = slice(None)
 
-        with Resource(h5_file, group=group) as f:
+        with PooledResource(h5_file, group=group) as f:
             sites_meta = f['meta', sites]
             sites_data = f[ds_name, :, sites]
 
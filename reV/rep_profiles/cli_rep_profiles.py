@@ -10,6 +10,7 @@ import pprint
 import time
 
 from reV.config.rep_profiles_config import RepProfilesConfig
+from reV.handlers.h5_pool import H5FilePool
 from reV.pipeline.status import Status
 from reV.rep_profiles.rep_profiles import RepProfiles, AggregatedRepProfiles
 from reV import __version__
@@ -66,6 +67,11 @@ def from_config(ctx, config_file, verbose):
     # Instantiate the config object
     config = RepProfilesConfig(config_file)
 
+    # chunk cache and handle pool settings are inherited by the local
+    # workers and the submitted hpc jobs through the environment
+    H5FilePool.configure_from_dict(
+        config.execution_control.h5_chunk_cache)
+
     # take name from config if not default
     if config.name.lower() != 'rev':
         name = config.name
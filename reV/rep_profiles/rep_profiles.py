@@ -17,6 +17,7 @@ from scipy import stats
 from warnings import warn
 
 
+from reV.handlers.h5_pool import PooledResource
 from reV.handlers.outputs import Outputs
 from reV.utilities.exceptions import FileInputError, DataShapeError
 
@@ -347,7 +348,7 @@ class RegionRepProfile:
         """
         if self._source_profiles is None:
             gen_gids = self._get_region_attr(self._rev_summary, self._gid_col)
-            with Resource(self._gen_fpath) as res:
+            with PooledResource(self._gen_fpath) as res:
                 self._source_profiles = res[self._cf_dset, :, gen_gids]
 
         return self._source_profiles
@@ -5,5 +5,6 @@ reV Supply Curve
 from .aggregation import Aggregation
 from .exclusions import ExclusionMask, ExclusionMaskFromDict
 from .sc_aggregation import SupplyCurveAggregation
+from .sc_scenarios import SupplyCurveScenarios
 from .supply_curve import SupplyCurve
 from .tech_mapping import TechMapping
@@ -5,18 +5,24 @@ reV aggregation framework.
 from abc import ABC, abstractmethod, abstractstaticmethod
 from concurrent.futures import as_completed
 import h5py
+import json
 import logging
 import numpy as np
 import os
 import pandas as pd
+from scipy import sparse
+from warnings import warn
 
 from reV.handlers.outputs import Outputs
 from reV.handlers.exclusions import ExclusionLayers
+from reV.handlers.h5_pool import PooledResource
+from reV.handlers.tables import ColumnarTableSink
 from reV.supply_curve.exclusions import ExclusionMaskFromDict
 from reV.supply_curve.points import (SupplyCurveExtent,
                                      AggregationSupplyCurvePoint)
 from reV.utilities.exceptions import (EmptySupplyCurvePointError,
-                                      FileInputError, SupplyCurveInputError)
+                                      FileInputError, InputWarning,
+                                      SupplyCurveInputError)
 
 from rex.resource import Resource
 from rex.utilities.execution import SpawnProcessPool
@@ -28,8 +34,14 @@ logger = logging.getLogger(__name__)
 class AbstractAggFileHandler(ABC):
     """Simple framework to handle aggregation file context managers."""
 
+    # default byte budget of the exclusion layer tile cache shared by all
+    # the supply curve points aggregated with this handler
+    TILE_CACHE_SIZE = 128 * 1024 ** 2
+
     def __init__(self, excl_fpath, excl_dict=None, area_filter_kernel='queen',
-                 min_area=None, check_excl_layers=False):
+                 min_area=None, check_excl_layers=False,
+                 tile_cache_size=TILE_CACHE_SIZE, area_filter=None,
+                 use_precomputed_mask=False):
         """
         Parameters
         ----------
@@ -44,13 +56,25 @@ class AbstractAggFileHandler(ABC):
         check_excl_layers : bool
             Run a pre-flight check on each exclusion layer to ensure they
             contain un-excluded values
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        area_filter : dict | None
+            Contiguous area filter labels of the full exclusion extent
+            computed once in the parent process (see
+            ExclusionMask.area_filter). None will label the contiguous
+            areas in this process if min_area is set.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
         """
 
         self._excl_fpath = excl_fpath
-        self._excl = ExclusionMaskFromDict(excl_fpath, layers_dict=excl_dict,
-                                           min_area=min_area,
-                                           kernel=area_filter_kernel,
-                                           check_layers=check_excl_layers)
+        self._excl = ExclusionMaskFromDict(
+            excl_fpath, layers_dict=excl_dict, min_area=min_area,
+            kernel=area_filter_kernel, check_layers=check_excl_layers,
+            tile_cache_size=tile_cache_size, area_filter=area_filter,
+            use_precomputed=use_precomputed_mask)
 
     def __enter__(self):
         return self
@@ -92,7 +116,9 @@ class AggFileHandler(AbstractAggFileHandler):
 
     def __init__(self, excl_fpath, h5_fpath, excl_dict=None,
                  area_filter_kernel='queen', min_area=None,
-                 check_excl_layers=False):
+                 check_excl_layers=False,
+                 tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                 area_filter=None, use_precomputed_mask=False):
         """
         Parameters
         ----------
@@ -109,13 +135,25 @@ class AggFileHandler(AbstractAggFileHandler):
         check_excl_layers : bool
             Run a pre-flight check on each exclusion layer to ensure they
             contain un-excluded values
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        area_filter : dict | None
+            Pre-computed contiguous area filter labels, see
+            AbstractAggFileHandler.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
         """
         super().__init__(excl_fpath, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
-                         check_excl_layers=check_excl_layers)
+                         check_excl_layers=check_excl_layers,
+                         tile_cache_size=tile_cache_size,
+                         area_filter=area_filter,
+                         use_precomputed_mask=use_precomputed_mask)
 
-        self._h5 = Resource(h5_fpath)
+        self._h5 = PooledResource(h5_fpath)
 
     @property
     def h5(self):
@@ -138,10 +176,14 @@ class AggFileHandler(AbstractAggFileHandler):
 class AbstractAggregation(ABC):
     """Abstract supply curve points aggregation framework based on only an
     exclusion file and techmap."""
+    # number of streamed SC points written to disk per batch
+    STREAM_BATCH_ROWS = 10000
 
     def __init__(self, excl_fpath, tm_dset, excl_dict=None,
                  area_filter_kernel='queen', min_area=None,
-                 check_excl_layers=False, resolution=64, gids=None):
+                 check_excl_layers=False, resolution=64, gids=None,
+                 tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                 use_precomputed_mask=False):
         """
         Parameters
         ----------
@@ -165,6 +207,17 @@ class AbstractAggregation(ABC):
         gids : list | None
             List of gids to get summary for (can use to subset if running in
             parallel), or None for all gids in the SC extent.
+        tile_cache_size : int | None
+            Byte budget of the exclusion layer tile cache, by default
+            AbstractAggFileHandler.TILE_CACHE_SIZE. Every parallel worker
+            has its own cache. None or 0 disables the cache.
+        use_precomputed_mask : bool
+            Flag to read the inclusion mask from the layer persisted by
+            ExclusionMaskFromDict.build_mask for these exclusion inputs if
+            it exists in excl_fpath instead of re-computing it. The
+            persisted mask is not checked against the exclusion layers and
+            must be rebuilt (overwrite=True) whenever a layer changes, by
+            default False.
         """
 
         self._excl_fpath = excl_fpath
@@ -174,6 +227,8 @@ class AbstractAggregation(ABC):
         self._area_filter_kernel = area_filter_kernel
         self._min_area = min_area
         self._check_excl_layers = check_excl_layers
+        self._tile_cache_size = tile_cache_size
+        self._use_precomputed_mask = use_precomputed_mask
         if check_excl_layers:
             logger.debug('Exclusions layers will be checked for un-excluded '
                          'values!')
@@ -201,12 +256,221 @@ class AbstractAggregation(ABC):
                                      .format(self._tm_dset,
                                              self._excl_fpath))
 
+    @property
+    def _signature_inputs(self):
+        """Inputs that determine the aggregation results of a SC point.
+
+        Returns
+        -------
+        inputs : dict
+            Mapping of input name to input value, filepaths are listed in
+            the "files" entry.
+        """
+        return {'files': {'excl_fpath': self._excl_fpath},
+                'tm_dset': self._tm_dset,
+                'excl_dict': self._excl_dict,
+                'resolution': self._resolution,
+                'area_filter_kernel': self._area_filter_kernel,
+                'min_area': self._min_area}
+
+    def _get_signature(self, **run_inputs):
+        """Get a signature of the aggregation inputs used to validate a
+        checkpoint before resuming from it.
+
+        Parameters
+        ----------
+        run_inputs : dict
+            Additional run method inputs that determine the aggregation
+            results, e.g. the agg_method.
+
+        Returns
+        -------
+        signature : str
+            Serialized aggregation inputs with the path, size and
+            modification time of the input files.
+        """
+        inputs = self._signature_inputs
+        inputs.update(run_inputs)
+        files = {}
+        for name, fps in inputs.pop('files').items():
+            if isinstance(fps, str):
+                fps = [fps]
+
+            if fps is not None:
+                fps = [[os.path.abspath(fp), os.path.getsize(fp),
+                        os.path.getmtime(fp)] for fp in fps]
+
+            files[name] = fps
+
+        inputs['files'] = files
+        inputs['class'] = self.__class__.__name__
+
+        return json.dumps(inputs, sort_keys=True, default=str)
+
+    def _open_sink(self, stream_fpath, chunks, resume=False, **run_inputs):
+        """Open a sink to stream the worker results to and remove the SC
+        point blocks that were completed by a previous run.
+
+        Parameters
+        ----------
+        stream_fpath : str
+            .h5 filepath to stream the worker results to.
+        chunks : list
+            List of SC point gid blocks to be summarized.
+        resume : bool
+            Flag to keep the results in an existing stream_fpath and skip
+            the SC points that they completed. A stream_fpath written with
+            different inputs is discarded.
+        run_inputs : dict
+            Additional run method inputs that determine the aggregation
+            results, stored in the sink signature (see _get_signature).
+
+        Returns
+        -------
+        sink : ColumnarTableSink
+            Open sink, the SC point gids of each block are recorded as the
+            completed task ids.
+        chunks : list
+            List of SC point gid blocks that still need to be summarized.
+        """
+        signature = self._get_signature(**run_inputs)
+        mode = 'a' if resume and os.path.exists(stream_fpath) else 'w'
+        if (mode == 'a' and ColumnarTableSink.read_signature(stream_fpath)
+                != signature):
+            msg = ('Checkpoint {} was written with different aggregation '
+                   'inputs, discarding it and starting over.'
+                   .format(stream_fpath))
+            logger.warning(msg)
+            warn(msg, InputWarning)
+            mode = 'w'
+
+        sink = ColumnarTableSink(stream_fpath, mode=mode,
+                                 batch_rows=self.STREAM_BATCH_ROWS,
+                                 signature=signature)
+        logger.info('Streaming aggregation results to: {}'
+                    .format(stream_fpath))
+
+        if mode == 'a':
+            completed = sink.completed
+            chunks = [gid_set[~np.isin(gid_set, completed)]
+                      for gid_set in chunks]
+            chunks = [gid_set for gid_set in chunks if len(gid_set)]
+            logger.info('Resuming from {}: {} SC points were completed by '
+                        'a previous run, {} blocks remaining.'
+                        .format(stream_fpath, len(completed), len(chunks)))
+
+        return sink, chunks
+
+    def _get_area_filter(self):
+        """Label the contiguous areas of the full exclusion extent once for
+        the min_area filter so that the labels can be passed to the parallel
+        workers instead of being relabeled by every worker.
+
+        Returns
+        -------
+        area_filter : dict | None
+            Contiguous area filter labels (see ExclusionMask.area_filter),
+            None if min_area is not set or if the exclusions are read from a
+            pre-computed inclusion mask (see use_precomputed_mask)
+        """
+        if self._min_area is None:
+            return None
+
+        upm = self._use_precomputed_mask
+        with ExclusionMaskFromDict(self._excl_fpath,
+                                   layers_dict=self._excl_dict,
+                                   min_area=self._min_area,
+                                   kernel=self._area_filter_kernel,
+                                   use_precomputed=upm) as f:
+            if f.mask_dset is not None:
+                return None
+
+            return f.area_filter
+
+    def _get_chunks(self, chunk_point_len=1000):
+        """Split the SC gids into the chunks processed by the parallel
+        workers. Chunks are full-width contiguous area filter bands when
+        min_area is set so that each band is read and filtered by a single
+        worker.
+
+        Parameters
+        ----------
+        chunk_point_len : int
+            Number of SC points to process on a single parallel worker.
+
+        Returns
+        -------
+        chunks : list
+            List of arrays of SC gids, one array per chunk.
+        """
+        if self._min_area is None:
+            return np.array_split(
+                self._gids, int(np.ceil(len(self._gids) / chunk_point_len)))
+
+        with SupplyCurveExtent(self._excl_fpath,
+                               resolution=self._resolution) as sc:
+            rows = sc.points.loc[self._gids, 'row_ind'].values
+
+        band = (rows * self._resolution
+                // ExclusionMaskFromDict.AREA_FILTER_BAND_SIZE)
+        _, band, counts = np.unique(band, return_inverse=True,
+                                    return_counts=True)
+        order = np.argsort(band, kind='stable')
+
+        return np.split(self._gids[order], np.cumsum(counts)[:-1])
+
+    def _run_blocks(self, chunks, args, kwargs, max_workers=None,
+                    loggers=None):
+        """Run run_serial() on each block of SC gids, in this process if
+        max_workers == 1 and on a process pool otherwise.
+
+        Parameters
+        ----------
+        chunks : list
+            List of arrays of SC gids, one array per block.
+        args : tuple
+            Positional args for run_serial()
+        kwargs : dict
+            Keyword args for run_serial() except gids.
+        max_workers : int | None
+            Number of cores to run on. None is all available cpus.
+        loggers : list | None
+            Loggers to initialize on the parallel workers.
+
+        Yields
+        ------
+        gid_set : np.ndarray
+            SC gids of a completed block.
+        out : object
+            Output of run_serial() for the block.
+        """
+        if max_workers == 1:
+            for i, gid_set in enumerate(chunks):
+                out = self.run_serial(*args, gids=gid_set, **kwargs)
+                logger.info('Serial aggregation blocks completed: {} out '
+                            'of {}'.format(i + 1, len(chunks)))
+                yield gid_set, out
+
+            return
+
+        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
+            futures = {exe.submit(self.run_serial, *args, gids=gid_set,
+                                  **kwargs): gid_set
+                       for gid_set in chunks}
+
+            for i, future in enumerate(as_completed(futures)):
+                logger.info('Parallel aggregation futures collected: {} out '
+                            'of {}'.format(i + 1, len(chunks)))
+                yield futures[future], future.result()
+
     @abstractstaticmethod
     def run_serial(sc_point_method, excl_fpath, tm_dset,
                    excl_dict=None, area_filter_kernel='queen',
                    min_area=None, check_excl_layers=False,
                    resolution=64, gids=None, args=None,
-                   kwargs=None):
+                   kwargs=None,
+                   tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                   area_filter=None, use_precomputed_mask=False):
         """Standalone method to create agg summary - can be parallelized.
 
         Parameters
@@ -237,6 +501,15 @@ class AbstractAggregation(ABC):
             List of positional args for sc_point_method
         kwargs : dict | None
             Dict of kwargs for sc_point_method
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        area_filter : dict | None
+            Pre-computed contiguous area filter labels, see
+            AbstractAggFileHandler.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
 
         Returns
         -------
@@ -260,7 +533,10 @@ class AbstractAggregation(ABC):
         file_kwargs = {'excl_dict': excl_dict,
                        'area_filter_kernel': area_filter_kernel,
                        'min_area': min_area,
-                       'check_excl_layers': check_excl_layers}
+                       'check_excl_layers': check_excl_layers,
+                       'tile_cache_size': tile_cache_size,
+                       'area_filter': area_filter,
+                       'use_precomputed_mask': use_precomputed_mask}
         # pylint: disable=abstract-class-instantiated
         with AbstractAggFileHandler(excl_fpath, **file_kwargs) as fh:
 
@@ -313,8 +589,7 @@ class AbstractAggregation(ABC):
             List of outputs from sc_point_method.
         """
 
-        chunks = np.array_split(
-            self._gids, int(np.ceil(len(self._gids) / chunk_point_len)))
+        chunks = self._get_chunks(chunk_point_len=chunk_point_len)
 
         logger.info('Running supply curve point aggregation for '
                     'points {} through {} at a resolution of {} '
@@ -322,34 +597,23 @@ class AbstractAggregation(ABC):
                     .format(self._gids[0], self._gids[-1], self._resolution,
                             max_workers, len(chunks)))
 
-        n_finished = 0
-        futures = []
+        serial_kwargs = {'excl_dict': self._excl_dict,
+                         'area_filter_kernel': self._area_filter_kernel,
+                         'min_area': self._min_area,
+                         'check_excl_layers': self._check_excl_layers,
+                         'resolution': self._resolution,
+                         'args': args,
+                         'kwargs': kwargs,
+                         'tile_cache_size': self._tile_cache_size,
+                         'area_filter': self._get_area_filter(),
+                         'use_precomputed_mask': self._use_precomputed_mask}
+
         output = []
         loggers = [__name__, 'reV.supply_curve.points', 'reV']
-        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
-
-            # iterate through split executions, submitting each to worker
-            for gid_set in chunks:
-                # submit executions and append to futures list
-                futures.append(exe.submit(
-                    self.run_serial,
-                    sc_point_method, self._excl_fpath, self._tm_dset,
-                    excl_dict=self._excl_dict,
-                    area_filter_kernel=self._area_filter_kernel,
-                    min_area=self._min_area,
-                    check_excl_layers=self._check_excl_layers,
-                    resolution=self._resolution,
-                    gids=gid_set,
-                    args=args,
-                    kwargs=kwargs))
-
-            # gather results
-            for future in as_completed(futures):
-                n_finished += 1
-                logger.info('Parallel aggregation futures collected: '
-                            '{} out of {}'
-                            .format(n_finished, len(chunks)))
-                output += future.result()
+        for _, out in self._run_blocks(
+                chunks, (sc_point_method, self._excl_fpath, self._tm_dset),
+                serial_kwargs, max_workers=max_workers, loggers=loggers):
+            output += out
 
         return output
 
@@ -379,6 +643,7 @@ class AbstractAggregation(ABC):
             max_workers = os.cpu_count()
 
         if max_workers == 1:
+            upm = self._use_precomputed_mask
             agg = self.run_serial(sc_point_method, self._excl_fpath,
                                   self._tm_dset,
                                   excl_dict=self._excl_dict,
@@ -388,7 +653,9 @@ class AbstractAggregation(ABC):
                                   resolution=self._resolution,
                                   gids=self._gids,
                                   args=args,
-                                  kwargs=kwargs)
+                                  kwargs=kwargs,
+                                  tile_cache_size=self._tile_cache_size,
+                                  use_precomputed_mask=upm)
         else:
             agg = self.run_parallel(sc_point_method, args=args,
                                     kwargs=kwargs, max_workers=max_workers,
@@ -406,7 +673,9 @@ class AbstractAggregation(ABC):
     def run(cls, excl_fpath, tm_dset, sc_point_method, excl_dict=None,
             area_filter_kernel='queen', min_area=None,
             check_excl_layers=False, resolution=64, gids=None,
-            args=None, kwargs=None, max_workers=None, chunk_point_len=1000):
+            args=None, kwargs=None, max_workers=None, chunk_point_len=1000,
+            tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+            use_precomputed_mask=False):
         """Get the supply curve points aggregation summary.
 
         Parameters
@@ -444,6 +713,12 @@ class AbstractAggregation(ABC):
             available cpus.
         chunk_point_len : int
             Number of SC points to process on a single parallel worker.
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
 
         Returns
         -------
@@ -454,7 +729,8 @@ class AbstractAggregation(ABC):
         agg = cls(excl_fpath, tm_dset, excl_dict=excl_dict,
                   area_filter_kernel=area_filter_kernel, min_area=min_area,
                   check_excl_layers=check_excl_layers, resolution=resolution,
-                  gids=gids)
+                  gids=gids, tile_cache_size=tile_cache_size,
+                  use_precomputed_mask=use_precomputed_mask)
 
         aggregation = agg.aggregate(sc_point_method, args=args, kwargs=kwargs,
                                     max_workers=max_workers,
@@ -466,11 +742,19 @@ class AbstractAggregation(ABC):
 class Aggregation(AbstractAggregation):
     """Concrete but generalized aggregation framework to aggregate ANY reV h5
     file to a supply curve grid (based on an aggregated exclusion grid)."""
+    # aggregated profiles are streamed with the meta so keep batches small
+    STREAM_BATCH_ROWS = 1000
+    # max number of source sites read at once when streaming over time
+    STREAM_MAX_SITES = 10000
+    # time steps per read when streaming un-chunked datasets over time
+    STREAM_TIME_STEPS = 8760
 
     def __init__(self, excl_fpath, h5_fpath, tm_dset, *agg_dset,
                  excl_dict=None, area_filter_kernel='queen', min_area=None,
                  check_excl_layers=False, resolution=64, excl_area=None,
-                 gids=None):
+                 gids=None,
+                 tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                 use_precomputed_mask=False):
         """
         Parameters
         ----------
@@ -501,12 +785,20 @@ class Aggregation(AbstractAggregation):
         gids : list | None
             List of gids to get aggregation for (can use to subset if running
             in parallel), or None for all gids in the SC extent.
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
         """
         super().__init__(excl_fpath, tm_dset, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
                          check_excl_layers=check_excl_layers,
-                         resolution=resolution, gids=gids)
+                         resolution=resolution, gids=gids,
+                         tile_cache_size=tile_cache_size,
+                         use_precomputed_mask=use_precomputed_mask)
 
         self._h5_fpath = h5_fpath
         if isinstance(agg_dset, str):
@@ -552,6 +844,22 @@ class Aggregation(AbstractAggregation):
                                          ' in h5 file: {}'
                                          .format(dset, self._h5_fpath))
 
+    @property
+    def _signature_inputs(self):
+        """Inputs that determine the aggregation results of a SC point.
+
+        Returns
+        -------
+        inputs : dict
+            Mapping of input name to input value, filepaths are listed in
+            the "files" entry.
+        """
+        inputs = super()._signature_inputs
+        inputs['files']['h5_fpath'] = self._h5_fpath
+        inputs['agg_dsets'] = self._agg_dsets
+
+        return inputs
+
     @staticmethod
     def _parse_gen_index(h5_fpath):
         """Parse gen outputs for an array of generation gids corresponding to
@@ -570,21 +878,15 @@ class Aggregation(AbstractAggregation):
             generation run.
         """
 
-        with Resource(h5_fpath) as f:
-            gen_index = f.meta
+        res_gids = None
+        with Outputs(h5_fpath, mode='r') as f:
+            if 'gid' in f.meta_columns:
+                res_gids = f.get_meta_arr('gid').astype(np.int64)
 
-        if 'gid' in gen_index:
-            gen_index = gen_index.rename(columns={'gid': 'res_gids'})
-            gen_index['gen_gids'] = gen_index.index
-            gen_index = gen_index[['res_gids', 'gen_gids']]
-            gen_index = gen_index.set_index(keys='res_gids')
-            gen_index = \
-                gen_index.reindex(range(int(gen_index.index.max() + 1)))
-            gen_index = gen_index['gen_gids'].values
-            gen_index[np.isnan(gen_index)] = -1
-            gen_index = gen_index.astype(np.int32)
-        else:
-            gen_index = None
+        gen_index = None
+        if res_gids is not None:
+            gen_index = np.full(int(res_gids.max() + 1), -1, dtype=np.int32)
+            gen_index[res_gids] = np.arange(len(res_gids), dtype=np.int32)
 
         return gen_index
 
@@ -593,7 +895,9 @@ class Aggregation(AbstractAggregation):
                    agg_method='mean', excl_dict=None,
                    area_filter_kernel='queen', min_area=None,
                    check_excl_layers=False, resolution=64, excl_area=0.0081,
-                   gids=None, gen_index=None):
+                   gids=None, gen_index=None,
+                   tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                   area_filter=None, use_precomputed_mask=False):
         """
         Standalone method to aggregate - can be parallelized.
 
@@ -631,6 +935,15 @@ class Aggregation(AbstractAggregation):
             Array of generation gids with array index equal to resource gid.
             Array value is -1 if the resource index was not used in the
             generation run.
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        area_filter : dict | None
+            Pre-computed contiguous area filter labels, see
+            AbstractAggFileHandler.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
 
         Returns
         -------
@@ -646,7 +959,10 @@ class Aggregation(AbstractAggregation):
         file_kwargs = {'excl_dict': excl_dict,
                        'area_filter_kernel': area_filter_kernel,
                        'min_area': min_area,
-                       'check_excl_layers': check_excl_layers}
+                       'check_excl_layers': check_excl_layers,
+                       'tile_cache_size': tile_cache_size,
+                       'area_filter': area_filter,
+                       'use_precomputed_mask': use_precomputed_mask}
         dsets = agg_dset + ('meta', )
         agg_out = {ds: [] for ds in dsets}
         with AggFileHandler(excl_fpath, h5_fpath, **file_kwargs) as fh:
@@ -684,10 +1000,179 @@ class Aggregation(AbstractAggregation):
 
         return agg_out
 
+    @staticmethod
+    def run_serial_weights(
+            excl_fpath, h5_fpath, tm_dset, excl_dict=None,
+            area_filter_kernel='queen', min_area=None,
+            check_excl_layers=False, resolution=64, excl_area=0.0081,
+            gids=None, gen_index=None,
+            tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+            area_filter=None, use_precomputed_mask=False):
+        """
+        Standalone method to get the meta data and h5 gid aggregation
+        weights of SC points without reading any h5 datasets - can be
+        parallelized.
+
+        Parameters
+        ----------
+        excl_fpath : str
+            Filepath to exclusions h5 with techmap dataset.
+        h5_fpath : str
+            Filepath to .h5 file to aggregate
+        tm_dset : str
+            Dataset name in the techmap file containing the
+            exclusions-to-resource mapping data.
+        excl_dict : dict | None
+            Dictionary of exclusion LayerMask arugments {layer: {kwarg: value}}
+        area_filter_kernel : str
+            Contiguous area filter method to use on final exclusions mask
+        min_area : float | None
+            Minimum required contiguous area filter in sq-km
+        check_excl_layers : bool
+            Run a pre-flight check on each exclusion layer to ensure they
+            contain un-excluded values
+        resolution : int | None
+            SC resolution, must be input in combination with gid. Prefered
+            option is to use the row/col slices to define the SC point instead.
+        excl_area : float
+            Area of an exclusion cell (square km).
+        gids : list | None
+            List of gids to get weights for (can use to subset if running in
+            parallel), or None for all gids in the SC extent.
+        gen_index : np.ndarray
+            Array of generation gids with array index equal to resource gid.
+            Array value is -1 if the resource index was not used in the
+            generation run.
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        area_filter : dict | None
+            Pre-computed contiguous area filter labels, see
+            AbstractAggFileHandler.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
+
+        Returns
+        -------
+        out : dict
+            Lists of the meta data ("meta"), h5 gids ("gids"), and h5 gid
+            weights ("weights") of each non-excluded SC point.
+        """
+        with SupplyCurveExtent(excl_fpath, resolution=resolution) as sc:
+            exclusion_shape = sc.exclusions.shape
+            if gids is None:
+                gids = sc.valid_sc_points(tm_dset)
+
+        file_kwargs = {'excl_dict': excl_dict,
+                       'area_filter_kernel': area_filter_kernel,
+                       'min_area': min_area,
+                       'check_excl_layers': check_excl_layers,
+                       'tile_cache_size': tile_cache_size,
+                       'area_filter': area_filter,
+                       'use_precomputed_mask': use_precomputed_mask}
+        out = {'meta': [], 'gids': [], 'weights': []}
+        with AggFileHandler(excl_fpath, h5_fpath, **file_kwargs) as fh:
+            for gid in gids:
+                try:
+                    gid_out = AggregationSupplyCurvePoint.run_weights(
+                        gid,
+                        fh.exclusions,
+                        fh.h5,
+                        tm_dset,
+                        excl_dict=excl_dict,
+                        resolution=resolution,
+                        excl_area=excl_area,
+                        exclusion_shape=exclusion_shape,
+                        close=False,
+                        gen_index=gen_index)
+
+                except EmptySupplyCurvePointError:
+                    logger.debug('SC gid {} is fully excluded or does not '
+                                 'have any valid source data!'.format(gid))
+                except Exception:
+                    logger.exception('SC gid {} failed!'.format(gid))
+                    raise
+                else:
+                    for k, v in gid_out.items():
+                        out[k].append(v)
+
+        return out
+
+    @staticmethod
+    def _stream_chunk(sink, gid_set, chunk_out):
+        """Append the aggregation results of one chunk of SC points to a
+        stream sink.
+
+        Parameters
+        ----------
+        sink : ColumnarTableSink
+            Open sink to stream the results to.
+        gid_set : np.ndarray
+            SC point gids in the chunk, recorded as completed.
+        chunk_out : dict
+            Aggregated values for each aggregation dataset from run_serial
+        """
+        meta = chunk_out.pop('meta')
+        arrays = None
+        if meta:
+            arrays = {k: np.asarray(v) for k, v in chunk_out.items()}
+
+        sink.append([m.to_dict() for m in meta], task_ids=gid_set,
+                    arrays=arrays)
+
+    def _read_stream(self, stream_fpath):
+        """Read the aggregation results streamed to a sink file
+
+        Parameters
+        ----------
+        stream_fpath : str
+            Sink .h5 filepath.
+
+        Returns
+        -------
+        agg_out : dict
+            Aggregated values for each aggregation dataset sorted by SC
+            point gid.
+        """
+        records = ColumnarTableSink.read_records(stream_fpath)
+        arrays = ColumnarTableSink.read_arrays(stream_fpath)
+        order = np.argsort([r['sc_point_gid'] for r in records],
+                           kind='stable')
+
+        agg_out = {'meta': [pd.Series(records[i]) for i in order]}
+        for dset in self._agg_dsets:
+            agg_out[dset] = list(arrays[dset][order]) if records else []
+
+        return agg_out
+
+    @staticmethod
+    def _format_meta(meta):
+        """Convert the SC point meta data series to a meta DataFrame
+
+        Parameters
+        ----------
+        meta : list
+            List of meta data pandas Series, one for each SC point.
+
+        Returns
+        -------
+        meta : pd.DataFrame
+            Meta data sorted by sc_point_gid with an sc_gid column.
+        """
+        meta = pd.concat(meta, axis=1).T
+        meta = meta.sort_values('sc_point_gid')
+        meta = meta.reset_index(drop=True)
+        meta.index.name = 'sc_gid'
+
+        return meta.reset_index()
+
     def run_parallel(self, agg_method='mean', excl_area=0.0081,
-                     max_workers=None, chunk_point_len=1000):
+                     max_workers=None, chunk_point_len=1000,
+                     stream_fpath=None, resume=False):
         """
-        Aggregate in parallel
+        Aggregate in parallel, or chunk by chunk in this process if
+        max_workers == 1.
 
         Parameters
         ----------
@@ -700,14 +1185,29 @@ class Aggregation(AbstractAggregation):
             available cpus.
         chunk_point_len : int
             Number of SC points to process on a single parallel worker.
+        stream_fpath : str | None
+            Optional .h5 filepath to stream the aggregated meta and values
+            of each completed chunk to (see ColumnarTableSink). This keeps
+            partial results on disk if the job is killed and records the
+            completed chunks as a checkpoint for resume.
+        resume : bool
+            Flag to skip the chunks that were checkpointed in an existing
+            stream_fpath by a previous run. A checkpoint written with
+            different inputs is discarded. Ignored if stream_fpath is None.
 
         Returns
         -------
         agg_out : dict
             Aggregated values for each aggregation dataset
         """
-        chunks = np.array_split(
-            self._gids, int(np.ceil(len(self._gids) / chunk_point_len)))
+        chunks = self._get_chunks(chunk_point_len=chunk_point_len)
+
+        sink = None
+        if stream_fpath is not None:
+            sink, chunks = self._open_sink(stream_fpath, chunks,
+                                           resume=resume,
+                                           agg_method=agg_method,
+                                           excl_area=excl_area)
 
         logger.info('Running supply curve point aggregation for '
                     'points {} through {} at a resolution of {} '
@@ -715,45 +1215,50 @@ class Aggregation(AbstractAggregation):
                     .format(self._gids[0], self._gids[-1], self._resolution,
                             max_workers, len(chunks)))
 
-        n_finished = 0
-        futures = []
+        serial_kwargs = {'agg_method': agg_method,
+                         'excl_dict': self._excl_dict,
+                         'area_filter_kernel': self._area_filter_kernel,
+                         'min_area': self._min_area,
+                         'check_excl_layers': self._check_excl_layers,
+                         'resolution': self._resolution,
+                         'excl_area': excl_area,
+                         'gen_index': self._gen_index,
+                         'tile_cache_size': self._tile_cache_size,
+                         'area_filter': self._get_area_filter(),
+                         'use_precomputed_mask': self._use_precomputed_mask}
+        args = (self._excl_fpath, self._h5_fpath, self._tm_dset,
+                *self._agg_dsets)
+
         dsets = self._agg_dsets + ('meta', )
         agg_out = {ds: [] for ds in dsets}
         loggers = [__name__, 'reV.supply_curve.points', 'reV']
-        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
-            # iterate through split executions, submitting each to worker
-            for gid_set in chunks:
-                # submit executions and append to futures list
-                futures.append(exe.submit(
-                    self.run_serial,
-                    self._excl_fpath,
-                    self._h5_fpath,
-                    self._tm_dset,
-                    *self._agg_dsets,
-                    agg_method=agg_method,
-                    excl_dict=self._excl_dict,
-                    area_filter_kernel=self._area_filter_kernel,
-                    min_area=self._min_area,
-                    check_excl_layers=self._check_excl_layers,
-                    resolution=self._resolution,
-                    excl_area=excl_area,
-                    gids=gid_set,
-                    gen_index=self._gen_index))
-
-            # gather results
-            for future in futures:
-                n_finished += 1
-                logger.info('Parallel aggregation futures collected: '
-                            '{} out of {}'
-                            .format(n_finished, len(chunks)))
-                for k, v in future.result().items():
+        try:
+            for gid_set, out in self._run_blocks(chunks, args, serial_kwargs,
+                                                 max_workers=max_workers,
+                                                 loggers=loggers):
+                if sink is not None:
+                    self._stream_chunk(sink, gid_set, out)
+                    continue
+
+                for k, v in out.items():
                     if v:
                         agg_out[k].extend(v)
+        finally:
+            if sink is not None:
+                sink.flush()
+
+        if sink is not None:
+            agg_out = self._read_stream(stream_fpath)
+        else:
+            # blocks are collected as they complete
+            order = np.argsort([m['sc_point_gid'] for m in agg_out['meta']],
+                               kind='stable')
+            agg_out = {k: [v[i] for i in order] for k, v in agg_out.items()}
 
         return agg_out
 
     def aggregate(self, agg_method='mean', max_workers=None,
-                  chunk_point_len=1000):
+                  chunk_point_len=1000, stream_fpath=None, resume=False):
         """
         Aggregate with given agg_method
 
@@ -766,6 +1271,12 @@ class Aggregation(AbstractAggregation):
             available cpus.
         chunk_point_len : int
             Number of SC points to process on a single parallel worker.
+        stream_fpath : str | None
+            Optional .h5 filepath to checkpoint the results to, see
+            run_parallel().
+        resume : bool
+            Flag to skip the chunks checkpointed to stream_fpath by a
+            previous run with the same inputs.
 
         Returns
         -------
@@ -775,7 +1286,8 @@ class Aggregation(AbstractAggregation):
         if max_workers is None:
             max_workers = os.cpu_count()
 
-        if max_workers == 1:
+        if max_workers == 1 and stream_fpath is None:
+            upm = self._use_precomputed_mask
             agg = self.run_serial(self._excl_fpath,
                                   self._h5_fpath,
                                   self._tm_dset,
@@ -787,12 +1299,16 @@ class Aggregation(AbstractAggregation):
                                   check_excl_layers=self._check_excl_layers,
                                   resolution=self._resolution,
                                   excl_area=self._excl_area,
-                                  gen_index=self._gen_index)
+                                  gen_index=self._gen_index,
+                                  tile_cache_size=self._tile_cache_size,
+                                  use_precomputed_mask=upm)
         else:
             agg = self.run_parallel(agg_method=agg_method,
                                     excl_area=self._excl_area,
                                     max_workers=max_workers,
-                                    chunk_point_len=chunk_point_len)
+                                    chunk_point_len=chunk_point_len,
+                                    stream_fpath=stream_fpath,
+                                    resume=resume)
 
         if not agg['meta']:
             e = ('Supply curve aggregation found no non-excluded SC points. '
@@ -802,11 +1318,7 @@ class Aggregation(AbstractAggregation):
 
         for k, v in agg.items():
             if k == 'meta':
-                v = pd.concat(v, axis=1).T
-                v = v.sort_values('sc_point_gid')
-                v = v.reset_index(drop=True)
-                v.index.name = 'sc_gid'
-                agg[k] = v.reset_index()
+                agg[k] = self._format_meta(v)
             else:
                 v = np.dstack(v)[0]
                 if v.shape[0] == 1:
@@ -829,6 +1341,28 @@ class Aggregation(AbstractAggregation):
         """
         agg_out = aggregation.copy()
         meta = agg_out.pop('meta')
+        shapes = {dset: data.shape for dset, data in agg_out.items()}
+        self._init_h5(out_fpath, meta, shapes)
+
+        with Outputs(out_fpath, mode='a') as out:
+            for dset, data in agg_out.items():
+                out[dset] = data
+
+    def _init_h5(self, out_fpath, meta, shapes):
+        """
+        Initialize the aggregation output .h5 file with the attributes,
+        chunks, and dtypes of the source datasets.
+
+        Parameters
+        ----------
+        out_fpath : str
+            Output .h5 file path
+        meta : pd.DataFrame
+            Aggregated meta data.
+        shapes : dict
+            Output shape of each aggregation dataset.
+        """
+        meta = meta.copy()
         for c in meta.columns:
             try:
                 meta[c] = pd.to_numeric(meta[c])
@@ -836,17 +1370,14 @@ class Aggregation(AbstractAggregation):
                 pass
 
         dsets = []
-        shapes = {}
         attrs = {}
         chunks = {}
         dtypes = {}
         time_index = None
         with Resource(self._h5_fpath) as f:
-            for dset, data in agg_out.items():
+            for dset, shape in shapes.items():
                 dsets.append(dset)
-                shape = data.shape
-                shapes[dset] = shape
-                if len(data.shape) == 2:
+                if len(shape) == 2:
                     if ('time_index' in f) and (shape[0] == f.shape[0]):
                         if time_index is None:
                             time_index = f.time_index
@@ -859,16 +1390,400 @@ class Aggregation(AbstractAggregation):
         Outputs.init_h5(out_fpath, dsets, shapes, attrs, chunks, dtypes,
                         meta, time_index=time_index)
 
-        with Outputs(out_fpath, mode='a') as out:
-            for dset, data in agg_out.items():
-                out[dset] = data
+    @staticmethod
+    def _check_agg_method(agg_method):
+        """Parse the aggregation method for time streamed aggregation
+
+        Parameters
+        ----------
+        agg_method : str
+            Aggregation method, either mean, sum/aggregate, or wind_dir
+
+        Returns
+        -------
+        agg_method : str
+            "mean", "sum", or "wind_dir"
+        """
+        if agg_method.lower().startswith('mean'):
+            agg_method = 'mean'
+        elif agg_method.lower().startswith(('sum', 'agg')):
+            agg_method = 'sum'
+        elif 'wind_dir' in agg_method.lower():
+            agg_method = 'wind_dir'
+        else:
+            msg = ('Aggregation method must be either mean, '
+                   'sum/aggregate, or wind_dir')
+            logger.error(msg)
+            raise ValueError(msg)
+
+        return agg_method
+
+    def _run_weights_parallel(self, max_workers=None, chunk_point_len=1000,
+                              **kwargs):
+        """Get the meta data and h5 gid weights of the SC points in parallel
+
+        Parameters
+        ----------
+        max_workers : int | None
+            Number of cores to run on. None is all available cpus.
+        chunk_point_len : int
+            Number of SC points to process on a single parallel worker.
+        kwargs : dict
+            Keyword arguments for run_serial_weights()
+
+        Returns
+        -------
+        out : dict
+            Lists of the meta data ("meta"), h5 gids ("gids"), and h5 gid
+            weights ("weights") of each non-excluded SC point.
+        """
+        chunks = self._get_chunks(chunk_point_len=chunk_point_len)
+
+        kwargs['area_filter'] = self._get_area_filter()
+        out = {'meta': [], 'gids': [], 'weights': []}
+        loggers = [__name__, 'reV.supply_curve.points', 'reV']
+        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
+            futures = [exe.submit(self.run_serial_weights, self._excl_fpath,
+                                  self._h5_fpath, self._tm_dset,
+                                  gids=gid_set, **kwargs)
+                       for gid_set in chunks]
+
+            for i, future in enumerate(as_completed(futures)):
+                logger.info('Parallel aggregation weights futures '
+                            'collected: {} out of {}'
+                            .format(i + 1, len(chunks)))
+                for k, v in future.result().items():
+                    out[k].extend(v)
+
+        return out
+
+    @staticmethod
+    def _weight_matrix(gids, weights):
+        """Build a sparse matrix of the h5 gid weights of each SC point
+
+        Parameters
+        ----------
+        gids : list
+            Sorted unique h5 gids of each SC point.
+        weights : list
+            Inclusion weights of the h5 gids of each SC point.
+
+        Returns
+        -------
+        used : np.ndarray
+            Sorted unique h5 gids used by any SC point.
+        matrix : scipy.sparse.csr_matrix
+            (n_points, n_used) matrix of the weight of each used h5 gid in
+            each SC point.
+        """
+        rows = np.repeat(np.arange(len(gids)), [len(g) for g in gids])
+        used, cols = np.unique(np.concatenate(gids), return_inverse=True)
+        matrix = sparse.csr_matrix((np.concatenate(weights), (rows, cols)),
+                                   shape=(len(gids), len(used)))
+
+        return used, matrix
+
+    def _get_weights(self, max_workers=None, chunk_point_len=1000):
+        """Get the meta data and the h5 gid weights of all SC points
+
+        Parameters
+        ----------
+        max_workers : int | None
+            Number of cores to run on. None is all available cpus.
+        chunk_point_len : int
+            Number of SC points to process on a single parallel worker.
+
+        Returns
+        -------
+        meta : pd.DataFrame
+            Meta data of the non-excluded SC points sorted by sc_point_gid.
+        used : np.ndarray
+            Sorted unique h5 gids used by any SC point.
+        matrix : scipy.sparse.csr_matrix
+            (n_points, n_used) matrix of the weight of each used h5 gid in
+            each SC point (rows in the order of meta).
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        kwargs = {'excl_dict': self._excl_dict,
+                  'area_filter_kernel': self._area_filter_kernel,
+                  'min_area': self._min_area,
+                  'check_excl_layers': self._check_excl_layers,
+                  'tile_cache_size': self._tile_cache_size,
+                  'use_precomputed_mask': self._use_precomputed_mask,
+                  'resolution': self._resolution,
+                  'excl_area': self._excl_area,
+                  'gen_index': self._gen_index}
+        if max_workers == 1:
+            out = self.run_serial_weights(self._excl_fpath, self._h5_fpath,
+                                          self._tm_dset, gids=self._gids,
+                                          **kwargs)
+        else:
+            out = self._run_weights_parallel(max_workers=max_workers,
+                                             chunk_point_len=chunk_point_len,
+                                             **kwargs)
+
+        if not out['meta']:
+            e = ('Supply curve aggregation found no non-excluded SC points. '
+                 'Please check your exclusions or subset SC GID selection.')
+            logger.error(e)
+            raise EmptySupplyCurvePointError(e)
+
+        order = np.argsort([m['sc_point_gid'] for m in out['meta']],
+                           kind='stable')
+        meta = self._format_meta([out['meta'][i] for i in order])
+        used, matrix = self._weight_matrix([out['gids'][i] for i in order],
+                                           [out['weights'][i] for i in order])
+
+        return meta, used, matrix
+
+    def _site_blocks(self, used, matrix, site_chunk):
+        """Split the used h5 gids into blocks of sites that are read at once.
+        Blocks start at a site chunk boundary and span at most
+        STREAM_MAX_SITES sites (rounded up to whole site chunks).
+
+        Parameters
+        ----------
+        used : np.ndarray
+            Sorted unique h5 gids used by any SC point.
+        matrix : scipy.sparse.csr_matrix
+            (n_points, n_used) matrix of the h5 gid weights.
+        site_chunk : int
+            Number of sites in each chunk of the h5 dataset.
+
+        Returns
+        -------
+        blocks : list
+            List of (site_slice, cols, weights) for each block where
+            site_slice is the slice of sites to read, cols are the used
+            columns of the read data, and weights is the (n_points, n_cols)
+            weight matrix of the block.
+        """
+        block_size = int(np.ceil(self.STREAM_MAX_SITES / site_chunk))
+        block_size *= site_chunk
+        splits = np.flatnonzero(np.diff(used // block_size)) + 1
+        matrix = matrix.tocsc()
+
+        blocks = []
+        for i0, i1 in zip(np.r_[0, splits], np.r_[splits, len(used)]):
+            s0 = used[i0] // site_chunk * site_chunk
+            blocks.append((slice(s0, used[i1 - 1] + 1),
+                           used[i0:i1] - s0,
+                           matrix[:, i0:i1].tocsr()))
+
+        return blocks
+
+    def _time_step(self, chunks, time_chunk=None):
+        """Get the number of time steps to aggregate at once
+
+        Parameters
+        ----------
+        chunks : tuple | None
+            Chunk shape of the h5 dataset.
+        time_chunk : int | None
+            Requested number of time steps, None will use the dataset time
+            chunk size.
+
+        Returns
+        -------
+        step : int
+            Number of time steps, a multiple of the dataset time chunk size
+            if the dataset is chunked.
+        """
+        if chunks is None:
+            return time_chunk or self.STREAM_TIME_STEPS
+
+        step = int(np.ceil((time_chunk or chunks[0]) / chunks[0]))
+
+        return step * chunks[0]
+
+    @staticmethod
+    def _agg_slab(res, dset, time_slice, blocks, agg_method):
+        """Get the weighted sums of a slab of h5 data for all SC points
+
+        Parameters
+        ----------
+        res : Resource
+            Open source h5 handler.
+        dset : str
+            Dataset to aggregate.
+        time_slice : slice | None
+            Time steps to aggregate, None for 1D datasets.
+        blocks : list
+            Site blocks from _site_blocks()
+        agg_method : str
+            "mean", "sum", or "wind_dir"
+
+        Returns
+        -------
+        sums : list
+            Weighted sums for each SC point (n_points, ) or
+            (n_points, n_time_steps). Sines and cosines for wind_dir, values
+            and non-NaN weights for the mean of 1D datasets.
+        """
+        sums = None
+        for site_slice, cols, weights in blocks:
+            if time_slice is None:
+                data = res[dset, site_slice][cols]
+            else:
+                data = res[dset, time_slice, site_slice][:, cols].T
+
+            data = data.astype(np.float64)
+            if agg_method == 'wind_dir':
+                data = np.radians(data)
+                arrays = (np.sin(data), np.cos(data))
+            elif agg_method == 'mean' and time_slice is None:
+                nan = np.isnan(data)
+                arrays = (np.where(nan, 0, data), (~nan).astype(np.float64))
+            else:
+                arrays = (data, )
+
+            block = [weights @ arr for arr in arrays]
+            if sums is None:
+                sums = block
+            else:
+                sums = [s + b for s, b in zip(sums, block)]
+
+        return sums
+
+    @staticmethod
+    def _finalize(sums, agg_method, denom):
+        """Get the aggregated values from the weighted sums
+
+        Parameters
+        ----------
+        sums : list
+            Weighted sums from _agg_slab()
+        agg_method : str
+            "mean", "sum", or "wind_dir"
+        denom : np.ndarray
+            Total inclusion weight of each SC point.
+
+        Returns
+        -------
+        out : np.ndarray
+            Aggregated float32 values (n_points, ) or
+            (n_time_steps, n_points)
+        """
+        if agg_method == 'wind_dir':
+            out = np.degrees(np.arctan2(sums[0], sums[1]))
+            out[out < 0] += 360
+        elif agg_method == 'mean':
+            if len(sums) == 2:
+                denom = sums[1]
+            else:
+                denom = denom.reshape((-1, ) + (1, ) * (sums[0].ndim - 1))
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                out = sums[0] / denom
+        else:
+            out = sums[0]
+
+        return out.T.astype(np.float32)
+
+    def _stream_dset(self, res, out, dset, used, matrix, agg_method,
+                     time_chunk=None):
+        """Aggregate a dataset in time chunks and write each chunk directly
+        to the output file
+
+        Parameters
+        ----------
+        res : Resource
+            Open source h5 handler.
+        out : Outputs
+            Open output h5 handler with initialized datasets.
+        dset : str
+            Dataset to aggregate.
+        used : np.ndarray
+            Sorted unique h5 gids used by any SC point.
+        matrix : scipy.sparse.csr_matrix
+            (n_points, n_used) matrix of the h5 gid weights.
+        agg_method : str
+            "mean", "sum", or "wind_dir"
+        time_chunk : int | None
+            Number of time steps to aggregate at once, None will use the
+            dataset time chunk size.
+        """
+        shape, _, chunks = res.get_dset_properties(dset)
+        blocks = self._site_blocks(used, matrix, chunks[-1] if chunks else 1)
+        denom = np.asarray(matrix.sum(axis=1)).ravel()
+
+        if len(shape) == 1:
+            sums = self._agg_slab(res, dset, None, blocks, agg_method)
+            out[dset] = self._finalize(sums, agg_method, denom)
+            return
+
+        step = self._time_step(chunks, time_chunk)
+        for t0 in range(0, shape[0], step):
+            time_slice = slice(t0, min(t0 + step, shape[0]))
+            sums = self._agg_slab(res, dset, time_slice, blocks, agg_method)
+            out[dset, time_slice, slice(None)] = self._finalize(
+                sums, agg_method, denom)
+            logger.debug('Aggregated "{}" time steps {} through {} out of {}'
+                         .format(dset, time_slice.start, time_slice.stop,
+                                 shape[0]))
+
+    def aggregate_to_h5(self, out_fpath, agg_method='mean', max_workers=None,
+                        chunk_point_len=1000, time_chunk=None):
+        """
+        Aggregate with given agg_method streaming over time chunks and write
+        the aggregated data directly to an output .h5 file. The SC point
+        weights of each h5 gid are computed first, then each dataset is read
+        in time chunks aligned to its h5 chunks so that every used h5 gid
+        column is read once for all SC points and the aggregated profiles
+        never have to fit in memory.
+
+        Parameters
+        ----------
+        out_fpath : str
+            Output .h5 file path
+        agg_method : str
+            Aggregation method, either mean, sum/aggregate, or wind_dir
+        max_workers : int | None
+            Number of cores to compute the SC point weights on. None is all
+            available cpus.
+        chunk_point_len : int
+            Number of SC points to process on a single parallel worker.
+        time_chunk : int | None
+            Number of time steps to aggregate at once (rounded up to whole
+            dataset time chunks). None will use the dataset time chunk
+            size.
+
+        Returns
+        -------
+        meta : pd.DataFrame
+            Aggregated meta data that was written to out_fpath.
+        """
+        agg_method = self._check_agg_method(agg_method)
+        meta, used, matrix = self._get_weights(
+            max_workers=max_workers, chunk_point_len=chunk_point_len)
+        logger.info('Streaming aggregation of {} SC points from {} source '
+                    'sites to: {}'.format(len(meta), len(used), out_fpath))
+
+        with Resource(self._h5_fpath) as f:
+            shapes = {dset: f.get_dset_properties(dset)[0][:-1]
+                      + (len(meta), ) for dset in self._agg_dsets}
+
+        self._init_h5(out_fpath, meta, shapes)
+
+        with Resource(self._h5_fpath) as f:
+            with Outputs(out_fpath, mode='a') as out:
+                for dset in self._agg_dsets:
+                    self._stream_dset(f, out, dset, used, matrix, agg_method,
+                                      time_chunk=time_chunk)
+
+        return meta
 
     @classmethod
     def run(cls, excl_fpath, h5_fpath, tm_dset, *agg_dset,
             excl_dict=None, area_filter_kernel='queen', min_area=None,
             check_excl_layers=False, resolution=64, gids=None,
             agg_method='mean', excl_area=None, max_workers=None,
-            chunk_point_len=1000, out_fpath=None):
+            chunk_point_len=1000, out_fpath=None, stream_fpath=None,
+            resume=False, stream_time=False, time_chunk=None,
+            tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+            use_precomputed_mask=False):
         """Get the supply curve points aggregation summary.
 
         Parameters
@@ -909,21 +1824,61 @@ class Aggregation(AbstractAggregation):
             Number of SC points to process on a single parallel worker.
         out_fpath : str
             Output .h5 file path
+        stream_fpath : str | None
+            Optional .h5 filepath to stream the parallel results to as each
+            chunk of SC points completes. The file keeps the partial results
+            if the job is killed and is a checkpoint for resume.
+        resume : bool
+            Flag to resume a killed job from the checkpoint in stream_fpath,
+            the chunks that it completed are not aggregated again. A
+            checkpoint written with different inputs is discarded.
+        stream_time : bool
+            Flag to aggregate the datasets in time chunks and write them
+            directly to out_fpath (see aggregate_to_h5()) instead of holding
+            all aggregated values in memory, e.g. for high resolution
+            profiles. Requires out_fpath, stream_fpath and resume are
+            ignored.
+        time_chunk : int | None
+            Number of time steps to aggregate at once if stream_time is
+            True (rounded up to whole dataset time chunks). None will use
+            the dataset time chunk size.
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
 
         Returns
         -------
         agg : dict
-            Aggregated values for each aggregation dataset
+            Aggregated values for each aggregation dataset, only the
+            aggregated "meta" if stream_time is True.
         """
+        if stream_time and out_fpath is None:
+            msg = 'Aggregation with stream_time=True requires an out_fpath!'
+            logger.error(msg)
+            raise SupplyCurveInputError(msg)
 
         agg = cls(excl_fpath, h5_fpath, tm_dset, *agg_dset,
                   excl_dict=excl_dict, area_filter_kernel=area_filter_kernel,
                   min_area=min_area, check_excl_layers=check_excl_layers,
-                  resolution=resolution, gids=gids, excl_area=excl_area)
+                  resolution=resolution, gids=gids, excl_area=excl_area,
+                  tile_cache_size=tile_cache_size,
+                  use_precomputed_mask=use_precomputed_mask)
+
+        if stream_time:
+            meta = agg.aggregate_to_h5(out_fpath, agg_method=agg_method,
+                                       max_workers=max_workers,
+                                       chunk_point_len=chunk_point_len,
+                                       time_chunk=time_chunk)
+            return {'meta': meta}
 
         aggregation = agg.aggregate(agg_method=agg_method,
                                     max_workers=max_workers,
-                                    chunk_point_len=chunk_point_len)
+                                    chunk_point_len=chunk_point_len,
+                                    stream_fpath=stream_fpath,
+                                    resume=resume)
 
         if out_fpath is not None:
             agg.save_agg_to_h5(out_fpath, aggregation)
@@ -0,0 +1,772 @@
+# -*- coding: utf-8 -*-
+"""reV supply curve block summary framework.
+
+Summarize many supply curve points at once using a sparse matrix of
+inclusion weights instead of one SupplyCurvePointSummary per point.
+"""
+import logging
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from warnings import warn
+
+from reV.handlers.exclusions import ExclusionLayers
+from reV.supply_curve.data_layers import DataLayerAggregation
+from reV.supply_curve.point_summary import SupplyCurvePointSummary
+from reV.supply_curve.points import AggregationSupplyCurvePoint
+from reV.utilities.exceptions import (FileInputError, InputWarning,
+                                      OutputWarning, reVDeprecationWarning)
+
+logger = logging.getLogger(__name__)
+
+
+class SupplyCurveBlockSummary:
+    """
+    Summarize a rectangular block of supply curve points at once.
+
+    Each supply curve point and resource class bin in the block is a row of
+    a sparse (SC point x generation gid) matrix holding the sum of the
+    inclusion values of the exclusion pixels that map to each generation
+    gid. Exclusion weighted means of generation data (mean_cf, mean_lcoe,
+    mean_res, h5_dsets) are sparse matrix-vector products for all points
+    in the block. Outputs match SupplyCurvePointSummary.summarize() to
+    floating point precision.
+    """
+
+    def __init__(self, gids, excl, gen, tm_dset, gen_index, res_data=None,
+                 res_class_bins=None, excl_area=0.0081, power_density=None,
+                 cf_data=None, lcoe_data=None, h5_dsets_data=None,
+                 resolution=64, exclusion_shape=None, offshore_flags=None,
+                 friction_layer=None):
+        """
+        Parameters
+        ----------
+        gids : list | np.ndarray
+            SC point gids to summarize. Any set of gids is allowed but the
+            exclusion data is read for their bounding box so gids should be
+            spatially contiguous (see get_blocks).
+        excl : ExclusionMask
+            Open exclusions mask handler.
+        gen : Resource | MultiFileResource
+            Open reV generation (and econ) output handler.
+        tm_dset : str
+            Dataset name in the exclusions file containing the
+            exclusions-to-resource mapping data.
+        gen_index : np.ndarray
+            Array of generation gids with array index equal to resource gid.
+            Array value is -1 if the resource index was not used in the
+            generation run.
+        res_data : np.ndarray | None
+            Pre-extracted resource data used for resource classes and
+            mean_res. None if no resource classes.
+        res_class_bins : list | None
+            List of two-entry lists dictating the resource class bins.
+            None if no resource classes.
+        excl_area : float
+            Area of an exclusion cell (square km).
+        power_density : float | None | pd.DataFrame
+            Constant power density float, None, or opened dataframe with
+            (resource) "gid" and "power_density columns".
+        cf_data : np.ndarray | None
+            Pre-extracted capacity factor data.
+        lcoe_data : np.ndarray | None
+            Pre-extracted LCOE data.
+        h5_dsets_data : dict | None
+            Pre-extracted data for any additional h5 datasets to summarize,
+            keyed by dataset name.
+        resolution : int
+            Number of exclusion points per SC point along an axis.
+        exclusion_shape : tuple | None
+            Shape of the full exclusions extent (rows, cols).
+        offshore_flags : np.ndarray | None
+            Array of offshore boolean flags if available from wind generation
+            data. None if offshore flag is not available.
+        friction_layer : None | FrictionMask
+            Friction layer with scalar friction values if valid friction inputs
+            were entered. Otherwise, None to not apply friction layer.
+        """
+        self._excl = excl
+        self._gen = gen
+        self._res_data = res_data
+        self._res_class_bins = res_class_bins or [None]
+        self._excl_area = excl_area
+        self._power_density = power_density
+        self._cf_data = cf_data
+        self._lcoe_data = lcoe_data
+        self._h5_dsets_data = h5_dsets_data
+        self._resolution = resolution
+        self._friction_layer = friction_layer
+
+        if exclusion_shape is None:
+            exclusion_shape = excl.shape
+
+        self._shape = tuple(exclusion_shape)
+        self._n_sc_cols = int(np.ceil(self._shape[1] / resolution))
+        self._gids = np.unique(np.asarray(gids, dtype=np.int64))
+        self._parse_block()
+
+        res_gids = self._to_points(self._excl.excl_h5[tm_dset, self._rows,
+                                                      self._cols],
+                                   fill=-1).astype(np.int32)
+        self._excl_data = self._to_points(self._excl[self._rows, self._cols],
+                                          fill=0)
+        self._excl_data[res_gids == -1] = 0.0
+        if self._excl_data.max() > 1:
+            w = ('Exclusions data max value is > 1: {}'
+                 .format(self._excl_data.max()))
+            logger.warning(w)
+            warn(w, InputWarning)
+
+        self._gen_gids, self._res_gids = \
+            AggregationSupplyCurvePoint._map_gen_gids(res_gids, gen_index)
+        self._remove_offshore(offshore_flags)
+        self._build_matrix()
+
+    def _parse_block(self):
+        """Get the SC row/col indices of the gids and the exclusion row/col
+        slices of the block bounding box."""
+        res = self._resolution
+        n_sc_rows = int(np.ceil(self._shape[0] / res))
+        if self._gids[0] < 0 or self._gids[-1] >= n_sc_rows * self._n_sc_cols:
+            msg = ('Gids {} out of bounds for extent shape {} and resolution '
+                   '{}.'.format(self._gids, self._shape, res))
+            logger.error(msg)
+            raise IndexError(msg)
+
+        self._sc_rows = self._gids // self._n_sc_cols
+        self._sc_cols = self._gids % self._n_sc_cols
+        r0, c0 = self._sc_rows.min(), self._sc_cols.min()
+        self._block_shape = (self._sc_rows.max() - r0 + 1,
+                             self._sc_cols.max() - c0 + 1)
+        self._rows = slice(r0 * res, min((r0 + self._block_shape[0]) * res,
+                                         self._shape[0]))
+        self._cols = slice(c0 * res, min((c0 + self._block_shape[1]) * res,
+                                         self._shape[1]))
+        self._local = ((self._sc_rows - r0) * self._block_shape[1]
+                       + self._sc_cols - c0)
+        inside = np.ones((self._rows.stop - self._rows.start,
+                          self._cols.stop - self._cols.start), dtype=bool)
+        self._inside = self._to_points(inside, fill=False)
+
+    def _to_points(self, arr, fill):
+        """Reshape a 2D array covering the block bounding box to
+        (n_points, resolution ** 2). Each row has the pixels of one SC point
+        in row-major order, windows at the edge of the exclusion extent are
+        padded with fill.
+
+        Parameters
+        ----------
+        arr : np.ndarray
+            2D (or 3D with a leading axis of 1) array with the exclusion
+            data of the block bounding box.
+        fill : int | float | bool
+            Value used to pad windows at the edge of the exclusion extent.
+
+        Returns
+        -------
+        out : np.ndarray
+            2D array of pixel values for each SC point in the block.
+        """
+        res = self._resolution
+        n_rows, n_cols = self._block_shape
+        arr = arr.reshape(arr.shape[-2:])
+        out = np.full((n_rows * res, n_cols * res), fill, dtype=arr.dtype)
+        out[:arr.shape[0], :arr.shape[1]] = arr
+        out = out.reshape(n_rows, res, n_cols, res).transpose(0, 2, 1, 3)
+
+        return out.reshape(n_rows * n_cols, res * res)[self._local]
+
+    def _remove_offshore(self, offshore_flags):
+        """Remove offshore generation gids from the block"""
+        if offshore_flags is not None:
+            offshore = offshore_flags[self._gen_gids] == 1
+            offshore &= self._gen_gids != -1
+            self._gen_gids[offshore] = -1
+            self._res_gids[offshore] = -1
+
+    def _bin_exclusions(self, res_bin, index=slice(None)):
+        """Get the inclusion values and valid pixel mask of SC points for a
+        single resource class bin.
+
+        Parameters
+        ----------
+        res_bin : list | None
+            Two-entry list with the resource class bin bounds.
+        index : int | slice
+            Index of the SC points in the block, by default all points.
+
+        Returns
+        -------
+        excl_data : np.ndarray
+            Inclusion values with pixels outside of the resource bin set
+            to zero.
+        valid : np.ndarray
+            Boolean mask of included pixels with a valid generation gid.
+        """
+        excl_data = self._excl_data[index]
+        gen_gids = self._gen_gids[index]
+        exclude = excl_data == 0
+        if self._res_data is not None and res_bin is not None:
+            res = self._res_data[gen_gids]
+            exclude |= (res < np.min(res_bin)) | (res >= np.max(res_bin))
+
+        excl_data = np.where(exclude, 0, excl_data).astype(excl_data.dtype)
+        valid = ~exclude & (gen_gids != -1)
+
+        return excl_data, valid
+
+    def _build_matrix(self):
+        """Build the sparse (SC point/bin x gen gid) inclusion matrix. Matrix
+        entries are ordered by the first appearance of each gen gid in the
+        SC point (same order as SupplyCurvePointSummary gen/res gid sets)."""
+        n_bins = len(self._res_class_bins)
+        n_pixels = self._gen_gids.shape[1]
+        self._n_rows = len(self._gids) * n_bins
+
+        rows, pixels = [], []
+        for i, res_bin in enumerate(self._res_class_bins):
+            point, pixel = np.nonzero(self._bin_exclusions(res_bin)[1])
+            rows.append(point * n_bins + i)
+            pixels.append(point * n_pixels + pixel)
+
+        rows = np.concatenate(rows)
+        order = np.argsort(rows, kind='stable')
+        rows = rows[order]
+        pixels = np.concatenate(pixels)[order]
+        self._pixel_rows = rows
+        self._pixels = pixels
+
+        gen_gids = self._gen_gids.ravel()[pixels]
+        keys = rows * (len(self._gen.meta) + 1) + gen_gids
+        _, first, inverse = np.unique(keys, return_index=True,
+                                      return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        first = first[order]
+
+        weights = self._excl_data.ravel()[pixels].astype(np.float64)
+        data = np.bincount(rank[inverse], weights=weights,
+                           minlength=len(first))
+        self._pair_rows = rows[first]
+        self._pair_res_gids = self._res_gids.ravel()[pixels[first]]
+        indptr = np.zeros(self._n_rows + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(self._pair_rows,
+                                           minlength=self._n_rows))
+        self._matrix = sparse.csr_matrix((data, gen_gids[first], indptr),
+                                         shape=(self._n_rows,
+                                                len(self._gen.meta)))
+
+        self._n_gids = np.bincount(rows, minlength=self._n_rows)
+        self._out_rows = np.where(self._n_gids > 0)[0]
+        self._weight_sum = np.bincount(self._pair_rows, weights=data,
+                                       minlength=self._n_rows)
+
+    @property
+    def matrix(self):
+        """Sparse (SC point/bin x gen gid) matrix of summed inclusion values.
+        Row index is point_index * n_bins + res_class where point_index is
+        the position of the SC point in the sorted gids.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+        """
+        return self._matrix
+
+    @property
+    def sc_point_gids(self):
+        """SC point gid of each summarized (non-empty) row.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._gids[self._out_rows // len(self._res_class_bins)]
+
+    @property
+    def res_class(self):
+        """Resource class index of each summarized (non-empty) row.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._out_rows % len(self._res_class_bins)
+
+    @property
+    def area(self):
+        """Included area of each summarized row in square km.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._weight_sum[self._out_rows] * self._excl_area
+
+    @property
+    def n_gids(self):
+        """Number of included exclusion pixels of each summarized row.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._n_gids[self._out_rows]
+
+    def _split(self, arr):
+        """Split an array of matrix entries into lists for each summarized
+        row"""
+        indptr = self._matrix.indptr
+        return [arr[indptr[i]:indptr[i + 1]].tolist()
+                for i in self._out_rows]
+
+    def exclusion_weighted_mean(self, arr):
+        """Calc the exclusions-weighted mean of a flat array of gen data for
+        every summarized row.
+
+        Parameters
+        ----------
+        arr : np.ndarray
+            1D array with an entry for every site in the generation extent.
+
+        Returns
+        -------
+        mean : np.ndarray
+            Exclusions weighted mean of arr for each summarized row.
+        """
+        mean = self._matrix.dot(np.asarray(arr, dtype=np.float64))
+
+        return mean[self._out_rows] / self._weight_sum[self._out_rows]
+
+    def _pair_values(self, col):
+        """Get a gen meta column for each matrix entry"""
+        return self._gen.meta.loc[self._matrix.indices, col].values
+
+    def _meta_mode(self, col):
+        """Get the most common value (smallest value on ties) of a gen meta
+        column over the unique gen gids of each summarized row"""
+        if col not in self._gen.meta:
+            return None
+
+        codes, uniques = pd.factorize(self._pair_values(col), sort=True,
+                                      use_na_sentinel=False)
+        keys = self._pair_rows * len(uniques) + codes
+        keys, counts = np.unique(keys, return_counts=True)
+        rows, codes = np.divmod(keys, len(uniques))
+        order = np.lexsort((codes, -counts, rows))
+        first = np.r_[True, np.diff(rows[order]) != 0]
+        mode = np.empty(self._n_rows, dtype=object)
+        mode[rows[order][first]] = np.asarray(uniques)[codes[order][first]]
+
+        return mode[self._out_rows]
+
+    def _meta_mean(self, col):
+        """Get the mean of a gen meta column over the unique gen gids of each
+        summarized row"""
+        if col not in self._gen.meta:
+            return None
+
+        values = self._pair_values(col).astype(np.float64)
+        finite = ~np.isnan(values)
+        values = np.where(finite, values, 0)
+        total = np.bincount(self._pair_rows, weights=values,
+                            minlength=self._n_rows)
+        count = np.bincount(self._pair_rows, weights=finite,
+                            minlength=self._n_rows)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return (total / count)[self._out_rows]
+
+    def _centroid(self, dset):
+        """Get the mean of latitude or longitude over the full SC point
+        extent (exclusions are not considered)"""
+        data = self._excl.excl_h5[dset, self._rows, self._cols]
+        data = self._to_points(data.astype(np.float32), fill=np.nan)
+        mean = np.round(np.nanmean(data, axis=1), decimals=3)
+        point = self._out_rows // len(self._res_class_bins)
+
+        return mean[point]
+
+    @property
+    def power_density(self):
+        """Get the power density of each summarized row
+
+        Returns
+        -------
+        power_density : float | np.ndarray | None
+            Estimated power density in MW/km2, an array if a variable power
+            density table was input.
+        """
+        if self._power_density is None:
+            tech = self._gen.meta['reV_tech'][0]
+            if tech in SupplyCurvePointSummary.POWER_DENSITY:
+                self._power_density = \
+                    SupplyCurvePointSummary.POWER_DENSITY[tech]
+            else:
+                warn('Could not recognize reV technology in generation meta '
+                     'data: "{}". Cannot lookup an appropriate power density '
+                     'to calculate SC point capacity.'.format(tech))
+
+        elif isinstance(self._power_density, pd.DataFrame):
+            pdf = self._power_density
+            missing = set(self._pair_res_gids) - set(pdf.index.values)
+            if any(missing):
+                msg = ('Variable power density input is missing the '
+                       'following resource GIDs: {}'.format(missing))
+                logger.error(msg)
+                raise FileInputError(msg)
+
+            pds = pdf.loc[self._pair_res_gids, 'power_density'].values
+            pds = pds.astype(np.float32) * self._matrix.data
+            pds = np.bincount(self._pair_rows, weights=pds,
+                              minlength=self._n_rows)
+            return pds[self._out_rows] / self._weight_sum[self._out_rows]
+
+        return self._power_density
+
+    @property
+    def capacity(self):
+        """Get the estimated capacity in MW of each summarized row
+
+        Returns
+        -------
+        capacity : np.ndarray | None
+        """
+        capacity = None
+        power_density = self.power_density
+        if power_density is not None:
+            capacity = self.area * power_density
+
+        return capacity
+
+    @property
+    def mean_friction(self):
+        """Get the mean friction scalar (not weighted by inclusion values) of
+        each summarized row
+
+        Returns
+        -------
+        mean_friction : np.ndarray | None
+        """
+        if self._friction_layer is None:
+            return None
+
+        friction = self._friction_layer[self._rows, self._cols]
+        friction = self._to_points(friction, fill=0).ravel()[self._pixels]
+        friction = np.bincount(self._pixel_rows, weights=friction,
+                               minlength=self._n_rows)
+
+        return friction[self._out_rows] / self.n_gids
+
+    def _mean(self, data):
+        """Get the exclusions weighted mean of data or None if data is
+        None"""
+        if data is None:
+            return None
+
+        return self.exclusion_weighted_mean(data)
+
+    def _summary_args(self):
+        """Get a dictionary of summary arrays/lists for each summarized row
+        with the same outputs as SupplyCurvePointSummary.point_summary"""
+        mean_lcoe = self._mean(self._lcoe_data)
+        ARGS = {'res_gids': self._split(self._pair_res_gids),
+                'gen_gids': self._split(self._matrix.indices),
+                'gid_counts': self._split(self._matrix.data
+                                          .astype(np.float32)),
+                'n_gids': self.n_gids,
+                'mean_cf': self._mean(self._cf_data),
+                'mean_lcoe': mean_lcoe,
+                'mean_res': self._mean(self._res_data),
+                'capacity': self.capacity,
+                'area_sq_km': self.area,
+                'latitude': self._centroid('latitude'),
+                'longitude': self._centroid('longitude'),
+                'country': self._meta_mode('country'),
+                'state': self._meta_mode('state'),
+                'county': self._meta_mode('county'),
+                'elevation': self._meta_mean('elevation'),
+                'timezone': self._meta_mode('timezone'),
+                }
+
+        if self._friction_layer is not None:
+            ARGS['mean_friction'] = self.mean_friction
+            ARGS['mean_lcoe_friction'] = None
+            if mean_lcoe is not None:
+                ARGS['mean_lcoe_friction'] = mean_lcoe * ARGS['mean_friction']
+
+        if self._h5_dsets_data is not None:
+            for dset, data in self._h5_dsets_data.items():
+                ARGS['mean_{}'.format(dset)] = self._mean(data)
+
+        return ARGS
+
+    def _layer_values(self, raw, nodata, index):
+        """Get the flat data layer values of a set of summarized rows of the
+        same resource class bin (same logic as
+        SupplyCurvePointSummary.agg_data_layers)
+
+        Parameters
+        ----------
+        raw : np.ndarray
+            Data layer values for each SC point in the block, see
+            _to_points()
+        nodata : int | float | None
+            Data layer nodata value.
+        index : np.ndarray
+            Index of the summarized rows in self._out_rows, must all be in
+            the same resource class bin.
+
+        Returns
+        -------
+        groups : np.ndarray
+            Position in index of each value.
+        data : np.ndarray
+            Included data layer values.
+        excl_mult : np.ndarray
+            Inclusion value of each data layer value.
+        """
+        n_bins = len(self._res_class_bins)
+        points, bins = np.divmod(self._out_rows[index], n_bins)
+        excl_data, valid = self._bin_exclusions(self._res_class_bins[bins[0]])
+        data = raw[points]
+        excl_data = excl_data[points]
+        valid = valid[points]
+        if nodata is not None:
+            is_data = data != nodata
+
+            # rows where all included data is nodata fall back to all of the
+            # pixels inside of the SC point extent
+            fallback = ~(valid & is_data).any(axis=1)
+            valid[fallback] = self._inside[points[fallback]]
+            valid &= is_data
+
+        groups, pixels = np.nonzero(valid)
+
+        return groups, data[groups, pixels], excl_data[groups, pixels]
+
+    def _agg_data_layer(self, summary, name, attrs, fobj):
+        """Aggregate a single data layer for all summarized rows at once with
+        grouped reductions (see DataLayerAggregation)"""
+        raw = self._to_points(fobj[attrs['dset'], self._rows, self._cols],
+                              fill=0)
+        nodata = fobj.get_nodata_value(attrs['dset'])
+        out = np.full(len(self._out_rows), None, dtype=object)
+        bins = self._out_rows % len(self._res_class_bins)
+        for i in np.unique(bins):
+            index = np.flatnonzero(bins == i)
+            groups, data, excl_mult = self._layer_values(raw, nodata, index)
+            out[index] = DataLayerAggregation.run(groups, data, excl_mult,
+                                                  len(index),
+                                                  attrs['method'])
+
+        n_empty = sum(value is None for value in out)
+        if n_empty:
+            logger.debug('Data layer "{}" has no valid data for {} SC '
+                         'points!'.format(name, n_empty))
+
+        for pointsum, value in zip(summary, out):
+            pointsum[name] = value
+
+    def agg_data_layers(self, summary, data_layers):
+        """Perform additional data layer aggregation for each summarized row.
+
+        Parameters
+        ----------
+        summary : list
+            List of summary dictionaries, one for each summarized row.
+        data_layers : None | dict
+            Aggregation data layers. Must be a dictionary keyed by data label
+            name. Each value must be another dictionary with "dset", "method",
+            and "fpath".
+
+        Returns
+        -------
+        summary : list
+            List of summary dictionaries with a new entry for each data
+            layer.
+        """
+        if data_layers is not None:
+            for name, attrs in data_layers.items():
+                if 'fobj' in attrs:
+                    self._agg_data_layer(summary, name, attrs, attrs['fobj'])
+                else:
+                    with ExclusionLayers(attrs['fpath']) as f:
+                        self._agg_data_layer(summary, name, attrs, f)
+
+        return summary
+
+    def point_summary(self, args=None):
+        """Get a summary dictionary for each non-empty SC point and resource
+        class bin in the block.
+
+        Parameters
+        ----------
+        args : tuple | list | None
+            List of summary arguments to include. None defaults to all
+            available args defined in the class attr.
+
+        Returns
+        -------
+        summary : list
+            List of dictionaries of summary outputs, one for each summarized
+            row.
+        """
+        if not len(self._out_rows):
+            return []
+
+        ARGS = self._summary_args()
+        if args is None:
+            args = list(ARGS.keys())
+
+        columns = {}
+        for arg in args:
+            if arg in ARGS:
+                values = ARGS[arg]
+                if values is None or np.isscalar(values):
+                    values = [values] * len(self._out_rows)
+                columns[arg] = values
+            else:
+                warn('Cannot find "{}" as an available SC self summary '
+                     'output', OutputWarning)
+
+        return [dict(zip(columns, values))
+                for values in zip(*columns.values())]
+
+    @staticmethod
+    def get_blocks(gids, n_sc_cols, block_size=1024):
+        """Split SC point gids into spatially contiguous blocks of SC point
+        row segments. The bounding box of each block (which is read from the
+        exclusion, techmap, and data layer datasets) spans at most block_size
+        SC points so that sparse gids in distant columns are not combined.
+
+        Parameters
+        ----------
+        gids : list | np.ndarray
+            SC point gids.
+        n_sc_cols : int
+            Number of SC point columns in the SC extent.
+        block_size : int
+            Target maximum number of SC points in the bounding box of each
+            block.
+
+        Returns
+        -------
+        blocks : list
+            List of arrays of sorted SC point gids.
+        """
+        block_size = max(int(block_size), 1)
+        gids = np.unique(np.asarray(gids, dtype=np.int64))
+        if not len(gids):
+            return []
+
+        sc_rows = gids // n_sc_cols
+        sc_cols = gids % n_sc_cols
+
+        # split rows into segments that span less than block_size columns
+        segments = []
+        for rows in np.split(np.arange(len(gids)),
+                             np.where(np.diff(sc_rows))[0] + 1):
+            seg = (sc_cols[rows] - sc_cols[rows[0]]) // block_size
+            segments += np.split(rows, np.where(np.diff(seg))[0] + 1)
+
+        blocks = []
+        block = []
+        for seg in segments:
+            row, c0, c1 = sc_rows[seg[0]], sc_cols[seg[0]], sc_cols[seg[-1]]
+            if block:
+                box = (row - r0 + 1) * (max(c1, b1) - min(c0, b0) + 1)
+                if box > block_size:
+                    blocks.append(gids[np.concatenate(block)])
+                    block = []
+
+            if block:
+                b0, b1 = min(b0, c0), max(b1, c1)
+            else:
+                r0, b0, b1 = row, c0, c1
+
+            block.append(seg)
+
+        if block:
+            blocks.append(gids[np.concatenate(block)])
+
+        return blocks
+
+    @classmethod
+    def summarize(cls, gids, excl, gen, tm_dset, gen_index, block_size=1024,
+                  args=None, data_layers=None, cap_cost_scale=None,
+                  **kwargs):
+        """Get summary dictionaries for SC points, block by block.
+
+        Parameters
+        ----------
+        gids : list | np.ndarray
+            SC point gids to summarize.
+        excl : ExclusionMask
+            Open exclusions mask handler.
+        gen : Resource | MultiFileResource
+            Open reV generation (and econ) output handler.
+        tm_dset : str
+            Dataset name in the exclusions file containing the
+            exclusions-to-resource mapping data.
+        gen_index : np.ndarray
+            Array of generation gids with array index equal to resource gid.
+            Array value is -1 if the resource index was not used in the
+            generation run.
+        block_size : int
+            Target maximum number of SC points summarized at once.
+        args : tuple | list | None
+            List of summary arguments to include. None defaults to all
+            available args defined in the class attr.
+        data_layers : None | dict
+            Aggregation data layers. Must be a dictionary keyed by data label
+            name. Each value must be another dictionary with "dset", "method",
+            and "fpath".
+        cap_cost_scale : str | None
+            Deprecated, economies of scale should be applied to the full
+            summary table with SupplyCurveAggregation.economies_of_scale.
+            Optional LCOE scaling equation to implement "economies of
+            scale".
+        kwargs : dict
+            Keyword arguments for SupplyCurveBlockSummary.
+
+        Returns
+        -------
+        summary : list
+            List of dictionaries, each being an SC point summary, including
+            sc_point_gid, sc_row_ind, sc_col_ind, and res_class.
+        """
+        summary = []
+        exclusion_shape = kwargs.pop('exclusion_shape', None) or excl.shape
+        n_sc_cols = int(np.ceil(exclusion_shape[1]
+                                / kwargs.get('resolution', 64)))
+        blocks = cls.get_blocks(gids, n_sc_cols, block_size=block_size)
+        for i, block_gids in enumerate(blocks):
+            block = cls(block_gids, excl, gen, tm_dset, gen_index,
+                        exclusion_shape=exclusion_shape, **kwargs)
+            if not len(block.sc_point_gids):
+                continue
+
+            block_summary = block.point_summary(args=args)
+            block_summary = block.agg_data_layers(block_summary, data_layers)
+            for gid, ri, pointsum in zip(block.sc_point_gids,
+                                         block.res_class, block_summary):
+                pointsum['sc_point_gid'] = gid
+                pointsum['sc_row_ind'] = gid // n_sc_cols
+                pointsum['sc_col_ind'] = gid % n_sc_cols
+                pointsum['res_class'] = ri
+                summary.append(pointsum)
+
+            logger.debug('Block aggregation: {} out of {} blocks complete'
+                         .format(i + 1, len(blocks)))
+
+        if cap_cost_scale is not None:
+            warn('The cap_cost_scale input to SupplyCurveBlockSummary is '
+                 'deprecated, economies of scale should be applied to the '
+                 'full summary table with '
+                 'SupplyCurveAggregation.economies_of_scale',
+                 reVDeprecationWarning)
+            summary = SupplyCurvePointSummary.economies_of_scale(
+                cap_cost_scale, summary)
+
+        return summary
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+# pylint: disable=all
+"""
+reV Exclusions command line interface (cli).
+"""
+import os
+import click
+import logging
+import pprint
+import time
+
+from reV.config.supply_curve_configs import ExclusionMaskConfig
+from reV.pipeline.status import Status
+from reV.supply_curve.exclusions import ExclusionMaskFromDict
+from reV import __version__
+
+from rex.utilities.hpc import SLURM
+from rex.utilities.cli_dtypes import STR, INT, FLOAT
+from rex.utilities.loggers import init_mult
+from rex.utilities.utilities import dict_str_load, get_class_properties
+
+logger = logging.getLogger(__name__)
+
+
+@click.group()
+@click.option('--name', '-n', default='reV-excl', type=STR,
+              show_default=True,
+              help='Job name. Default is "reV-excl".')
+@click.option('-v', '--verbose', is_flag=True,
+              help='Flag to turn on debug logging. Default is not verbose.')
+@click.pass_context
+def main(ctx, name, verbose):
+    """reV Exclusions Command Line Interface"""
+    ctx.ensure_object(dict)
+    ctx.obj['NAME'] = name
+    ctx.obj['VERBOSE'] = verbose
+
+
+@main.command()
+def version():
+    """
+    print version
+    """
+    click.echo(__version__)
+
+
+@main.command()
+def valid_config_keys():
+    """
+    Echo the valid ExclusionMask config keys
+    """
+    click.echo(', '.join(get_class_properties(ExclusionMaskConfig)))
+
+
+@main.command()
+@click.option('--config_file', '-c', required=True,
+              type=click.Path(exists=True),
+              help='reV exclusions configuration json file.')
+@click.option('-v', '--verbose', is_flag=True,
+              help='Flag to turn on debug logging. Default is not verbose.')
+@click.pass_context
+def from_config(ctx, config_file, verbose):
+    """Build the persisted inclusion mask from a config file."""
+    name = ctx.obj['NAME']
+
+    # Instantiate the config object
+    config = ExclusionMaskConfig(config_file)
+
+    # take name from config if not default
+    if config.name.lower() != 'rev':
+        name = config.name
+        ctx.obj['NAME'] = name
+
+    # Enforce verbosity if logging level is specified in the config
+    if config.log_level == logging.DEBUG:
+        verbose = True
+
+    # initialize loggers
+    init_mult(name, config.logdir, modules=['reV', 'rex'], verbose=verbose)
+
+    # Initial log statements
+    logger.info('Running reV exclusions mask build from config '
+                'file: "{}"'.format(config_file))
+    logger.info('Target output directory: "{}"'.format(config.dirout))
+    logger.info('Target logging directory: "{}"'.format(config.logdir))
+    logger.debug('The full configuration input is as follows:\n{}'
+                 .format(pprint.pformat(config, indent=4)))
+
+    if config.execution_control.option == 'local':
+        status = Status.retrieve_job_status(config.dirout, 'exclusions',
+                                            name)
+        if status != 'successful':
+            Status.add_job(
+                config.dirout, 'exclusions', name, replace=True,
+                job_attrs={'hardware': 'local',
+                           'fout': os.path.basename(config.excl_fpath),
+                           'dirout': os.path.dirname(config.excl_fpath)})
+            ctx.invoke(build_mask,
+                       excl_fpath=config.excl_fpath,
+                       excl_dict=config.excl_dict,
+                       area_filter_kernel=config.area_filter_kernel,
+                       min_area=config.min_area,
+                       tile_size=config.tile_size,
+                       max_workers=config.max_workers,
+                       overwrite=config.overwrite,
+                       out_dir=config.dirout,
+                       log_dir=config.logdir,
+                       verbose=verbose)
+
+    elif config.execution_control.option in ('eagle', 'slurm'):
+
+        ctx.obj['NAME'] = name
+        ctx.obj['EXCL_FPATH'] = config.excl_fpath
+        ctx.obj['EXCL_DICT'] = config.excl_dict
+        ctx.obj['AREA_FILTER_KERNEL'] = config.area_filter_kernel
+        ctx.obj['MIN_AREA'] = config.min_area
+        ctx.obj['TILE_SIZE'] = config.tile_size
+        ctx.obj['MAX_WORKERS'] = config.max_workers
+        ctx.obj['OVERWRITE'] = config.overwrite
+        ctx.obj['OUT_DIR'] = config.dirout
+        ctx.obj['LOG_DIR'] = config.logdir
+        ctx.obj['VERBOSE'] = verbose
+
+        ctx.invoke(slurm,
+                   alloc=config.execution_control.allocation,
+                   memory=config.execution_control.memory,
+                   feature=config.execution_control.feature,
+                   walltime=config.execution_control.walltime,
+                   conda_env=config.execution_control.conda_env,
+                   module=config.execution_control.module)
+
+
+@main.group(invoke_without_command=True)
+@click.option('--excl_fpath', '-exf', type=STR, required=True,
+              help='Exclusions file (.h5) the inclusion mask is written to.')
+@click.option('--excl_dict', '-exd', type=STR, required=True,
+              help=('String representation of a dictionary of exclusions '
+                    'LayerMask arguments {layer: {kwarg: value}} where '
+                    'layer is a dataset in excl_fpath and kwarg can be '
+                    '"inclusion_range", "exclude_values", "include_values", '
+                    '"inclusion_weights", "force_include_values", '
+                    '"force_include_range", "use_as_weights", "exclude_nodata"'
+                    ', and/or "weight".'))
+@click.option('--area_filter_kernel', '-afk', type=STR, default='queen',
+              show_default=True,
+              help='Contiguous area filter kernel name ("queen", "rook").')
+@click.option('--min_area', '-ma', type=FLOAT, default=None,
+              show_default=True,
+              help='Contiguous area filter minimum area, default is None '
+              '(No minimum area filter).')
+@click.option('--tile_size', '-ts', type=INT, default=1024,
+              show_default=True,
+              help=('Number of exclusion rows and columns computed on each '
+                    'worker, rounded up to a multiple of the exclusion '
+                    'chunk shape.'))
+@click.option('--max_workers', '-mw', type=INT, default=None,
+              show_default=True,
+              help=('Number of cores to run the mask build on. None is all '
+                    'available cpus.'))
+@click.option('--overwrite', '-ow', is_flag=True,
+              help='Flag to re-compute an existing inclusion mask, e.g. '
+              'after an exclusion layer changed.')
+@click.option('--out_dir', '-o', type=STR, default='./',
+              show_default=True,
+              help='Directory to save the job status file to.')
+@click.option('--log_dir', '-ld', type=STR, default='./logs/',
+              show_default=True,
+              help='Directory to save logs.')
+@click.option('-v', '--verbose', is_flag=True,
+              help='Flag to turn on debug logging. Default is not verbose.')
+@click.pass_context
+def build_mask(ctx, excl_fpath, excl_dict, area_filter_kernel, min_area,
+               tile_size, max_workers, overwrite, out_dir, log_dir, verbose):
+    """Build the final inclusion mask and persist it in the exclusions h5."""
+
+    name = ctx.obj['NAME']
+    ctx.obj['EXCL_FPATH'] = excl_fpath
+    ctx.obj['EXCL_DICT'] = excl_dict
+    ctx.obj['AREA_FILTER_KERNEL'] = area_filter_kernel
+    ctx.obj['MIN_AREA'] = min_area
+    ctx.obj['TILE_SIZE'] = tile_size
+    ctx.obj['MAX_WORKERS'] = max_workers
+    ctx.obj['OVERWRITE'] = overwrite
+    ctx.obj['OUT_DIR'] = out_dir
+    ctx.obj['LOG_DIR'] = log_dir
+    ctx.obj['VERBOSE'] = verbose
+
+    if ctx.invoked_subcommand is None:
+        t0 = time.time()
+        init_mult(name, log_dir, modules=['reV', 'rex'],
+                  verbose=verbose)
+
+        if isinstance(excl_dict, str):
+            excl_dict = dict_str_load(excl_dict)
+
+        try:
+            mask_dset = ExclusionMaskFromDict.build_mask(
+                excl_fpath, excl_dict, min_area=min_area,
+                kernel=area_filter_kernel, tile_size=tile_size,
+                max_workers=max_workers, overwrite=overwrite)
+        except Exception as e:
+            logger.exception('Inclusion mask build failed. Received the '
+                             'following error:\n{}'.format(e))
+            raise e
+
+        runtime = (time.time() - t0) / 60
+        logger.info('Inclusion mask build complete. '
+                    'Time elapsed: {:.2f} min. Target output file: {}'
+                    .format(runtime, excl_fpath))
+
+        # add job to reV status file.
+        status = {'dirout': os.path.dirname(excl_fpath),
+                  'fout': os.path.basename(excl_fpath),
+                  'job_status': 'successful',
+                  'runtime': runtime,
+                  'finput': excl_fpath,
+                  'mask_dset': mask_dset,
+                  'excl_dict': excl_dict,
+                  'area_filter_kernel': area_filter_kernel,
+                  'min_area': min_area}
+        Status.make_job_file(out_dir, 'exclusions', name, status)
+
+
+def get_node_cmd(name, excl_fpath, excl_dict, area_filter_kernel, min_area,
+                 tile_size, max_workers, overwrite, out_dir, log_dir,
+                 verbose):
+    """Get a CLI call command for the exclusions mask build cli."""
+
+    args = ['-exf {}'.format(SLURM.s(excl_fpath)),
+            '-exd {}'.format(SLURM.s(excl_dict)),
+            '-afk {}'.format(SLURM.s(area_filter_kernel)),
+            '-ma {}'.format(SLURM.s(min_area)),
+            '-ts {}'.format(SLURM.s(tile_size)),
+            '-mw {}'.format(SLURM.s(max_workers)),
+            '-o {}'.format(SLURM.s(out_dir)),
+            '-ld {}'.format(SLURM.s(log_dir)),
+            ]
+
+    if overwrite:
+        args.append('-ow')
+
+    if verbose:
+        args.append('-v')
+
+    cmd = ('python -m reV.supply_curve.cli_exclusions -n {} build-mask {}'
+           .format(SLURM.s(name), ' '.join(args)))
+    logger.debug('Creating the following command line call:\n\t{}'.format(cmd))
+
+    return cmd
+
+
+@build_mask.command()
+@click.option('--alloc', '-a', required=True, type=STR,
+              help='SLURM allocation account name.')
+@click.option('--walltime', '-wt', default=1.0, type=float,
+              show_default=True,
+              help='SLURM walltime request in hours for a single node.')
+@click.option('--feature', '-l', default=None, type=STR,
+              show_default=True,
+              help=('Additional flags for SLURM job. Format is "--qos=high" '
+                    'or "--depend=[state:job_id]". Default is None.'))
+@click.option('--memory', '-mem', default=None, type=INT,
+              show_default=True,
+              help='SLURM node memory request in GB. Default is None')
+@click.option('--module', '-mod', default=None, type=STR,
+              show_default=True,
+              help='Module to load')
+@click.option('--conda_env', '-env', default=None, type=STR,
+              show_default=True,
+              help='Conda env to activate')
+@click.option('--stdout_path', '-sout', default=None, type=STR,
+              show_default=True,
+              help='Subprocess standard output path. Default is in out_dir.')
+@click.pass_context
+def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
+          stdout_path):
+    """slurm (Eagle) submission tool for the reV inclusion mask build."""
+    name = ctx.obj['NAME']
+    excl_fpath = ctx.obj['EXCL_FPATH']
+    excl_dict = ctx.obj['EXCL_DICT']
+    area_filter_kernel = ctx.obj['AREA_FILTER_KERNEL']
+    min_area = ctx.obj['MIN_AREA']
+    tile_size = ctx.obj['TILE_SIZE']
+    max_workers = ctx.obj['MAX_WORKERS']
+    overwrite = ctx.obj['OVERWRITE']
+    out_dir = ctx.obj['OUT_DIR']
+    log_dir = ctx.obj['LOG_DIR']
+    verbose = ctx.obj['VERBOSE']
+
+    if stdout_path is None:
+        stdout_path = os.path.join(log_dir, 'stdout/')
+
+    cmd = get_node_cmd(name, excl_fpath, excl_dict, area_filter_kernel,
+                       min_area, tile_size, max_workers, overwrite, out_dir,
+                       log_dir, verbose)
+
+    slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
+    if slurm_manager is None:
+        slurm_manager = SLURM()
+        ctx.obj['SLURM_MANAGER'] = slurm_manager
+
+    status = Status.retrieve_job_status(out_dir, 'exclusions', name,
+                                        hardware='eagle',
+                                        subprocess_manager=slurm_manager)
+
+    if status == 'successful':
+        msg = ('Job "{}" is successful in status json found in "{}", '
+               'not re-running.'
+               .format(name, out_dir))
+    elif 'fail' not in str(status).lower() and status is not None:
+        msg = ('Job "{}" was found with status "{}", not resubmitting'
+               .format(name, status))
+    else:
+        logger.info('Running reV inclusion mask build on SLURM with '
+                    'node name "{}"'.format(name))
+        out = slurm_manager.sbatch(cmd, alloc=alloc, memory=memory,
+                                   walltime=walltime, feature=feature,
+                                   name=name, stdout_path=stdout_path,
+                                   conda_env=conda_env, module=module)[0]
+        if out:
+            msg = ('Kicked off reV inclusion mask build job "{}" '
+                   '(SLURM jobid #{}).'
+                   .format(name, out))
+            Status.add_job(
+                out_dir, 'exclusions', name, replace=True,
+                job_attrs={'job_id': out, 'hardware': 'eagle',
+                           'fout': os.path.basename(excl_fpath),
+                           'dirout': os.path.dirname(excl_fpath)})
+
+    click.echo(msg)
+    logger.info(msg)
+
+
+if __name__ == '__main__':
+    try:
+        main(obj={})
+    except Exception:
+        logger.exception('Error running reV Exclusions CLI')
+        raise
@@ -11,9 +11,11 @@ import time
 import h5py
 
 from reV.config.supply_curve_configs import SupplyCurveAggregationConfig
+from reV.handlers.h5_pool import H5FilePool
 from reV.pipeline.status import Status
 from reV.supply_curve.tech_mapping import TechMapping
-from reV.supply_curve.sc_aggregation import SupplyCurveAggregation
+from reV.supply_curve.sc_aggregation import (SupplyCurveAggregation,
+                                             SupplyCurveAggFileHandler)
 from reV import __version__
 
 from rex.utilities.hpc import SLURM
@@ -104,6 +106,7 @@ def from_config(ctx, config_file, verbose):
                        gen_fpath=config.gen_fpath,
                        econ_fpath=config.econ_fpath,
                        res_fpath=config.res_fpath,
+                       techmap_projection=config.techmap_projection,
                        tm_dset=config.tm_dset,
                        excl_dict=config.excl_dict,
                        check_excl_layers=config.check_excl_layers,
@@ -124,6 +127,13 @@ def from_config(ctx, config_file, verbose):
                        out_dir=config.dirout,
                        max_workers=config.max_workers,
                        points_per_worker=config.points_per_worker,
+                       engine=config.engine,
+                       block_size=config.block_size,
+                       shared_inputs=config.shared_inputs,
+                       resume=config.resume,
+                       tile_cache_size=config.tile_cache_size,
+                       use_precomputed_mask=config.use_precomputed_mask,
+                       h5_chunk_cache=config.execution_control.h5_chunk_cache,
                        log_dir=config.logdir,
                        verbose=verbose)
 
@@ -134,6 +144,7 @@ def from_config(ctx, config_file, verbose):
         ctx.obj['GEN_FPATH'] = config.gen_fpath
         ctx.obj['ECON_FPATH'] = config.econ_fpath
         ctx.obj['RES_FPATH'] = config.res_fpath
+        ctx.obj['TECHMAP_PROJECTION'] = config.techmap_projection
         ctx.obj['TM_DSET'] = config.tm_dset
         ctx.obj['EXCL_DICT'] = config.excl_dict
         ctx.obj['CHECK_LAYERS'] = config.check_excl_layers
@@ -154,6 +165,13 @@ def from_config(ctx, config_file, verbose):
         ctx.obj['OUT_DIR'] = config.dirout
         ctx.obj['MAX_WORKERS'] = config.max_workers
         ctx.obj['POINTS_PER_WORKER'] = config.points_per_worker
+        ctx.obj['ENGINE'] = config.engine
+        ctx.obj['BLOCK_SIZE'] = config.block_size
+        ctx.obj['SHARED_INPUTS'] = config.shared_inputs
+        ctx.obj['RESUME'] = config.resume
+        ctx.obj['TILE_CACHE_SIZE'] = config.tile_cache_size
+        ctx.obj['USE_PRECOMPUTED_MASK'] = config.use_precomputed_mask
+        ctx.obj['H5_CHUNK_CACHE'] = config.execution_control.h5_chunk_cache
         ctx.obj['LOG_DIR'] = config.logdir
         ctx.obj['VERBOSE'] = verbose
 
@@ -182,6 +200,12 @@ def from_config(ctx, config_file, verbose):
 @click.option('--res_fpath', '-rf', type=STR, default=None,
               show_default=True,
               help='Resource file, required if techmap dset is to be created.')
+@click.option('--techmap_projection', '-tmp', type=STR, default='latlon',
+              show_default=True,
+              help='Coordinate space of the nearest neighbor queries if the '
+              'techmap dset is to be created: "latlon", "ecef" or '
+              '"equal_area". The distance upper bound is inferred in km for '
+              '"ecef" and "equal_area".')
 @click.option('--excl_dict', '-exd', type=STR, default=None,
               show_default=True,
               help=('String representation of a dictionary of exclusion '
@@ -268,6 +292,40 @@ def from_config(ctx, config_file, verbose):
 @click.option('--points_per_worker', '-ppw', type=int, default=10,
               show_default=True,
               help="Number of sc_points to summarize on each worker")
+@click.option('--engine', '-en', type=click.Choice(['point', 'sparse']),
+              default='point', show_default=True,
+              help='Summary engine, "point" summarizes one SC point at a '
+              'time and "sparse" summarizes blocks of SC points at once with '
+              'a sparse matrix of inclusion weights.')
+@click.option('--block_size', '-bs', type=int, default=1024,
+              show_default=True,
+              help='Target number of SC points summarized at once with the '
+              '"sparse" engine.')
+@click.option('--shared_inputs', '-si', is_flag=True,
+              help='Flag to read the gen/econ input arrays once and share '
+              'them with the parallel workers as read-only memory-mapped '
+              'scratch files.')
+@click.option('--resume', '-rs', is_flag=True,
+              help='Flag to checkpoint the SC point blocks to '
+              '"{name}_checkpoint.h5" in out_dir and to resume a killed job '
+              'from an existing checkpoint. By default the summary is kept '
+              'in memory without a checkpoint.')
+@click.option('--tile_cache_size', '-tcs', type=INT,
+              default=SupplyCurveAggFileHandler.TILE_CACHE_SIZE,
+              show_default=True,
+              help='Byte budget of the exclusion layer tile cache of each '
+              'worker. None or 0 disables the cache.')
+@click.option('--use_precomputed_mask', '-upm', is_flag=True,
+              help='Flag to read the inclusion mask persisted by '
+              '"reV exclusions build-mask" for these exclusion inputs '
+              'instead of re-computing it. The mask is not checked against '
+              'the exclusion layers and must be rebuilt whenever a layer '
+              'changes.')
+@click.option('--h5_chunk_cache', '-h5c', type=STR, default=None,
+              show_default=True,
+              help='String representation of a dictionary of h5 chunk cache '
+              'settings e.g. {"rdcc_nbytes": 268435456, "max_idle": 4}. '
+              'None uses the h5py defaults.')
 @click.option('--log_dir', '-ld', type=STR, default='./logs/',
               show_default=True,
               help='Directory to save aggregation logs.')
@@ -275,11 +333,13 @@ def from_config(ctx, config_file, verbose):
               help='Flag to turn on debug logging. Default is not verbose.')
 @click.pass_context
 def direct(ctx, excl_fpath, gen_fpath, tm_dset, econ_fpath, res_fpath,
-           excl_dict, check_excl_layers, res_class_dset, res_class_bins,
-           cf_dset, lcoe_dset, h5_dsets, data_layers, resolution, excl_area,
-           power_density, area_filter_kernel, min_area, friction_fpath,
-           friction_dset, cap_cost_scale, out_dir, max_workers,
-           points_per_worker, log_dir, verbose):
+           techmap_projection, excl_dict, check_excl_layers,
+           res_class_dset, res_class_bins, cf_dset, lcoe_dset, h5_dsets,
+           data_layers, resolution, excl_area, power_density,
+           area_filter_kernel, min_area, friction_fpath, friction_dset,
+           cap_cost_scale, out_dir, max_workers, points_per_worker, engine,
+           block_size, shared_inputs, resume, tile_cache_size,
+           use_precomputed_mask, h5_chunk_cache, log_dir, verbose):
     """reV Supply Curve Aggregation Summary CLI."""
 
     name = ctx.obj['NAME']
@@ -287,6 +347,7 @@ def direct(ctx, excl_fpath, gen_fpath, tm_dset, econ_fpath, res_fpath,
     ctx.obj['GEN_FPATH'] = gen_fpath
     ctx.obj['ECON_FPATH'] = econ_fpath
     ctx.obj['RES_FPATH'] = res_fpath
+    ctx.obj['TECHMAP_PROJECTION'] = techmap_projection
     ctx.obj['TM_DSET'] = tm_dset
     ctx.obj['EXCL_DICT'] = excl_dict
     ctx.obj['CHECK_LAYERS'] = check_excl_layers
@@ -307,6 +368,13 @@ def direct(ctx, excl_fpath, gen_fpath, tm_dset, econ_fpath, res_fpath,
     ctx.obj['OUT_DIR'] = out_dir
     ctx.obj['MAX_WORKERS'] = max_workers
     ctx.obj['POINTS_PER_WORKER'] = points_per_worker
+    ctx.obj['ENGINE'] = engine
+    ctx.obj['BLOCK_SIZE'] = block_size
+    ctx.obj['SHARED_INPUTS'] = shared_inputs
+    ctx.obj['RESUME'] = resume
+    ctx.obj['TILE_CACHE_SIZE'] = tile_cache_size
+    ctx.obj['USE_PRECOMPUTED_MASK'] = use_precomputed_mask
+    ctx.obj['H5_CHUNK_CACHE'] = h5_chunk_cache
     ctx.obj['LOG_DIR'] = log_dir
     ctx.obj['VERBOSE'] = verbose
 
@@ -319,7 +387,12 @@ def direct(ctx, excl_fpath, gen_fpath, tm_dset, econ_fpath, res_fpath,
             dsets = list(f)
         if tm_dset not in dsets:
             try:
-                TechMapping.run(excl_fpath, res_fpath, tm_dset)
+                # the default distance upper bound is in decimal degrees so
+                # infer it in km for the projected coordinate spaces
+                dist = 0.03 if techmap_projection == 'latlon' else None
+                TechMapping.run(excl_fpath, res_fpath, tm_dset,
+                                distance_upper_bound=dist,
+                                projection=techmap_projection)
             except Exception as e:
                 logger.exception('TechMapping process failed. Received the '
                                  'following error:\n{}'.format(e))
@@ -331,6 +404,9 @@ def direct(ctx, excl_fpath, gen_fpath, tm_dset, econ_fpath, res_fpath,
         if isinstance(data_layers, str):
             data_layers = dict_str_load(data_layers)
 
+        H5FilePool.configure_from_dict(h5_chunk_cache)
+        stream_fpath = _get_stream_fpath(out_dir, name, resume)
+
         try:
             summary = SupplyCurveAggregation.summary(
                 excl_fpath, gen_fpath, tm_dset,
@@ -352,16 +428,21 @@ def direct(ctx, excl_fpath, gen_fpath, tm_dset, econ_fpath, res_fpath,
                 check_excl_layers=check_excl_layers,
                 cap_cost_scale=cap_cost_scale,
                 max_workers=max_workers,
-                points_per_worker=points_per_worker)
+                points_per_worker=points_per_worker,
+                engine=engine,
+                block_size=block_size,
+                shared_inputs=shared_inputs,
+                stream_fpath=stream_fpath,
+                resume=resume,
+                tile_cache_size=tile_cache_size,
+                use_precomputed_mask=use_precomputed_mask)
 
         except Exception as e:
             logger.exception('Supply curve Aggregation failed. Received the '
                              'following error:\n{}'.format(e))
             raise e
 
-        fn_out = '{}.csv'.format(name)
-        fpath_out = os.path.join(out_dir, fn_out)
-        summary.to_csv(fpath_out)
+        fn_out = _save_summary(summary, out_dir, name, stream_fpath)
 
         runtime = (time.time() - t0) / 60
         logger.info('Supply curve aggregation complete. '
@@ -385,12 +466,49 @@ def direct(ctx, excl_fpath, gen_fpath, tm_dset, econ_fpath, res_fpath,
         Status.make_job_file(out_dir, 'supply-curve-aggregation', name, status)
 
 
+def _get_stream_fpath(out_dir, name, resume):
+    """Get the checkpoint file to stream the SC aggregation results to.
+
+    Returns
+    -------
+    stream_fpath : str | None
+        Checkpoint .h5 filepath in out_dir if resume is requested, otherwise
+        None to keep the summary in memory.
+    """
+    stream_fpath = None
+    if resume:
+        stream_fpath = os.path.join(out_dir, '{}_checkpoint.h5'.format(name))
+
+    return stream_fpath
+
+
+def _save_summary(summary, out_dir, name, stream_fpath):
+    """Save the SC aggregation summary to csv and remove the checkpoint file
+    of the completed run.
+
+    Returns
+    -------
+    fn_out : str
+        Output csv file name in out_dir.
+    """
+    fn_out = '{}.csv'.format(name)
+    fpath_out = os.path.join(out_dir, fn_out)
+    summary.to_csv(fpath_out)
+
+    if stream_fpath is not None and os.path.exists(stream_fpath):
+        os.remove(stream_fpath)
+
+    return fn_out
+
+
 def get_node_cmd(name, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
-                 excl_dict, check_excl_layers, res_class_dset, res_class_bins,
-                 cf_dset, lcoe_dset, h5_dsets, data_layers, resolution,
-                 excl_area, power_density, area_filter_kernel, min_area,
-                 friction_fpath, friction_dset, cap_cost_scale,
-                 out_dir, max_workers, points_per_worker, log_dir, verbose):
+                 techmap_projection, excl_dict, check_excl_layers,
+                 res_class_dset, res_class_bins, cf_dset, lcoe_dset,
+                 h5_dsets, data_layers, resolution, excl_area, power_density,
+                 area_filter_kernel, min_area, friction_fpath, friction_dset,
+                 cap_cost_scale, out_dir, max_workers, points_per_worker,
+                 engine, block_size, shared_inputs, resume, tile_cache_size,
+                 use_precomputed_mask, h5_chunk_cache, log_dir, verbose):
     """Get a CLI call command for the SC aggregation cli."""
 
     args = ['-exf {}'.format(SLURM.s(excl_fpath)),
@@ -398,6 +516,7 @@ def get_node_cmd(name, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
             '-ef {}'.format(SLURM.s(econ_fpath)),
             '-rf {}'.format(SLURM.s(res_fpath)),
             '-tm {}'.format(SLURM.s(tm_dset)),
+            '-tmp {}'.format(SLURM.s(techmap_projection)),
             '-exd {}'.format(SLURM.s(excl_dict)),
             '-cd {}'.format(SLURM.s(res_class_dset)),
             '-cb {}'.format(SLURM.s(res_class_bins)),
@@ -416,12 +535,25 @@ def get_node_cmd(name, excl_fpath, gen_fpath, econ_fpath, res_fpath, tm_dset,
             '-o {}'.format(SLURM.s(out_dir)),
             '-mw {}'.format(SLURM.s(max_workers)),
             '-ppw {}'.format(SLURM.s(points_per_worker)),
+            '-en {}'.format(SLURM.s(engine)),
+            '-bs {}'.format(SLURM.s(block_size)),
+            '-tcs {}'.format(SLURM.s(tile_cache_size)),
+            '-h5c {}'.format(SLURM.s(h5_chunk_cache)),
             '-ld {}'.format(SLURM.s(log_dir)),
             ]
 
     if check_excl_layers:
         args.append('-cl')
 
+    if shared_inputs:
+        args.append('-si')
+
+    if resume:
+        args.append('-rs')
+
+    if use_precomputed_mask:
+        args.append('-upm')
+
     if verbose:
         args.append('-v')
 
@@ -463,6 +595,7 @@ def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
     gen_fpath = ctx.obj['GEN_FPATH']
     econ_fpath = ctx.obj['ECON_FPATH']
     res_fpath = ctx.obj['RES_FPATH']
+    techmap_projection = ctx.obj['TECHMAP_PROJECTION']
     tm_dset = ctx.obj['TM_DSET']
     excl_dict = ctx.obj['EXCL_DICT']
     check_excl_layers = ctx.obj['CHECK_LAYERS']
@@ -483,6 +616,13 @@ def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
     out_dir = ctx.obj['OUT_DIR']
     max_workers = ctx.obj['MAX_WORKERS']
     points_per_worker = ctx.obj['POINTS_PER_WORKER']
+    engine = ctx.obj['ENGINE']
+    block_size = ctx.obj['BLOCK_SIZE']
+    shared_inputs = ctx.obj['SHARED_INPUTS']
+    resume = ctx.obj['RESUME']
+    tile_cache_size = ctx.obj['TILE_CACHE_SIZE']
+    use_precomputed_mask = ctx.obj['USE_PRECOMPUTED_MASK']
+    h5_chunk_cache = ctx.obj['H5_CHUNK_CACHE']
     log_dir = ctx.obj['LOG_DIR']
     verbose = ctx.obj['VERBOSE']
 
@@ -490,14 +630,15 @@ def slurm(ctx, alloc, walltime, feature, memory, module, conda_env,
         stdout_path = os.path.join(log_dir, 'stdout/')
 
     cmd = get_node_cmd(name, excl_fpath, gen_fpath, econ_fpath, res_fpath,
-                       tm_dset, excl_dict, check_excl_layers,
-                       res_class_dset, res_class_bins,
+                       tm_dset, techmap_projection, excl_dict,
+                       check_excl_layers, res_class_dset, res_class_bins,
                        cf_dset, lcoe_dset, h5_dsets, data_layers,
                        resolution, excl_area,
                        power_density, area_filter_kernel, min_area,
                        friction_fpath, friction_dset, cap_cost_scale,
-                       out_dir, max_workers, points_per_worker, log_dir,
-                       verbose)
+                       out_dir, max_workers, points_per_worker, engine,
+                       block_size, shared_inputs, resume, tile_cache_size,
+                       use_precomputed_mask, h5_chunk_cache, log_dir, verbose)
 
     slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
     if slurm_manager is None:
@@ -10,7 +10,9 @@ import pprint
 import time
 
 from reV.config.supply_curve_configs import SupplyCurveConfig
+from reV.handlers.tables import ColumnarTable
 from reV.pipeline.status import Status
+from reV.supply_curve.sc_scenarios import SupplyCurveScenarios
 from reV.supply_curve.supply_curve import SupplyCurve
 from reV import __version__
 
@@ -90,10 +92,11 @@ def from_config(ctx, config_file, verbose):
         status = Status.retrieve_job_status(config.dirout, 'supply-curve',
                                             name)
         if status != 'successful':
+            ext = ColumnarTable.output_ext(config.sc_points)
             Status.add_job(
                 config.dirout, 'supply-curve', name, replace=True,
                 job_attrs={'hardware': 'local',
-                           'fout': '{}.csv'.format(name),
+                           'fout': '{}{}'.format(name, ext),
                            'dirout': config.dirout})
             ctx.invoke(direct,
                        sc_points=config.sc_points,
@@ -110,6 +113,8 @@ def from_config(ctx, config_file, verbose):
                        log_dir=config.logdir,
                        simple=config.simple,
                        line_limited=config.line_limited,
+                       scenarios=config.scenarios,
+                       scenario_cache=config.scenario_cache,
                        verbose=verbose)
 
     elif config.execution_control.option in ('eagle', 'slurm'):
@@ -131,6 +136,8 @@ def from_config(ctx, config_file, verbose):
         ctx.obj['LOG_DIR'] = config.logdir
         ctx.obj['SIMPLE'] = config.simple
         ctx.obj['LINE_LIMITED'] = config.line_limited
+        ctx.obj['SCENARIOS'] = config.scenarios
+        ctx.obj['SCENARIO_CACHE'] = config.scenario_cache
         ctx.obj['VERBOSE'] = verbose
 
         ctx.invoke(slurm,
@@ -144,15 +151,18 @@ def from_config(ctx, config_file, verbose):
 
 @main.group(invoke_without_command=True)
 @click.option('--sc_points', '-sc', type=STR, required=True,
-              help='Supply curve point summary table (.csv or .json).')
+              help=('Supply curve point summary table (.csv, .json, .h5, '
+                    '.parquet, or .feather). The supply curve is written in '
+                    'the same format (.csv for .csv and .json inputs).'))
 @click.option('--trans_table', '-tt', type=STR, required=True,
-              help='Supply curve transmission mapping table (.csv or .json).')
+              help=('Supply curve transmission mapping table (.csv, .json, '
+                    '.h5, .parquet, or .feather).'))
 @click.option('--fixed_charge_rate', '-fcr', type=float, required=True,
               help='Fixed charge rate used to compute LCOT')
 @click.option('--sc_features', '-scf', type=STR, default=None,
               show_default=True,
               help='Table containing additional supply curve features '
-                   '(.csv or .json)')
+                   '(.csv, .json, .h5, .parquet, or .feather)')
 @click.option('--transmission_costs', '-tc', type=STR, default=None,
               show_default=True,
               help='Table or serialized dict of transmission cost inputs.')
@@ -194,13 +204,23 @@ def from_config(ctx, config_file, verbose):
               help='Flag to turn on line-limited substation capacity '
               'calculation (legacy methodology). Alternative is multi-line '
               'spread capacity.')
+@click.option('--scenarios', '-scn', type=STR, default=None,
+              show_default=True,
+              help=('Supply curve scenario definitions (.json file or '
+                    'serialized json). If provided, the supply curve tables '
+                    'are merged once and one supply curve is written per '
+                    'scenario. Scenario inputs default to the inputs above.'))
+@click.option('--scenario_cache', '-scc', type=STR, default=None,
+              show_default=True,
+              help=('.h5 file to cache the merged supply curve tables in '
+                    'for scenario sweeps.'))
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
 @click.pass_context
 def direct(ctx, sc_points, trans_table, fixed_charge_rate, sc_features,
            transmission_costs, sort_on, offshore_trans_table, wind_dirs,
            n_dirs, downwind, offshore_compete, max_workers, out_dir, log_dir,
-           simple, line_limited, verbose):
+           simple, line_limited, scenarios, scenario_cache, verbose):
     """reV Supply Curve CLI."""
     name = ctx.obj['NAME']
     ctx.obj['SC_POINTS'] = sc_points
@@ -219,6 +239,8 @@ def direct(ctx, sc_points, trans_table, fixed_charge_rate, sc_features,
     ctx.obj['LOG_DIR'] = log_dir
     ctx.obj['SIMPLE'] = simple
     ctx.obj['LINE_LIMITED'] = line_limited
+    ctx.obj['SCENARIOS'] = scenarios
+    ctx.obj['SCENARIO_CACHE'] = scenario_cache
     ctx.obj['VERBOSE'] = verbose
 
     if ctx.invoked_subcommand is None:
@@ -229,38 +251,27 @@ def direct(ctx, sc_points, trans_table, fixed_charge_rate, sc_features,
         if isinstance(transmission_costs, str):
             transmission_costs = dict_str_load(transmission_costs)
 
-        offshore_table = offshore_trans_table
+        kwargs = {'sc_features': sc_features,
+                  'transmission_costs': transmission_costs,
+                  'sort_on': sort_on, 'wind_dirs': wind_dirs,
+                  'n_dirs': n_dirs, 'downwind': downwind,
+                  'offshore_trans_table': offshore_trans_table,
+                  'offshore_compete': offshore_compete}
         try:
-            if simple:
-                out = SupplyCurve.simple(sc_points, trans_table,
-                                         fixed_charge_rate,
-                                         sc_features=sc_features,
-                                         transmission_costs=transmission_costs,
-                                         sort_on=sort_on, wind_dirs=wind_dirs,
-                                         n_dirs=n_dirs, downwind=downwind,
-                                         max_workers=max_workers,
-                                         offshore_trans_table=offshore_table,
-                                         offshore_compete=offshore_compete)
+            if scenarios is not None:
+                fn_out = run_scenarios(name, sc_points, trans_table,
+                                       fixed_charge_rate, scenarios,
+                                       scenario_cache, out_dir, simple,
+                                       line_limited, max_workers, **kwargs)
             else:
-                out = SupplyCurve.full(sc_points, trans_table,
-                                       fixed_charge_rate,
-                                       sc_features=sc_features,
-                                       transmission_costs=transmission_costs,
-                                       line_limited=line_limited,
-                                       sort_on=sort_on, wind_dirs=wind_dirs,
-                                       n_dirs=n_dirs, downwind=downwind,
-                                       max_workers=max_workers,
-                                       offshore_trans_table=offshore_table,
-                                       offshore_compete=offshore_compete)
+                fn_out = run_sc(name, sc_points, trans_table,
+                                fixed_charge_rate, out_dir, simple,
+                                line_limited, max_workers, **kwargs)
         except Exception as e:
             logger.exception('Supply curve compute failed. Received the '
                              'following error:\n{}'.format(e))
             raise e
 
-        fn_out = '{}.csv'.format(name)
-        fpath_out = os.path.join(out_dir, fn_out)
-        out.to_csv(fpath_out, index=False)
-
         runtime = (time.time() - t0) / 60
         logger.info('Supply curve complete. Time elapsed: {:.2f} min. '
                     'Target output dir: {}'.format(runtime, out_dir))
@@ -280,10 +291,110 @@ def direct(ctx, sc_points, trans_table, fixed_charge_rate, sc_features,
         Status.make_job_file(out_dir, 'supply-curve', name, status)
 
 
+def run_sc(name, sc_points, trans_table, fixed_charge_rate, out_dir, simple,
+           line_limited, max_workers, **kwargs):
+    """Run a single supply curve and save it to out_dir.
+
+    Parameters
+    ----------
+    name : str
+        Job name, used for the output file name.
+    sc_points : str
+        Supply curve point summary table.
+    trans_table : str
+        Supply curve transmission mapping table.
+    fixed_charge_rate : float
+        Fixed charge rate used to compute LCOT.
+    out_dir : str
+        Directory to save the supply curve output to.
+    simple : bool
+        Flag to run the simple supply curve calculation.
+    line_limited : bool
+        Flag to use the line-limited substation capacity calculation.
+    max_workers : int | None
+        Number of workers to use to compute lcot.
+    kwargs : dict
+        Additional kwargs for SupplyCurve.full or SupplyCurve.simple
+
+    Returns
+    -------
+    fn_out : str
+        Output file name.
+    """
+    if simple:
+        out = SupplyCurve.simple(sc_points, trans_table, fixed_charge_rate,
+                                 max_workers=max_workers, **kwargs)
+    else:
+        out = SupplyCurve.full(sc_points, trans_table, fixed_charge_rate,
+                               line_limited=line_limited,
+                               max_workers=max_workers, **kwargs)
+
+    fn_out = '{}{}'.format(name, ColumnarTable.output_ext(sc_points))
+    ColumnarTable.save(out, os.path.join(out_dir, fn_out))
+
+    return fn_out
+
+
+def run_scenarios(name, sc_points, trans_table, fixed_charge_rate, scenarios,
+                  scenario_cache, out_dir, simple, line_limited, max_workers,
+                  sc_features=None, offshore_trans_table=None, **defaults):
+    """Run a supply curve scenario sweep and save one output per scenario
+    to out_dir.
+
+    Parameters
+    ----------
+    name : str
+        Job name, used as the prefix of the output file names.
+    sc_points : str
+        Supply curve point summary table.
+    trans_table : str
+        Supply curve transmission mapping table.
+    fixed_charge_rate : float
+        Default fixed charge rate used to compute LCOT.
+    scenarios : str | dict | list
+        Scenario definitions, see SupplyCurveScenarios.parse_scenarios
+    scenario_cache : str | None
+        .h5 file to cache the merged supply curve tables in.
+    out_dir : str
+        Directory to save the scenario outputs to.
+    simple : bool
+        Default flag to run the simple supply curve calculation.
+    line_limited : bool
+        Default flag to use the line-limited substation capacity calculation.
+    max_workers : int | None
+        Number of scenarios to run in parallel.
+    sc_features : str | None
+        Table containing additional supply curve features.
+    offshore_trans_table : str | None
+        Offshore transmission table.
+    defaults : dict
+        Additional default scenario inputs.
+
+    Returns
+    -------
+    fn_out : list
+        Output file names, one per scenario.
+    """
+    if isinstance(scenarios, str) and not os.path.exists(scenarios):
+        scenarios = dict_str_load(scenarios)
+
+    out = SupplyCurveScenarios.run(sc_points, trans_table, scenarios,
+                                   sc_features=sc_features,
+                                   offshore_trans_table=offshore_trans_table,
+                                   cache_fpath=scenario_cache,
+                                   out_dir=out_dir, out_prefix=name,
+                                   max_workers=max_workers,
+                                   fcr=fixed_charge_rate, simple=simple,
+                                   line_limited=line_limited, **defaults)
+
+    return [os.path.basename(fp) for fp in out.values()]
+
+
 def get_node_cmd(name, sc_points, trans_table, fixed_charge_rate, sc_features,
                  transmission_costs, sort_on, offshore_trans_table, wind_dirs,
                  n_dirs, downwind, offshore_compete, max_workers, out_dir,
-                 log_dir, simple, line_limited, verbose):
+                 log_dir, simple, line_limited, verbose, scenarios=None,
+                 scenario_cache=None):
     """Get a CLI call command for the Supply Curve cli."""
 
     args = ['-sc {}'.format(SLURM.s(sc_points)),
@@ -302,6 +413,12 @@ def get_node_cmd(name, sc_points, trans_table, fixed_charge_rate, sc_features,
     if wind_dirs is not None:
         args.append('-wd {}'.format(SLURM.s(wind_dirs)))
 
+    if scenarios is not None:
+        args.append('-scn {}'.format(SLURM.s(scenarios)))
+
+    if scenario_cache is not None:
+        args.append('-scc {}'.format(SLURM.s(scenario_cache)))
+
     if downwind:
         args.append('-dw')
 
@@ -366,6 +483,8 @@ def slurm(ctx, alloc, memory, walltime, feature, module, conda_env,
     max_workers = ctx.obj['MAX_WORKERS']
     out_dir = ctx.obj['OUT_DIR']
     log_dir = ctx.obj['LOG_DIR']
+    scenarios = ctx.obj['SCENARIOS']
+    scenario_cache = ctx.obj['SCENARIO_CACHE']
     verbose = ctx.obj['VERBOSE']
 
     if stdout_path is None:
@@ -375,7 +494,8 @@ def slurm(ctx, alloc, memory, walltime, feature, module, conda_env,
                        sc_features, transmission_costs, sort_on,
                        offshore_trans_table, wind_dirs, n_dirs, downwind,
                        offshore_compete, max_workers, out_dir, log_dir,
-                       simple, line_limited, verbose)
+                       simple, line_limited, verbose, scenarios=scenarios,
+                       scenario_cache=scenario_cache)
 
     slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
     if slurm_manager is None:
@@ -407,7 +527,9 @@ def slurm(ctx, alloc, memory, walltime, feature, module, conda_env,
             Status.add_job(
                 out_dir, 'supply-curve', name, replace=True,
                 job_attrs={'job_id': out, 'hardware': 'eagle',
-                           'fout': '{}.csv'.format(name), 'dirout': out_dir})
+                           'fout': '{}{}'.format(
+                               name, ColumnarTable.output_ext(sc_points)),
+                           'dirout': out_dir})
 
     click.echo(msg)
     logger.info(msg)
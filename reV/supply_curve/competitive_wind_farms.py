@@ -5,7 +5,8 @@ Competitive Wind Farms exclusion handler
 import logging
 import numpy as np
 
-from rex.utilities.utilities import parse_table
+from reV.handlers.tables import ColumnarTable
+from reV.supply_curve.full_sort import exclude_points
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,11 @@ logger = logging.getLogger(__name__)
 class CompetitiveWindFarms:
     """
     Handle competitive wind farm exclusion during supply curve sorting
+
+    The neighbor graph is stored in dense integer arrays indexed by
+    sc_point_gid (upwind and downwind neighbors, -1 for no neighbor) and the
+    sc_point_gid to sc_gid mapping is stored in CSR format so that all
+    lookups and exclusions are array operations.
     """
 
     def __init__(self, wind_dirs, sc_points, n_dirs=2, offshore=False):
@@ -33,8 +39,10 @@ class CompetitiveWindFarms:
         """
         self._wind_dirs = self._parse_wind_dirs(wind_dirs)
 
-        self._sc_gids, self._sc_point_gids, self._mask = \
-            self._parse_sc_points(sc_points, offshore=offshore)
+        out = self._parse_sc_points(sc_points, offshore=offshore)
+        self._sc_gid_map, self._point_ptr, self._point_sc_gids = out
+        self._valid = np.diff(self._point_ptr) > 0
+        self._mask = np.ones(len(self._valid), dtype=bool)
 
         self._offshore = offshore
 
@@ -46,15 +54,15 @@ class CompetitiveWindFarms:
             logger.error(msg)
             raise RuntimeError(msg)
 
-        mask = self._wind_dirs.index.isin(self._sc_point_gids.keys())
+        mask = self._wind_dirs.index.isin(np.flatnonzero(self._valid))
         self._wind_dirs = self._wind_dirs.loc[mask]
-        self._upwind, self._downwind = self._get_neighbors(self._wind_dirs,
-                                                           n_dirs=n_dirs)
+        self._upwind, self._downwind = \
+            self._get_neighbors(self._wind_dirs, n_dirs=n_dirs,
+                                n_points=len(self._mask))
 
     def __repr__(self):
-        gids = len(self._upwind)
-        # pylint: disable=unsubscriptable-object
-        neighbors = len(self._upwind.values[0])
+        gids = self._valid.sum()
+        neighbors = self._upwind.shape[1]
         msg = ("{} with {} sc_point_gids and {} prominent directions"
                .format(self.__class__.__name__, gids, neighbors))
 
@@ -119,10 +127,7 @@ class CompetitiveWindFarms:
         -------
         ndarray
         """
-        sc_point_gids = np.array(list(self._sc_point_gids.keys()), dtype=int)
-        mask = self.mask[sc_point_gids]
-
-        return sc_point_gids[mask]
+        return np.flatnonzero(self._valid & self._mask)
 
     @property
     def sc_gids(self):
@@ -133,11 +138,48 @@ class CompetitiveWindFarms:
         -------
         ndarray
         """
-        sc_gids = \
-            np.concatenate([self._sc_point_gids[gid]
-                            for gid in self.sc_point_gids])
+        keep = np.repeat(self._valid & self._mask, np.diff(self._point_ptr))
+
+        return self._point_sc_gids[keep]
+
+    @property
+    def valid(self):
+        """
+        Boolean array of sc_point_gids present in the supply curve points,
+        only valid sc_point_gids can be excluded
+
+        Returns
+        -------
+        ndarray
+        """
+        return self._valid
+
+    @property
+    def sc_gid_map(self):
+        """
+        Dense sc_gid to sc_point_gid mapping, -1 for sc_gids that are not
+        in the (on-shore) supply curve points
+
+        Returns
+        -------
+        ndarray
+        """
+        return self._sc_gid_map
+
+    @property
+    def sc_point_gid_csr(self):
+        """
+        sc_point_gid to sc_gid mapping in CSR format: the sc_gids of
+        sc_point_gid i are sc_gids[ptr[i]:ptr[i + 1]]
 
-        return sc_gids
+        Returns
+        -------
+        ptr : ndarray
+            CSR pointers, length is len(mask) + 1
+        sc_gids : ndarray
+            sc_gids sorted by sc_point_gid
+        """
+        return self._point_ptr, self._point_sc_gids
 
     @staticmethod
     def _parse_table(table):
@@ -148,7 +190,8 @@ class CompetitiveWindFarms:
         Parameters
         ----------
         table : str | pd.DataFrame
-            Path to .csv or .json or DataFrame to parse
+            Path to .csv, .json, .h5, .parquet, or .feather or DataFrame
+            to parse
 
         Returns
         -------
@@ -156,7 +199,7 @@ class CompetitiveWindFarms:
             DataFrame extracted from file path
         """
         try:
-            table = parse_table(table)
+            table = ColumnarTable.parse(table)
         except ValueError as ex:
             logger.error(ex)
             raise
@@ -204,12 +247,14 @@ class CompetitiveWindFarms:
 
         Returns
         -------
-        sc_gids : pandas.DataFrame
-            sc_gid to sc_point_gid mapping
-        sc_point_gids : pandas.DataFrame
-            sc_point_gid to sc_gid mapping
-        mask : ndarray
-            Mask array to mask excluded sc_point_gids
+        sc_gid_map : ndarray
+            Dense sc_gid to sc_point_gid mapping, -1 for missing sc_gids
+        point_ptr : ndarray
+            CSR pointers from sc_point_gid to point_sc_gids, length is
+            max(sc_point_gid) + 2
+        point_sc_gids : ndarray
+            Unique sc_gids of each sc_point_gid (in order of appearance)
+            sorted by sc_point_gid
         """
         sc_points = cls._parse_table(sc_points)
         if 'offshore' in sc_points and not offshore:
@@ -218,21 +263,28 @@ class CompetitiveWindFarms:
             mask = sc_points['offshore'] == 0
             sc_points = sc_points.loc[mask]
 
-        mask = np.ones(int(1 + sc_points['sc_point_gid'].max()), dtype=bool)
+        sc_gids = sc_points['sc_gid'].values.astype(np.int64)
+        point_gids = sc_points['sc_point_gid'].values.astype(np.int64)
+        n_points = int(1 + point_gids.max())
+
+        sc_gid_map = np.full(int(1 + sc_gids.max()), -1, dtype=np.int64)
+        sc_gid_map[sc_gids] = point_gids
 
-        sc_points = sc_points[['sc_gid', 'sc_point_gid']]
-        sc_gids = sc_points.set_index('sc_gid')
-        sc_gids = {k: int(v[0]) for k, v in sc_gids.iterrows()}
+        # unique (sc_point_gid, sc_gid) pairs in order of appearance
+        pairs = np.stack((point_gids, sc_gids), axis=1)
+        _, first = np.unique(pairs, axis=0, return_index=True)
+        first = np.sort(first)
+        order = np.argsort(point_gids[first], kind='stable')
+        point_sc_gids = sc_gids[first][order]
 
-        sc_point_gids = \
-            sc_points.groupby('sc_point_gid')['sc_gid'].unique().to_frame()
-        sc_point_gids = {int(k): v['sc_gid']
-                         for k, v in sc_point_gids.iterrows()}
+        counts = np.bincount(point_gids[first], minlength=n_points)
+        point_ptr = np.zeros(n_points + 1, dtype=np.int64)
+        point_ptr[1:] = np.cumsum(counts)
 
-        return sc_gids, sc_point_gids, mask
+        return sc_gid_map, point_ptr, point_sc_gids
 
     @staticmethod
-    def _get_neighbors(wind_dirs, n_dirs=2):
+    def _get_neighbors(wind_dirs, n_dirs=2, n_points=None):
         """
         Parse prominent direction neighbors
 
@@ -243,13 +295,18 @@ class CompetitiveWindFarms:
             cardinal direction for each available sc point gid
         n_dirs : int, optional
             Number of prominent directions to use, by default 2
+        n_points : int, optional
+            Length of the sc_point_gid axis of the neighbor arrays, by
+            default None which uses max(sc_point_gid) + 1
 
         Returns
         -------
-        upwind : pandas.DataFrame
-            Upwind neighbor gids for n prominent wind directions
-        downwind : pandas.DataFrame
-            Downwind neighbor gids for n prominent wind directions
+        upwind : ndarray
+            (n_points, n_dirs) upwind neighbor gids for n prominent wind
+            directions, -1 for no neighbor
+        downwind : ndarray
+            (n_points, n_dirs) downwind neighbor gids for n prominent wind
+            directions, -1 for no neighbor
         """
         cols = [c for c in wind_dirs
                 if (c.endswith('_gid') and not c.startswith('sc'))]
@@ -268,14 +325,40 @@ class CompetitiveWindFarms:
         downwind_gids = wind_dirs[cols].values
         downwind_gids = np.take_along_axis(downwind_gids, neighbors, axis=1)
 
-        downwind = {}
-        upwind = {}
-        for i, gid in enumerate(wind_dirs.index.values):
-            downwind[gid] = downwind_gids[i]
-            upwind[gid] = upwind_gids[i]
+        gids = wind_dirs.index.values.astype(np.int64)
+        if n_points is None:
+            n_points = int(1 + gids.max()) if len(gids) else 0
+
+        upwind = np.full((n_points, neighbors.shape[1]), -1, dtype=np.int64)
+        downwind = upwind.copy()
+        for arr, neighbor_gids in ((upwind, upwind_gids),
+                                   (downwind, downwind_gids)):
+            neighbor_gids = np.asarray(neighbor_gids, dtype=float)
+            arr[gids] = np.nan_to_num(neighbor_gids, nan=-1).astype(np.int64)
 
         return upwind, downwind
 
+    def get_neighbors(self, downwind=False):
+        """
+        Get the neighbor sc_point_gids to exclude for every sc_point_gid
+
+        Parameters
+        ----------
+        downwind : bool, optional
+            Flag to include downwind neighbors as well as upwind neighbors,
+            by default False
+
+        Returns
+        -------
+        neighbors : ndarray
+            (n_points, n_neighbors) array of neighbor sc_point_gids, -1 for
+            no neighbor
+        """
+        if downwind:
+            return np.hstack((self._upwind, self._downwind))
+
+        return self._upwind
+
     def map_sc_point_gid_to_sc_gid(self, sc_point_gid):
         """
         Map given sc_point_gid to equivalent sc_gid(s)
@@ -287,10 +370,16 @@ class CompetitiveWindFarms:
 
         Returns
         -------
-        int | list
+        ndarray
             Equivalent supply curve gid(s)
         """
-        return self._sc_point_gids[sc_point_gid]
+        if not self._is_valid(sc_point_gid):
+            msg = 'Invalid sc_point_gid: {}'.format(sc_point_gid)
+            logger.error(msg)
+            raise KeyError(msg)
+
+        ptr = self._point_ptr
+        return self._point_sc_gids[ptr[sc_point_gid]:ptr[sc_point_gid + 1]]
 
     def map_sc_gid_to_sc_point_gid(self, sc_gid):
         """
@@ -306,7 +395,13 @@ class CompetitiveWindFarms:
         int
             Equivalent supply point curve gid
         """
-        return self._sc_gids[sc_gid]
+        sc_point_gid = self.check_sc_gid(sc_gid)
+        if sc_point_gid is None:
+            msg = 'Invalid sc_gid: {}'.format(sc_gid)
+            logger.error(msg)
+            raise KeyError(msg)
+
+        return sc_point_gid
 
     def check_sc_gid(self, sc_gid):
         """
@@ -325,11 +420,28 @@ class CompetitiveWindFarms:
             (offshore)
         """
         sc_point_gid = None
-        if sc_gid in self._sc_gids:
-            sc_point_gid = self._sc_gids[sc_gid]
+        if 0 <= sc_gid < len(self._sc_gid_map):
+            if self._sc_gid_map[int(sc_gid)] >= 0:
+                sc_point_gid = int(self._sc_gid_map[int(sc_gid)])
 
         return sc_point_gid
 
+    def _is_valid(self, sc_point_gid):
+        """
+        Check if sc_point_gid is in the supply curve points
+
+        Parameters
+        ----------
+        sc_point_gid : int
+            Supply curve point gid
+
+        Returns
+        -------
+        bool
+        """
+        return (0 <= sc_point_gid < len(self._valid)
+                and self._valid[int(sc_point_gid)])
+
     def map_upwind(self, sc_point_gid):
         """
         Map given sc_point_gid to upwind neighbors
@@ -340,7 +452,7 @@ class CompetitiveWindFarms:
             Supply point curve gid to get upwind neighbors
         Returns
         -------
-        int | list
+        ndarray
             upwind neighborings
         """
         return self._upwind[sc_point_gid]
@@ -355,31 +467,34 @@ class CompetitiveWindFarms:
             Supply point curve gid to get downwind neighbors
         Returns
         -------
-        int | list
+        ndarray
             downwind neighborings
         """
         return self._downwind[sc_point_gid]
 
     def exclude_sc_point_gid(self, sc_point_gid):
         """
-        Exclude supply curve point gid, return False if gid is not present
-        in list of available gids to avoid key errors elsewhere
+        Exclude supply curve point gid(s), gids that are not present in the
+        list of available gids are ignored to avoid key errors elsewhere
 
         Parameters
         ----------
-        sc_point_gid : int
-            supply curve point gid to mask
+        sc_point_gid : int | list | ndarray
+            supply curve point gid(s) to mask
 
         Returns
         -------
-        bool
-            Flag if gid is valid and was masked
+        bool | ndarray
+            Flag(s) if gid is valid and was masked
         """
-        if sc_point_gid in self._sc_point_gids:
-            self._mask[sc_point_gid] = False
-            out = True
-        else:
-            out = False
+        gids = np.asarray(sc_point_gid, dtype=np.int64)
+        in_bounds = (gids >= 0) & (gids < len(self._valid))
+        out = np.zeros(gids.shape, dtype=bool)
+        out[in_bounds] = self._valid[gids[in_bounds]]
+        self._mask[gids[out]] = False
+
+        if out.ndim == 0:
+            out = bool(out)
 
         return out
 
@@ -413,19 +528,9 @@ class CompetitiveWindFarms:
 
         sc_points = sc_points.sort_values(sort_on)
 
-        sc_point_gids = sc_points['sc_point_gid'].values.astype(int)
-
-        for i in range(len(sc_points)):
-            gid = sc_point_gids[i]
-            if self.mask[gid]:
-                upwind_gids = self['upwind', gid]
-                for n in upwind_gids:
-                    self.exclude_sc_point_gid(n)
-
-                if downwind:
-                    downwind_gids = self['downwind', gid]
-                    for n in downwind_gids:
-                        self.exclude_sc_point_gid(n)
+        sc_point_gids = sc_points['sc_point_gid'].values.astype(np.int64)
+        exclude_points(sc_point_gids, self._mask, self._valid,
+                       self.get_neighbors(downwind=downwind))
 
         sc_gids = self.sc_gids
         mask = sc_points['sc_gid'].isin(sc_gids)
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""reV supply curve data layer aggregation.
+
+Aggregate data layer values for many supply curve points at once with
+integer coded bincount and ufunc.reduceat reductions instead of one numpy
+(or scipy.stats) call per supply curve point.
+"""
+import json
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class DataLayerAggregation:
+    """
+    Grouped data layer aggregation. The included data layer values of all
+    groups (e.g. SC points) are passed as flat arrays together with the
+    group index of each value. Outputs match the single point
+    SupplyCurvePointSummary data layer methods:
+
+    - mode: most common value, smallest value on ties
+    - mean: sum of the inclusion weighted values divided by the number of
+      values
+    - max / min / sum: max, min, and inclusion weighted sum of the values
+    - category: jsonified dictionary mapping each unique value to the sum
+      of its inclusion values
+    """
+    METHODS = ('mode', 'mean', 'max', 'min', 'sum', 'category')
+    # integer data with a value range below this (or the number of values)
+    # is coded by offset instead of sorting
+    MAX_OFFSET_CODES = 2 ** 16
+    # max number of (group, value) pairs counted with a dense bincount
+    MAX_DENSE_PAIRS = 2 ** 26
+
+    def __init__(self, groups, data, excl_mult, n_groups):
+        """
+        Parameters
+        ----------
+        groups : np.ndarray
+            1D array with the group index of each value, must be sorted in
+            non-decreasing order.
+        data : np.ndarray
+            1D array of data layer values.
+        excl_mult : np.ndarray
+            1D array of inclusion values for each data layer value.
+        n_groups : int
+            Number of groups. Groups without any values have None outputs.
+        """
+        self._groups = np.asarray(groups, dtype=np.int64)
+        self._data = np.asarray(data)
+        self._excl_mult = np.asarray(excl_mult)
+        self._n_groups = n_groups
+
+        starts = np.ones(len(self._groups), dtype=bool)
+        starts[1:] = self._groups[1:] != self._groups[:-1]
+        self._starts = np.flatnonzero(starts)
+        self._present = self._groups[self._starts]
+
+    def _empty(self):
+        """Get an object array of None outputs for all groups"""
+        return np.full(self._n_groups, None, dtype=object)
+
+    def _fill(self, values):
+        """Place one value per present group into the group outputs"""
+        out = self._empty()
+        out[self._present] = list(values)
+
+        return out
+
+    def _weighted_sum(self):
+        """Inclusion weighted sum of the values of each present group, cast
+        to the dtype of data * excl_mult"""
+        dtype = np.result_type(self._data.dtype, self._excl_mult.dtype)
+        weights = self._data.astype(np.float64) * self._excl_mult
+        total = np.bincount(self._groups, weights=weights,
+                            minlength=self._n_groups)
+
+        return total[self._present], dtype
+
+    def sum(self):
+        """Inclusion weighted sum of each group
+
+        Returns
+        -------
+        np.ndarray
+        """
+        total, dtype = self._weighted_sum()
+
+        return self._fill(total.astype(dtype))
+
+    def mean(self):
+        """Inclusion weighted sum of each group divided by the number of
+        values in the group
+
+        Returns
+        -------
+        np.ndarray
+        """
+        total, dtype = self._weighted_sum()
+        count = np.diff(np.append(self._starts, len(self._groups)))
+
+        return self._fill((total / count).astype(dtype))
+
+    def _reduceat(self, ufunc):
+        """Reduce the values of each present group with a numpy ufunc"""
+        if not len(self._data):
+            return self._empty()
+
+        return self._fill(ufunc.reduceat(self._data, self._starts))
+
+    def max(self):
+        """Max value of each group
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._reduceat(np.maximum)
+
+    def min(self):
+        """Min value of each group
+
+        Returns
+        -------
+        np.ndarray
+        """
+        return self._reduceat(np.minimum)
+
+    def _codes(self):
+        """Integer code the data values. Integer data with a small value
+        range is coded by offset (no sorting), other data with np.unique.
+
+        Returns
+        -------
+        codes : np.ndarray
+            Index of each data value in uniques.
+        uniques : np.ndarray
+            Sorted candidate data values (may include values that are not
+            in the data for offset coded data).
+        """
+        data = self._data
+        if data.dtype.kind in 'iub':
+            vmin, vmax = int(data.min()), int(data.max())
+            if vmax - vmin < max(len(data), self.MAX_OFFSET_CODES):
+                uniques = np.arange(vmin, vmax + 1).astype(data.dtype)
+                codes = data.astype(np.int64) - vmin
+                return codes, uniques
+
+        uniques, codes = np.unique(data, return_inverse=True)
+
+        return codes, uniques
+
+    def _pair_sums(self, weights=None):
+        """Get the count (or sum of weights) of each unique (group, value)
+        pair
+
+        Parameters
+        ----------
+        weights : np.ndarray | None
+            Weights for each data value, None counts the values.
+
+        Returns
+        -------
+        groups : np.ndarray
+            Group index of each pair that is in the data, sorted.
+        codes : np.ndarray
+            Index of the value of each pair in uniques, sorted within each
+            group.
+        sums : np.ndarray
+            Count or sum of weights of each pair.
+        uniques : np.ndarray
+            Sorted data values.
+        """
+        codes, uniques = self._codes()
+        n_uniques = len(uniques)
+        keys = self._groups * n_uniques + codes
+        if self._n_groups * n_uniques <= self.MAX_DENSE_PAIRS:
+            sums = np.bincount(keys, weights=weights,
+                               minlength=self._n_groups * n_uniques)
+            counts = sums if weights is None else np.bincount(
+                keys, minlength=self._n_groups * n_uniques)
+            keys = np.flatnonzero(counts)
+            sums = sums[keys]
+        else:
+            keys, inverse = np.unique(keys, return_inverse=True)
+            sums = np.bincount(inverse, weights=weights,
+                               minlength=len(keys))
+
+        groups, codes = np.divmod(keys, n_uniques)
+
+        return groups, codes, sums, uniques
+
+    def mode(self):
+        """Most common value of each group (smallest value on ties)
+
+        Returns
+        -------
+        np.ndarray
+        """
+        out = self._empty()
+        if not len(self._data):
+            return out
+
+        groups, codes, counts, uniques = self._pair_sums()
+        order = np.lexsort((codes, -counts, groups))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = groups[order][1:] != groups[order][:-1]
+        order = order[first]
+        out[groups[order]] = list(uniques[codes[order]])
+
+        return out
+
+    def category(self):
+        """Jsonified dictionary of the sum of the inclusion values of each
+        unique value in each group
+
+        Returns
+        -------
+        np.ndarray
+        """
+        out = self._empty()
+        if not len(self._data):
+            return out
+
+        groups, codes, totals, uniques = self._pair_sums(
+            weights=self._excl_mult)
+        totals = totals.astype(self._excl_mult.dtype).tolist()
+
+        # same string keys as rex jsonify_dict
+        categories = [str(category) for category in uniques[codes]]
+
+        splits = np.flatnonzero(groups[1:] != groups[:-1]) + 1
+        bounds = zip(np.r_[0, splits], np.r_[splits, len(groups)])
+        for i0, i1 in bounds:
+            out[groups[i0]] = json.dumps(dict(zip(categories[i0:i1],
+                                                  totals[i0:i1])))
+
+        return out
+
+    @classmethod
+    def run(cls, groups, data, excl_mult, n_groups, method):
+        """Aggregate data layer values for each group.
+
+        Parameters
+        ----------
+        groups : np.ndarray
+            1D array with the group index of each value, must be sorted in
+            non-decreasing order.
+        data : np.ndarray
+            1D array of data layer values.
+        excl_mult : np.ndarray
+            1D array of inclusion values for each data layer value.
+        n_groups : int
+            Number of groups.
+        method : str
+            Aggregation method (mode, mean, max, min, sum, category)
+
+        Returns
+        -------
+        out : np.ndarray
+            Object array with the aggregated value of each group, None for
+            groups without any values.
+        """
+        method = method.lower()
+        if method not in cls.METHODS:
+            e = ('Cannot recognize data layer agg method: '
+                 '"{}". Can only {}'.format(method, list(cls.METHODS)))
+            logger.error(e)
+            raise ValueError(e)
+
+        agg = cls(groups, data, excl_mult, n_groups)
+
+        return getattr(agg, method)()
@@ -2,13 +2,22 @@
 """
 Generate reV inclusion mask from exclusion layers
 """
+from collections import OrderedDict
+from concurrent.futures import as_completed
+import h5py
+import hashlib
+import json
 import logging
 import numpy as np
-from scipy import ndimage
+import os
+from scipy import ndimage, sparse
+from scipy.sparse import csgraph
 from warnings import warn
 
+from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.loggers import log_mem
 from reV.handlers.exclusions import ExclusionLayers
+from reV.handlers.h5_pool import H5FilePool
 from reV.utilities.exceptions import ExclusionLayerError
 
 logger = logging.getLogger(__name__)
@@ -391,8 +400,22 @@ class ExclusionMask:
                           [1, 1, 1],
                           [0, 1, 0]])}
 
+    # number of exclusion rows labeled at once by the contiguous area filter
+    AREA_FILTER_BAND_SIZE = 512
+
+    # number of area filtered row bands kept in memory in each process
+    AREA_FILTER_CACHE_BANDS = 2
+
+    # contiguous area filter labels and area filtered row bands shared by
+    # the masks in this process, keyed by the exclusion inputs
+    # (see _area_filter_key)
+    _AREA_FILTERS = OrderedDict()
+    _AREA_FILTERS_SIZE = 8
+    _FILTERED_BANDS = OrderedDict()
+
     def __init__(self, excl_h5, layers=None, min_area=None,
-                 kernel='queen', hsds=False, check_layers=False):
+                 kernel='queen', hsds=False, check_layers=False,
+                 tile_cache_size=None, area_filter=None):
         """
         Parameters
         ----------
@@ -410,11 +433,23 @@ class ExclusionMask:
         check_layers : bool
             Run a pre-flight check on each layer to ensure they contain
             un-excluded values
+        tile_cache_size : int | None
+            Optional byte budget for the ExclusionLayers LRU tile cache,
+            None disables the cache.
+        area_filter : dict | None
+            Contiguous area filter labels for the full exclusion extent
+            computed by another mask with the same inputs (see area_filter
+            property), e.g. in a parent process. None will label the
+            contiguous areas when they are first needed.
         """
         self._layers = {}
-        self._excl_h5 = ExclusionLayers(excl_h5, hsds=hsds)
+        self._excl_h5 = ExclusionLayers(excl_h5, hsds=hsds,
+                                        tile_cache_size=tile_cache_size)
         self._excl_layers = None
         self._check_layers = check_layers
+        self._mask_dset = None
+        self._area_filter = area_filter
+        self._area_key = None
 
         if layers is not None:
             if not isinstance(layers, list):
@@ -468,6 +503,9 @@ class ExclusionMask:
             ("and" operation) such that 1 is included, 0 is excluded,
             0.5 is half.
         """
+        if self._mask_dset is not None:
+            return self._read_mask(*ds_slice)
+
         return self._generate_mask(*ds_slice)
 
     def close(self):
@@ -547,6 +585,18 @@ class ExclusionMask:
         mask = self[...]
         return mask
 
+    @property
+    def mask_dset(self):
+        """
+        Name of the persisted inclusion mask layer read in place of the
+        exclusion layers, None if the mask is computed on the fly
+
+        Returns
+        -------
+        str | None
+        """
+        return self._mask_dset
+
     @property
     def latitude(self):
         """
@@ -655,66 +705,6 @@ class ExclusionMask:
 
         return mask
 
-    def _increase_mask_slice(self, ds_slice, n=1):
-        """Increase the mask slice, e.g. from 64x64 to 192x192, to help the
-        contiguous area filter be more accurate.
-
-        Parameters
-        ----------
-        ds_slice : tuple
-            Two entry tuple with x and y slices. Anything else will be passed
-            through unaffected.
-        n : int
-            Number of blocks to increase in each direction. For example,
-            a 64x64 slice with n=1 will increase to 192x192
-            (increases by 64xn in each direction).
-
-        Returns
-        -------
-        new_slice : tuple
-            Two entry tuple with x and y slices with increased dimensions.
-        sub_slice : tuple
-            Two entry tuple with x and y slices to retrieve the original
-            slice out of the bigger slice.
-        """
-        new_slice = ds_slice
-        sub_slice = (slice(None), slice(None))
-
-        if isinstance(ds_slice, tuple) and len(ds_slice) == 2:
-            y_slice = ds_slice[0]
-            x_slice = ds_slice[1]
-            if isinstance(x_slice, slice) and isinstance(y_slice, slice):
-                y_diff = n * np.abs(y_slice.stop - y_slice.start)
-                x_diff = n * np.abs(x_slice.stop - x_slice.start)
-
-                y_new_start = int(np.max((0, (y_slice.start - y_diff))))
-                x_new_start = int(np.max((0, (x_slice.start - x_diff))))
-
-                y_new_stop = int(np.min((self.shape[0],
-                                         (y_slice.stop + y_diff))))
-                x_new_stop = int(np.min((self.shape[1],
-                                         (x_slice.stop + x_diff))))
-
-                new_slice = (slice(y_new_start, y_new_stop),
-                             slice(x_new_start, x_new_stop))
-
-                if y_new_start == y_slice.start:
-                    y_sub_start = 0
-                else:
-                    y_sub_start = int(n * y_diff)
-                if x_new_start == x_slice.start:
-                    x_sub_start = 0
-                else:
-                    x_sub_start = int(n * x_diff)
-
-                y_sub_stop = y_sub_start + y_diff
-                x_sub_stop = x_sub_start + x_diff
-
-                sub_slice = (slice(y_sub_start, y_sub_stop),
-                             slice(x_sub_start, x_sub_stop))
-
-        return new_slice, sub_slice
-
     def _generate_ones_mask(self, ds_slice):
         """
         Generate mask of all ones
@@ -758,9 +748,9 @@ class ExclusionMask:
 
         return mask
 
-    def _generate_mask(self, *ds_slice):
+    def _read_mask(self, *ds_slice):
         """
-        Generate multiplicative inclusion mask from exclusion layers.
+        Read the multiplicative inclusion mask from the persisted mask layer.
 
         Parameters
         ----------
@@ -769,6 +759,27 @@ class ExclusionMask:
             For example, (slice(0, 64), slice(0, 64)) will extract a 64x64
             exclusions mask.
 
+        Returns
+        -------
+        mask : ndarray
+            Multiplicative inclusion mask such that 1 is included,
+            0 is excluded, 0.5 is half.
+        """
+        if len(ds_slice) == 1 and isinstance(ds_slice[0], tuple):
+            ds_slice = ds_slice[0]
+
+        return self.excl_h5[(self._mask_dset, ) + ds_slice]
+
+    def _combine_layers(self, ds_slice):
+        """
+        Combine the exclusion layers into a multiplicative inclusion mask
+        without the contiguous area filter.
+
+        Parameters
+        ----------
+        ds_slice : tuple
+            dataset slice of interest along axis 0 and 1
+
         Returns
         -------
         mask : ndarray
@@ -777,41 +788,279 @@ class ExclusionMask:
             0.5 is half.
         """
         mask = None
-        if len(ds_slice) == 1 & isinstance(ds_slice[0], tuple):
-            ds_slice = ds_slice[0]
+        force_include = []
+        for layer in self.layers:
+            if layer.force_include:
+                force_include.append(layer)
+            else:
+                logger.debug('Computing exclusions {}'.format(layer))
+                log_mem(logger, log_level='DEBUG')
+                layer_slice = (layer.layer, ) + ds_slice
+                layer_mask = layer[self.excl_h5[layer_slice]]
+                if mask is None:
+                    mask = layer_mask
+                else:
+                    mask = np.minimum(mask, layer_mask, dtype='float32')
 
-        if self._min_area is not None:
-            ds_slice, sub_slice = self._increase_mask_slice(ds_slice, n=1)
+        if force_include:
+            logger.debug('Computing forced inclusions')
+            log_mem(logger, log_level='DEBUG')
+            mask = self._force_include(mask, force_include, ds_slice)
 
-        if self.layers:
-            force_include = []
-            for layer in self.layers:
-                if layer.force_include:
-                    force_include.append(layer)
-                else:
-                    logger.debug('Computing exclusions {}'.format(layer))
-                    log_mem(logger, log_level='DEBUG')
-                    layer_slice = (layer.layer, ) + ds_slice
-                    layer_mask = layer[self.excl_h5[layer_slice]]
-                    if mask is None:
-                        mask = layer_mask
-                    else:
-                        mask = np.minimum(mask, layer_mask, dtype='float32')
+        return mask
 
-            if force_include:
-                logger.debug('Computing forced inclusions')
-                log_mem(logger, log_level='DEBUG')
-                mask = self._force_include(mask, force_include, ds_slice)
+    @property
+    def area_filter(self):
+        """
+        Contiguous area filter labels for the full exclusion extent, computed
+        once per process for a given set of exclusion inputs.
+
+        Returns
+        -------
+        area_filter : dict
+            "bands" list of (start, stop) exclusion rows labeled together,
+            "offsets" array of the first global component index in each
+            band, and "small" boolean array flagging the global components
+            smaller than min_area.
+        """
+        if self._area_filter is None and self._min_area is not None:
+            key = self._area_filter_key
+            if key in self._AREA_FILTERS:
+                self._AREA_FILTERS.move_to_end(key)
+            else:
+                self._AREA_FILTERS[key] = self._label_components()
+                while len(self._AREA_FILTERS) > self._AREA_FILTERS_SIZE:
+                    self._AREA_FILTERS.popitem(last=False)
+
+            self._area_filter = self._AREA_FILTERS[key]
+
+        return self._area_filter
+
+    @property
+    def _area_filter_key(self):
+        """
+        Key identifying the contiguous area filter of this mask in the
+        process caches.
+
+        Returns
+        -------
+        key : tuple
+        """
+        if self._area_key is None:
+            layers = sorted(json.dumps(vars(layer), sort_keys=True,
+                                       default=str)
+                            for layer in self.layers)
+            self._area_key = (self.excl_h5.h5_file, tuple(layers),
+                              float(self._min_area), self._kernel,
+                              self.AREA_FILTER_BAND_SIZE)
+
+        return self._area_key
+
+    def _label_band(self, band):
+        """
+        Label the contiguous included areas of a full-width row band.
+
+        Parameters
+        ----------
+        band : tuple
+            (start, stop) exclusion rows of the band
+
+        Returns
+        -------
+        mask : ndarray
+            Inclusion mask of the band before the area filter
+        labels : ndarray
+            Band-local component labels, 0 is excluded
+        n : int
+            Number of components in the band
+        """
+        mask = self._combine_layers((slice(*band), slice(None)))
+        labels, n = ndimage.label(mask > 0,
+                                  structure=self.FILTER_KERNELS[self._kernel])
+
+        return mask, labels, n
+
+    def _band_edges(self, upper, lower):
+        """
+        Find the components connected across the boundary of two bands.
+
+        Parameters
+        ----------
+        upper : ndarray
+            Global component index of the last row of the upper band,
+            -1 is excluded
+        lower : ndarray
+            Global component index of the first row of the lower band,
+            -1 is excluded
+
+        Returns
+        -------
+        edges : ndarray
+            (2, n) array of connected global component indices
+        """
+        edges = []
+        n = len(upper)
+        for j in np.where(self.FILTER_KERNELS[self._kernel][0])[0]:
+            shift = j - 1
+            a = upper[max(0, -shift):n - max(0, shift)]
+            b = lower[max(0, shift):n - max(0, -shift)]
+            edges.append(np.vstack((a, b)))
+
+        edges = np.hstack(edges)
+
+        return edges[:, (edges >= 0).all(axis=0)]
+
+    def _label_components(self, excl_area=0.0081):
+        """
+        Label the contiguous included areas of the full exclusion extent by
+        streaming full-width row bands and merging the components that touch
+        across band boundaries (union-find over the band edge graph).
+
+        Parameters
+        ----------
+        excl_area : float
+            Area of each exclusion pixel in km^2, assumes 90m resolution
+
+        Returns
+        -------
+        area_filter : dict
+            See area_filter property.
+        """
+        n_rows = self.shape[0]
+        step = self.AREA_FILTER_BAND_SIZE
+        bands = [(r0, min(r0 + step, n_rows))
+                 for r0 in range(0, n_rows, step)]
+        logger.debug('Labeling contiguous areas for the {}km2 area filter '
+                     'in {} row bands'.format(self._min_area, len(bands)))
+
+        offsets = np.zeros(len(bands) + 1, dtype=np.int64)
+        counts = []
+        edges = [np.zeros((2, 0), dtype=np.int64)]
+        last = None
+        for i, band in enumerate(bands):
+            _, labels, n = self._label_band(band)
+            counts.append(np.bincount(labels.ravel(), minlength=n + 1)[1:])
+            offsets[i + 1] = offsets[i] + n
+            first = np.where(labels[0] > 0, labels[0] + offsets[i] - 1, -1)
+            if last is not None:
+                edges.append(self._band_edges(last, first))
+
+            last = np.where(labels[-1] > 0, labels[-1] + offsets[i] - 1, -1)
+
+        n = int(offsets[-1])
+        edges = np.hstack(edges)
+        graph = sparse.coo_matrix((np.ones(edges.shape[1], dtype=bool),
+                                   (edges[0], edges[1])), shape=(n, n))
+        roots = csgraph.connected_components(graph, directed=False)[1]
+        area = np.bincount(roots, weights=np.concatenate(counts))
+        small = area[roots] < np.ceil(self._min_area / excl_area)
+
+        return {'bands': bands, 'offsets': offsets, 'small': small}
+
+    def _get_filtered_band(self, i):
+        """
+        Get the area filtered inclusion mask of a row band, keeping the most
+        recent bands in memory for all the masks in this process.
+
+        Parameters
+        ----------
+        i : int
+            Band index
+
+        Returns
+        -------
+        mask : ndarray
+            Area filtered inclusion mask of the band
+        """
+        key = (self._area_filter_key, i)
+        if key in self._FILTERED_BANDS:
+            self._FILTERED_BANDS.move_to_end(key)
+            return self._FILTERED_BANDS[key]
+
+        area_filter = self.area_filter
+        mask, labels, _ = self._label_band(area_filter['bands'][i])
+        pos = labels > 0
+        drop = np.zeros(labels.shape, dtype=bool)
+        drop[pos] = area_filter['small'][labels[pos]
+                                         + area_filter['offsets'][i] - 1]
+        mask[drop] = 0
+
+        self._FILTERED_BANDS[key] = mask
+        while len(self._FILTERED_BANDS) > self.AREA_FILTER_CACHE_BANDS:
+            self._FILTERED_BANDS.popitem(last=False)
+
+        return mask
+
+    def _get_area_filtered_mask(self, ds_slice):
+        """
+        Get the inclusion mask with the global contiguous area filter applied
+        from the row bands covering the requested slice.
+
+        Parameters
+        ----------
+        ds_slice : tuple
+            dataset slice of interest along axis 0 and 1
+
+        Returns
+        -------
+        mask : ndarray
+            Area filtered multiplicative inclusion mask
+        """
+        row_slice = slice(None)
+        if ds_slice and ds_slice[0] is not Ellipsis:
+            row_slice = ds_slice[0]
+
+        rows = np.atleast_1d(np.arange(self.shape[0])[row_slice])
+        if not rows.size:
+            return np.zeros(self.shape, dtype=np.float32)[ds_slice]
+
+        step = self.area_filter['bands'][0][1]
+        i0, i1 = rows.min() // step, rows.max() // step + 1
+        offset = i0 * step
+        if isinstance(row_slice, slice):
+            start, stop, s = row_slice.indices(self.shape[0])
+            stop = stop - offset if stop - offset >= 0 else None
+            row_slice = slice(start - offset, stop, s)
+        elif np.ndim(row_slice) == 0:
+            row_slice = int(rows[0] - offset)
+        else:
+            row_slice = rows - offset
 
-            if self._min_area is not None:
-                mask = self._area_filter(mask, min_area=self._min_area,
-                                         kernel=self._kernel)
-                mask = mask[sub_slice]
+        if i1 - i0 == 1:
+            mask = self._get_filtered_band(i0)
         else:
-            if self._min_area is not None:
-                ds_slice = sub_slice
+            mask = np.vstack([self._get_filtered_band(i)
+                              for i in range(i0, i1)])
+
+        return mask[(row_slice, ) + tuple(ds_slice[1:])].copy()
+
+    def _generate_mask(self, *ds_slice):
+        """
+        Generate multiplicative inclusion mask from exclusion layers.
+
+        Parameters
+        ----------
+        ds_slice : int | slice | list | ndarray
+            What to extract from ds, each arg is for a sequential axis.
+            For example, (slice(0, 64), slice(0, 64)) will extract a 64x64
+            exclusions mask.
 
+        Returns
+        -------
+        mask : ndarray
+            Multiplicative inclusion mask with all layers multiplied together
+            ("and" operation) such that 1 is included, 0 is excluded,
+            0.5 is half.
+        """
+        if len(ds_slice) == 1 & isinstance(ds_slice[0], tuple):
+            ds_slice = ds_slice[0]
+
+        if not self.layers:
             mask = self._generate_ones_mask(ds_slice)
+        elif self._min_area is None:
+            mask = self._combine_layers(ds_slice)
+        else:
+            mask = self._get_area_filtered_mask(ds_slice)
 
         return mask
 
@@ -851,8 +1100,14 @@ class ExclusionMaskFromDict(ExclusionMask):
     """
     Class to initialize ExclusionMask from a dictionary defining layers
     """
+
+    # prefix of the persisted inclusion mask layers written by build_mask
+    MASK_PREFIX = 'inclusion_mask_'
+
     def __init__(self, excl_h5, layers_dict=None, min_area=None,
-                 kernel='queen', hsds=False, check_layers=False):
+                 kernel='queen', hsds=False, check_layers=False,
+                 tile_cache_size=None, use_precomputed=False,
+                 area_filter=None):
         """
         Parameters
         ----------
@@ -870,6 +1125,21 @@ class ExclusionMaskFromDict(ExclusionMask):
         check_layers : bool
             Run a pre-flight check on each layer to ensure they contain
             un-excluded values
+        tile_cache_size : int | None
+            Optional byte budget for the ExclusionLayers LRU tile cache,
+            None disables the cache.
+        use_precomputed : bool
+            Flag to read the inclusion mask from the layer persisted by
+            build_mask for this layers_dict, min_area, and kernel if it
+            exists in excl_h5 instead of re-computing it from the
+            exclusion layers. The persisted mask is only identified by
+            these inputs, it is not checked against the exclusion layer
+            data and must be rebuilt whenever a layer changes.
+        area_filter : dict | None
+            Contiguous area filter labels for the full exclusion extent
+            computed by another mask with the same inputs (see area_filter
+            property), e.g. in a parent process. None will label the
+            contiguous areas when they are first needed.
         """
         if layers_dict is not None:
             layers = []
@@ -879,7 +1149,281 @@ class ExclusionMaskFromDict(ExclusionMask):
             layers = None
 
         super().__init__(excl_h5, layers=layers, min_area=min_area,
-                         kernel=kernel, hsds=hsds, check_layers=check_layers)
+                         kernel=kernel, hsds=hsds, check_layers=check_layers,
+                         tile_cache_size=tile_cache_size,
+                         area_filter=area_filter)
+
+        if use_precomputed and layers_dict:
+            mask_dset = self.get_mask_dset(layers_dict, min_area=min_area,
+                                           kernel=kernel)
+            if mask_dset in self.excl_layers:
+                logger.info('Reading pre-computed inclusion mask "{}" from {}'
+                            .format(mask_dset, excl_h5))
+                self._mask_dset = mask_dset
+
+    @staticmethod
+    def get_mask_key(layers_dict, min_area=None, kernel='queen'):
+        """
+        Get the hash identifying the inclusion mask computed from the given
+        exclusion inputs
+
+        Parameters
+        ----------
+        layers_dict : dict
+            Dictionary of LayerMask arugments {layer: {kwarg: value}}
+        min_area : float | NoneType
+            Minimum required contiguous area in sq-km
+        kernel : str
+            Contiguous filter method to use on final exclusion
+
+        Returns
+        -------
+        key : str
+            Hex digest of the exclusion inputs
+        """
+        if min_area is None:
+            kernel = None
+        else:
+            min_area = float(min_area)
+
+        inputs = {'excl_dict': layers_dict, 'min_area': min_area,
+                  'kernel': kernel}
+        inputs = json.dumps(inputs, sort_keys=True, default=str)
+
+        return hashlib.sha1(inputs.encode()).hexdigest()[:16]
+
+    @classmethod
+    def get_mask_dset(cls, layers_dict, min_area=None, kernel='queen'):
+        """
+        Get the name of the persisted inclusion mask layer for the given
+        exclusion inputs
+
+        Parameters
+        ----------
+        layers_dict : dict
+            Dictionary of LayerMask arugments {layer: {kwarg: value}}
+        min_area : float | NoneType
+            Minimum required contiguous area in sq-km
+        kernel : str
+            Contiguous filter method to use on final exclusion
+
+        Returns
+        -------
+        str
+        """
+        key = cls.get_mask_key(layers_dict, min_area=min_area, kernel=kernel)
+
+        return cls.MASK_PREFIX + key
+
+    @staticmethod
+    def _get_tiles(shape, chunks, tile_size):
+        """
+        Split the exclusion extent into tiles aligned with the layer chunks
+
+        Parameters
+        ----------
+        shape : tuple
+            (rows, cols) exclusions shape
+        chunks : tuple | None
+            (rows, cols) exclusion layer chunk shape
+        tile_size : int
+            Target number of rows and columns in each tile, rounded up to
+            a multiple of the chunk shape
+
+        Returns
+        -------
+        tiles : list
+            List of (row_slice, col_slice) tuples
+        """
+        if chunks is None:
+            chunks = (1, 1)
+
+        tiles = []
+        steps = [int(np.ceil(tile_size / c) * c) for c in chunks[-2:]]
+        for r0 in range(0, shape[0], steps[0]):
+            for c0 in range(0, shape[1], steps[1]):
+                tiles.append((slice(r0, min(r0 + steps[0], shape[0])),
+                              slice(c0, min(c0 + steps[1], shape[1]))))
+
+        return tiles
+
+    @classmethod
+    def _build_tile(cls, excl_h5, layers_dict, min_area, kernel, tile,
+                    area_filter=None):
+        """
+        Compute the inclusion mask for a single tile
+
+        Parameters
+        ----------
+        excl_h5 : str
+            Path to exclusions .h5 file
+        layers_dict : dict
+            Dictionary of LayerMask arugments {layer: {kwarg: value}}
+        min_area : float | NoneType
+            Minimum required contiguous area in sq-km
+        kernel : str
+            Contiguous filter method to use on final exclusion
+        tile : tuple
+            (row_slice, col_slice) of the tile to compute
+        area_filter : dict | None
+            Pre-computed contiguous area filter labels (see area_filter
+            property), None to compute them if min_area is set.
+
+        Returns
+        -------
+        tile : tuple
+            (row_slice, col_slice) of the tile
+        mask : ndarray
+            Inclusion mask for the tile
+        """
+        with cls(excl_h5, layers_dict=layers_dict, min_area=min_area,
+                 kernel=kernel, use_precomputed=False,
+                 area_filter=area_filter) as f:
+            mask = f[tile]
+
+        return tile, mask
+
+    @classmethod
+    def _write_mask(cls, excl_h5, fp_tmp, mask_dset, attrs):
+        """
+        Copy the inclusion mask from the temporary file into the exclusions
+        .h5 file
+
+        Parameters
+        ----------
+        excl_h5 : str
+            Path to exclusions .h5 file
+        fp_tmp : str
+            Path to temporary .h5 file with the full mask in "mask"
+        mask_dset : str
+            Name of the inclusion mask layer to write
+        attrs : dict
+            Attributes to write to the inclusion mask layer
+        """
+        with H5FilePool.open(excl_h5, mode='a') as f:
+            if mask_dset in f:
+                del f[mask_dset]
+
+            with h5py.File(fp_tmp, mode='r') as f_tmp:
+                f.copy(f_tmp['mask'], mask_dset)
+
+            for k, v in attrs.items():
+                f[mask_dset].attrs[k] = v
+
+        os.remove(fp_tmp)
+
+    @classmethod
+    def build_mask(cls, excl_h5, layers_dict, min_area=None,
+                   kernel='queen', tile_size=1024, max_workers=None,
+                   overwrite=False):
+        """
+        Compute the inclusion mask once for the full exclusion extent and
+        persist it as a single layer in excl_h5 so that subsequent
+        aggregations with the same exclusion inputs (e.g. for every
+        technology) can read the final mask instead of re-computing it
+        (see use_precomputed). Re-run with overwrite=True whenever an
+        exclusion layer changes.
+
+        The mask is computed in parallel on tiles aligned with the exclusion
+        layer chunks. When min_area is set, the contiguous areas are labeled
+        once for the full extent and the mask is computed on full-width row
+        bands of AREA_FILTER_BAND_SIZE rows instead.
+
+        Parameters
+        ----------
+        excl_h5 : str
+            Path to exclusions .h5 file
+        layers_dict : dict
+            Dictionary of LayerMask arugments {layer: {kwarg: value}}
+        min_area : float | NoneType
+            Minimum required contiguous area in sq-km
+        kernel : str
+            Contiguous filter method to use on final exclusion
+        tile_size : int
+            Number of exclusion rows and columns computed on each worker,
+            rounded up to a multiple of the exclusion chunk shape. Not used
+            if min_area is set.
+        max_workers : int | None
+            Number of workers to use, None is all available cpus, 1 runs
+            in serial.
+        overwrite : bool
+            Flag to re-compute the mask if it already exists in excl_h5
+
+        Returns
+        -------
+        mask_dset : str
+            Name of the inclusion mask layer in excl_h5
+        """
+        if not layers_dict:
+            msg = 'Cannot build an inclusion mask without exclusion layers!'
+            logger.error(msg)
+            raise ExclusionLayerError(msg)
+
+        mask_dset = cls.get_mask_dset(layers_dict, min_area=min_area,
+                                      kernel=kernel)
+        with ExclusionLayers(excl_h5) as f:
+            exists = mask_dset in f.layers
+            shape = f.shape
+            chunks = f.chunks
+            profile = f.h5.attrs.get('profile', None)
+
+        if exists and not overwrite:
+            logger.info('Inclusion mask "{}" already exists in {}'
+                        .format(mask_dset, excl_h5))
+            return mask_dset
+
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        tiles = cls._get_tiles(shape, chunks, tile_size)
+        area_filter = None
+        if min_area is not None:
+            with cls(excl_h5, layers_dict=layers_dict, min_area=min_area,
+                     kernel=kernel, use_precomputed=False) as f:
+                area_filter = f.area_filter
+
+            tiles = [(slice(*band), slice(0, shape[1]))
+                     for band in area_filter['bands']]
+
+        logger.info('Building inclusion mask "{}" in {} on {} tiles with {} '
+                    'workers.'.format(mask_dset, excl_h5, len(tiles),
+                                      max_workers))
+
+        fp_tmp = '{}.{}.tmp'.format(os.path.splitext(excl_h5)[0], mask_dset)
+        with h5py.File(fp_tmp, mode='w') as f_tmp:
+            ds = f_tmp.create_dataset('mask', shape=shape, dtype=np.float32,
+                                      chunks=chunks)
+            args = (excl_h5, layers_dict, min_area, kernel)
+            if max_workers > 1:
+                loggers = [__name__, 'reV']
+                with SpawnProcessPool(max_workers=max_workers,
+                                      loggers=loggers) as exe:
+                    futures = [exe.submit(cls._build_tile, *args, tile,
+                                          area_filter=area_filter)
+                               for tile in tiles]
+                    for i, future in enumerate(as_completed(futures)):
+                        tile, mask = future.result()
+                        ds[tile] = mask
+                        logger.debug('Completed {} out of {} inclusion mask '
+                                     'tiles'.format(i + 1, len(tiles)))
+            else:
+                for i, tile in enumerate(tiles):
+                    ds[tile] = cls._build_tile(
+                        *args, tile, area_filter=area_filter)[1]
+                    logger.debug('Completed {} out of {} inclusion mask '
+                                 'tiles'.format(i + 1, len(tiles)))
+
+        attrs = {'excl_dict': json.dumps(layers_dict, default=str),
+                 'min_area': json.dumps(min_area),
+                 'kernel': kernel}
+        if profile is not None:
+            attrs['profile'] = profile
+
+        cls._write_mask(excl_h5, fp_tmp, mask_dset, attrs)
+        logger.info('Inclusion mask "{}" written to {}'
+                    .format(mask_dset, excl_h5))
+
+        return mask_dset
 
     @classmethod
     def run(cls, excl_h5, layers_dict=None, min_area=None,
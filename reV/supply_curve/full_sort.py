@@ -0,0 +1,486 @@
+# -*- coding: utf-8 -*-
+"""
+Array based greedy connection engine for the full supply curve sort.
+
+The kernels in this module only use plain loops over numpy arrays so that
+they can be compiled with numba when it is installed
+(``pip install reV[numba]``). Without numba the exact same kernels run as
+regular python functions.
+"""
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA = True
+except ImportError:
+    NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function un-compiled."""
+        if args and callable(args[0]):
+            return args[0]
+
+        return lambda func: func
+
+# TransmissionFeatures.FEATURE_TYPES codes
+TRANSLINE = 0
+SUBSTATION = 1
+LOADCEN = 2
+
+
+@njit(cache=True)
+def substation_capacity(avail_cap, lines, line_limited):
+    """
+    Available capacity of a substation from its transmission lines, see
+    TransmissionFeatures._substation_capacity
+
+    Parameters
+    ----------
+    avail_cap : ndarray
+        Available capacity of all features
+    lines : ndarray
+        Dense indices of the substation's lines
+    line_limited : bool
+        Substation connection is limited by maximum capacity of the
+        attached lines
+
+    Returns
+    -------
+    cap : float
+        Substation available capacity
+    """
+    if len(lines) == 0:
+        return 0.0
+
+    total = 0.0
+    max_cap = avail_cap[lines[0]]
+    for line in lines:
+        total += avail_cap[line]
+        max_cap = max(max_cap, avail_cap[line])
+
+    cap = total / 2
+    if line_limited and max_cap / 2 < cap:
+        cap = max_cap / 2
+
+    return cap
+
+
+@njit(cache=True)
+def available_capacity(i, avail_cap, from_lines, unlimited, line_ptr,
+                       line_idx, line_limited):
+    """
+    Available capacity of a feature, see
+    TransmissionFeatures._available_capacity
+
+    Parameters
+    ----------
+    i : int
+        Dense feature index
+    avail_cap : ndarray
+        Available capacity of all features
+    from_lines : ndarray
+        Mask of substations that derive their capacity from their lines
+    unlimited : ndarray
+        Mask of features with unlimited capacity
+    line_ptr : ndarray
+        CSR substation line pointers
+    line_idx : ndarray
+        CSR substation line dense indices
+    line_limited : bool
+        Substation connection is limited by maximum capacity of the
+        attached lines
+
+    Returns
+    -------
+    cap : float
+        Available capacity, NaN if unlimited
+    """
+    if from_lines[i]:
+        cap = substation_capacity(avail_cap,
+                                  line_idx[line_ptr[i]:line_ptr[i + 1]],
+                                  line_limited)
+    elif unlimited[i]:
+        cap = np.nan
+    else:
+        cap = avail_cap[i]
+
+    return cap
+
+
+@njit(cache=True)
+def spread_substation_load(avail_cap, lines, capacity):
+    """
+    Spread capacity over the lines of a substation, see
+    TransmissionFeatures._spread_substation_load
+
+    Parameters
+    ----------
+    avail_cap : ndarray
+        Available capacity of all features, updated in place
+    lines : ndarray
+        Dense indices of the substation lines with non-zero capacity
+    capacity : float
+        Capacity needed in MW
+    """
+    n = len(lines)
+    while True:
+        apply_cap = capacity / n
+        keep = np.ones(n, dtype=np.bool_)
+        n_keep = n
+        for k in range(n):
+            line_cap = avail_cap[lines[k]]
+            if line_cap < apply_cap:
+                # fill lines that can not take an equal share
+                avail_cap[lines[k]] = line_cap - line_cap
+                capacity -= line_cap
+                keep[k] = False
+                n_keep -= 1
+
+        lines = lines[keep]
+        if n_keep < n:
+            n = n_keep
+        else:
+            break
+
+    apply_cap = capacity / n
+    for line in lines:
+        avail_cap[line] = avail_cap[line] - apply_cap
+
+
+@njit(cache=True)
+def connect(i, capacity, types, avail_cap, from_lines, unlimited, line_ptr,
+            line_idx, available, line_limited):
+    """
+    Connect capacity to a transmission feature if possible, see
+    TransmissionFeatures.connect(apply=True)
+
+    Parameters
+    ----------
+    i : int
+        Dense feature index
+    capacity : float
+        Capacity needed in MW
+    types : ndarray
+        Feature type codes
+    avail_cap : ndarray
+        Available capacity of all features, updated in place
+    from_lines : ndarray
+        Mask of substations that derive their capacity from their lines
+    unlimited : ndarray
+        Mask of features with unlimited capacity
+    line_ptr : ndarray
+        CSR substation line pointers
+    line_idx : ndarray
+        CSR substation line dense indices
+    available : ndarray
+        Feature availability mask, updated in place
+    line_limited : bool
+        Substation connection is limited by maximum capacity of the
+        attached lines
+
+    Returns
+    -------
+    connected : bool
+        Flag as to whether the connection was made
+    """
+    if not available[i]:
+        return False
+
+    cap = available_capacity(i, avail_cap, from_lines, unlimited, line_ptr,
+                             line_idx, line_limited)
+    if not unlimited[i] and capacity > cap:
+        return False
+
+    if types[i] == TRANSLINE or types[i] == LOADCEN:
+        avail_cap[i] = avail_cap[i] - capacity
+    elif types[i] == SUBSTATION:
+        lines = line_idx[line_ptr[i]:line_ptr[i + 1]]
+        if line_limited:
+            line = lines[np.argmax(avail_cap[lines])]
+            avail_cap[line] = avail_cap[line] - capacity
+        else:
+            lines = lines[avail_cap[lines] != 0]
+            spread_substation_load(avail_cap, lines, capacity)
+
+    cap = available_capacity(i, avail_cap, from_lines, unlimited, line_ptr,
+                             line_idx, line_limited)
+    if not unlimited[i] and cap == 0:
+        available[i] = False
+
+    return True
+
+
+@njit(cache=True)
+def exclude_neighbors(sc_gid, sc_mask, sc_point, point_mask, point_valid,
+                      neighbors, point_ptr, point_sc_gids):
+    """
+    Exclude the upwind (and downwind) competitive neighbors of a connected
+    supply curve point and all of their sc_gids
+
+    Parameters
+    ----------
+    sc_gid : int
+        Connected supply curve gid
+    sc_mask : ndarray
+        Supply curve gid availability mask, updated in place
+    sc_point : ndarray
+        sc_point_gid of each sc_gid, -1 for sc_gids without neighbors
+    point_mask : ndarray
+        Competitive wind farm sc_point_gid mask, updated in place
+    point_valid : ndarray
+        Mask of sc_point_gids that can be excluded
+    neighbors : ndarray
+        (sc_point_gid, n_neighbors) array of neighbor sc_point_gids to
+        exclude, -1 for no neighbor
+    point_ptr : ndarray
+        CSR pointers from sc_point_gid to point_sc_gids
+    point_sc_gids : ndarray
+        CSR sc_gids of each sc_point_gid
+    """
+    gid = sc_point[sc_gid]
+    if gid >= 0 and point_mask[gid]:
+        for n in neighbors[gid]:
+            if 0 <= n < len(point_valid) and point_valid[n]:
+                point_mask[n] = False
+                for sc_id in point_sc_gids[point_ptr[n]:point_ptr[n + 1]]:
+                    if sc_id < len(sc_mask) and sc_mask[sc_id]:
+                        sc_mask[sc_id] = False
+
+
+@njit(cache=True)
+def exclude_points(point_gids, point_mask, point_valid, neighbors):
+    """
+    Greedily exclude the competitive neighbors of supply curve points in
+    the given (sorted) order. Points that have already been excluded do
+    not exclude their neighbors.
+
+    Parameters
+    ----------
+    point_gids : ndarray
+        Sorted sc_point_gids
+    point_mask : ndarray
+        Competitive wind farm sc_point_gid mask, updated in place
+    point_valid : ndarray
+        Mask of sc_point_gids that can be excluded
+    neighbors : ndarray
+        (sc_point_gid, n_neighbors) array of neighbor sc_point_gids to
+        exclude, -1 for no neighbor
+    """
+    for gid in point_gids:
+        if point_mask[gid]:
+            for n in neighbors[gid]:
+                if 0 <= n < len(point_valid) and point_valid[n]:
+                    point_mask[n] = False
+
+
+@njit(cache=True)
+def full_sort_kernel(start, stop, row_sc_gids, row_features, row_caps,
+                     sc_mask, conn_rows, types, avail_cap, from_lines,
+                     unlimited, line_ptr, line_idx, available, line_limited,
+                     sc_point, point_mask, point_valid, neighbors, point_ptr,
+                     point_sc_gids):
+    """
+    Greedily connect supply curve points to transmission features for the
+    sorted connection rows start:stop.
+
+    Parameters
+    ----------
+    start : int
+        First row to process
+    stop : int
+        Last row to process (exclusive)
+    row_sc_gids : ndarray
+        sc_gid of each sorted connection row
+    row_features : ndarray
+        Dense transmission feature index of each sorted connection row
+    row_caps : ndarray
+        Capacity of each sorted connection row
+    sc_mask : ndarray
+        Supply curve gid availability mask, updated in place
+    conn_rows : ndarray
+        Connection row of each sc_gid, -1 if not connected, updated in place
+    types, avail_cap, from_lines, unlimited, line_ptr, line_idx, available,
+    line_limited
+        Transmission feature state, see connect()
+    sc_point, point_mask, point_valid, neighbors, point_ptr, point_sc_gids
+        Competitive wind farm state, see exclude_neighbors(). Pass an empty
+        sc_point array to skip the competitive wind farm exclusion.
+
+    Returns
+    -------
+    n_connected : int
+        Number of supply curve points connected in rows start:stop
+    """
+    n_connected = 0
+    for row in range(start, stop):
+        sc_gid = row_sc_gids[row]
+        if sc_mask[sc_gid]:
+            if connect(row_features[row], row_caps[row], types, avail_cap,
+                       from_lines, unlimited, line_ptr, line_idx, available,
+                       line_limited):
+                n_connected += 1
+                sc_mask[sc_gid] = False
+                conn_rows[sc_gid] = row
+                if sc_gid < len(sc_point):
+                    exclude_neighbors(sc_gid, sc_mask, sc_point, point_mask,
+                                      point_valid, neighbors, point_ptr,
+                                      point_sc_gids)
+
+    return n_connected
+
+
+def python_full_sort(start, trans_features, row_sc_gids, row_trans_gids,
+                     row_caps, sc_mask, conn_rows, sc_point, point_mask,
+                     point_valid, neighbors, point_ptr, point_sc_gids):
+    """
+    Pure python equivalent of full_sort_kernel used when numba is not
+    installed. Connections are made with TransmissionFeatures.connect, which
+    is faster than running the connection kernels un-compiled.
+
+    Parameters
+    ----------
+    start : int
+        Row index of the first row in the row lists
+    trans_features : TransmissionFeatures
+        Transmission features handler, updated in place
+    row_sc_gids : list
+        sc_gid of each sorted connection row
+    row_trans_gids : list
+        Transmission feature gid of each sorted connection row
+    row_caps : list
+        Capacity of each sorted connection row
+    sc_mask : ndarray
+        Supply curve gid availability mask, updated in place
+    conn_rows : ndarray
+        Connection row of each sc_gid, -1 if not connected, updated in place
+    sc_point, point_mask, point_valid, neighbors, point_ptr, point_sc_gids
+        Competitive wind farm state, see exclude_neighbors()
+
+    Returns
+    -------
+    n_connected : int
+        Number of supply curve points connected
+    """
+    n_connected = 0
+    for row, sc_gid in enumerate(row_sc_gids):
+        if sc_mask[sc_gid]:
+            if trans_features.connect(row_trans_gids[row], row_caps[row]):
+                n_connected += 1
+                sc_mask[sc_gid] = False
+                conn_rows[sc_gid] = start + row
+                if sc_gid < len(sc_point):
+                    exclude_neighbors(sc_gid, sc_mask, sc_point, point_mask,
+                                      point_valid, neighbors, point_ptr,
+                                      point_sc_gids)
+
+    return n_connected
+
+
+def competitive_arrays(comp_wind_dirs, downwind=False):
+    """
+    Get the competitive wind farm neighbor arrays used by full_sort_kernel
+
+    Parameters
+    ----------
+    comp_wind_dirs : CompetitiveWindFarms | None
+        Pre-initilized CompetitiveWindFarms instance
+    downwind : bool, optional
+        Flag to remove downwind neighbors as well as upwind neighbors,
+        by default False
+
+    Returns
+    -------
+    arrays : tuple
+        sc_point, point_mask, point_valid, neighbors, point_ptr,
+        point_sc_gids, see exclude_neighbors(). All empty if comp_wind_dirs
+        is None.
+    """
+    if comp_wind_dirs is None:
+        empty = np.zeros(0, dtype=np.int64)
+        no_mask = np.zeros(0, dtype=np.bool_)
+        return (empty, no_mask, no_mask, np.zeros((0, 0), dtype=np.int64),
+                empty, empty)
+
+    cwf = comp_wind_dirs
+    point_ptr, point_sc_gids = cwf.sc_point_gid_csr
+
+    return (cwf.sc_gid_map, cwf.mask, cwf.valid,
+            cwf.get_neighbors(downwind=downwind), point_ptr, point_sc_gids)
+
+
+def full_sort(trans_features, sc_mask, row_sc_gids, row_trans_gids,
+              row_caps, comp_wind_dirs=None, downwind=False,
+              chunk_size=1000000):
+    """
+    Greedily connect supply curve points to transmission features in the
+    order of the sorted connection rows.
+
+    Parameters
+    ----------
+    trans_features : TransmissionFeatures
+        Transmission features handler, the feature capacities are updated
+        in place
+    sc_mask : ndarray
+        Supply curve gid availability mask, updated in place
+    row_sc_gids : ndarray
+        sc_gid of each sorted connection row
+    row_trans_gids : ndarray
+        Transmission feature gid of each sorted connection row
+    row_caps : ndarray
+        Supply curve point capacity of each sorted connection row
+    comp_wind_dirs : CompetitiveWindFarms, optional
+        Pre-initilized CompetitiveWindFarms instance, the mask is updated in
+        place, by default None
+    downwind : bool, optional
+        Flag to remove downwind neighbors as well as upwind neighbors,
+        by default False
+    chunk_size : int, optional
+        Number of rows to process between progress updates,
+        by default 1,000,000
+
+    Returns
+    -------
+    conn_rows : ndarray
+        Connection row of each sc_gid, -1 if not connected
+    """
+    tf = trans_features
+    row_sc_gids = np.asarray(row_sc_gids, dtype=np.int64)
+    row_trans_gids = np.asarray(row_trans_gids, dtype=np.int64)
+    row_features = tf.feature_indices(row_trans_gids)
+    row_caps = np.asarray(row_caps, dtype=np.float64)
+    conn_rows = np.full(len(sc_mask), -1, dtype=np.int64)
+    available = tf.available_mask
+    cwf_arrays = competitive_arrays(comp_wind_dirs, downwind=downwind)
+
+    logger.debug('Running full sort on {} connections (numba: {})'
+                 .format(len(row_sc_gids), NUMBA))
+    n_sc_gids = sc_mask.sum()
+    connected = 0
+    progress = 0
+    for start in range(0, len(row_sc_gids), chunk_size):
+        stop = min(start + chunk_size, len(row_sc_gids))
+        if NUMBA:
+            connected += full_sort_kernel(
+                start, stop, row_sc_gids, row_features, row_caps, sc_mask,
+                conn_rows, *tf.connection_arrays, available,
+                tf.line_limited, *cwf_arrays)
+        else:
+            connected += python_full_sort(
+                start, tf, row_sc_gids[start:stop].tolist(),
+                row_trans_gids[start:stop].tolist(),
+                row_caps[start:stop].tolist(), sc_mask, conn_rows,
+                *cwf_arrays)
+
+        current_prog = connected // (n_sc_gids / 100)
+        if current_prog > progress:
+            progress = current_prog
+            logger.info('{} % of supply curve points connected'
+                        .format(progress))
+
+    if NUMBA:
+        tf.available_mask = available
+
+    return conn_rows
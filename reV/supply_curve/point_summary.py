@@ -8,15 +8,14 @@ Created on Fri Jun 21 13:24:31 2019
 import logging
 import numpy as np
 import pandas as pd
-from scipy import stats
 from warnings import warn
 
-from reV.econ.economies_of_scale import EconomiesOfScale
 from reV.handlers.exclusions import ExclusionLayers
+from reV.supply_curve.data_layers import DataLayerAggregation
 from reV.supply_curve.points import GenerationSupplyCurvePoint
 from reV.utilities.exceptions import (EmptySupplyCurvePointError,
                                       OutputWarning, FileInputError,
-                                      DataShapeError)
+                                      DataShapeError, reVDeprecationWarning)
 
 from rex.utilities.utilities import jsonify_dict
 
@@ -394,7 +393,10 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
         float | int
             Mode of data
         """
-        return stats.mode(data).mode[0]
+        groups = np.zeros(len(data), dtype=np.int64)
+        agg = DataLayerAggregation(groups, data, np.ones(len(data)), 1)
+
+        return agg.mode()[0]
 
     @staticmethod
     def _categorize(data, excl_mult):
@@ -416,11 +418,9 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
             Jsonified string of the dictionary mapping categorical values to
             total inclusions
         """
-        data = {category: float(excl_mult[(data == category)].sum())
-                for category in np.unique(data)}
-        data = jsonify_dict(data)
+        groups = np.zeros(len(data), dtype=np.int64)
 
-        return data
+        return DataLayerAggregation(groups, data, excl_mult, 1).category()[0]
 
     @classmethod
     def _agg_data_layer_method(cls, data, excl_mult, method):
@@ -646,7 +646,10 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
 
     @staticmethod
     def economies_of_scale(cap_cost_scale, summary):
-        """Apply economies of scale to this point summary
+        """Apply economies of scale to point summaries. This delegates to
+        the vectorized SupplyCurveAggregation.economies_of_scale, which is
+        the preferred method to apply economies of scale to the full
+        summary table in one pass.
 
         Parameters
         ----------
@@ -657,18 +660,29 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
             the equation should match the names of the columns in the reV
             supply curve aggregation table. This will not affect offshore
             wind LCOE.
-        summary : dict
-            Dictionary of summary outputs for this sc point.
+        summary : dict | list
+            Dictionary of summary outputs for this sc point or a list of
+            sc point summary dictionaries.
 
         Returns
         -------
-        summary : dict
-            Dictionary of summary outputs for this sc point.
+        summary : dict | list
+            Dictionary of summary outputs for this sc point or a list of
+            sc point summary dictionaries with scaled mean_lcoe and unscaled
+            raw_lcoe entries.
         """
-
-        eos = EconomiesOfScale(cap_cost_scale, summary)
-        summary['mean_lcoe'] = eos.scaled_lcoe
-        summary['raw_lcoe'] = eos.raw_lcoe
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from reV.supply_curve.sc_aggregation import SupplyCurveAggregation
+
+        points = [summary] if isinstance(summary, dict) else summary
+        if points:
+            table = SupplyCurveAggregation.economies_of_scale(
+                cap_cost_scale, pd.DataFrame(points))
+            for point, mean_lcoe, raw_lcoe in zip(points,
+                                                  table['mean_lcoe'],
+                                                  table['raw_lcoe']):
+                point['mean_lcoe'] = mean_lcoe
+                point['raw_lcoe'] = raw_lcoe
 
         return summary
 
@@ -744,12 +758,10 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
             name. Each value must be another dictionary with "dset", "method",
             and "fpath", by default None
         cap_cost_scale : str | None
-            Optional LCOE scaling equation to implement "economies of scale".
-            Equations must be in python string format and return a scalar
-            value to multiply the capital cost by. Independent variables in
-            the equation should match the names of the columns in the reV
-            supply curve aggregation table. This will not affect offshore
-            wind LCOE.
+            Deprecated, economies of scale should be applied to the full
+            summary table with SupplyCurveAggregation.economies_of_scale.
+            Optional LCOE scaling equation to implement "economies of
+            scale", by default None
 
         Returns
         -------
@@ -777,7 +789,12 @@ class SupplyCurvePointSummary(GenerationSupplyCurvePoint):
             if data_layers is not None:
                 summary = point.agg_data_layers(summary, data_layers)
 
-            if cap_cost_scale is not None:
-                summary = point.economies_of_scale(cap_cost_scale, summary)
+        if cap_cost_scale is not None:
+            warn('The cap_cost_scale input to SupplyCurvePointSummary is '
+                 'deprecated, economies of scale should be applied to the '
+                 'full summary table with '
+                 'SupplyCurveAggregation.economies_of_scale',
+                 reVDeprecationWarning)
+            summary = cls.economies_of_scale(cap_cost_scale, summary)
 
         return summary
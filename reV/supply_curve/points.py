@@ -3,13 +3,16 @@
 reV supply curve extent and points base frameworks.
 """
 from abc import ABC
+from collections import OrderedDict
 import logging
 import numpy as np
+import os
 import pandas as pd
 from scipy import stats
 from warnings import warn
 
 from reV.handlers.exclusions import ExclusionLayers
+from reV.handlers.h5_pool import PooledResource
 from reV.supply_curve.exclusions import ExclusionMask, ExclusionMaskFromDict
 from reV.utilities.exceptions import (SupplyCurveError, SupplyCurveInputError,
                                       EmptySupplyCurvePointError, InputWarning)
@@ -776,7 +779,7 @@ class AggregationSupplyCurvePoint(SupplyCurvePoint):
             Resource h5 handler object.
         """
         if self._h5 is None:
-            self._h5 = Resource(self._h5_fpath,)
+            self._h5 = PooledResource(self._h5_fpath)
 
         return self._h5
 
@@ -861,6 +864,28 @@ class AggregationSupplyCurvePoint(SupplyCurvePoint):
 
         return gid_counts
 
+    @property
+    def h5_gid_weights(self):
+        """Get the unique h5 gids of this sc point and the sum of the
+        inclusion values mapped to each gid. A weighted sum of the h5 data
+        with these weights equals the sum of the exclusion weighted data of
+        every exclusion pixel in the sc point.
+
+        Returns
+        -------
+        gids : np.ndarray
+            Sorted unique h5 gids.
+        weights : np.ndarray
+            Sum of the inclusion values of each h5 gid.
+        """
+        gids, inverse = np.unique(self._gids[self.bool_mask],
+                                  return_inverse=True)
+        weights = np.bincount(inverse,
+                              weights=self.excl_data_flat[self.bool_mask],
+                              minlength=len(gids))
+
+        return gids, weights
+
     @property
     def summary(self):
         """
@@ -964,6 +989,60 @@ class AggregationSupplyCurvePoint(SupplyCurvePoint):
 
         return out
 
+    @classmethod
+    def run_weights(cls, gid, excl, agg_h5, tm_dset, excl_dict=None,
+                    resolution=64, excl_area=0.0081, exclusion_shape=None,
+                    close=True, gen_index=None):
+        """
+        Get the meta data and the h5 gid aggregation weights of the sc point
+        without reading any h5 datasets.
+
+        Parameters
+        ----------
+        gid : int
+            gid for supply curve point to analyze.
+        excl : str | ExclusionMask
+            Filepath to exclusions h5 or ExclusionMask file handler.
+        agg_h5 : str | Resource
+            Filepath to .h5 file to aggregate or Resource handler
+        tm_dset : str
+            Dataset name in the exclusions file containing the
+            exclusions-to-resource mapping data.
+        excl_dict : dict | None
+            Dictionary of exclusion LayerMask arugments {layer: {kwarg: value}}
+            None if excl input is pre-initialized.
+        resolution : int
+            Number of exclusion points per SC point along an axis.
+            This number**2 is the total number of exclusion points per
+            SC point.
+        excl_area : float
+            Area of an exclusion cell (square km).
+        exclusion_shape : tuple
+            Shape of the full exclusions extent (rows, cols). Inputing this
+            will speed things up considerably.
+        close : bool
+            Flag to close object file handlers on exit.
+        gen_index : np.ndarray
+            Array of generation gids with array index equal to resource gid.
+            Array value is -1 if the resource index was not used in the
+            generation run.
+
+        Returns
+        -------
+        out : dict
+            Supply curve point meta data ("meta"), sorted unique h5 gids
+            ("gids"), and the sum of the inclusion values of each h5 gid
+            ("weights").
+        """
+        kwargs = {"excl_dict": excl_dict, "resolution": resolution,
+                  "excl_area": excl_area, "exclusion_shape": exclusion_shape,
+                  "close": close, "gen_index": gen_index}
+        with cls(gid, excl, agg_h5, tm_dset, **kwargs) as point:
+            gids, weights = point.h5_gid_weights
+            out = {'meta': point.summary, 'gids': gids, 'weights': weights}
+
+        return out
+
 
 class GenerationSupplyCurvePoint(AggregationSupplyCurvePoint):
     """Single supply curve point with associated reV generation"""
@@ -1099,7 +1178,7 @@ class GenerationSupplyCurvePoint(AggregationSupplyCurvePoint):
             reV generation Resource object
         """
         if self._gen is None:
-            self._gen = Resource(self._gen_fpath, str_decode=False)
+            self._gen = PooledResource(self._gen_fpath, str_decode=False)
 
         return self._gen
 
@@ -1166,6 +1245,17 @@ class GenerationSupplyCurvePoint(AggregationSupplyCurvePoint):
 class SupplyCurveExtent:
     """Supply curve full extent framework."""
 
+    # target number of exclusion rows of the techmap read at once when
+    # finding the valid sc points, rounded up to whole techmap chunk rows and
+    # sc point rows
+    VALID_BAND_SIZE = 128
+
+    # valid sc point gids computed in this process, keyed by the techmap
+    # file, dataset, modification time, and resolution. The cache is limited
+    # to _VALID_SC_POINTS_NBYTES, least recently used entries are dropped.
+    _VALID_SC_POINTS = OrderedDict()
+    _VALID_SC_POINTS_NBYTES = 64 * 1024 ** 2
+
     def __init__(self, f_excl, resolution=64):
         """
         Parameters
@@ -1624,7 +1714,8 @@ class SupplyCurveExtent:
     def valid_sc_points(self, tm_dset):
         """
         Determine which sc_point_gids contain resource gids and are thus
-        valid supply curve points
+        valid supply curve points. The result is cached in this process for
+        the techmap file, dataset, and resolution.
 
         Parameters
         ----------
@@ -1636,16 +1727,55 @@ class SupplyCurveExtent:
         valid_gids : ndarray
             Vector of valid sc_point_gids that contain resource gis
         """
-        valid_gids = []
-        tm = self._excls[tm_dset]
-        gid = 0
-        for r in range(self.n_rows):
-            r = slice(r * self._res, (r + 1) * self._res)
-            for c in range(self.n_cols):
-                c = slice(c * self._res, (c + 1) * self._res)
-                if np.any(tm[r, c] != -1):
-                    valid_gids.append(gid)
+        mtime = None
+        if os.path.exists(self._excl_fpath):
+            mtime = os.path.getmtime(self._excl_fpath)
+
+        key = (self._excl_fpath, tm_dset, mtime, self._res)
+        cache = self._VALID_SC_POINTS
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key].copy()
+
+        valid_gids = self._get_valid_sc_points(tm_dset)
+        if valid_gids.nbytes <= self._VALID_SC_POINTS_NBYTES:
+            cache[key] = valid_gids.copy()
+            while (sum(v.nbytes for v in cache.values())
+                   > self._VALID_SC_POINTS_NBYTES):
+                cache.popitem(last=False)
+
+        return valid_gids
+
+    def _get_valid_sc_points(self, tm_dset):
+        """
+        Find the sc points with any valid techmap gid by reading the techmap
+        in row bands and reducing each band to the sc point blocks.
 
-                gid += 1
+        Parameters
+        ----------
+        tm_dset : str
+            Techmap dataset name
 
-        return np.array(valid_gids, dtype=np.uint32)
+        Returns
+        -------
+        valid_gids : ndarray
+            Vector of valid sc_point_gids that contain resource gis
+        """
+        res = self._res
+        n_rows, n_cols = self.exclusions.shape
+        chunks = self._excls.h5.get_dset_properties(tm_dset)[2]
+        step = self.VALID_BAND_SIZE
+        if chunks is not None:
+            step = int(np.ceil(step / chunks[0]) * chunks[0])
+
+        step = int(np.ceil(step / res) * res)
+        valid = []
+        for r0 in range(0, n_rows, step):
+            r1 = min(r0 + step, n_rows)
+            tm = self._excls[tm_dset, r0:r1] != -1
+            pad = ((0, -(r1 - r0) % res), (0, self.n_cols * res - n_cols))
+            tm = np.pad(tm, pad)
+            tm = tm.reshape(tm.shape[0] // res, res, self.n_cols, res)
+            valid.append(tm.any(axis=(1, 3)).ravel())
+
+        return np.where(np.concatenate(valid))[0].astype(np.uint32)
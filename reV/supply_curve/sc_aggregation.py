@@ -5,31 +5,34 @@ Created on Fri Jun 21 13:24:31 2019
 
 @author: gbuster
 """
-from concurrent.futures import as_completed
 import h5py
 import logging
 import numpy as np
 import os
 import pandas as pd
 from scipy.spatial import cKDTree
+import tempfile
 from warnings import warn
 
+from reV.econ.economies_of_scale import EconomiesOfScale
 from reV.generation.base import BaseGen
 from reV.handlers.exclusions import ExclusionLayers
+from reV.handlers.h5_pool import PooledResource
+from reV.handlers.tables import ColumnarTableSink
 from reV.offshore.offshore import Offshore as OffshoreClass
 from reV.supply_curve.aggregation import (AbstractAggFileHandler,
                                           AbstractAggregation,
                                           Aggregation)
-from reV.supply_curve.exclusions import FrictionMask
+from reV.supply_curve.block_summary import SupplyCurveBlockSummary
+from reV.supply_curve.exclusions import ExclusionMask, FrictionMask
 from reV.supply_curve.points import SupplyCurveExtent
 from reV.supply_curve.point_summary import SupplyCurvePointSummary
 from reV.utilities.exceptions import (EmptySupplyCurvePointError,
                                       OutputWarning, FileInputError,
-                                      InputWarning, SupplyCurveInputError)
+                                      InputWarning, SupplyCurveInputError,
+                                      reVDeprecationWarning)
 
-from rex.resource import Resource
 from rex.multi_file_resource import MultiFileResource
-from rex.utilities.execution import SpawnProcessPool
 from rex.utilities.utilities import get_lat_lon_cols
 
 logger = logging.getLogger(__name__)
@@ -49,7 +52,9 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
                  data_layers=None, power_density=None, excl_dict=None,
                  friction_fpath=None, friction_dset=None,
                  area_filter_kernel='queen', min_area=None,
-                 check_excl_layers=False):
+                 check_excl_layers=False,
+                 tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                 area_filter=None, use_precomputed_mask=False):
         """
         Parameters
         ----------
@@ -90,12 +95,25 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
         check_excl_layers : bool
             Run a pre-flight check on each exclusion layer to ensure they
             contain un-excluded values
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        area_filter : dict | None
+            Pre-computed contiguous area filter labels, see
+            AbstractAggFileHandler.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
         """
         super().__init__(excl_fpath, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
-                         check_excl_layers=check_excl_layers)
+                         check_excl_layers=check_excl_layers,
+                         tile_cache_size=tile_cache_size,
+                         area_filter=area_filter,
+                         use_precomputed_mask=use_precomputed_mask)
 
+        self._tile_cache_size = tile_cache_size
         self._gen = self._open_gen_econ_resource(gen_fpath, econ_fpath)
         # pre-initialize any import attributes
         _ = self._gen.meta
@@ -135,7 +153,7 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
         """
 
         if econ_fpath is None:
-            handler = Resource(gen_fpath)
+            handler = PooledResource(gen_fpath)
         else:
             handler = MultiFileResource([gen_fpath, econ_fpath],
                                         check_files=True)
@@ -165,7 +183,8 @@ class SupplyCurveAggFileHandler(AbstractAggFileHandler):
                 if 'fpath' in attrs:
                     if attrs['fpath'] != self._excl_fpath:
                         data_layers[name]['fobj'] = ExclusionLayers(
-                            attrs['fpath'])
+                            attrs['fpath'],
+                            tile_cache_size=self._tile_cache_size)
 
         return data_layers
 
@@ -682,13 +701,19 @@ class SupplyCurveAggregation(AbstractAggregation):
             sum of inclusion scalar values associated with all pixels with that
             unique value.
     """
+    # available summary engines, see SupplyCurveBlockSummary for "sparse"
+    ENGINES = ('point', 'sparse')
+
     def __init__(self, excl_fpath, gen_fpath, tm_dset, econ_fpath=None,
                  excl_dict=None, area_filter_kernel='queen', min_area=None,
                  check_excl_layers=False, resolution=64, excl_area=None,
                  gids=None, res_class_dset=None, res_class_bins=None,
                  cf_dset='cf_mean-means', lcoe_dset='lcoe_fcr-means',
                  h5_dsets=None, data_layers=None, power_density=None,
-                 friction_fpath=None, friction_dset=None, cap_cost_scale=None):
+                 friction_fpath=None, friction_dset=None, cap_cost_scale=None,
+                 engine='point', block_size=1024, shared_inputs=False,
+                 tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                 use_precomputed_mask=False):
         """
         Parameters
         ----------
@@ -761,13 +786,34 @@ class SupplyCurveAggregation(AbstractAggregation):
             the equation should match the names of the columns in the reV
             supply curve aggregation table. This will not affect offshore
             wind LCOE.
+        engine : str
+            Summary engine, "point" summarizes one SC point at a time and
+            "sparse" summarizes blocks of SC points at once with a sparse
+            matrix of inclusion weights (SupplyCurveBlockSummary).
+        block_size : int
+            Target number of SC points summarized at once with the "sparse"
+            engine.
+        shared_inputs : bool
+            Flag to read the generation/econ input arrays (cf, lcoe, resource
+            class, offshore flags, and h5_dsets) once in the parent process
+            and share them with the parallel workers as read-only
+            memory-mapped scratch .npy files instead of having every worker
+            read the full arrays from the h5 files.
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
         """
 
         super().__init__(excl_fpath, tm_dset, excl_dict=excl_dict,
                          area_filter_kernel=area_filter_kernel,
                          min_area=min_area,
                          check_excl_layers=check_excl_layers,
-                         resolution=resolution, gids=gids)
+                         resolution=resolution, gids=gids,
+                         tile_cache_size=tile_cache_size,
+                         use_precomputed_mask=use_precomputed_mask)
 
         self._gen_fpath = gen_fpath
         self._econ_fpath = econ_fpath
@@ -781,6 +827,15 @@ class SupplyCurveAggregation(AbstractAggregation):
         self._friction_fpath = friction_fpath
         self._friction_dset = friction_dset
         self._data_layers = data_layers
+        self._engine = engine
+        self._block_size = block_size
+        self._shared_inputs = shared_inputs
+
+        if self._engine not in self.ENGINES:
+            msg = ('Supply curve aggregation engine must be one of {}, but '
+                   'received: "{}"'.format(self.ENGINES, self._engine))
+            logger.error(msg)
+            raise SupplyCurveInputError(msg)
 
         logger.debug('Resource class bins: {}'.format(self._res_class_bins))
 
@@ -829,6 +884,31 @@ class SupplyCurveAggregation(AbstractAggregation):
                                      .format(self._tm_dset,
                                              self._excl_fpath))
 
+    @property
+    def _signature_inputs(self):
+        """Inputs that determine the aggregation summary of a SC point.
+
+        Returns
+        -------
+        inputs : dict
+            Mapping of input name to input value, filepaths are listed in
+            the "files" entry.
+        """
+        inputs = super()._signature_inputs
+        inputs['files'].update({'gen_fpath': self._gen_fpath,
+                                'econ_fpath': self._econ_fpath,
+                                'friction_fpath': self._friction_fpath})
+        inputs.update({'res_class_dset': self._res_class_dset,
+                       'res_class_bins': self._res_class_bins,
+                       'cf_dset': self._cf_dset,
+                       'lcoe_dset': self._lcoe_dset,
+                       'h5_dsets': sorted(self._h5_dsets or []),
+                       'data_layers': self._data_layers,
+                       'power_density': self._power_density,
+                       'friction_dset': self._friction_dset})
+
+        return inputs
+
     def _check_data_layers(self, methods=('mean', 'max', 'min',
                            'mode', 'sum', 'category')):
         """Run pre-flight checks on requested aggregation data layers.
@@ -970,6 +1050,82 @@ class SupplyCurveAggregation(AbstractAggregation):
         return (res_data, res_class_bins, cf_data, lcoe_data, offshore_flag,
                 h5_dsets_data)
 
+    @staticmethod
+    def _share_input_data(inputs, scratch_dir):
+        """Save SC point agg input data arrays to scratch .npy files so they
+        can be memory-mapped by parallel workers.
+
+        Parameters
+        ----------
+        inputs : tuple
+            SC point agg input data from _get_input_data().
+        scratch_dir : str
+            Directory to save the scratch .npy files to.
+
+        Returns
+        -------
+        shared_inputs : tuple
+            Same as inputs but with every array replaced by the filepath to
+            its scratch .npy file.
+        """
+
+        def _save(name, arr):
+            """Save an array to a scratch .npy file and return the fpath"""
+            if arr is None:
+                return None
+
+            fpath = os.path.join(scratch_dir, '{}.npy'.format(name))
+            np.save(fpath, np.asarray(arr))
+
+            return fpath
+
+        res_data, res_class_bins, cf_data, lcoe_data, offshore_flag, \
+            h5_dsets_data = inputs
+
+        if h5_dsets_data is not None:
+            h5_dsets_data = {dset: _save('h5_dset_{}'.format(i), arr)
+                             for i, (dset, arr)
+                             in enumerate(h5_dsets_data.items())}
+
+        return (_save('res_data', res_data), res_class_bins,
+                _save('cf_data', cf_data), _save('lcoe_data', lcoe_data),
+                _save('offshore_flag', offshore_flag), h5_dsets_data)
+
+    @staticmethod
+    def _load_input_data(shared_inputs):
+        """Attach read-only memory-mapped views of shared SC point agg input
+        data arrays.
+
+        Parameters
+        ----------
+        shared_inputs : tuple
+            SC point agg input data from _share_input_data() with filepaths
+            to scratch .npy files in place of the arrays.
+
+        Returns
+        -------
+        inputs : tuple
+            SC point agg input data in the same format as _get_input_data()
+            with read-only memory-mapped arrays.
+        """
+
+        def _load(fpath):
+            """Memory-map a scratch .npy file"""
+            if fpath is None:
+                return None
+
+            return np.load(fpath, mmap_mode='r')
+
+        res_data, res_class_bins, cf_data, lcoe_data, offshore_flag, \
+            h5_dsets_data = shared_inputs
+
+        if h5_dsets_data is not None:
+            h5_dsets_data = {dset: _load(fpath)
+                             for dset, fpath in h5_dsets_data.items()}
+
+        return (_load(res_data), res_class_bins, _load(cf_data),
+                _load(lcoe_data), _load(offshore_flag), h5_dsets_data)
+
     @classmethod
     def run_serial(cls, excl_fpath, gen_fpath, tm_dset, gen_index,
                    econ_fpath=None, excl_dict=None, area_filter_kernel='queen',
@@ -978,7 +1134,10 @@ class SupplyCurveAggregation(AbstractAggregation):
                    res_class_bins=None, cf_dset='cf_mean-means',
                    lcoe_dset='lcoe_fcr-means', h5_dsets=None, data_layers=None,
                    power_density=None, friction_fpath=None, friction_dset=None,
-                   excl_area=0.0081, cap_cost_scale=None):
+                   excl_area=0.0081, cap_cost_scale=None, engine='point',
+                   block_size=1024, shared_inputs=None,
+                   tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                   area_filter=None, use_precomputed_mask=False):
         """Standalone method to create agg summary - can be parallelized.
 
         Parameters
@@ -1051,12 +1210,30 @@ class SupplyCurveAggregation(AbstractAggregation):
         excl_area : float
             Area of an exclusion cell (square km).
         cap_cost_scale : str | None
-            Optional LCOE scaling equation to implement "economies of scale".
-            Equations must be in python string format and return a scalar
-            value to multiply the capital cost by. Independent variables in
-            the equation should match the names of the columns in the reV
-            supply curve aggregation table. This will not affect offshore
-            wind LCOE.
+            Deprecated, economies of scale are applied to the full summary
+            table by summarize() (see economies_of_scale()). Optional LCOE
+            scaling equation to implement "economies of scale", applied to
+            the point summaries of this run.
+        engine : str
+            Summary engine, "point" summarizes one SC point at a time and
+            "sparse" summarizes blocks of SC points at once with a sparse
+            matrix of inclusion weights (SupplyCurveBlockSummary).
+        block_size : int
+            Target number of SC points summarized at once with the "sparse"
+            engine.
+        shared_inputs : tuple | None
+            Filepaths to scratch .npy files of the pre-extracted gen/econ
+            input data from _share_input_data(). These are memory-mapped
+            instead of reading the input data from gen_fpath and econ_fpath.
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        area_filter : dict | None
+            Pre-computed contiguous area filter labels, see
+            AbstractAggFileHandler.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
 
         Returns
         -------
@@ -1081,12 +1258,31 @@ class SupplyCurveAggregation(AbstractAggregation):
                        'min_area': min_area,
                        'friction_fpath': friction_fpath,
                        'friction_dset': friction_dset,
-                       'check_excl_layers': check_excl_layers}
+                       'check_excl_layers': check_excl_layers,
+                       'tile_cache_size': tile_cache_size,
+                       'area_filter': area_filter,
+                       'use_precomputed_mask': use_precomputed_mask}
         with SupplyCurveAggFileHandler(excl_fpath, gen_fpath,
                                        **file_kwargs) as fh:
-            inputs = cls._get_input_data(fh.gen, gen_fpath, econ_fpath,
-                                         res_class_dset, res_class_bins,
-                                         cf_dset, lcoe_dset, h5_dsets)
+            if shared_inputs is not None:
+                inputs = cls._load_input_data(shared_inputs)
+            else:
+                inputs = cls._get_input_data(fh.gen, gen_fpath, econ_fpath,
+                                             res_class_dset, res_class_bins,
+                                             cf_dset, lcoe_dset, h5_dsets)
+
+            if engine == 'sparse':
+                return SupplyCurveBlockSummary.summarize(
+                    gids, fh.exclusions, fh.gen, tm_dset, gen_index,
+                    block_size=block_size, args=args,
+                    data_layers=fh.data_layers,
+                    cap_cost_scale=cap_cost_scale,
+                    res_data=inputs[0], res_class_bins=inputs[1],
+                    cf_data=inputs[2], lcoe_data=inputs[3],
+                    h5_dsets_data=inputs[5], offshore_flags=inputs[4],
+                    excl_area=excl_area, power_density=fh.power_density,
+                    friction_layer=fh.friction_layer, resolution=resolution,
+                    exclusion_shape=exclusion_shape)
 
             n_finished = 0
             for gid in gids:
@@ -1112,8 +1308,7 @@ class SupplyCurveAggregation(AbstractAggregation):
                             excl_area=excl_area,
                             close=False,
                             offshore_flags=inputs[4],
-                            friction_layer=fh.friction_layer,
-                            cap_cost_scale=cap_cost_scale)
+                            friction_layer=fh.friction_layer)
 
                     except EmptySupplyCurvePointError:
                         pass
@@ -1134,11 +1329,84 @@ class SupplyCurveAggregation(AbstractAggregation):
                                      '{} out of {} points complete'
                                      .format(n_finished, len(gids)))
 
+        if cap_cost_scale is not None:
+            warn('The cap_cost_scale input to '
+                 'SupplyCurveAggregation.run_serial is deprecated, economies '
+                 'of scale are applied to the full summary table by '
+                 'SupplyCurveAggregation.summarize',
+                 reVDeprecationWarning)
+            summary = SupplyCurvePointSummary.economies_of_scale(
+                cap_cost_scale, summary)
+
         return summary
 
+    def _get_gid_blocks(self, points_per_worker=10):
+        """Split the SC gids into rectangular blocks of neighboring SC points
+        that are aligned to the exclusion h5 chunk grid.
+
+        Blocks are full-width contiguous area filter bands when min_area is
+        set so that each band is read and filtered by a single worker. Blocks
+        are sorted from largest to smallest so that the process pool queue,
+        which hands the next block to whichever worker is idle, balances the
+        load across workers.
+
+        Parameters
+        ----------
+        points_per_worker : int
+            Target number of sc_points in each block.
+
+        Returns
+        -------
+        gid_blocks : list
+            List of arrays of SC gids, one array per block.
+        """
+        res = self._resolution
+        with ExclusionLayers(self._excl_fpath) as f:
+            chunks = f.chunks
+
+        if chunks is None or None in tuple(chunks)[-2:]:
+            chunks = (res, res)
+
+        row_align, col_align = (int(c) for c in tuple(chunks)[-2:])
+        if self._min_area is not None:
+            row_align = int(np.lcm(row_align,
+                                   ExclusionMask.AREA_FILTER_BAND_SIZE))
+
+        area = max(points_per_worker, 1) * res ** 2
+        block_rows = int(max(1, np.round(np.sqrt(area) / row_align)))
+        block_rows *= row_align
+        block_cols = int(max(1, np.round(area / block_rows / col_align)))
+        block_cols *= col_align
+
+        gids = np.asarray(self._gids)
+        with SupplyCurveExtent(self._excl_fpath, resolution=res) as sc:
+            points = sc.points.loc[gids]
+            if self._min_area is not None:
+                block_rows = row_align
+                block_cols = sc.n_cols * res
+
+            n_block_cols = sc.n_cols * res // block_cols + 1
+
+        block_ind = ((points['row_ind'].values * res) // block_rows
+                     * n_block_cols
+                     + (points['col_ind'].values * res) // block_cols)
+        _, block_ind, counts = np.unique(block_ind, return_inverse=True,
+                                         return_counts=True)
+
+        order = np.argsort(block_ind, kind='stable')
+        gid_blocks = np.split(gids[order], np.cumsum(counts)[:-1])
+        gid_blocks = sorted(gid_blocks, key=len, reverse=True)
+
+        logger.debug('Split {} SC points into {} blocks of up to {} x {} '
+                     'exclusion pixels.'.format(len(gids), len(gid_blocks),
+                                                block_rows, block_cols))
+
+        return gid_blocks
+
     def run_parallel(self, args=None, excl_area=0.0081, max_workers=None,
-                     points_per_worker=10):
-        """Get the supply curve points aggregation summary using futures.
+                     points_per_worker=10, stream_fpath=None, resume=False):
+        """Get the supply curve points aggregation summary using futures,
+        or block by block in this process if max_workers == 1.
 
         Parameters
         ----------
@@ -1151,15 +1419,33 @@ class SupplyCurveAggregation(AbstractAggregation):
             Number of cores to run summary on. None is all
             available cpus, by default None
         points_per_worker : int
-            Number of sc_points to summarize on each worker, by default 10
+            Target number of sc_points to summarize on each worker, by
+            default 10. The sc_points are scheduled in rectangular blocks
+            aligned to the exclusion chunks, see _get_gid_blocks().
+        stream_fpath : str | None
+            Optional .h5 filepath to stream the worker results to as they
+            are completed (see ColumnarTableSink). This bounds the memory
+            of the parent process and leaves the partial results on disk if
+            the job is killed. The streamed batches are consolidated into
+            the returned summary once all workers are done.
+        resume : bool
+            Flag to resume from the checkpoint in an existing stream_fpath:
+            the SC point blocks recorded as completed in stream_fpath are
+            skipped and their results are kept. A checkpoint written with
+            different inputs is discarded. Ignored if stream_fpath is None.
 
         Returns
         -------
         summary : list
             List of dictionaries, each being an SC point summary.
         """
-        chunks = len(self._gids) // points_per_worker
-        chunks = np.array_split(self._gids, chunks)
+        chunks = self._get_gid_blocks(points_per_worker=points_per_worker)
+
+        sink = None
+        if stream_fpath is not None:
+            sink, chunks = self._open_sink(stream_fpath, chunks,
+                                           resume=resume, args=args,
+                                           excl_area=excl_area)
 
         logger.info('Running supply curve point aggregation for '
                     'points {} through {} at a resolution of {} '
@@ -1167,47 +1453,93 @@ class SupplyCurveAggregation(AbstractAggregation):
                     .format(self._gids[0], self._gids[-1], self._resolution,
                             max_workers, len(chunks)))
 
-        n_finished = 0
-        futures = []
+        scratch = None
+        shared_inputs = None
+        if self._shared_inputs and max_workers != 1:
+            scratch = tempfile.TemporaryDirectory(prefix='reV_sc_agg_')
+            shared_inputs = self._get_shared_inputs(scratch.name)
+
+        serial_kwargs = {'econ_fpath': self._econ_fpath,
+                         'excl_dict': self._excl_dict,
+                         'res_class_dset': self._res_class_dset,
+                         'res_class_bins': self._res_class_bins,
+                         'cf_dset': self._cf_dset,
+                         'lcoe_dset': self._lcoe_dset,
+                         'h5_dsets': self._h5_dsets,
+                         'data_layers': self._data_layers,
+                         'resolution': self._resolution,
+                         'power_density': self._power_density,
+                         'friction_fpath': self._friction_fpath,
+                         'friction_dset': self._friction_dset,
+                         'area_filter_kernel': self._area_filter_kernel,
+                         'min_area': self._min_area,
+                         'args': args,
+                         'excl_area': excl_area,
+                         'check_excl_layers': self._check_excl_layers,
+                         'engine': self._engine,
+                         'block_size': self._block_size,
+                         'shared_inputs': shared_inputs,
+                         'tile_cache_size': self._tile_cache_size,
+                         'area_filter': self._get_area_filter(),
+                         'use_precomputed_mask': self._use_precomputed_mask}
+        serial_args = (self._excl_fpath, self._gen_fpath, self._tm_dset,
+                       self._gen_index)
+
         summary = []
         loggers = [__name__, 'reV.supply_curve.point_summary', 'reV']
-        with SpawnProcessPool(max_workers=max_workers, loggers=loggers) as exe:
-
-            # iterate through split executions, submitting each to worker
-            for gid_set in chunks:
-                # submit executions and append to futures list
-                futures.append(exe.submit(
-                    self.run_serial,
-                    self._excl_fpath, self._gen_fpath,
-                    self._tm_dset, self._gen_index,
-                    econ_fpath=self._econ_fpath,
-                    excl_dict=self._excl_dict,
-                    res_class_dset=self._res_class_dset,
-                    res_class_bins=self._res_class_bins,
-                    cf_dset=self._cf_dset,
-                    lcoe_dset=self._lcoe_dset,
-                    h5_dsets=self._h5_dsets,
-                    data_layers=self._data_layers,
-                    resolution=self._resolution,
-                    power_density=self._power_density,
-                    friction_fpath=self._friction_fpath,
-                    friction_dset=self._friction_dset,
-                    area_filter_kernel=self._area_filter_kernel,
-                    min_area=self._min_area,
-                    gids=gid_set, args=args, excl_area=excl_area,
-                    check_excl_layers=self._check_excl_layers,
-                    cap_cost_scale=self._cap_cost_scale))
-
-            # gather results
-            for future in as_completed(futures):
-                n_finished += 1
-                logger.info('Parallel aggregation futures collected: '
-                            '{} out of {}'
-                            .format(n_finished, len(chunks)))
-                summary += future.result()
+        try:
+            for gid_set, out in self._run_blocks(chunks, serial_args,
+                                                 serial_kwargs,
+                                                 max_workers=max_workers,
+                                                 loggers=loggers):
+                if sink is None:
+                    summary += out
+                else:
+                    sink.append(out, task_ids=gid_set)
+        finally:
+            if sink is not None:
+                sink.flush()
+
+            if scratch is not None:
+                scratch.cleanup()
+
+        if sink is not None:
+            summary = ColumnarTableSink.read_records(stream_fpath)
 
         return summary
 
+    def _get_shared_inputs(self, scratch_dir):
+        """Read the gen/econ input data once and save it to scratch .npy
+        files that are memory-mapped by the parallel workers.
+
+        Parameters
+        ----------
+        scratch_dir : str
+            Directory to save the scratch .npy files to.
+
+        Returns
+        -------
+        shared_inputs : tuple
+            Filepaths to the scratch .npy files of the gen/econ input data,
+            see _share_input_data().
+        """
+        gen = SupplyCurveAggFileHandler._open_gen_econ_resource(
+            self._gen_fpath, self._econ_fpath)
+        try:
+            inputs = self._get_input_data(gen, self._gen_fpath,
+                                          self._econ_fpath,
+                                          self._res_class_dset,
+                                          self._res_class_bins, self._cf_dset,
+                                          self._lcoe_dset, self._h5_dsets)
+        finally:
+            gen.close()
+
+        logger.info('Sharing supply curve aggregation input data with the '
+                    'parallel workers from scratch directory: {}'
+                    .format(scratch_dir))
+
+        return self._share_input_data(inputs, scratch_dir)
+
     def run_offshore(self, summary, offshore_capacity=600,
                      offshore_gid_counts=494, offshore_pixel_area=4,
                      offshore_meta_cols=None):
@@ -1316,15 +1648,63 @@ class SupplyCurveAggregation(AbstractAggregation):
             Summary of the SC points.
         """
         summary = pd.DataFrame(summary)
-        summary = summary.sort_values('sc_point_gid')
+        # stable sort keeps the resource class rows of each SC point in order
+        summary = summary.sort_values('sc_point_gid', kind='mergesort')
         summary = summary.reset_index(drop=True)
         summary.index.name = 'sc_gid'
 
         return summary
 
+    @staticmethod
+    def economies_of_scale(cap_cost_scale, summary, use_numexpr=True):
+        """Apply economies of scale to all onshore SC points of a summary
+        table in one vectorized pass. This can also re-apply a new scaling
+        equation to an existing (scaled) summary table without re-running
+        the aggregation: mean_lcoe is reset to raw_lcoe before the new
+        equation is evaluated.
+
+        Parameters
+        ----------
+        cap_cost_scale : str
+            LCOE scaling equation to implement "economies of scale".
+            Equation must be in python string format and return a scalar
+            value to multiply the capital cost by. Independent variables in
+            the equation should match the names of the columns in the reV
+            supply curve aggregation table. This will not affect offshore
+            wind LCOE.
+        summary : pd.DataFrame
+            Summary of the SC points. Must include the LCOE input columns
+            (see BaseGen.LCOE_ARGS) and the equation variables.
+        use_numexpr : bool
+            Flag to evaluate the equation with numexpr if it is installed.
+
+        Returns
+        -------
+        summary : pd.DataFrame
+            Copy of the SC points summary with scaled mean_lcoe and unscaled
+            raw_lcoe columns.
+        """
+        summary = summary.copy()
+        onshore = np.ones(len(summary), dtype=bool)
+        if 'offshore' in summary:
+            onshore = (summary['offshore'] != 1).values
+
+        if 'raw_lcoe' in summary:
+            scaled = summary['raw_lcoe'].notna().values & onshore
+            summary.loc[scaled, 'mean_lcoe'] = summary.loc[scaled, 'raw_lcoe']
+
+        if onshore.any():
+            eos = EconomiesOfScale(cap_cost_scale, summary[onshore],
+                                   use_numexpr=use_numexpr)
+            summary.loc[onshore, 'mean_lcoe'] = eos.scaled_lcoe
+            summary.loc[onshore, 'raw_lcoe'] = eos.raw_lcoe
+
+        return summary
+
     def summarize(self, args=None, max_workers=None, points_per_worker=10,
                   offshore_capacity=600, offshore_gid_counts=494,
-                  offshore_pixel_area=4, offshore_meta_cols=None):
+                  offshore_pixel_area=4, offshore_meta_cols=None,
+                  stream_fpath=None, resume=False):
         """
         Get the supply curve points aggregation summary
 
@@ -1337,7 +1717,8 @@ class SupplyCurveAggregation(AbstractAggregation):
             Number of cores to run summary on. None is all
             available cpus, by default None
         points_per_worker : int
-            Number of sc_points to summarize on each worker, by default 10
+            Target number of sc_points to summarize on each worker, by
+            default 10
         offshore_capacity : int | float
             Offshore resource pixel generation capacity in MW.
         offshore_gid_counts : int
@@ -1350,6 +1731,13 @@ class SupplyCurveAggregation(AbstractAggregation):
             through to the offshore module output meta data. None will use
             Offshore class variable DEFAULT_META_COLS, and any
             additional requested cols will be added to DEFAULT_META_COLS.
+        stream_fpath : str | None
+            Optional .h5 filepath to stream the worker results to as they
+            are completed, see run_parallel().
+        resume : bool
+            Flag to skip the SC point blocks that were completed and
+            checkpointed to stream_fpath by a previous run with the same
+            inputs.
 
         Returns
         -------
@@ -1359,9 +1747,10 @@ class SupplyCurveAggregation(AbstractAggregation):
         if max_workers is None:
             max_workers = os.cpu_count()
 
-        if max_workers == 1:
+        if max_workers == 1 and stream_fpath is None:
             afk = self._area_filter_kernel
             chk = self._check_excl_layers
+            upm = self._use_precomputed_mask
             summary = self.run_serial(self._excl_fpath, self._gen_fpath,
                                       self._tm_dset, self._gen_index,
                                       econ_fpath=self._econ_fpath,
@@ -1381,11 +1770,16 @@ class SupplyCurveAggregation(AbstractAggregation):
                                       gids=self._gids, args=args,
                                       excl_area=self._excl_area,
                                       check_excl_layers=chk,
-                                      cap_cost_scale=self._cap_cost_scale)
+                                      engine=self._engine,
+                                      block_size=self._block_size,
+                                      tile_cache_size=self._tile_cache_size,
+                                      use_precomputed_mask=upm)
         else:
             summary = self.run_parallel(args=args, excl_area=self._excl_area,
                                         max_workers=max_workers,
-                                        points_per_worker=points_per_worker)
+                                        points_per_worker=points_per_worker,
+                                        stream_fpath=stream_fpath,
+                                        resume=resume)
 
         summary = self.run_offshore(summary,
                                     offshore_capacity=offshore_capacity,
@@ -1403,6 +1797,9 @@ class SupplyCurveAggregation(AbstractAggregation):
         summary = OffshoreAggregation._agg_data_layers(self._data_layers,
                                                        summary)
 
+        if self._cap_cost_scale is not None:
+            summary = self.economies_of_scale(self._cap_cost_scale, summary)
+
         return summary
 
     @classmethod
@@ -1417,7 +1814,10 @@ class SupplyCurveAggregation(AbstractAggregation):
                 points_per_worker=10,
                 cap_cost_scale=None, offshore_capacity=600,
                 offshore_gid_counts=494, offshore_pixel_area=4,
-                offshore_meta_cols=None):
+                offshore_meta_cols=None, engine='point', block_size=1024,
+                shared_inputs=False, stream_fpath=None, resume=False,
+                tile_cache_size=AbstractAggFileHandler.TILE_CACHE_SIZE,
+                use_precomputed_mask=False):
         """Get the supply curve points aggregation summary.
 
         Parameters
@@ -1491,7 +1891,8 @@ class SupplyCurveAggregation(AbstractAggregation):
             Number of cores to run summary on. None is all
             available cpus, by default None
         points_per_worker : int
-            Number of sc_points to summarize on each worker, by default 10
+            Target number of sc_points to summarize on each worker, by
+            default 10
         cap_cost_scale : str | None
             Optional LCOE scaling equation to implement "economies of scale".
             Equations must be in python string format and return a scalar
@@ -1511,6 +1912,35 @@ class SupplyCurveAggregation(AbstractAggregation):
             through to the offshore module output meta data. None will use
             Offshore class variable DEFAULT_META_COLS, and any
             additional requested cols will be added to DEFAULT_META_COLS.
+        engine : str
+            Summary engine, "point" summarizes one SC point at a time and
+            "sparse" summarizes blocks of SC points at once with a sparse
+            matrix of inclusion weights (SupplyCurveBlockSummary).
+        block_size : int
+            Target number of SC points summarized at once with the "sparse"
+            engine.
+        shared_inputs : bool
+            Flag to read the generation/econ input arrays once in the parent
+            process and share them with the parallel workers as read-only
+            memory-mapped scratch .npy files (saved to the system temporary
+            directory) instead of having every worker read the full arrays.
+        stream_fpath : str | None
+            Optional .h5 filepath to stream the parallel worker results to
+            as they are completed (see ColumnarTableSink). The file is kept
+            so that partial results can be recovered with
+            ColumnarTableSink.read() if the job is killed. The completed SC
+            point blocks are recorded in the file so that it is also a
+            checkpoint for resume.
+        resume : bool
+            Flag to resume a killed job from the checkpoint in stream_fpath,
+            the SC point blocks that it completed are not summarized again.
+            A checkpoint written with different inputs is discarded.
+        tile_cache_size : int | None
+            Exclusion layer tile cache byte budget, see
+            AbstractAggregation.
+        use_precomputed_mask : bool
+            Flag to read a persisted inclusion mask, see
+            AbstractAggregation.
 
         Returns
         -------
@@ -1536,7 +1966,12 @@ class SupplyCurveAggregation(AbstractAggregation):
                   min_area=min_area,
                   check_excl_layers=check_excl_layers,
                   excl_area=excl_area,
-                  cap_cost_scale=cap_cost_scale)
+                  cap_cost_scale=cap_cost_scale,
+                  engine=engine,
+                  block_size=block_size,
+                  shared_inputs=shared_inputs,
+                  tile_cache_size=tile_cache_size,
+                  use_precomputed_mask=use_precomputed_mask)
 
         summary = agg.summarize(args=args,
                                 max_workers=max_workers,
@@ -1544,6 +1979,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                                 offshore_capacity=offshore_capacity,
                                 offshore_gid_counts=offshore_gid_counts,
                                 offshore_pixel_area=offshore_pixel_area,
-                                offshore_meta_cols=offshore_meta_cols)
+                                offshore_meta_cols=offshore_meta_cols,
+                                stream_fpath=stream_fpath,
+                                resume=resume)
 
         return summary
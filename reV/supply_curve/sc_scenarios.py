@@ -0,0 +1,617 @@
+# -*- coding: utf-8 -*-
+"""
+reV supply curve scenario sweeps: evaluate many supply curve scenarios
+(fixed charge rates, transmission costs, sort orders, multipliers...) from a
+single parsed and merged supply curve / transmission table.
+"""
+from concurrent.futures import as_completed
+import h5py
+import json
+import logging
+import os
+import time
+
+from reV.handlers.tables import ColumnarTable
+from reV.supply_curve.supply_curve import SupplyCurve
+from reV.utilities.exceptions import SupplyCurveInputError
+
+from rex.utilities.execution import SpawnProcessPool
+from rex.utilities.utilities import safe_json_load
+
+logger = logging.getLogger(__name__)
+
+
+class SupplyCurveScenarios:
+    """
+    Supply curve scenario sweep.
+
+    The supply curve points, sc_features, transmission table, and offshore
+    transmission table are parsed, merged, and checked only once. The
+    merged tables can be cached to a columnar .h5 file that is re-used by
+    subsequent sweeps with the same inputs and is read by the parallel
+    scenario workers. Each scenario then only re-computes connection costs
+    and the supply curve sort.
+
+    Examples
+    --------
+    >>> scenarios = {'low_fcr': {'fcr': 0.05},
+    ...              'high_cost': {'fcr': 0.1,
+    ...                            'transmission_costs': {'line_cost': 5000}},
+    ...              'simple': {'fcr': 0.1, 'simple': True}}
+    >>> out = SupplyCurveScenarios.run(sc_points, trans_table, scenarios,
+    ...                                out_dir='./', max_workers=3)
+    """
+
+    #: Scenario keys used to compute connection costs
+    COST_KEYS = ('fcr', 'transmission_costs', 'line_limited',
+                 'consider_friction', 'transmission_multiplier')
+
+    #: Scenario keys used to sort the supply curve
+    SORT_KEYS = ('simple', 'sort_on', 'columns', 'wind_dirs', 'n_dirs',
+                 'downwind', 'offshore_compete')
+
+    #: Groups in the scenario cache file
+    CACHE_GROUPS = ('sc_points', 'trans_table')
+
+    def __init__(self, sc_points, trans_table, sc_features=None,
+                 offshore_trans_table=None, cache_fpath=None):
+        """
+        Parameters
+        ----------
+        sc_points : str | pandas.DataFrame
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supply curve point summary
+        trans_table : str | pandas.DataFrame
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supply curve transmission mapping
+        sc_features : str | pandas.DataFrame, optional
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing additional supply curve features, e.g.
+            transmission multipliers, regions
+        offshore_trans_table : str, optional
+            Path to offshore transmission table, if None offshore sc points
+            will not be included, by default None
+        cache_fpath : str, optional
+            Path to .h5 file to cache the parsed and merged tables in. If the
+            file already contains a cache built from the same input files it
+            is loaded instead of re-parsing the inputs, by default None
+        """
+        self._cache_fpath = cache_fpath
+        self._out_ext = ColumnarTable.output_ext(sc_points)
+        inputs = {'sc_points': sc_points, 'trans_table': trans_table,
+                  'sc_features': sc_features,
+                  'offshore_trans_table': offshore_trans_table}
+        self._signature = self._get_signature(inputs)
+
+        if self._cache_valid(cache_fpath, self._signature):
+            logger.info('Loading merged supply curve tables from cache: {}'
+                        .format(cache_fpath))
+            self._sc_points, self._trans_table = self._load_cache(cache_fpath)
+        else:
+            self._sc_points = SupplyCurve._parse_sc_points(
+                sc_points, sc_features=sc_features)
+            self._trans_table = SupplyCurve._merge_sc_trans_tables(
+                self._sc_points, trans_table,
+                offshore_table=offshore_trans_table)
+            SupplyCurve._check_sc_trans_table(self._sc_points,
+                                              self._trans_table)
+            if cache_fpath is not None:
+                self._write_cache(cache_fpath)
+
+    def __repr__(self):
+        msg = ('{} with {} supply curve points and {} transmission '
+               'connections'.format(self.__class__.__name__,
+                                    len(self._sc_points),
+                                    len(self._trans_table)))
+
+        return msg
+
+    @property
+    def sc_points(self):
+        """Parsed supply curve points table
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        return self._sc_points
+
+    @property
+    def trans_table(self):
+        """Transmission table merged with the supply curve points
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        return self._trans_table
+
+    @property
+    def cache_fpath(self):
+        """Path to the merged table cache file
+
+        Returns
+        -------
+        str | None
+        """
+        return self._cache_fpath
+
+    @staticmethod
+    def _get_signature(inputs):
+        """Get a signature of the input files used to validate the cache.
+
+        Parameters
+        ----------
+        inputs : dict
+            Mapping of input name to input filepath or DataFrame.
+
+        Returns
+        -------
+        signature : str | None
+            Serialized input file paths, sizes and modification times. None
+            if any of the inputs is not a file (cache cannot be validated).
+        """
+        signature = {}
+        for name, fp in inputs.items():
+            if fp is not None:
+                if not isinstance(fp, str) or not os.path.exists(fp):
+                    return None
+
+                stat = os.stat(fp)
+                fp = [os.path.abspath(fp), stat.st_size, stat.st_mtime]
+
+            signature[name] = fp
+
+        return json.dumps(signature, sort_keys=True)
+
+    @classmethod
+    def _cache_valid(cls, cache_fpath, signature):
+        """Check if the cache file exists and was built from the same inputs
+
+        Parameters
+        ----------
+        cache_fpath : str | None
+            Path to .h5 cache file.
+        signature : str | None
+            Signature of the current input files.
+
+        Returns
+        -------
+        bool
+        """
+        if cache_fpath is None or signature is None:
+            return False
+
+        if not os.path.exists(cache_fpath):
+            return False
+
+        with h5py.File(cache_fpath, mode='r') as f:
+            valid = (all(g in f for g in cls.CACHE_GROUPS)
+                     and f.attrs.get('signature', None) == signature)
+
+        if not valid:
+            logger.info('Supply curve scenario cache {} is out of date, '
+                        're-building.'.format(cache_fpath))
+
+        return valid
+
+    def _write_cache(self, cache_fpath):
+        """Write the parsed and merged tables to the cache file
+
+        Parameters
+        ----------
+        cache_fpath : str
+            Path to .h5 cache file.
+        """
+        if not cache_fpath.endswith('.h5'):
+            msg = ('Supply curve scenario cache must be an .h5 file, got: {}'
+                   .format(cache_fpath))
+            logger.error(msg)
+            raise SupplyCurveInputError(msg)
+
+        logger.info('Caching merged supply curve tables to: {}'
+                    .format(cache_fpath))
+        ColumnarTable.write(self._sc_points, cache_fpath,
+                            group='sc_points', mode='w')
+        ColumnarTable.write(self._trans_table, cache_fpath,
+                            group='trans_table')
+
+        with h5py.File(cache_fpath, mode='a') as f:
+            if self._signature is not None:
+                f.attrs['signature'] = self._signature
+
+    @classmethod
+    def _load_cache(cls, cache_fpath):
+        """Load the parsed and merged tables from a cache file
+
+        Parameters
+        ----------
+        cache_fpath : str
+            Path to .h5 cache file.
+
+        Returns
+        -------
+        sc_points : pandas.DataFrame
+            Parsed supply curve points table
+        trans_table : pandas.DataFrame
+            Transmission table merged with the supply curve points
+        """
+        return tuple(ColumnarTable.read(cache_fpath, group=g)
+                     for g in cls.CACHE_GROUPS)
+
+    @classmethod
+    def parse_scenarios(cls, scenarios, **defaults):
+        """Parse scenario definitions and fill in default scenario inputs
+
+        Parameters
+        ----------
+        scenarios : str | dict | list
+            Scenario definitions: a dictionary mapping scenario names to
+            scenario input dictionaries, a list of scenario input
+            dictionaries each with a "name" key, or a path to a .json file
+            containing either.
+        defaults : dict
+            Default scenario inputs used where a scenario does not specify
+            a value, e.g. fcr=0.1
+
+        Returns
+        -------
+        scenarios : dict
+            Mapping of scenario names to full scenario input dictionaries
+        """
+        if isinstance(scenarios, str):
+            scenarios = safe_json_load(scenarios)
+
+        if isinstance(scenarios, (list, tuple)):
+            named = {}
+            for i, scenario in enumerate(scenarios):
+                scenario = dict(scenario)
+                name = str(scenario.pop('name', 'scenario_{}'.format(i)))
+                if name in named:
+                    msg = 'Duplicate scenario name: "{}"'.format(name)
+                    logger.error(msg)
+                    raise SupplyCurveInputError(msg)
+
+                named[name] = scenario
+
+            scenarios = named
+
+        valid_keys = cls.COST_KEYS + cls.SORT_KEYS
+        out = {}
+        for name, scenario in scenarios.items():
+            scenario = {k: v for k, v in scenario.items() if v is not None}
+            bad = [k for k in list(scenario) + list(defaults)
+                   if k not in valid_keys]
+            if bad:
+                msg = ('Invalid inputs for supply curve scenario "{}": {}. '
+                       'Valid inputs are: {}'.format(name, bad, valid_keys))
+                logger.error(msg)
+                raise SupplyCurveInputError(msg)
+
+            kwargs = {k: v for k, v in defaults.items() if v is not None}
+            kwargs.update(scenario)
+            if 'fcr' not in kwargs:
+                msg = ('Supply curve scenario "{}" requires a fixed charge '
+                       'rate "fcr"'.format(name))
+                logger.error(msg)
+                raise SupplyCurveInputError(msg)
+
+            out[name] = kwargs
+
+        return out
+
+    @staticmethod
+    def _apply_multiplier(sc_points, trans_table, transmission_multiplier):
+        """Scale the transmission multipliers for a scenario
+
+        Parameters
+        ----------
+        sc_points : pandas.DataFrame
+            Parsed supply curve points table
+        trans_table : pandas.DataFrame
+            Transmission table merged with the supply curve points
+        transmission_multiplier : float
+            Scalar applied on top of any "transmission_multiplier" column
+            from the sc_features.
+
+        Returns
+        -------
+        sc_points : pandas.DataFrame
+            Supply curve points with scaled "transmission_multiplier"
+        trans_table : pandas.DataFrame
+            Transmission table with scaled "transmission_multiplier"
+        """
+        col = 'transmission_multiplier'
+        tables = []
+        for table in (sc_points, trans_table):
+            table = table.copy()
+            if col in table:
+                table[col] = table[col] * transmission_multiplier
+            else:
+                table[col] = transmission_multiplier
+
+            tables.append(table)
+
+        return tables
+
+    @classmethod
+    def run_scenario(cls, sc_points, trans_table, scenario, max_workers=1):
+        """Run a single supply curve scenario on the merged tables
+
+        Parameters
+        ----------
+        sc_points : str | pandas.DataFrame
+            Parsed supply curve points table or path to the scenario .h5
+            cache file (in which case trans_table is ignored)
+        trans_table : pandas.DataFrame | None
+            Transmission table merged with the supply curve points
+        scenario : dict
+            Scenario inputs, see COST_KEYS and SORT_KEYS
+        max_workers : int | NoneType
+            Number of workers to use to compute lcot, by default 1
+
+        Returns
+        -------
+        supply_curve : pandas.DataFrame
+            Updated sc_points table with transmission connections, LCOT
+            and LCOE+LCOT
+        """
+        if isinstance(sc_points, str):
+            sc_points, trans_table = cls._load_cache(sc_points)
+
+        scenario = dict(scenario)
+        tm = scenario.pop('transmission_multiplier', None)
+        if tm is not None:
+            sc_points, trans_table = cls._apply_multiplier(sc_points,
+                                                           trans_table, tm)
+
+        simple = bool(scenario.pop('simple', False))
+        sort_kwargs = {k: scenario.pop(k) for k in cls.SORT_KEYS
+                       if k in scenario}
+        if 'columns' in sort_kwargs:
+            sort_kwargs['columns'] = tuple(sort_kwargs['columns'])
+
+        if simple:
+            scenario.pop('line_limited', None)
+
+        sc = SupplyCurve.from_merged_tables(sc_points, trans_table,
+                                            connectable=not simple,
+                                            max_workers=max_workers,
+                                            **scenario)
+        if simple:
+            supply_curve = sc.simple_sort(**sort_kwargs)
+        else:
+            supply_curve = sc.full_sort(**sort_kwargs)
+
+        return supply_curve
+
+    @staticmethod
+    def _save_scenario(supply_curve, out_fpath):
+        """Save a scenario supply curve table to disk
+
+        Parameters
+        ----------
+        supply_curve : pandas.DataFrame
+            Scenario supply curve table
+        out_fpath : str
+            Output filepath (.csv, .h5, .parquet, or .feather)
+
+        Returns
+        -------
+        out_fpath : str
+            Output filepath
+        """
+        ColumnarTable.save(supply_curve, out_fpath)
+        logger.debug('Saved supply curve scenario to: {}'.format(out_fpath))
+
+        return out_fpath
+
+    @classmethod
+    def _run_and_save(cls, sc_points, trans_table, scenario, out_fpath):
+        """Run a single supply curve scenario and save it to disk. Used
+        by the parallel workers.
+
+        Parameters
+        ----------
+        sc_points : str | pandas.DataFrame
+            Parsed supply curve points table or path to the scenario .h5
+            cache file (in which case trans_table is ignored)
+        trans_table : pandas.DataFrame | None
+            Transmission table merged with the supply curve points
+        scenario : dict
+            Scenario inputs, see COST_KEYS and SORT_KEYS
+        out_fpath : str | None
+            Output filepath, if None the supply curve table is returned
+
+        Returns
+        -------
+        out : str | pandas.DataFrame
+            Output filepath or supply curve table if out_fpath is None
+        """
+        supply_curve = cls.run_scenario(sc_points, trans_table, scenario)
+        if out_fpath is None:
+            return supply_curve
+
+        return cls._save_scenario(supply_curve, out_fpath)
+
+    def _scenario_fpaths(self, scenarios, out_dir, out_prefix):
+        """Get the output filepath for each scenario
+
+        Parameters
+        ----------
+        scenarios : dict
+            Parsed scenario definitions
+        out_dir : str | None
+            Output directory, if None no scenario outputs are saved.
+        out_prefix : str | None
+            Prefix for the scenario output file names.
+
+        Returns
+        -------
+        dict
+            Mapping of scenario name to output filepath or None
+        """
+        if out_dir is None:
+            return {name: None for name in scenarios}
+
+        os.makedirs(out_dir, exist_ok=True)
+        fpaths = {}
+        for name in scenarios:
+            fn = '{}{}'.format(name, self._out_ext)
+            if out_prefix:
+                fn = '{}_{}'.format(out_prefix, fn)
+
+            fpaths[name] = os.path.join(out_dir, fn)
+
+        return fpaths
+
+    def run_scenarios(self, scenarios, out_dir=None, out_prefix=None,
+                      max_workers=None, **defaults):
+        """Run a set of supply curve scenarios
+
+        Parameters
+        ----------
+        scenarios : str | dict | list
+            Scenario definitions, see SupplyCurveScenarios.parse_scenarios
+        out_dir : str, optional
+            Directory to save one file per scenario to (in the same format
+            as sc_points, .csv for .csv and .json inputs), by default None
+            which returns the scenario tables instead of saving them.
+        out_prefix : str, optional
+            Prefix for the scenario output file names, by default None
+        max_workers : int | None
+            Number of scenarios to run in parallel processes, None uses
+            all available cpus, by default None
+        defaults : dict
+            Default scenario inputs, see SupplyCurveScenarios.parse_scenarios
+
+        Returns
+        -------
+        out : dict
+            Mapping of scenario names to output filepaths (or supply curve
+            tables if out_dir is None)
+        """
+        scenarios = self.parse_scenarios(scenarios, **defaults)
+        fpaths = self._scenario_fpaths(scenarios, out_dir, out_prefix)
+        logger.info('Running {} supply curve scenarios: {}'
+                    .format(len(scenarios), list(scenarios)))
+
+        if max_workers is None:
+            max_workers = os.cpu_count()
+
+        max_workers = min(max_workers, len(scenarios))
+        if max_workers > 1:
+            out = self._run_parallel(scenarios, fpaths, max_workers)
+        else:
+            out = {}
+            for i, (name, scenario) in enumerate(scenarios.items()):
+                t0 = time.time()
+                out[name] = self._run_and_save(self._sc_points,
+                                               self._trans_table, scenario,
+                                               fpaths[name])
+                logger.info('Finished supply curve scenario "{}" ({} out of '
+                            '{}) in {:.2f} min'
+                            .format(name, i + 1, len(scenarios),
+                                    (time.time() - t0) / 60))
+
+        return {name: out[name] for name in scenarios}
+
+    def _run_parallel(self, scenarios, fpaths, max_workers):
+        """Run supply curve scenarios in parallel processes
+
+        Parameters
+        ----------
+        scenarios : dict
+            Parsed scenario definitions
+        fpaths : dict
+            Mapping of scenario name to output filepath or None
+        max_workers : int
+            Number of parallel workers
+
+        Returns
+        -------
+        out : dict
+            Mapping of scenario names to output filepaths (or supply curve
+            tables if no output filepaths were given)
+        """
+        if self._cache_fpath is not None:
+            args = (self._cache_fpath, None)
+        else:
+            args = (self._sc_points, self._trans_table)
+
+        loggers = [__name__, 'reV.supply_curve', 'reV.handlers']
+        out = {}
+        with SpawnProcessPool(max_workers=max_workers,
+                              loggers=loggers) as exe:
+            futures = {exe.submit(self._run_and_save, *args, scenario,
+                                  fpaths[name]): name
+                       for name, scenario in scenarios.items()}
+
+            for i, future in enumerate(as_completed(futures)):
+                name = futures[future]
+                out[name] = future.result()
+                logger.info('Finished supply curve scenario "{}" ({} out of '
+                            '{})'.format(name, i + 1, len(futures)))
+
+        return out
+
+    @classmethod
+    def run(cls, sc_points, trans_table, scenarios, sc_features=None,
+            offshore_trans_table=None, cache_fpath=None, out_dir=None,
+            out_prefix=None, max_workers=None, **defaults):
+        """Parse and merge the supply curve tables once and run a set of
+        supply curve scenarios on them.
+
+        Parameters
+        ----------
+        sc_points : str | pandas.DataFrame
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supply curve point summary
+        trans_table : str | pandas.DataFrame
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supply curve transmission mapping
+        scenarios : str | dict | list
+            Scenario definitions: a dictionary mapping scenario names to
+            scenario input dictionaries, a list of scenario input
+            dictionaries each with a "name" key, or a path to a .json file
+            containing either. Valid scenario inputs are: fcr,
+            transmission_costs, line_limited, consider_friction,
+            transmission_multiplier (scalar applied to any multipliers in
+            sc_features), simple, sort_on, columns, wind_dirs, n_dirs,
+            downwind, and offshore_compete.
+        sc_features : str | pandas.DataFrame, optional
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing additional supply curve features, e.g.
+            transmission multipliers, regions
+        offshore_trans_table : str, optional
+            Path to offshore transmission table, if None offshore sc points
+            will not be included, by default None
+        cache_fpath : str, optional
+            Path to .h5 file to cache the parsed and merged tables in, by
+            default None
+        out_dir : str, optional
+            Directory to save one file per scenario to (in the same format
+            as sc_points, .csv for .csv and .json inputs), by default None
+            which returns the scenario tables instead of saving them.
+        out_prefix : str, optional
+            Prefix for the scenario output file names, by default None
+        max_workers : int | None
+            Number of scenarios to run in parallel processes, None uses
+            all available cpus, by default None
+        defaults : dict
+            Default scenario inputs used where a scenario does not specify
+            a value, e.g. fcr=0.1
+
+        Returns
+        -------
+        out : dict
+            Mapping of scenario names to output filepaths (or supply curve
+            tables if out_dir is None)
+        """
+        sweep = cls(sc_points, trans_table, sc_features=sc_features,
+                    offshore_trans_table=offshore_trans_table,
+                    cache_fpath=cache_fpath)
+
+        return sweep.run_scenarios(scenarios, out_dir=out_dir,
+                                   out_prefix=out_prefix,
+                                   max_workers=max_workers, **defaults)
@@ -4,20 +4,18 @@ reV supply curve module
 - Calculation of LCOT
 - Supply Curve creation
 """
-from copy import deepcopy
-import os
 import logging
 import numpy as np
 import pandas as pd
 from warnings import warn
 
+from reV.handlers.tables import ColumnarTable
 from reV.handlers.transmission import TransmissionCosts as TC
 from reV.handlers.transmission import TransmissionFeatures as TF
 from reV.supply_curve.competitive_wind_farms import CompetitiveWindFarms
+from reV.supply_curve.full_sort import full_sort
 from reV.utilities.exceptions import SupplyCurveInputError, SupplyCurveError
 
-from rex.utilities import parse_table, SpawnProcessPool
-
 logger = logging.getLogger(__name__)
 
 
@@ -58,24 +56,31 @@ class SupplyCurve:
         Total LCOE of each supply curve point considering the LCOE friction
         scalar from the aggregation step (mean_lcoe_friction + lcot) ($/MWh).
     """
+    #: Transmission table columns needed to compute the supply curve (in
+    #: addition to the sc row/col merge columns)
+    TRANS_TABLE_COLUMNS = ('trans_line_gid', 'category', 'ac_cap',
+                           'trans_gids', 'dist_mi', 'farm_gid',
+                           'transmission_multiplier')
+
     def __init__(self, sc_points, trans_table, fcr, sc_features=None,
                  transmission_costs=None, line_limited=False,
                  connectable=True, max_workers=None, consider_friction=True,
-                 offshore_trans_table=None):
+                 offshore_trans_table=None, trans_table_columns=None):
         """
         Parameters
         ----------
         sc_points : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing supply curve
-            point summary
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supply curve point summary
         trans_table : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing supply curve
-            transmission mapping
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supply curve transmission mapping
         fcr : float
             Fixed charge rate, used to compute LCOT
         sc_features : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing additional supply
-            curve features, e.g. transmission multipliers, regions
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing additional supply curve features, e.g.
+            transmission multipliers, regions
         transmission_costs : str | dict
             Transmission feature costs to use with TransmissionFeatures
             handler: line_tie_in_cost, line_cost, station_tie_in_cost,
@@ -93,18 +98,53 @@ class SupplyCurve:
         offshore_trans_table : str, optional
             Path to offshore transmission table, if None offshore sc points
             will not be included, by default None
+        trans_table_columns : list, optional
+            Additional (onshore and offshore) transmission table columns to
+            load, e.g. output or sort_on columns. If None all columns are
+            loaded, otherwise only TRANS_TABLE_COLUMNS, the merge columns,
+            and these columns are read, by default None
         """
 
         logger.info('Supply curve points input: {}'.format(sc_points))
         logger.info('Transmission table input: {}'.format(trans_table))
 
-        trans_costs = transmission_costs
         self._sc_points = self._parse_sc_points(sc_points,
                                                 sc_features=sc_features)
-        self._trans_table = \
-            self._merge_sc_trans_tables(self._sc_points, trans_table,
-                                        offshore_table=offshore_trans_table)
+        self._trans_table = self._merge_sc_trans_tables(
+            self._sc_points, trans_table, offshore_table=offshore_trans_table,
+            trans_table_columns=trans_table_columns)
         self._check_sc_trans_table(self._sc_points, self._trans_table)
+        self._init_costs(fcr, transmission_costs=transmission_costs,
+                         line_limited=line_limited, connectable=connectable,
+                         max_workers=max_workers,
+                         consider_friction=consider_friction)
+
+    def _init_costs(self, fcr, transmission_costs=None, line_limited=False,
+                    connectable=True, max_workers=None,
+                    consider_friction=True):
+        """Compute connection costs for the merged sc points and
+        transmission table and initialize the transmission features handler.
+
+        Parameters
+        ----------
+        fcr : float
+            Fixed charge rate, used to compute LCOT
+        transmission_costs : str | dict
+            Transmission feature costs to use with TransmissionFeatures
+            handler: line_tie_in_cost, line_cost, station_tie_in_cost,
+            center_tie_in_cost, sink_tie_in_cost
+        line_limited : bool
+            Substation connection is limited by maximum capacity of the
+            attached lines, legacy method
+        connectable : bool
+            Determine if connection is possible
+        max_workers : int | NoneType
+            Number of workers to use to compute lcot, if > 1 run in parallel.
+            None uses all available cpu's.
+        consider_friction : bool
+            Flag to consider friction layer on LCOE.
+        """
+        trans_costs = transmission_costs
         self._trans_table = self._add_trans_lcot(self._trans_table, fcr,
                                                  trans_costs=trans_costs,
                                                  line_limited=line_limited,
@@ -119,6 +159,55 @@ class SupplyCurve:
         out = self._parse_sc_gids(self._trans_table)
         self._trans_table, self._sc_gids, self._mask = out
 
+    @classmethod
+    def from_merged_tables(cls, sc_points, trans_table, fcr,
+                           transmission_costs=None, line_limited=False,
+                           connectable=True, max_workers=None,
+                           consider_friction=True):
+        """Initialize a SupplyCurve from pre-parsed supply curve points and
+        a transmission table that has already been merged with the supply
+        curve points (e.g. from a cached scenario sweep), skipping the
+        table parsing, merging, and checks.
+
+        Parameters
+        ----------
+        sc_points : pandas.DataFrame
+            Parsed supply curve point summary including any additional
+            sc_features (output of SupplyCurve._parse_sc_points)
+        trans_table : pandas.DataFrame
+            Transmission table merged with sc_points (output of
+            SupplyCurve._merge_sc_trans_tables)
+        fcr : float
+            Fixed charge rate, used to compute LCOT
+        transmission_costs : str | dict
+            Transmission feature costs to use with TransmissionFeatures
+            handler: line_tie_in_cost, line_cost, station_tie_in_cost,
+            center_tie_in_cost, sink_tie_in_cost
+        line_limited : bool
+            Substation connection is limited by maximum capacity of the
+            attached lines, legacy method
+        connectable : bool
+            Determine if connection is possible
+        max_workers : int | NoneType
+            Number of workers to use to compute lcot, if > 1 run in parallel.
+            None uses all available cpu's.
+        consider_friction : bool
+            Flag to consider friction layer on LCOE.
+
+        Returns
+        -------
+        sc : SupplyCurve
+        """
+        sc = cls.__new__(cls)
+        sc._sc_points = sc_points.copy()
+        sc._trans_table = trans_table.copy()
+        sc._init_costs(fcr, transmission_costs=transmission_costs,
+                       line_limited=line_limited, connectable=connectable,
+                       max_workers=max_workers,
+                       consider_friction=consider_friction)
+
+        return sc
+
     def __repr__(self):
         msg = "{} with {} points".format(self.__class__.__name__, len(self))
 
@@ -145,10 +234,12 @@ class SupplyCurve:
         Parameters
         ----------
         sc_points : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing supply curve
+            Path to .csv, .json, .h5, .parquet, or .feather or DataFrame
+            containing supply curve point summary
         sc_features : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing additional supply
-            curve features, e.g. transmission multipliers, regions
+            Path to .csv, .json, .h5, .parquet, or .feather or DataFrame
+            containing additional supply curve features, e.g. transmission
+            multipliers, regions
 
         Returns
         -------
@@ -156,12 +247,12 @@ class SupplyCurve:
             DataFrame of supply curve point summary with additional features
             added if supplied
         """
-        sc_points = parse_table(sc_points)
+        sc_points = ColumnarTable.parse(sc_points)
         logger.debug('Supply curve points table imported with columns: {}'
                      .format(sc_points.columns.values.tolist()))
 
         if sc_features is not None:
-            sc_features = parse_table(sc_features)
+            sc_features = ColumnarTable.parse(sc_features)
             merge_cols = [c for c in sc_features
                           if c in sc_points]
             sc_points = sc_points.merge(sc_features, on=merge_cols, how='left')
@@ -210,8 +301,42 @@ class SupplyCurve:
 
         return merge_cols
 
-    @staticmethod
-    def _parse_trans_table(trans_table):
+    @classmethod
+    def _trans_table_columns(cls, columns=None):
+        """
+        Get a function selecting the transmission table columns to load
+
+        Parameters
+        ----------
+        columns : list | tuple | None
+            Additional columns to load (output column names such as
+            trans_gid and trans_type are mapped to the transmission table
+            column names). None loads all columns.
+
+        Returns
+        -------
+        keep : callable | None
+            Function returning True for columns to load, None to load all
+            columns.
+        """
+        if columns is None:
+            return None
+
+        rename = {'trans_gid': 'trans_line_gid', 'trans_type': 'category'}
+        columns = set(cls.TRANS_TABLE_COLUMNS).union(rename.get(c, c)
+                                                     for c in columns)
+
+        def keep(column):
+            """Check if a transmission table column should be loaded"""
+            merge_col = (str(column).startswith('sc_')
+                         and ('row' in column or 'col' in column))
+
+            return merge_col or column in columns
+
+        return keep
+
+    @classmethod
+    def _parse_trans_table(cls, trans_table, columns=None):
         """
         Import transmission features table
 
@@ -219,7 +344,11 @@ class SupplyCurve:
         ----------
         trans_table : pd.DataFrame | str
             Table mapping supply curve points to transmission features
-            (either str filepath to table file or pre-loaded dataframe).
+            (either str filepath to .csv, .json, .h5, .parquet, or .feather
+            table file or pre-loaded dataframe).
+        columns : list | tuple | None
+            Additional columns to load, see _trans_table_columns. None loads
+            all columns, by default None
 
         Returns
         -------
@@ -227,7 +356,8 @@ class SupplyCurve:
             Loaded transmission feature table.
         """
 
-        trans_table = parse_table(trans_table)
+        trans_table = ColumnarTable.parse(
+            trans_table, columns=cls._trans_table_columns(columns))
 
         drop_cols = ['sc_gid', 'cap_left', 'sc_point_gid']
         drop_cols = [c for c in drop_cols if c in trans_table]
@@ -240,7 +370,8 @@ class SupplyCurve:
     def _merge_sc_trans_tables(cls, sc_points, trans_table,
                                offshore_table=None,
                                sc_cols=('capacity', 'sc_gid', 'mean_cf',
-                                        'mean_lcoe')):
+                                        'mean_lcoe'),
+                               trans_table_columns=None):
         """Merge the supply curve table with the transmission features table.
 
         Parameters
@@ -257,6 +388,9 @@ class SupplyCurve:
         sc_cols : tuple | list, optional
             List of column from sc_points to transfer into the trans table,
             by default ('capacity', 'sc_gid', 'mean_cf', 'mean_lcoe')
+        trans_table_columns : list | tuple, optional
+            Additional transmission table columns to load, if None all
+            columns are loaded, by default None
 
         Returns
         -------
@@ -265,7 +399,8 @@ class SupplyCurve:
             This is performed by merging left with trans_table, so there may be
             rows with nan sc_gid.
         """
-        trans_table = cls._parse_trans_table(trans_table)
+        trans_table = cls._parse_trans_table(trans_table,
+                                             columns=trans_table_columns)
 
         if isinstance(sc_cols, tuple):
             sc_cols = list(sc_cols)
@@ -286,7 +421,8 @@ class SupplyCurve:
         if offshore_table is not None:
             logger.info('Merging in offshore transmission table on primary '
                         'key "farm_gid": {}'.format(offshore_table))
-            offshore_table = cls._parse_trans_table(offshore_table)
+            offshore_table = cls._parse_trans_table(
+                offshore_table, columns=trans_table_columns)
             logger.debug('Offshore transmission table has columns: {}'
                          .format(list(offshore_table.columns)))
             logger.debug('Merging offshore transmission table with supply '
@@ -534,8 +670,8 @@ class SupplyCurve:
             handler: line_tie_in_cost, line_cost, station_tie_in_cost,
             center_tie_in_cost, sink_tie_in_cost
         max_workers : int | NoneType
-            Number of workers to use to compute lcot, if > 1 run in parallel.
-            None uses all available cpu's.
+            Not used, costs for all connections are computed at once with
+            vectorized array operations. Kept for backwards compatibility.
         connectable : bool
             Determine if connection is possible
         line_limited : bool
@@ -561,53 +697,24 @@ class SupplyCurve:
         else:
             trans_costs = {}
 
-        if max_workers is None:
-            max_workers = os.cpu_count()
-
         logger.info('Computing LCOT costs for all possible connections...')
-        if max_workers > 1:
-            groups = trans_table.groupby('sc_gid')
-            loggers = [__name__, 'reV.handlers.transmission', 'reV']
-            with SpawnProcessPool(max_workers=max_workers,
-                                  loggers=loggers) as exe:
-                futures = []
-                for sc_gid, sc_table in groups:
-                    if connectable:
-                        capacity = sc_table['capacity'].unique()
-                        if len(capacity) == 1:
-                            capacity = capacity[0]
-                        else:
-                            msg = ('Each supply curve point should only have '
-                                   'a single capacity, but {} has {}'
-                                   .format(sc_gid, capacity))
-                            logger.error(msg)
-                            raise RuntimeError(msg)
-                    else:
-                        capacity = None
-
-                    futures.append(exe.submit(TC.feature_costs, sc_table,
-                                              capacity=capacity,
-                                              line_limited=line_limited,
-                                              **trans_costs))
-
-                cost = [future.result() for future in futures]
-                cost = np.hstack(cost)
+        if connectable:
+            capacity = trans_table['capacity'].values
+            n_caps = trans_table.groupby('sc_gid')['capacity'].nunique()
+            if (n_caps > 1).any():
+                sc_gid = n_caps.index[n_caps > 1][0]
+                msg = ('Each supply curve point should only have '
+                       'a single capacity, but {} has {}'
+                       .format(sc_gid, trans_table.loc[
+                           trans_table['sc_gid'] == sc_gid,
+                           'capacity'].unique()))
+                logger.error(msg)
+                raise RuntimeError(msg)
         else:
-            feature = TC(trans_table, line_limited=line_limited,
-                         **trans_costs)
-            cost = []
-            for _, row in trans_table.iterrows():
-                if connectable:
-                    capacity = row['capacity']
-                else:
-                    capacity = None
-
-                tm = row.get('transmission_multiplier', 1)
-                cost.append(feature.cost(row['trans_line_gid'], row['dist_mi'],
-                                         capacity=capacity,
-                                         transmission_multiplier=tm))
-
-            cost = np.array(cost, dtype='float32')
+            capacity = None
+
+        cost = TC.feature_costs(trans_table, capacity=capacity,
+                                line_limited=line_limited, **trans_costs)
 
         cf_mean_arr = trans_table['mean_cf'].values
         lcot = (cost * fcr) / (cf_mean_arr * 8760)
@@ -628,45 +735,6 @@ class SupplyCurve:
             logger.info('Found mean LCOE with friction. Adding key '
                         '"total_lcoe_friction" to trans table.')
 
-    def _exclude_noncompetitive_wind_farms(self, comp_wind_dirs, sc_gid,
-                                           downwind=False):
-        """
-        Exclude non-competitive wind farms for given sc_gid
-
-        Parameters
-        ----------
-        comp_wind_dirs : CompetitiveWindFarms
-            Pre-initilized CompetitiveWindFarms instance
-        sc_gid : int
-            Supply curve gid to exclude non-competitive wind farms around
-        downwind : bool, optional
-            Flag to remove downwind neighbors as well as upwind neighbors,
-            by default False
-
-        Returns
-        -------
-        comp_wind_dirs : CompetitiveWindFarms
-            updated CompetitiveWindFarms instance
-        """
-        gid = comp_wind_dirs.check_sc_gid(sc_gid)
-        if gid is not None:
-            if comp_wind_dirs.mask[gid]:
-                exclude_gids = comp_wind_dirs['upwind', gid]
-                if downwind:
-                    exclude_gids = np.append(exclude_gids,
-                                             comp_wind_dirs['downwind', gid])
-                for n in exclude_gids:
-                    check = comp_wind_dirs.exclude_sc_point_gid(n)
-                    if check:
-                        sc_gids = comp_wind_dirs['sc_gid', n]
-                        for sc_id in sc_gids:
-                            if self._mask[sc_id]:
-                                logger.debug('Excluding sc_gid {}'
-                                             .format(sc_id))
-                                self._mask[sc_id] = False
-
-        return comp_wind_dirs
-
     @staticmethod
     def add_sum_cols(table, sum_cols):
         """Add a summation column to table.
@@ -738,57 +806,39 @@ class SupplyCurve:
             Updated sc_points table with transmission connections, LCOT
             and LCOE+LCOT based on full supply curve connections
         """
-        init_list = [np.nan] * int(1 + np.max(self._sc_gids))
-        conn_lists = {k: deepcopy(init_list) for k in columns}
-
-        trans_sc_gids = trans_table['sc_gid'].values.astype(int)
-        trans_gids = trans_table['trans_line_gid'].values
-        trans_cap = trans_table['avail_cap'].values
-        capacities = trans_table['capacity'].values
-        categories = trans_table['category'].values
-        dists = trans_table['dist_mi'].values
-        trans_cap_costs = trans_table['trans_cap_cost'].values
-        lcots = trans_table['lcot'].values
-        total_lcoes = trans_table['total_lcoe'].values
-
-        connected = 0
-        progress = 0
-        for i in range(len(trans_table)):
-            sc_gid = trans_sc_gids[i]
-            if self._mask[sc_gid]:
-                trans_gid = trans_gids[i]
-                connect = self._trans_features.connect(trans_gid,
-                                                       capacities[i])
-                if connect:
-                    connected += 1
-                    logger.debug('Connecting sc gid {}'.format(sc_gid))
-                    self._mask[sc_gid] = False
-
-                    conn_lists['trans_gid'][sc_gid] = trans_gid
-                    conn_lists['trans_capacity'][sc_gid] = trans_cap[i]
-                    conn_lists['trans_type'][sc_gid] = categories[i]
-                    conn_lists['trans_cap_cost'][sc_gid] = trans_cap_costs[i]
-                    conn_lists['dist_mi'][sc_gid] = dists[i]
-                    conn_lists['lcot'][sc_gid] = lcots[i]
-                    conn_lists['total_lcoe'][sc_gid] = total_lcoes[i]
-
-                    if total_lcoe_fric is not None:
-                        conn_lists['total_lcoe_friction'][sc_gid] = \
-                            total_lcoe_fric[i]
-
-                    current_prog = connected // (len(self) / 100)
-                    if current_prog > progress:
-                        progress = current_prog
-                        logger.info('{} % of supply curve points connected'
-                                    .format(progress))
-
-                    if comp_wind_dirs is not None:
-                        comp_wind_dirs = \
-                            self._exclude_noncompetitive_wind_farms(
-                                comp_wind_dirs, sc_gid, downwind=downwind)
-
-        index = range(0, int(1 + np.max(self._sc_gids)))
-        connections = pd.DataFrame(conn_lists, index=index)
+        conn_rows = full_sort(self._trans_features, self._mask,
+                              trans_table['sc_gid'].values,
+                              trans_table['trans_line_gid'].values,
+                              trans_table['capacity'].values,
+                              comp_wind_dirs=comp_wind_dirs,
+                              downwind=downwind)
+
+        sources = {'trans_gid': 'trans_line_gid',
+                   'trans_capacity': 'avail_cap',
+                   'trans_type': 'category',
+                   'trans_cap_cost': 'trans_cap_cost',
+                   'dist_mi': 'dist_mi',
+                   'lcot': 'lcot',
+                   'total_lcoe': 'total_lcoe'}
+        sc_gids = np.where(conn_rows >= 0)[0]
+        rows = conn_rows[sc_gids]
+        connections = pd.DataFrame(index=range(len(conn_rows)))
+        for col in columns:
+            values = np.full(len(rows), np.nan)
+            if col == 'total_lcoe_friction' and total_lcoe_fric is not None:
+                values = total_lcoe_fric[rows]
+            elif col in sources:
+                values = trans_table[sources[col]].values[rows]
+
+            if len(rows) < len(conn_rows):
+                # un-connected sc_gids are NaN, upcast to float or object
+                dtype = np.float64 if values.dtype.kind in 'iuf' else object
+                col_values = np.full(len(conn_rows), np.nan, dtype=dtype)
+                col_values[sc_gids] = values
+                values = col_values
+
+            connections[col] = values
+
         connections.index.name = 'sc_gid'
         connections = connections.dropna(subset=[sort_on])
         connections = connections[columns]
@@ -894,6 +944,36 @@ class SupplyCurve:
 
         return supply_curve
 
+    @staticmethod
+    def _simple_connections(trans_table, sort_on='total_lcoe'):
+        """Find the best (minimum sort_on) connection of each supply curve
+        point with a grouped argmin, without sorting the full table.
+
+        Parameters
+        ----------
+        trans_table : pandas.DataFrame
+            Supply Curve Tranmission table
+        sort_on : str
+            Column label to minimize for each sc_gid.
+
+        Returns
+        -------
+        rows : ndarray
+            Positional row index of the best connection for each sc_gid,
+            in order of ascending sc_gid. Ties are broken by the table
+            order, sc_gids whose sort_on values are all NaN use their first
+            row.
+        """
+        codes, _ = pd.factorize(trans_table['sc_gid'].values, sort=True)
+        values = trans_table[sort_on].values
+        mins = pd.Series(values).groupby(codes).min().values[codes]
+
+        candidates = (values == mins) | pd.isna(mins)
+        rows = np.flatnonzero(candidates)
+        _, first = np.unique(codes[rows], return_index=True)
+
+        return rows[first]
+
     def simple_sort(self, trans_table=None, sort_on='total_lcoe',
                     columns=('trans_gid', 'trans_type', 'lcot', 'total_lcoe',
                              'trans_cap_cost'),
@@ -941,12 +1021,12 @@ class SupplyCurve:
         if self._consider_friction and 'total_lcoe_friction' in trans_table:
             columns.append('total_lcoe_friction')
 
-        connections = trans_table.sort_values(sort_on).groupby('sc_gid')
-        connections = connections.first()
+        rows = self._simple_connections(trans_table, sort_on=sort_on)
+        connections = trans_table.iloc[rows]
         rename = {'trans_line_gid': 'trans_gid',
                   'category': 'trans_type'}
         connections = connections.rename(columns=rename)
-        connections = connections[columns].reset_index()
+        connections = connections[['sc_gid'] + columns].reset_index(drop=True)
 
         supply_curve = self._sc_points.merge(connections, on='sc_gid')
         if wind_dirs is not None:
@@ -981,16 +1061,17 @@ class SupplyCurve:
         Parameters
         ----------
         sc_points : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing supplcy curve
-            point summary
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supplcy curve point summary
         trans_table : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing supply curve
-            transmission mapping
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supply curve transmission mapping
         fcr : float
             Fixed charge rate, used to compute LCOT
         sc_features : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing additional supply
-            curve features, e.g. transmission multipliers, regions
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing additional supply curve features, e.g.
+            transmission multipliers, regions
         transmission_costs : str | dict
             Transmission feature costs to use with TransmissionFeatures
             handler: line_tie_in_cost, line_cost, station_tie_in_cost,
@@ -1031,7 +1112,8 @@ class SupplyCurve:
         sc = cls(sc_points, trans_table, fcr, sc_features=sc_features,
                  transmission_costs=transmission_costs,
                  line_limited=line_limited, max_workers=max_workers,
-                 offshore_trans_table=offshore_trans_table)
+                 offshore_trans_table=offshore_trans_table,
+                 trans_table_columns=list(columns) + [sort_on])
         supply_curve = sc.full_sort(sort_on=sort_on, columns=columns,
                                     wind_dirs=wind_dirs, n_dirs=n_dirs,
                                     downwind=downwind,
@@ -1054,16 +1136,17 @@ class SupplyCurve:
         Parameters
         ----------
         sc_points : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing supplcy curve
-            point summary
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supplcy curve point summary
         trans_table : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing supply curve
-            transmission mapping
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing supply curve transmission mapping
         fcr : float
             Fixed charge rate, used to compute LCOT
         sc_features : str | pandas.DataFrame
-            Path to .csv or .json or DataFrame containing additional supply
-            curve features, e.g. transmission multipliers, regions
+            Path to table file (.csv, .json, .h5, .parquet, .feather) or
+            DataFrame containing additional supply curve features, e.g.
+            transmission multipliers, regions
         transmission_costs : str | dict
             Transmission feature costs to use with TransmissionFeatures
             handler: line_tie_in_cost, line_cost, station_tie_in_cost,
@@ -1101,7 +1184,8 @@ class SupplyCurve:
         sc = cls(sc_points, trans_table, fcr, sc_features=sc_features,
                  transmission_costs=transmission_costs, connectable=False,
                  max_workers=max_workers,
-                 offshore_trans_table=offshore_trans_table)
+                 offshore_trans_table=offshore_trans_table,
+                 trans_table_columns=list(columns) + [sort_on])
         supply_curve = sc.simple_sort(sort_on=sort_on, columns=columns,
                                       wind_dirs=wind_dirs, n_dirs=n_dirs,
                                       downwind=downwind,
@@ -2,7 +2,10 @@
 """reV tech mapping framework.
 
 This module manages the exclusions-to-resource mapping.
-The core of this module is a parallel cKDTree.
+The core of this module is a single multi-threaded cKDTree queried with
+row bands of exclusion coordinates (or a parallel cKDTree per chunk). The
+trees can be built on un-projected (lat, lon) coordinates or on projected
+coordinates with distances in km (see reV.utilities.coordinates).
 
 Created on Fri Jun 21 16:05:47 2019
 
@@ -12,12 +15,19 @@ import h5py
 from concurrent.futures import as_completed
 import numpy as np
 import os
+import pandas as pd
 from scipy.spatial import cKDTree
 import logging
 from warnings import warn
 
+from reV.handlers.h5_pool import H5FilePool
 from reV.supply_curve.points import SupplyCurveExtent
-from reV.utilities.exceptions import FileInputWarning, FileInputError
+from reV.utilities.coordinates import (EARTH_RADIUS, check_projection,
+                                       get_projection_center,
+                                       project_lat_lon, km_to_projected,
+                                       projected_to_km)
+from reV.utilities.exceptions import (FileInputWarning, FileInputError,
+                                      SupplyCurveInputError)
 
 from rex.resource import Resource
 from rex.utilities.execution import SpawnProcessPool
@@ -28,8 +38,16 @@ logger = logging.getLogger(__name__)
 class TechMapping:
     """Framework to create map between tech layer (exclusions), res, and gen"""
 
+    # "band" queries a single resource tree with row bands of exclusion
+    # coordinates, "chunk" builds a resource tree for each map_chunk block
+    ENGINES = ('band', 'chunk')
+
+    # max number of exclusion points queried at once by the "band" engine
+    MAX_BAND_POINTS = 2 ** 24
+
     def __init__(self, excl_fpath, res_fpath, dset, distance_upper_bound=0.03,
-                 map_chunk=2560, max_workers=None):
+                 map_chunk=2560, max_workers=None, engine='band',
+                 projection='latlon'):
         """
         Parameters
         ----------
@@ -43,14 +61,40 @@ class TechMapping:
         distance_upper_bound : float | None
             Upper boundary distance for KNN lookup between exclusion points and
             resource points. None will calculate a good distance based on the
-            resource meta data coordinates. 0.03 is a good value for a 4km
-            resource grid and finer.
+            resource meta data coordinates. This is in decimal degrees for
+            the "latlon" projection (0.03 is a good value for a 4km resource
+            grid and finer) and in km for the other projections.
         map_chunk : int | None
-            Calculation chunk used for the tech mapping calc.
+            Calculation chunk used for the tech mapping calc. This is the
+            max number of exclusion rows in each band for the "band" engine.
         max_workers : int | None
             Number of cores to run mapping on. None uses all available cpus.
+        engine : str
+            Tech mapping engine, "band" (default) builds the resource
+            KD-tree once and queries it from multiple threads with large
+            row bands of exclusion coordinates, "chunk" builds a KD-tree
+            of the nearby resource points for every two map_chunk blocks on
+            parallel worker processes.
+        projection : str
+            Coordinate space for the nearest neighbor queries. "latlon"
+            (default) queries un-projected coordinates in decimal degrees,
+            "ecef" queries 3D earth-centered coordinates on a sphere and
+            "equal_area" queries a lambert azimuthal equal area projection
+            centered on the resource meta data. Distances for "ecef" and
+            "equal_area" are in km, which gives correct mappings at high
+            latitudes.
         """
 
+        if engine not in self.ENGINES:
+            msg = ('TechMapping engine must be one of {} but received: "{}"'
+                   .format(self.ENGINES, engine))
+            logger.error(msg)
+            raise SupplyCurveInputError(msg)
+
+        check_projection(projection)
+
+        self._engine = engine
+        self._projection = projection
         self._distance_upper_bound = distance_upper_bound
         self._excl_fpath = excl_fpath
         self._res_fpath = res_fpath
@@ -128,17 +172,28 @@ class TechMapping:
         distance_upper_bound : float
             Estimate of the upper bound distance based on the distance between
             resource points. Calculated as half of the diagonal between
-            closest resource points, with an extra 5% margin.
+            closest resource points, with an extra 5% margin. This is in
+            decimal degrees for the "latlon" projection and km otherwise.
         """
 
         if self._distance_upper_bound is None:
+            if self._projection == 'latlon':
+                with Resource(self._res_fpath, str_decode=False) as res:
+                    lats = res.get_meta_arr('latitude')
 
-            with Resource(self._res_fpath, str_decode=False) as res:
-                lats = res.get_meta_arr('latitude')
+                dists = np.abs(lats - np.roll(lats, 1))
+                dists = dists[(dists != 0)].min()
+            else:
+                # projected spacing is not uniform so use the median spacing
+                _, res_coords = self._get_res_coords(self._res_fpath,
+                                                     self._projection)
+                # pylint: disable=not-callable
+                dists, _ = cKDTree(res_coords).query(
+                    res_coords, k=2, workers=self._max_workers)
+                dists = projected_to_km(dists[:, 1], self._projection)
+                dists = np.median(dists[(dists != 0)])
 
-            dists = np.abs(lats - np.roll(lats, 1))
-            dists = dists[(dists != 0)]
-            self._distance_upper_bound = 1.05 * (2 ** 0.5) * (dists.min() / 2)
+            self._distance_upper_bound = 1.05 * (2 ** 0.5) * (dists / 2)
 
             logger.info('Distance upper bound was infered to be: {}'
                         .format(self._distance_upper_bound))
@@ -243,7 +298,8 @@ class TechMapping:
                                    self._excl_fpath,
                                    self._res_fpath,
                                    self.distance_upper_bound,
-                                   self._map_chunk)] = i
+                                   self._map_chunk,
+                                   projection=self._projection)] = i
 
             for future in as_completed(futures):
                 n_finished += 1
@@ -267,9 +323,370 @@ class TechMapping:
 
         return lats, lons, ind_all
 
+    @staticmethod
+    def _get_res_coords(res_fpath, projection='latlon'):
+        """Get the resource meta coordinates in the nearest neighbor space.
+
+        Parameters
+        ----------
+        res_fpath : str
+            Filepath to .h5 resource file that we're mapping to.
+        projection : str
+            Coordinate space for the nearest neighbor queries, see
+            reV.utilities.coordinates.PROJECTIONS.
+
+        Returns
+        -------
+        res_meta : np.ndarray
+            2D array (n, 2) of un-projected resource (latitude, longitude)
+            coordinates.
+        res_coords : np.ndarray
+            2D array of resource coordinates in the projected space.
+        """
+        with Resource(res_fpath, str_decode=False) as res:
+            res_meta = np.vstack((res.get_meta_arr('latitude'),
+                                  res.get_meta_arr('longitude'))).T
+
+        return res_meta, TechMapping._project(res_meta, res_meta, projection)
+
+    @staticmethod
+    def _project(coords, res_meta, projection='latlon'):
+        """Project coordinates into the nearest neighbor space.
+
+        Parameters
+        ----------
+        coords : np.ndarray
+            2D array (n, 2) of un-projected (latitude, longitude) coordinates.
+        res_meta : np.ndarray
+            2D array (n, 2) of un-projected resource (latitude, longitude)
+            coordinates which set the center of a local projection.
+        projection : str
+            Coordinate space for the nearest neighbor queries, see
+            reV.utilities.coordinates.PROJECTIONS.
+
+        Returns
+        -------
+        coords : np.ndarray
+            2D array of coordinates in the projected space.
+        """
+        center = None
+        if projection == 'equal_area':
+            center = get_projection_center(res_meta)
+
+        return project_lat_lon(coords, projection=projection, center=center)
+
+    @property
+    def _query_bound(self):
+        """Get the distance upper bound in the projected space units.
+
+        Returns
+        -------
+        bound : float
+            Distance upper bound for KD-tree queries.
+        """
+        return km_to_projected(self.distance_upper_bound, self._projection)
+
+    def _get_res_tree(self):
+        """Build a single KD-tree of all the resource meta coordinates.
+
+        Returns
+        -------
+        res_meta : np.ndarray
+            2D array (n, 2) of un-projected resource (latitude, longitude)
+            coordinates.
+        res_tree : cKDTree
+            KD-tree of the resource coordinates in the projected space.
+        """
+        res_meta, res_coords = self._get_res_coords(self._res_fpath,
+                                                    self._projection)
+        logger.debug('Building resource KD-tree with {} points'
+                     .format(len(res_coords)))
+
+        # pylint: disable=not-callable
+        return res_meta, cKDTree(res_coords)
+
+    def _query_res_tree(self, res_tree, res_meta, lats, lons):
+        """Map exclusion coordinates to the resource gids with a single
+        vectorized query of the resource KD-tree.
+
+        Parameters
+        ----------
+        res_tree : cKDTree
+            KD-tree of the resource coordinates in the projected space.
+        res_meta : np.ndarray
+            2D array (n, 2) of un-projected resource (latitude, longitude)
+            coordinates.
+        lats : np.ndarray
+            2D un-projected latitude array of tech exclusion points.
+        lons : np.ndarray
+            2D un-projected longitude array of tech exclusion points.
+
+        Returns
+        -------
+        ind : np.ndarray
+            Index values of the NN resource point. -1 if no res point found.
+            2D integer array with the same shape as lats.
+        """
+        bound = self._query_bound
+        coords = np.dstack((lats.ravel(), lons.ravel()))[0]
+        coords = self._project(coords, res_meta, self._projection)
+        dist, ind = res_tree.query(
+            coords, workers=self._max_workers,
+            distance_upper_bound=np.nextafter(bound, np.inf))
+        ind[dist > bound] = -1
+
+        return ind.reshape(lats.shape)
+
+    def _band_resource_map(self):
+        """Map all exclusion points to the resource gids by querying a single
+        resource KD-tree with row bands of exclusion coordinates.
+
+        Returns
+        -------
+        lats : np.ndarray
+            2D un-projected latitude array of tech exclusion points.
+            0's if no res point found. Shape is equal to exclusions shape.
+        lons : np.ndarray
+            2D un-projected longitude array of tech exclusion points.
+            0's if no res point found. Shape is equal to exclusions shape.
+        ind_all : np.ndarray
+            Index values of the NN resource point. -1 if no res point found.
+            2D integer array with shape equal to the exclusions extent shape.
+        """
+        res_meta, res_tree = self._get_res_tree()
+        n_rows, n_cols = self._excl_shape
+        step = int(max(1, min(self._map_chunk,
+                              self.MAX_BAND_POINTS // n_cols)))
+
+        ind_all = -1 * np.ones(self._excl_shape, dtype=np.int32)
+        lats = np.zeros(self._excl_shape, dtype=np.float32)
+        lons = np.zeros(self._excl_shape, dtype=np.float32)
+
+        n_bands = int(np.ceil(n_rows / step))
+        logger.info('Running tech mapping on {} row bands of {} rows'
+                    .format(n_bands, step))
+        with h5py.File(self._excl_fpath, 'r') as f:
+            for i, r0 in enumerate(range(0, n_rows, step)):
+                rows = slice(r0, min(r0 + step, n_rows))
+                band_lats = f['latitude'][rows]
+                band_lons = f['longitude'][rows]
+                ind_all[rows] = self._query_res_tree(res_tree, res_meta,
+                                                     band_lats, band_lons)
+                lats[rows] = band_lats
+                lons[rows] = band_lons
+                logger.debug('Completed tech mapping for band {} out of {}'
+                             .format(i + 1, n_bands))
+
+        return lats, lons, ind_all
+
+    def _get_prev_tech_map(self, prev_res_fpath=None):
+        """Get a pre-existing tech map that can be updated incrementally.
+
+        Parameters
+        ----------
+        prev_res_fpath : str | None
+            Filepath to the .h5 resource file that the pre-existing tech map
+            was created with. None will use the "fpath" attribute of the
+            pre-existing tech map dataset.
+
+        Returns
+        -------
+        ind_prev : np.ndarray | None
+            Pre-existing tech map padded with -2 to the exclusions extent
+            shape. None if there is no compatible pre-existing tech map.
+        prev_res_fpath : str | None
+            Filepath to the .h5 resource file that the pre-existing tech map
+            was created with.
+        """
+        wmsg = None
+        with h5py.File(self._excl_fpath, 'r') as f:
+            if self._dset not in f:
+                logger.info('No pre-existing tech map "{}" to update, running '
+                            'full tech mapping.'.format(self._dset))
+                return None, None
+
+            attrs = dict(f[self._dset].attrs)
+            if prev_res_fpath is None:
+                prev_res_fpath = attrs.get('fpath', None)
+
+            shape = f[self._dset].shape
+            if any(i > j for i, j in zip(shape, self._excl_shape)):
+                wmsg = ('Pre-existing tech map "{}" with shape {} is larger '
+                        'than the exclusions extent {}'
+                        .format(self._dset, shape, self._excl_shape))
+            elif attrs.get('projection', 'latlon') != self._projection:
+                wmsg = ('Pre-existing tech map "{}" was created with the "{}" '
+                        'projection'.format(self._dset,
+                                            attrs.get('projection', 'latlon')))
+            elif not np.isclose(attrs.get('distance_upper_bound', np.nan),
+                                self.distance_upper_bound):
+                wmsg = ('Pre-existing tech map "{}" was created with a '
+                        'different distance upper bound: {}'
+                        .format(self._dset,
+                                attrs.get('distance_upper_bound', None)))
+            elif prev_res_fpath is None or not os.path.exists(prev_res_fpath):
+                wmsg = ('Cannot find the resource file that the pre-existing '
+                        'tech map "{}" was created with: {}'
+                        .format(self._dset, prev_res_fpath))
+            else:
+                ind_prev = -2 * np.ones(self._excl_shape, dtype=np.int32)
+                ind_prev[:shape[0], :shape[1]] = f[self._dset][...]
+
+        if wmsg is not None:
+            wmsg += ', running full tech mapping.'
+            logger.warning(wmsg)
+            warn(wmsg, FileInputWarning)
+            return None, None
+
+        return ind_prev, prev_res_fpath
+
+    @staticmethod
+    def _diff_res_meta(prev_meta, res_meta):
+        """Match the previous resource gids to the new resource gids by their
+        coordinates.
+
+        Parameters
+        ----------
+        prev_meta : np.ndarray
+            2D array (n, 2) of the previous resource (latitude, longitude)
+            coordinates.
+        res_meta : np.ndarray
+            2D array (n, 2) of the new resource (latitude, longitude)
+            coordinates.
+
+        Returns
+        -------
+        gid_map : np.ndarray
+            New resource gid for each previous resource gid, -2 for previous
+            resource gids that were removed or moved.
+        added_meta : np.ndarray
+            2D array (n, 2) of the (latitude, longitude) coordinates of the
+            new resource gids that were added or moved.
+        """
+        labels = ['latitude', 'longitude']
+        prev = pd.DataFrame(prev_meta, columns=labels)
+        new = pd.DataFrame(res_meta, columns=labels)
+
+        # pair duplicate coordinates by their order of occurrence
+        prev['n'] = prev.groupby(labels).cumcount()
+        new['n'] = new.groupby(labels).cumcount()
+        prev['prev_gid'] = np.arange(len(prev))
+        new['gid'] = np.arange(len(new))
+        match = prev.merge(new, on=labels + ['n'], how='inner')
+
+        gid_map = -2 * np.ones(len(prev_meta), dtype=np.int32)
+        gid_map[match['prev_gid'].values] = match['gid'].values
+        added = np.ones(len(res_meta), dtype=bool)
+        added[match['gid'].values] = False
+
+        return gid_map, res_meta[added]
+
+    def _check_tile(self, ind_prev, lats, lons, added_meta):
+        """Check if the tech mapping of an exclusion tile could have changed.
+
+        Parameters
+        ----------
+        ind_prev : np.ndarray
+            Pre-existing tech map for the tile translated to the new resource
+            gids (-2 where the tile is outside of the pre-existing tech map or
+            was mapped to a removed or moved resource gid).
+        lats : np.ndarray
+            2D un-projected latitude array of the tile exclusion points.
+        lons : np.ndarray
+            2D un-projected longitude array of the tile exclusion points.
+        added_meta : np.ndarray
+            2D array (n, 2) of the new (latitude, longitude) coordinates of
+            the added and moved resource gids.
+
+        Returns
+        -------
+        update : bool
+            Flag for whether the tile needs to be re-mapped, True if any
+            tile point was mapped to a removed or moved resource gid or if
+            any added or moved resource gid is within the distance upper
+            bound of the tile.
+        """
+        if (ind_prev == -2).any():
+            return True
+
+        lat_range = (lats.min(), lats.max())
+        lon_range = (lons.min(), lons.max())
+        margin = self.distance_upper_bound
+        if self._projection != 'latlon':
+            margin = 0
+        lat_margin, lon_margin = self._get_margins(margin, lat_range,
+                                                   self.distance_upper_bound,
+                                                   self._projection)
+
+        near = ((added_meta[:, 0] >= lat_range[0] - lat_margin)
+                & (added_meta[:, 0] <= lat_range[1] + lat_margin)
+                & (added_meta[:, 1] >= lon_range[0] - lon_margin)
+                & (added_meta[:, 1] <= lon_range[1] + lon_margin))
+
+        return bool(near.any())
+
+    def _incremental_resource_map(self, prev_res_fpath=None):
+        """Update a pre-existing tech map by only re-mapping the exclusion
+        tiles whose nearest resource gid could have changed.
+
+        Parameters
+        ----------
+        prev_res_fpath : str | None
+            Filepath to the .h5 resource file that the pre-existing tech map
+            was created with. None will use the "fpath" attribute of the
+            pre-existing tech map dataset.
+
+        Returns
+        -------
+        lats : np.ndarray
+            2D un-projected latitude array of tech exclusion points.
+            0's if no res point found. Shape is equal to exclusions shape.
+        lons : np.ndarray
+            2D un-projected longitude array of tech exclusion points.
+            0's if no res point found. Shape is equal to exclusions shape.
+        ind_all : np.ndarray
+            Index values of the NN resource point. -1 if no res point found.
+            2D integer array with shape equal to the exclusions extent shape.
+        """
+        ind_all, prev_res_fpath = self._get_prev_tech_map(prev_res_fpath)
+        if ind_all is None:
+            return self._band_resource_map()
+
+        prev_meta, _ = self._get_res_coords(prev_res_fpath)
+        res_meta, res_tree = self._get_res_tree()
+        gid_map, added_meta = self._diff_res_meta(prev_meta, res_meta)
+        logger.info('Found {} removed and {} added resource gids (moved gids '
+                    'count as both) since the pre-existing tech map was '
+                    'created.'.format((gid_map == -2).sum(), len(added_meta)))
+
+        mapped = ind_all >= 0
+        ind_all[mapped] = gid_map[ind_all[mapped]]
+
+        with h5py.File(self._excl_fpath, 'r') as f:
+            lats = f['latitude'][...]
+            lons = f['longitude'][...]
+
+        n_updated = 0
+        with SupplyCurveExtent(self._excl_fpath,
+                               resolution=self._map_chunk) as sc:
+            for gid in range(len(sc)):
+                tile = sc.get_excl_slices(gid)
+                if self._check_tile(ind_all[tile], lats[tile], lons[tile],
+                                    added_meta):
+                    n_updated += 1
+                    ind_all[tile] = self._query_res_tree(res_tree, res_meta,
+                                                         lats[tile],
+                                                         lons[tile])
+
+            logger.info('Incremental tech mapping updated {} out of {} '
+                        'exclusion tiles.'.format(n_updated, len(sc)))
+
+        return lats.astype(np.float32), lons.astype(np.float32), ind_all
+
     @classmethod
     def map_resource_gids(cls, gids, excl_fpath, res_fpath,
-                          distance_upper_bound, map_chunk, margin=0.1):
+                          distance_upper_bound, map_chunk, margin=0.1,
+                          projection='latlon'):
         """Map exclusion gids to the resource meta.
 
         Parameters
@@ -284,11 +701,15 @@ class TechMapping:
             Filepath to .h5 resource file that we're mapping to.
         distance_upper_bound : float | None
             Upper boundary distance for KNN lookup between exclusion points and
-            resource points.
+            resource points. Decimal degrees for the "latlon" projection and
+            km otherwise.
         map_chunk : int
             Calculation chunk used for the tech mapping calc.
         margin : float
-            Margin when reducing the resource lat/lon.
+            Margin in decimal degrees when reducing the resource lat/lon.
+        projection : str
+            Coordinate space for the nearest neighbor queries, see
+            reV.utilities.coordinates.PROJECTIONS.
 
         Returns
         -------
@@ -310,28 +731,31 @@ class TechMapping:
             coords_out, lat_range, lon_range = cls._unpack_coords(
                 gids, sc, excl_fpath, coord_labels=coord_labels)
 
-        with Resource(res_fpath, str_decode=False) as res:
-            res_meta = np.vstack((res.get_meta_arr(coord_labels[0]),
-                                  res.get_meta_arr(coord_labels[1]))).T
+        res_meta, res_coords = cls._get_res_coords(res_fpath, projection)
+        lat_margin, lon_margin = cls._get_margins(margin, lat_range,
+                                                  distance_upper_bound,
+                                                  projection)
 
-        mask = ((res_meta[:, 0] > lat_range[0] - margin)
-                & (res_meta[:, 0] < lat_range[1] + margin)
-                & (res_meta[:, 1] > lon_range[0] - margin)
-                & (res_meta[:, 1] < lon_range[1] + margin))
+        mask = ((res_meta[:, 0] > lat_range[0] - lat_margin)
+                & (res_meta[:, 0] < lat_range[1] + lat_margin)
+                & (res_meta[:, 1] > lon_range[0] - lon_margin)
+                & (res_meta[:, 1] < lon_range[1] + lon_margin))
 
         # pylint: disable-msg=C0121
         mask_ind = np.where(mask == True)[0]  # noqa: E712
 
         if np.sum(mask) > 0:
             # pylint: disable=not-callable
-            res_tree = cKDTree(res_meta[mask, :])
+            res_tree = cKDTree(res_coords[mask, :])
+            bound = km_to_projected(distance_upper_bound, projection)
 
             logger.debug('Running tech mapping for chunks {} through {}'
                          .format(gids[0], gids[-1]))
             for i, _ in enumerate(gids):
-                dist, ind = res_tree.query(coords_out[i])
+                coords = cls._project(coords_out[i], res_meta, projection)
+                dist, ind = res_tree.query(coords)
                 ind = mask_ind[ind]
-                ind[(dist > distance_upper_bound)] = -1
+                ind[(dist > bound)] = -1
                 ind_out.append(ind)
         else:
             logger.debug('No close res points for chunks {} through {}'
@@ -341,9 +765,47 @@ class TechMapping:
 
         return ind_out, coords_out
 
+    @staticmethod
+    def _get_margins(margin, lat_range, distance_upper_bound,
+                     projection='latlon'):
+        """Get the lat/lon margins used to reduce the resource meta to the
+        points near a set of exclusion coordinates.
+
+        Parameters
+        ----------
+        margin : float
+            Margin in decimal degrees when reducing the resource lat/lon.
+        lat_range : tuple
+            Latitude (min, max) values of the exclusion coordinates.
+        distance_upper_bound : float
+            Upper boundary distance for KNN lookup. Decimal degrees for the
+            "latlon" projection and km otherwise.
+        projection : str
+            Coordinate space for the nearest neighbor queries, see
+            reV.utilities.coordinates.PROJECTIONS.
+
+        Returns
+        -------
+        lat_margin : float
+            Latitude margin in decimal degrees.
+        lon_margin : float
+            Longitude margin in decimal degrees. This is widened for projected
+            queries because meridians converge towards the poles.
+        """
+        if projection == 'latlon':
+            return margin, margin
+
+        lat_margin = max(margin,
+                         np.degrees(distance_upper_bound / EARTH_RADIUS))
+        max_lat = np.radians(min(np.max(np.abs(lat_range)) + lat_margin, 89))
+        lon_margin = min(lat_margin / np.cos(max_lat), 360)
+
+        return lat_margin, lon_margin
+
     @staticmethod
     def save_tech_map(lats, lons, ind, fpath_out, res_fpath, dset,
-                      distance_upper_bound, chunks=(128, 128)):
+                      distance_upper_bound, chunks=(128, 128),
+                      projection='latlon'):
         """Save tech mapping indices and coordinates to an h5 output file.
 
         Parameters
@@ -367,6 +829,8 @@ class TechMapping:
             Distance upper bound to save as attr.
         chunks : tuple
             Chunk shape of the 2D output datasets.
+        projection : str
+            Nearest neighbor coordinate space to save as attr.
         """
 
         if not fpath_out.endswith('.h5'):
@@ -379,7 +843,7 @@ class TechMapping:
 
         if not os.path.exists(fpath_out):
             if lats is not None and lons is None:
-                with h5py.File(fpath_out, 'w') as f:
+                with H5FilePool.open(fpath_out, mode='w') as f:
                     f.create_dataset('latitude', shape=shape,
                                      dtype=lats.dtype,
                                      data=lats,
@@ -389,13 +853,17 @@ class TechMapping:
                                      data=lons,
                                      chunks=chunks)
 
-        with h5py.File(fpath_out, 'a') as f:
+        with H5FilePool.open(fpath_out, mode='a') as f:
             if dset in list(f):
                 wmsg = ('TechMap results dataset "{}" is being replaced '
                         'in pre-existing Exclusions TechMapping file "{}"'
                         .format(dset, fpath_out))
                 logger.warning(wmsg)
                 warn(wmsg, FileInputWarning)
+                if f[dset].shape != shape:
+                    del f[dset]
+
+            if dset in list(f):
                 f[dset][...] = ind
             else:
                 f.create_dataset(dset, shape=shape, dtype=ind.dtype,
@@ -403,13 +871,16 @@ class TechMapping:
 
             f[dset].attrs['fpath'] = res_fpath
             f[dset].attrs['distance_upper_bound'] = distance_upper_bound
+            f[dset].attrs['projection'] = projection
 
         logger.info('Successfully saved tech map "{}" to {}'
                     .format(dset, fpath_out))
 
     @classmethod
     def run(cls, excl_fpath, res_fpath, dset, save_flag=True,
-            distance_upper_bound=0.03, map_chunk=2560, max_workers=None):
+            distance_upper_bound=0.03, map_chunk=2560, max_workers=None,
+            engine='band', projection='latlon', incremental=False,
+            prev_res_fpath=None):
         """Run parallel mapping and save to h5 file.
 
         Parameters
@@ -425,6 +896,18 @@ class TechMapping:
             Flag to write techmap to excl_fpath.
         kwargs : dict
             Keyword args to initialize the TechMapping object.
+        incremental : bool
+            Flag to update a pre-existing dset in excl_fpath instead of
+            mapping from scratch. Only the exclusion tiles (map_chunk x
+            map_chunk blocks) that were mapped to resource gids that have
+            been added, removed, or moved, that are within the distance
+            upper bound of an added or moved resource gid, or that extend
+            the pre-existing tech map are re-mapped. Falls back to a full
+            tech mapping if there is no compatible pre-existing dset.
+        prev_res_fpath : str | None
+            Filepath to the .h5 resource file that the pre-existing dset was
+            created with for incremental updates. None will use the "fpath"
+            attribute of the pre-existing dset.
 
         Returns
         -------
@@ -439,13 +922,22 @@ class TechMapping:
             2D integer array with shape equal to the exclusions extent shape.
         """
         kwargs = {"distance_upper_bound": distance_upper_bound,
-                  "map_chunk": map_chunk, "max_workers": max_workers}
+                  "map_chunk": map_chunk, "max_workers": max_workers,
+                  "engine": engine, "projection": projection}
         with cls(excl_fpath, res_fpath, dset, **kwargs) as mapper:
-            lats, lons, ind = mapper._parallel_resource_map()
+            if incremental:
+                lats, lons, ind = mapper._incremental_resource_map(
+                    prev_res_fpath=prev_res_fpath)
+            elif mapper._engine == 'band':
+                lats, lons, ind = mapper._band_resource_map()
+            else:
+                lats, lons, ind = mapper._parallel_resource_map()
+
             distance_upper_bound = mapper._distance_upper_bound
 
         if save_flag:
             mapper.save_tech_map(lats, lons, ind, excl_fpath, res_fpath,
-                                 dset, distance_upper_bound)
+                                 dset, distance_upper_bound,
+                                 projection=projection)
 
         return lats, lons, ind
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""Coordinate projection utilities for nearest neighbor mapping.
+
+Euclidean nearest neighbor queries on un-projected latitude/longitude
+coordinates distort distances away from the equator. These utilities project
+coordinates into spaces where Euclidean distances are in km so that KD-tree
+queries and distance bounds are geodesically meaningful.
+"""
+import logging
+import numpy as np
+
+from reV.utilities.exceptions import InputError
+
+logger = logging.getLogger(__name__)
+
+# mean earth radius in km
+EARTH_RADIUS = 6371.0088
+
+# "latlon" queries un-projected (lat, lon) coordinates in decimal degrees,
+# "ecef" queries 3D earth-centered earth-fixed coordinates on a sphere in km,
+# "equal_area" queries a lambert azimuthal equal area projection in km.
+PROJECTIONS = ('latlon', 'ecef', 'equal_area')
+
+
+def check_projection(projection):
+    """Check that a nearest neighbor projection is valid.
+
+    Parameters
+    ----------
+    projection : str
+        Coordinate projection, must be one of PROJECTIONS.
+    """
+    if projection not in PROJECTIONS:
+        msg = ('Nearest neighbor projection must be one of: {} but received: '
+               '"{}"'.format(', '.join(PROJECTIONS), projection))
+        logger.error(msg)
+        raise InputError(msg)
+
+
+def get_projection_center(lat_lon):
+    """Get the center of a set of coordinates for a local projection.
+
+    Parameters
+    ----------
+    lat_lon : np.ndarray
+        2D array (n, 2) of latitude, longitude coordinates in decimal degrees.
+
+    Returns
+    -------
+    center : tuple
+        Center (latitude, longitude) of the coordinates in decimal degrees.
+        The longitude is the circular mean so that coordinates crossing the
+        antimeridian are centered correctly.
+    """
+    lat_lon = np.radians(np.asarray(lat_lon, dtype=np.float64))
+    lat_0 = np.degrees(np.mean(lat_lon[:, 0]))
+    lon_0 = np.degrees(np.arctan2(np.mean(np.sin(lat_lon[:, 1])),
+                                  np.mean(np.cos(lat_lon[:, 1]))))
+
+    return lat_0, lon_0
+
+
+def lat_lon_to_ecef(lat_lon, radius=EARTH_RADIUS):
+    """Convert coordinates to 3D earth-centered earth-fixed coordinates.
+
+    Parameters
+    ----------
+    lat_lon : np.ndarray
+        2D array (n, 2) of latitude, longitude coordinates in decimal degrees.
+    radius : float
+        Sphere radius in km.
+
+    Returns
+    -------
+    xyz : np.ndarray
+        2D array (n, 3) of x, y, z coordinates in km on a sphere. Euclidean
+        distances between these points are chord lengths in km.
+    """
+    lat_lon = np.radians(np.asarray(lat_lon, dtype=np.float64))
+    lat = lat_lon[:, 0]
+    lon = lat_lon[:, 1]
+    cos_lat = np.cos(lat)
+
+    return radius * np.vstack((cos_lat * np.cos(lon),
+                               cos_lat * np.sin(lon),
+                               np.sin(lat))).T
+
+
+def lat_lon_to_equal_area(lat_lon, center, radius=EARTH_RADIUS):
+    """Project coordinates with a spherical lambert azimuthal equal area
+    projection.
+
+    Parameters
+    ----------
+    lat_lon : np.ndarray
+        2D array (n, 2) of latitude, longitude coordinates in decimal degrees.
+    center : tuple
+        Projection center (latitude, longitude) in decimal degrees.
+    radius : float
+        Sphere radius in km.
+
+    Returns
+    -------
+    xy : np.ndarray
+        2D array (n, 2) of projected x, y coordinates in km.
+    """
+    lat_lon = np.radians(np.asarray(lat_lon, dtype=np.float64))
+    lat_0, lon_0 = np.radians(center)
+    lat = lat_lon[:, 0]
+    d_lon = lat_lon[:, 1] - lon_0
+
+    cos_lat = np.cos(lat)
+    cos_c = (np.sin(lat_0) * np.sin(lat)
+             + np.cos(lat_0) * cos_lat * np.cos(d_lon))
+    k = radius * np.sqrt(2 / np.maximum(1 + cos_c, 1e-12))
+    x = k * cos_lat * np.sin(d_lon)
+    y = k * (np.cos(lat_0) * np.sin(lat)
+             - np.sin(lat_0) * cos_lat * np.cos(d_lon))
+
+    return np.vstack((x, y)).T
+
+
+def project_lat_lon(lat_lon, projection='latlon', center=None):
+    """Project coordinates into the space used for nearest neighbor queries.
+
+    Parameters
+    ----------
+    lat_lon : np.ndarray
+        2D array (n, 2) of latitude, longitude coordinates in decimal degrees.
+    projection : str
+        Coordinate projection, must be one of PROJECTIONS. "latlon" returns
+        the input coordinates.
+    center : tuple | None
+        Projection center (latitude, longitude) for the "equal_area"
+        projection. None will use the center of lat_lon. Must be the same
+        for all coordinates that are compared to each other.
+
+    Returns
+    -------
+    coords : np.ndarray
+        2D array of projected coordinates.
+    """
+    check_projection(projection)
+
+    if projection == 'ecef':
+        lat_lon = lat_lon_to_ecef(lat_lon)
+    elif projection == 'equal_area':
+        if center is None:
+            center = get_projection_center(lat_lon)
+        lat_lon = lat_lon_to_equal_area(lat_lon, center)
+
+    return lat_lon
+
+
+def km_to_projected(distance, projection='latlon'):
+    """Convert a distance in km to the units of a projected space.
+
+    Parameters
+    ----------
+    distance : float | np.ndarray
+        Distance in km ("ecef" and "equal_area") or decimal degrees
+        ("latlon").
+    projection : str
+        Coordinate projection, must be one of PROJECTIONS.
+
+    Returns
+    -------
+    distance : float | np.ndarray
+        Distance in the projected space, which is the chord length for
+        "ecef" and unchanged for the other projections.
+    """
+    check_projection(projection)
+
+    if projection == 'ecef':
+        distance = np.minimum(distance, np.pi * EARTH_RADIUS)
+        distance = 2 * EARTH_RADIUS * np.sin(distance / (2 * EARTH_RADIUS))
+
+    return distance
+
+
+def projected_to_km(distance, projection='latlon'):
+    """Convert a distance in a projected space to km.
+
+    Parameters
+    ----------
+    distance : float | np.ndarray
+        Distance in the projected space.
+    projection : str
+        Coordinate projection, must be one of PROJECTIONS.
+
+    Returns
+    -------
+    distance : float | np.ndarray
+        Great circle distance in km for "ecef" and unchanged for the other
+        projections.
+    """
+    check_projection(projection)
+
+    if projection == 'ecef':
+        distance = np.minimum(distance / (2 * EARTH_RADIUS), 1)
+        distance = 2 * EARTH_RADIUS * np.arcsin(distance)
+
+    return distance
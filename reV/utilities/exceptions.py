@@ -16,6 +16,12 @@ class ConfigError(Exception):
     """
 
 
+class InputError(Exception):
+    """
+    Error for bad user inputs
+    """
+
+
 class FileInputError(Exception):
     """
     Error during input file checks.
@@ -41,7 +41,7 @@ class PostDevelopCommand(develop):
 with open("requirements.txt") as f:
     install_requires = f.readlines()
 
-test_requires = ["pytest>=5.2", ]
+test_requires = ["pytest>=5.2", "numba>=0.50"]
 description = ("National Renewable Energy Laboratory's (NREL's) Renewable "
                "Energy Potential(V) Model: reV")
 
@@ -63,6 +63,8 @@ setup(
                             "reV-gen=reV.generation.cli_gen:main",
                             "reV-multiyear=reV.handlers.cli_multi_year:main",
                             "reV-pipeline=reV.pipeline.cli_pipeline:main",
+                            ("reV-exclusions=reV.supply_curve."
+                             "cli_exclusions:main"),
                             ("reV-supply-curve-aggregation=reV.supply_curve."
                              "cli_sc_aggregation:main"),
                             ("reV-supply-curve=reV.supply_curve."
@@ -95,6 +97,7 @@ setup(
     extras_require={
         "test": test_requires,
         "dev": test_requires + ["flake8", "pre-commit", "pylint"],
+        "numba": ["numba>=0.50"],
     },
     cmdclass={"develop": PostDevelopCommand},
 )
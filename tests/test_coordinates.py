@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# pylint: skip-file
+"""
+Test the nearest neighbor coordinate projection utilities
+"""
+import os
+import numpy as np
+import pytest
+
+from reV.utilities.coordinates import (EARTH_RADIUS, get_projection_center,
+                                       km_to_projected, project_lat_lon,
+                                       projected_to_km)
+from reV.utilities.exceptions import InputError
+
+
+def haversine(lat_lon_1, lat_lon_2):
+    """Get the great circle distance in km between coordinates"""
+    lat_1, lon_1 = np.radians(lat_lon_1).T
+    lat_2, lon_2 = np.radians(lat_lon_2).T
+    a = (np.sin((lat_2 - lat_1) / 2) ** 2
+         + np.cos(lat_1) * np.cos(lat_2) * np.sin((lon_2 - lon_1) / 2) ** 2)
+
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+
+
+@pytest.mark.parametrize('lat', [0, 41, 65, 80])
+def test_projected_distances(lat):
+    """Test that projected distances are great circle distances in km"""
+    rng = np.random.default_rng(0)
+    lat_lon_1 = np.vstack((rng.uniform(lat - 0.5, lat + 0.5, 100),
+                           rng.uniform(-150.5, -149.5, 100))).T
+    lat_lon_2 = lat_lon_1 + rng.uniform(-0.05, 0.05, (100, 2))
+    truth = haversine(lat_lon_1, lat_lon_2)
+
+    xyz_1 = project_lat_lon(lat_lon_1, projection='ecef')
+    xyz_2 = project_lat_lon(lat_lon_2, projection='ecef')
+    dist = projected_to_km(np.linalg.norm(xyz_1 - xyz_2, axis=1), 'ecef')
+    assert np.allclose(dist, truth, rtol=1e-6)
+    assert np.allclose(km_to_projected(dist, 'ecef'),
+                       np.linalg.norm(xyz_1 - xyz_2, axis=1))
+
+    center = get_projection_center(lat_lon_1)
+    xy_1 = project_lat_lon(lat_lon_1, projection='equal_area', center=center)
+    xy_2 = project_lat_lon(lat_lon_2, projection='equal_area', center=center)
+    dist = np.linalg.norm(xy_1 - xy_2, axis=1)
+    assert np.allclose(dist, truth, rtol=0.01)
+
+    with pytest.raises(InputError):
+        project_lat_lon(lat_lon_1, projection='bad')
+
+
+def test_projection_center():
+    """Test the projection center across the antimeridian"""
+    lat_lon = np.array([[60, 179.5], [61, -179.5]])
+    lat_0, lon_0 = get_projection_center(lat_lon)
+    assert np.isclose(lat_0, 60.5)
+    assert np.isclose(abs(lon_0), 180)
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
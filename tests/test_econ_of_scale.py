@@ -4,6 +4,7 @@ PyTest file for reV LCOE economies of scale
 """
 import h5py
 import numpy as np
+import pandas as pd
 import pytest
 import os
 import shutil
@@ -11,6 +12,7 @@ import tempfile
 
 from reV.generation.generation import Gen
 from reV.econ.economies_of_scale import EconomiesOfScale
+from reV.supply_curve.point_summary import SupplyCurvePointSummary
 from reV.supply_curve.sc_aggregation import SupplyCurveAggregation
 from reV import TESTDATADIR
 
@@ -195,6 +197,58 @@ def test_sc_agg_econ_scale():
                 assert s.loc[i, 'mean_lcoe'] >= s.loc[i, 'raw_lcoe']
 
 
+@pytest.mark.parametrize('use_numexpr', [True, False])
+def test_summary_econ_scale(use_numexpr):
+    """Test the vectorized economies of scale on a summary table against the
+    single point calculation and the re-application of a new equation"""
+    n = 20
+    summary = pd.DataFrame({'capacity': np.linspace(5, 300, n),
+                            'mean_cf': np.linspace(0.1, 0.4, n),
+                            'mean_lcoe': np.full(n, 100.0),
+                            'capital_cost': np.full(n, 53455000.0),
+                            'fixed_operating_cost': np.full(n, 360000.0),
+                            'fixed_charge_rate': np.full(n, 0.096),
+                            'variable_operating_cost': np.zeros(n),
+                            'offshore': np.zeros(n, dtype=int)})
+    summary.loc[n - 2:, 'offshore'] = 1
+
+    eqn = '2 * capacity ** -0.3'
+    s1 = SupplyCurveAggregation.economies_of_scale(eqn, summary,
+                                                   use_numexpr=use_numexpr)
+    assert 'raw_lcoe' not in summary
+    for i, row in summary.iloc[:n - 2].iterrows():
+        eos = EconomiesOfScale(eqn, row.to_dict())
+        assert np.isclose(s1.loc[i, 'mean_lcoe'], eos.scaled_lcoe)
+        assert np.isclose(s1.loc[i, 'raw_lcoe'], eos.raw_lcoe)
+
+    offshore = s1['offshore'] == 1
+    assert (s1.loc[offshore, 'mean_lcoe'] == 100).all()
+    assert s1.loc[offshore, 'raw_lcoe'].isnull().all()
+
+    eqn2 = 'np.exp(-capacity / 50) + 0.5'
+    s2 = SupplyCurveAggregation.economies_of_scale(eqn2, s1,
+                                                   use_numexpr=use_numexpr)
+    truth = SupplyCurveAggregation.economies_of_scale(eqn2, summary)
+    assert np.allclose(s2['mean_lcoe'], truth['mean_lcoe'])
+    assert np.allclose(s2['raw_lcoe'], s1['raw_lcoe'], equal_nan=True)
+    assert not np.allclose(s2['mean_lcoe'], s1['mean_lcoe'])
+
+    points = summary.to_dict('records')
+    point = SupplyCurvePointSummary.economies_of_scale(eqn, dict(points[0]))
+    assert np.isclose(point['mean_lcoe'], s1.loc[0, 'mean_lcoe'])
+    assert np.isclose(point['raw_lcoe'], s1.loc[0, 'raw_lcoe'])
+
+    points = SupplyCurvePointSummary.economies_of_scale(eqn, points)
+    assert np.allclose([p['mean_lcoe'] for p in points], s1['mean_lcoe'])
+
+
+def test_econ_scale_bad_eqn():
+    """Test that questionable equations are rejected before evaluation"""
+    data = {'capacity': 10.0}
+    with pytest.raises(ValueError):
+        EconomiesOfScale('__import__("os").getcwd() * capacity', data)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -123,6 +123,41 @@ def test_shape():
         assert np.allclose(truth, test)
 
 
+def test_tile_cache(tmpdir):
+    """
+    Test the exclusion layer LRU tile cache against direct reads
+    """
+    excl_h5 = os.path.join(tmpdir, 'excl.h5')
+    arr = np.random.randint(0, 100, (1, 100, 130)).astype(np.int16)
+    with h5py.File(excl_h5, mode='w') as f:
+        f.create_dataset('layer', data=arr, chunks=(1, 16, 16))
+        f.create_dataset('contiguous', data=arr[0])
+
+    cache_size = 16 * 16 * 2 * 10
+    ds_slices = [(slice(5, 40), slice(20, 90)),
+                 (slice(90, None), slice(-20, None)),
+                 (slice(10, 20), ),
+                 (slice(16, 32), slice(32, 48)),
+                 (3, slice(5, 9)),
+                 ([1, 2], [3, 4])]
+    with ExclusionLayers(excl_h5, tile_cache_size=cache_size) as f:
+        for ds_slice in ds_slices:
+            for layer in ('layer', 'contiguous'):
+                test = f[(layer, ) + ds_slice]
+                assert np.array_equal(test, arr[0][ds_slice])
+
+            assert f._tile_bytes <= cache_size
+
+        # (slice(16, 32), slice(32, 48)) is a single tile and was cached last
+        assert list(f._tiles)[-1] == ('layer', 1, 2)
+        assert all(key[0] == 'layer' for key in f._tiles)
+
+        # full layer reads exceed the cache budget and bypass the cache
+        n_tiles = len(f._tiles)
+        assert np.array_equal(f['layer'], arr[0])
+        assert len(f._tiles) == n_tiles
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -10,6 +10,7 @@ import os
 import tempfile
 
 from reV.version import __version__
+from reV.handlers.h5_pool import H5FilePool, PooledResource
 from reV.handlers.outputs import Outputs
 from reV.utilities.exceptions import HandlerRuntimeError, HandlerValueError
 
@@ -118,6 +119,207 @@ def test_bad_shape():
             Outputs.add_dataset(fp, 'dset3', np.ones((10, 10)), None, float)
 
 
+def test_h5_pool():
+    """Test the pooled h5 file handles and chunk cache configuration"""
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'outputs.h5')
+
+        with Outputs(fp, 'w') as f:
+            f.meta = meta
+            f.time_index = time_index
+
+        Outputs.add_dataset(fp, 'dset1', arr3, None, np.float64)
+
+        try:
+            H5FilePool.configure(rdcc_nbytes=4 * 1024**2, rdcc_nslots=1021,
+                                 files={'outputs.h5': {'rdcc_w0': 0.5}},
+                                 max_idle=1)
+            kwargs = H5FilePool.chunk_cache_kwargs(fp)
+            assert kwargs == {'rdcc_nbytes': 4 * 1024**2,
+                              'rdcc_nslots': 1021, 'rdcc_w0': 0.5}
+
+            with Outputs(fp) as f1:
+                with PooledResource(fp) as f2:
+                    assert f1.h5 is f2.h5
+                    assert np.allclose(f2['dset1'], arr3)
+                    cache = f1.h5.id.get_access_plist().get_cache()
+                    assert cache[1:] == (1021, 4 * 1024**2, 0.5)
+
+                assert f1.h5.id.valid
+
+            # idle handle is kept open for re-use until a write is requested
+            assert f1.h5.id.valid
+            with Outputs(fp, 'a') as f:
+                assert not f1.h5.id.valid
+                f['dset1', :, 0] = arr3[:, 0] * 2
+
+            with Outputs(fp) as f:
+                assert np.allclose(f['dset1', :, 0], arr3[:, 0] * 2)
+
+            with pytest.raises(HandlerValueError):
+                H5FilePool.configure(files={'outputs.h5': {'bad': 1}})
+        finally:
+            H5FilePool.reset()
+
+        assert not H5FilePool.chunk_cache_kwargs(fp)
+
+
+def test_h5_pool_release():
+    """Test that pooled handles are closed on release by default and that
+    stale handles are not re-used"""
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'outputs.h5')
+
+        with Outputs(fp, 'w') as f:
+            f.meta = meta
+            f.time_index = time_index
+
+        Outputs.add_dataset(fp, 'dset1', arr3, None, np.float64)
+
+        try:
+            H5FilePool.reset()
+            with Outputs(fp) as f:
+                assert np.allclose(f['dset1'], arr3)
+
+            assert not f.h5.id.valid
+            with h5py.File(fp, 'a') as f:
+                f.attrs['test'] = 1
+
+            H5FilePool.configure(max_idle=1)
+            with Outputs(fp) as f1:
+                assert 'dset1' in f1.datasets
+
+            assert f1.h5.id.valid
+
+            # file re-created at the same path while the handle is idle
+            os.remove(fp)
+            with h5py.File(fp, 'w') as f:
+                f.create_dataset('dset2', data=arr1)
+
+            with PooledResource(fp) as f2:
+                assert f2.h5 is not f1.h5
+                assert 'dset2' in f2.datasets
+                assert 'dset1' not in f2.datasets
+
+            assert not f1.h5.id.valid
+        finally:
+            H5FilePool.reset()
+
+
+def test_write_buffer():
+    """Test the write-combining buffer for small adjacent slice writes"""
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'outputs.h5')
+
+        with Outputs(fp, 'w') as f:
+            f.meta = meta
+            f.time_index = time_index
+            f.h5.create_dataset('dset1', shape=(100, ), dtype=np.float32,
+                                chunks=(10, ))
+            f._create_dset('dset2', (8760, 100), np.int32, chunks=(None, 10),
+                           attrs={'scale_factor': 100})
+
+        with Outputs(fp, 'a', write_buffer=1e9) as f:
+            for i in range(0, 100, 3):
+                f['dset1', i:i + 3] = arr1[i:i + 3].astype(np.float32)
+                f['dset2', :, i:i + 3] = arr3[:, i:i + 3]
+                assert all(b['start'] % 10 == 0 for b in f._buffers.values())
+
+            # non-adjacent and fancy writes bypass the buffer
+            f['dset2', :, 50:55] = arr3[:, 50:55] * 2
+            f['dset2', 0, [90, 91]] = np.array([1.0, 2.0])
+
+            # buffered data is flushed before any read
+            f['dset1', 10:14] = arr1[10:14].astype(np.float32) * 3
+            assert 'dset1' in f._buffers
+            assert np.allclose(f['dset1', 10:14], 3)
+            assert 'dset1' not in f._buffers
+
+            f['dset2', :, 3:7] = arr3[:, 3:7] * 3
+
+        truth = arr3.copy()
+        truth[:, 50:55] *= 2
+        truth[0, 90:92] = [1, 2]
+        truth[:, 3:7] *= 3
+        with Outputs(fp) as f:
+            assert np.allclose(f['dset1'], np.where(
+                np.isin(np.arange(100), range(10, 14)), 3, 1))
+            assert np.allclose(f['dset2'], truth)
+
+
+def test_write_buffer_reuse():
+    """Test that buffered writes are not changed by a re-used input array
+    and are flushed when an existing dataset is re-initialized"""
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'outputs.h5')
+
+        with Outputs(fp, 'w') as f:
+            f.meta = meta
+            f.h5.create_dataset('dset1', shape=(100, ), dtype=np.float32,
+                                chunks=(100, ))
+
+        data = np.zeros(10, dtype=np.float32)
+        with Outputs(fp, 'a', write_buffer=1e6) as f:
+            for i in range(4):
+                data[:] = i
+                f['dset1', i * 10:(i + 1) * 10] = data
+
+            assert 'dset1' in f._buffers
+            f._create_dset('dset1', (100, ), np.float32, replace=False)
+            assert 'dset1' not in f._buffers
+
+        with Outputs(fp) as f:
+            truth = np.repeat(np.arange(4), 10)
+            assert np.allclose(f['dset1'][:40], truth)
+
+
+def test_meta_columns():
+    """Test lazy column-selective meta access and the gid index"""
+
+    test_meta = meta.copy()
+    test_meta['gid'] = np.arange(100)[::-1] * 2
+    test_meta['state'] = 'Colorado'
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'outputs.h5')
+
+        with Outputs(fp, 'w') as f:
+            f.meta = test_meta
+            f.time_index = time_index
+
+        with Outputs(fp) as f:
+            assert f.datasets == ['meta', 'time_index']
+            assert f.get_gid_index(10) == 94
+
+        with Outputs(fp) as f:
+            assert f.meta_columns == ['latitude', 'longitude', 'gid', 'state']
+
+            sub = f.get_meta_columns(['gid', 'state'], rows=slice(5, 10))
+            assert f._meta is None
+            assert ('meta', 'gid') not in f._meta_cols
+            assert sub.index.tolist() == list(range(5, 10))
+            assert (sub['gid'] == test_meta['gid'].iloc[5:10]).all()
+            assert (sub['state'] == 'Colorado').all()
+
+            state = f['meta', :, 'state']
+            assert isinstance(state, pd.Series)
+            assert ('meta', 'state') in f._meta_cols
+            assert (state == 'Colorado').all()
+
+            sub = f['meta', [1, 7], ['latitude', 'gid']]
+            assert sub.equals(f.meta[['latitude', 'gid']].iloc[[1, 7]])
+
+            rows = f.get_gid_index([0, 10, 198, 7])
+            assert np.array_equal(rows, [99, 94, 0, -1])
+
+            empty = f['meta', np.array([], dtype=int)]
+            assert empty.shape == (0, 4)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
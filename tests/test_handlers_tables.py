@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+PyTest file for reV columnar table handler
+"""
+import h5py
+import numpy as np
+import os
+import pandas as pd
+from pandas.testing import assert_frame_equal
+import pytest
+import tempfile
+
+from reV.handlers.tables import ColumnarTable, ColumnarTableSink
+from reV.utilities.exceptions import HandlerKeyError, HandlerValueError
+
+
+def test_h5_table_round_trip():
+    """Test writing and reading tables to/from columnar .h5 files"""
+    table = pd.DataFrame({'sc_gid': np.arange(10),
+                          'capacity': np.linspace(0, 1, 10),
+                          'category': ['Substation', None] * 5,
+                          'valid': np.arange(10) % 3 == 0,
+                          1: np.arange(10, dtype=np.float32)},
+                         index=np.arange(10)[::-1] * 2)
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'tables.h5')
+        ColumnarTable.write(table, fp, group='a')
+        ColumnarTable.write(table.iloc[::2], fp, group='b')
+
+        assert ColumnarTable.columns(fp, group='a') == list(table.columns)
+        assert_frame_equal(ColumnarTable.read(fp, group='a'), table)
+        assert_frame_equal(ColumnarTable.read(fp, group='b'), table.iloc[::2])
+
+        sub = ColumnarTable.read(fp, columns=['category', 'sc_gid'],
+                                 group='a')
+        assert_frame_equal(sub, table[['category', 'sc_gid']])
+        assert sub['category'].isnull().sum() == 5
+
+        with pytest.raises(HandlerKeyError):
+            ColumnarTable.read(fp, columns=['bad'], group='a')
+
+        with pytest.raises(HandlerKeyError):
+            ColumnarTable.read(fp)
+
+        with pytest.raises(HandlerValueError):
+            ColumnarTable.write(table, os.path.join(td, 'table.csv'))
+
+
+def test_table_sink():
+    """Test streaming record batches to a columnar table sink"""
+    records = [{'sc_point_gid': i, 'capacity': np.float32(i / 2),
+                'res_gids': list(range(i)), 'gid_counts': [1.5] * i,
+                'category': None if i % 2 else 'a'}
+               for i in range(25)]
+    truth = pd.DataFrame(records)
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'sink.h5')
+        with ColumnarTableSink(fp, batch_rows=10) as sink:
+            for i in range(0, 25, 3):
+                sink.append(records[i:i + 3])
+
+            assert sink.n_batches == 2
+            assert sink.n_rows == 24
+
+        assert_frame_equal(ColumnarTableSink.read(fp), truth)
+        assert ColumnarTableSink.read_records(fp) == records
+
+        with ColumnarTableSink(fp, batch_rows=10, mode='a') as sink:
+            assert sink.n_batches == 3
+            assert sink.n_rows == 25
+            sink.append(truth.iloc[:5])
+
+        out_fp = os.path.join(td, 'table.h5')
+        table = ColumnarTableSink.read(fp, out_fpath=out_fp)
+        assert_frame_equal(table, pd.concat([truth, truth.iloc[:5]],
+                                            ignore_index=True))
+        assert_frame_equal(ColumnarTable.read(out_fp).iloc[:, :2],
+                           table.iloc[:, :2])
+
+        with pytest.raises(HandlerValueError):
+            ColumnarTableSink(os.path.join(td, 'sink.csv'))
+
+
+def test_table_sink_checkpoint():
+    """Test recording completed tasks and companion arrays in a columnar
+    table sink with the input signature and discarding incomplete batches on
+    resume"""
+    profiles = np.arange(50, dtype=np.float32).reshape((10, 5))
+    records = [{'sc_point_gid': i} for i in range(10)]
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'sink.h5')
+        with ColumnarTableSink(fp, batch_rows=4, signature='inputs') as sink:
+            for i in range(0, 10, 2):
+                sink.append(records[i:i + 2], task_ids=[2 * i, 2 * i + 1],
+                            arrays={'profiles': profiles[i:i + 2]})
+
+            # task with no records
+            sink.append([], task_ids=[100])
+
+            with pytest.raises(HandlerValueError):
+                sink.append(records[:2], arrays={'profiles': profiles})
+
+        assert sink.n_batches == 3
+        assert sorted(sink.completed) == [0, 1, 4, 5, 8, 9, 12, 13, 16, 17,
+                                          100]
+        assert np.array_equal(ColumnarTableSink.read_arrays(fp)['profiles'],
+                              profiles)
+
+        # simulate a batch that was killed while being written
+        with h5py.File(fp, mode='a') as f:
+            del f['batches/b000001'].attrs['json_columns']
+
+        sink = ColumnarTableSink(fp, mode='a')
+        assert ColumnarTableSink.read_signature(fp) == 'inputs'
+        assert sink.n_batches == 2
+        assert sink.n_rows == 6
+        assert sorted(sink.completed) == [0, 1, 4, 5, 16, 17, 100]
+        sink.append(records[4:8], task_ids=[8, 9, 12, 13],
+                    arrays={'profiles': profiles[4:8]})
+        sink.flush()
+
+        table = ColumnarTableSink.read(fp)
+        arrays = ColumnarTableSink.read_arrays(fp)
+        assert sorted(table['sc_point_gid']) == list(range(10))
+        assert np.array_equal(arrays['profiles'],
+                              profiles[table['sc_point_gid'].values])
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
@@ -2,11 +2,13 @@
 """
 Transmission Feature Tests
 """
+import numpy as np
 import os
 import pandas as pd
 import pytest
 
 from reV import TESTDATADIR
+from reV.handlers.transmission import TransmissionCosts as TC
 from reV.handlers.transmission import TransmissionFeatures as TF
 
 TRANS_COSTS_1 = {'line_tie_in_cost': 200, 'line_cost': 1000,
@@ -127,6 +129,59 @@ def test_substation_load_spreading(i, trans_costs, trans_table):
         assert LINE_CAPS[i][line_id] == tf[line_id]['avail_cap'], msg
 
 
+@pytest.mark.parametrize('line_limited', (False, True))
+def test_available_capacities(line_limited, trans_table):
+    """
+    Test vectorized available capacity against per-feature capacities after
+    a sequence of connections
+    """
+    tf = TF(trans_table, **TRANS_COSTS_1, line_limited=line_limited)
+    gids = trans_table['trans_line_gid'].values
+    for gid, capacity in zip(gids[::7], np.linspace(1, 200, len(gids[::7]))):
+        tf.connect(gid, capacity)
+
+    avail_cap = tf.available_capacities()
+    assert len(avail_cap) == len(tf)
+    for gid, cap in zip(tf.feature_gids, avail_cap):
+        truth = tf.available_capacity(gid)
+        if truth is None:
+            assert np.isnan(cap)
+            assert tf[gid]['type'] == 'pcaloadcen'
+        else:
+            assert cap == truth
+
+    feature_cap = TF.feature_capacity(trans_table, available_capacity=0.1)
+    assert np.array_equal(feature_cap['trans_line_gid'], tf.feature_gids)
+
+
+@pytest.mark.parametrize(('trans_costs', 'line_limited'),
+                         ((TRANS_COSTS_1, False),
+                          (TRANS_COSTS_2, True)))
+def test_vectorized_costs(trans_costs, line_limited, trans_table):
+    """
+    Test vectorized feature costs against per-connection costs
+    """
+    trans_table = trans_table.copy()
+    trans_table['capacity'] = np.linspace(1, 500, len(trans_table))
+    trans_table['transmission_multiplier'] = np.linspace(
+        1, 2, len(trans_table))
+    costs = TC.feature_costs(trans_table,
+                             capacity=trans_table['capacity'].values,
+                             line_limited=line_limited, **trans_costs)
+
+    tc = TC(trans_table, line_limited=line_limited, **trans_costs)
+    truth = []
+    for _, row in trans_table.iterrows():
+        truth.append(tc.cost(row['trans_line_gid'], row['dist_mi'],
+                             capacity=row['capacity'],
+                             transmission_multiplier=row[
+                                 'transmission_multiplier']))
+
+    truth = np.array(truth, dtype='float32')
+    assert np.isnan(truth).any()
+    assert np.array_equal(truth, costs, equal_nan=True)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
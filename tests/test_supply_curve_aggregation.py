@@ -7,8 +7,12 @@ import numpy as np
 import os
 from pandas.testing import assert_frame_equal
 import pytest
+import tempfile
 
+from reV.handlers.tables import ColumnarTableSink
 from reV.supply_curve.aggregation import Aggregation
+from reV.supply_curve.exclusions import ExclusionMask
+from reV.supply_curve.points import SupplyCurveExtent
 from reV import TESTDATADIR
 
 from rex.resource import Resource
@@ -80,6 +84,59 @@ def test_aggregation_parallel(excl_dict, baseline_name):
     check_agg(agg_out, baseline_h5)
 
 
+def test_aggregation_min_area():
+    """
+    test that the contiguous area filter labels computed in the parent
+    process give the same parallel aggregation as a serial run
+    """
+    kwargs = {'excl_dict': EXCL_DICT, 'min_area': 0.5}
+    agg = Aggregation(EXCL, GEN, TM_DSET, *AGG_DSET, **kwargs)
+    chunks = agg._get_chunks(chunk_point_len=10)
+    band_size = ExclusionMask.AREA_FILTER_BAND_SIZE
+    with SupplyCurveExtent(EXCL, resolution=64) as sc:
+        rows = [set(sc.points.loc[c, 'row_ind'] * 64 // band_size)
+                for c in chunks]
+
+    assert all(len(r) == 1 for r in rows)
+    assert len(set.union(*rows)) == len(chunks)
+
+    serial = Aggregation.run(EXCL, GEN, TM_DSET, *AGG_DSET, max_workers=1,
+                             **kwargs)
+    parallel = Aggregation.run(EXCL, GEN, TM_DSET, *AGG_DSET, max_workers=2,
+                               chunk_point_len=10, **kwargs)
+
+    assert_frame_equal(serial['meta'], parallel['meta'])
+    for dset in AGG_DSET:
+        assert np.allclose(serial[dset], parallel[dset])
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_aggregation_resume(max_workers):
+    """
+    test resuming a serial or parallel aggregation from a checkpoint
+    """
+    agg_out = Aggregation.run(EXCL, GEN, TM_DSET, *AGG_DSET,
+                              max_workers=2, chunk_point_len=10)
+    gids = agg_out['meta']['sc_point_gid'].values
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'checkpoint.h5')
+        Aggregation.run(EXCL, GEN, TM_DSET, *AGG_DSET, gids=gids[::2],
+                        max_workers=max_workers, chunk_point_len=10,
+                        stream_fpath=fp)
+        completed = ColumnarTableSink.read_completed(fp)
+        assert sorted(completed) == sorted(gids[::2])
+
+        agg_resume = Aggregation.run(EXCL, GEN, TM_DSET, *AGG_DSET,
+                                     max_workers=max_workers,
+                                     chunk_point_len=10,
+                                     stream_fpath=fp, resume=True)
+
+    assert_frame_equal(agg_out['meta'], agg_resume['meta'])
+    for dset in AGG_DSET:
+        assert np.allclose(agg_out[dset], agg_resume[dset])
+
+
 @pytest.mark.parametrize('excl_dict', [None, EXCL_DICT])
 def test_gid_counts(excl_dict):
     """
@@ -144,6 +201,55 @@ def test_mean_wind_dirs(excl_dict):
         assert np.allclose(truth, test, rtol=RTOL, atol=ATOL), msg
 
 
+@pytest.mark.parametrize(('excl_dict', 'max_workers'),
+                         [(None, 1), (EXCL_DICT, None)])
+def test_aggregation_stream_time(excl_dict, max_workers, monkeypatch):
+    """
+    test aggregation streamed over time chunks directly to the output h5
+    """
+    monkeypatch.setattr(Aggregation, 'STREAM_MAX_SITES', 10)
+    agg_out = Aggregation.run(EXCL, GEN, TM_DSET, *AGG_DSET,
+                              excl_dict=excl_dict, max_workers=1)
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'agg.h5')
+        out = Aggregation.run(EXCL, GEN, TM_DSET, *AGG_DSET,
+                              excl_dict=excl_dict, max_workers=max_workers,
+                              chunk_point_len=10, out_fpath=fp,
+                              stream_time=True, time_chunk=100)
+        assert list(out) == ['meta']
+        assert_frame_equal(agg_out['meta'], out['meta'])
+
+        with Resource(fp) as f:
+            assert len(f.meta) == len(out['meta'])
+            for dset in AGG_DSET:
+                test = f[dset]
+                assert test.shape == agg_out[dset].shape
+                assert np.allclose(agg_out[dset], test, rtol=RTOL, atol=ATOL)
+
+
+def test_mean_wind_dirs_stream_time():
+    """
+    Test mean wind direction aggregation streamed over time chunks
+    """
+    RES = os.path.join(TESTDATADIR, 'wtk/wind_dirs_2012.h5')
+    DSET = 'winddirection_100m'
+    agg_out = Aggregation.run(EXCL, RES, TM_DSET, DSET,
+                              agg_method='wind_dir', max_workers=1)
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'agg.h5')
+        Aggregation.run(EXCL, RES, TM_DSET, DSET, agg_method='wind_dir',
+                        max_workers=1, out_fpath=fp, stream_time=True,
+                        time_chunk=100)
+        with Resource(fp) as f:
+            test = f[DSET]
+
+    diff = np.abs(agg_out[DSET] - test)
+    diff = np.minimum(diff, 360 - diff)
+    assert np.allclose(diff, 0, atol=0.1)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
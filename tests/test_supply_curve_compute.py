@@ -4,13 +4,17 @@ Supply Curve computation integrated tests
 """
 import os
 import pandas as pd
+import tempfile
 from pandas.testing import assert_frame_equal
 import pytest
 import warnings
 import numpy as np
 
 from reV import TESTDATADIR
+from reV.handlers.tables import ColumnarTable
+from reV.supply_curve.sc_scenarios import SupplyCurveScenarios
 from reV.supply_curve.supply_curve import SupplyCurve
+from reV.utilities.exceptions import SupplyCurveInputError
 
 TRANS_COSTS_1 = {'line_tie_in_cost': 200, 'line_cost': 1000,
                  'station_tie_in_cost': 50, 'center_tie_in_cost': 10,
@@ -181,6 +185,113 @@ def test_parallel(sc_points, trans_table, multipliers):
     assert_frame_equal(sc_full_parallel, sc_full_serial)
 
 
+def test_simple_connections():
+    """Test the grouped argmin used by the simple supply curve sort"""
+    rng = np.random.default_rng(42)
+    table = pd.DataFrame({'sc_gid': rng.integers(0, 50, 1000),
+                          'total_lcoe': rng.random(1000),
+                          'trans_line_gid': np.arange(1000)})
+    table.loc[table['sc_gid'] == 7, 'total_lcoe'] = np.nan
+
+    rows = SupplyCurve._simple_connections(table, sort_on='total_lcoe')
+    test = table.iloc[rows].set_index('sc_gid')
+    truth = table.sort_values('total_lcoe').groupby('sc_gid').first()
+    mask = truth.index != 7
+    assert_frame_equal(test.loc[mask], truth.loc[mask])
+
+    # all-NaN groups and ties use the first row of the group
+    first = table.index[table['sc_gid'] == 7][0]
+    assert test.loc[7, 'trans_line_gid'] == first
+    table['total_lcoe'] = 1
+    rows = SupplyCurve._simple_connections(table, sort_on='total_lcoe')
+    assert np.array_equal(rows, table.drop_duplicates('sc_gid')
+                          .sort_values('sc_gid').index)
+
+
+@pytest.mark.parametrize('simple', [True, False])
+def test_columnar_inputs(simple, sc_points, trans_table, multipliers):
+    """Test supply curve with columnar .h5 inputs and projected csv inputs
+    against DataFrame inputs"""
+    sc_func = SupplyCurve.simple if simple else SupplyCurve.full
+    truth = sc_func(sc_points, trans_table, fcr=0.1,
+                    sc_features=multipliers,
+                    transmission_costs=TRANS_COSTS_1)
+
+    with tempfile.TemporaryDirectory() as td:
+        sc_fp = os.path.join(td, 'sc_points.h5')
+        ColumnarTable.write(sc_points, sc_fp)
+        tt_fp = os.path.join(td, 'trans_table.h5')
+        ColumnarTable.write(trans_table, tt_fp)
+        test = sc_func(sc_fp, tt_fp, fcr=0.1, sc_features=multipliers,
+                       transmission_costs=TRANS_COSTS_1)
+        assert_frame_equal(test, truth)
+
+        tt_fp = os.path.join(td, 'trans_table.csv')
+        trans_table['dummy'] = 1
+        trans_table.to_csv(tt_fp, index=False)
+        test = sc_func(sc_points, tt_fp, fcr=0.1, sc_features=multipliers,
+                       transmission_costs=TRANS_COSTS_1)
+        assert_frame_equal(test, truth)
+
+        out_fp = os.path.join(td, 'sc_out.h5')
+        ColumnarTable.save(test, out_fp)
+        assert_frame_equal(ColumnarTable.parse(out_fp), truth)
+
+
+def test_scenarios(sc_points, trans_table, multipliers):
+    """Test the supply curve scenario sweep against individual runs"""
+    scenarios = [{'name': 'full_1', 'transmission_costs': TRANS_COSTS_1},
+                 {'name': 'full_2', 'fcr': 0.05,
+                  'transmission_costs': TRANS_COSTS_2, 'line_limited': True},
+                 {'name': 'simple', 'simple': True, 'sort_on': 'lcot'}]
+
+    with tempfile.TemporaryDirectory() as td:
+        cache_fpath = os.path.join(td, 'sc_cache.h5')
+        for max_workers in (1, 2):
+            out = SupplyCurveScenarios.run(sc_points, trans_table, scenarios,
+                                           sc_features=multipliers,
+                                           cache_fpath=cache_fpath,
+                                           max_workers=max_workers, fcr=0.1)
+            assert list(out) == ['full_1', 'full_2', 'simple']
+            assert os.path.exists(cache_fpath)
+
+            truth = SupplyCurve.full(sc_points, trans_table, fcr=0.1,
+                                     sc_features=multipliers,
+                                     transmission_costs=TRANS_COSTS_1)
+            assert_frame_equal(out['full_1'], truth)
+
+            truth = SupplyCurve.full(sc_points, trans_table, fcr=0.05,
+                                     sc_features=multipliers,
+                                     transmission_costs=TRANS_COSTS_2,
+                                     line_limited=True)
+            assert_frame_equal(out['full_2'], truth)
+
+            truth = SupplyCurve.simple(sc_points, trans_table, fcr=0.1,
+                                       sc_features=multipliers,
+                                       sort_on='lcot')
+            assert_frame_equal(out['simple'], truth)
+
+        sc_fp = os.path.join(td, 'sc_points.csv')
+        sc_points.to_csv(sc_fp, index=False)
+        tt_fp = os.path.join(td, 'trans_table.csv')
+        trans_table.to_csv(tt_fp, index=False)
+        out = SupplyCurveScenarios.run(sc_fp, tt_fp, {'a': {}, 'b': {}},
+                                       cache_fpath=cache_fpath, out_dir=td,
+                                       out_prefix='sweep', max_workers=1,
+                                       fcr=0.1)
+        assert out['b'] == os.path.join(td, 'sweep_b.csv')
+
+        # cached tables are re-used for the same input files
+        sweep = SupplyCurveScenarios(sc_fp, tt_fp, cache_fpath=cache_fpath)
+        truth = SupplyCurveScenarios(sc_fp, tt_fp)
+        assert_frame_equal(sweep.trans_table, truth.trans_table)
+        assert_frame_equal(sweep.sc_points, truth.sc_points)
+
+        with pytest.raises(SupplyCurveInputError):
+            SupplyCurveScenarios.parse_scenarios({'a': {'bad_key': 1}},
+                                                 fcr=0.1)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
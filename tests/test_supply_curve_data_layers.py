@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# pylint: skip-file
+"""
+Test the grouped supply curve data layer aggregation
+"""
+import json
+import os
+import numpy as np
+import pytest
+
+from reV.supply_curve.data_layers import DataLayerAggregation
+
+
+def make_groups(dtype, n_groups=50, seed=0):
+    """Make sorted random group indices, data, and inclusion values with a
+    few empty groups"""
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(0, 40, n_groups)
+    sizes[[0, 7, n_groups - 1]] = 0
+    groups = np.repeat(np.arange(n_groups), sizes)
+    if np.dtype(dtype).kind == 'f':
+        data = rng.choice([0.5, 1.25, 3.0, 7.5], len(groups)).astype(dtype)
+    else:
+        data = rng.integers(0, 6, len(groups)).astype(dtype)
+    excl_mult = rng.uniform(0, 1, len(groups)).astype(np.float32)
+
+    return groups, data, excl_mult, n_groups
+
+
+def loop_agg(groups, data, excl_mult, n_groups, method):
+    """Baseline single point data layer aggregation"""
+    out = []
+    for i in range(n_groups):
+        mask = groups == i
+        if not mask.any():
+            out.append(None)
+        elif method == 'mean':
+            out.append((data[mask] * excl_mult[mask]).sum() / mask.sum())
+        elif method == 'sum':
+            out.append((data[mask] * excl_mult[mask]).sum())
+        elif method == 'max':
+            out.append(data[mask].max())
+        elif method == 'min':
+            out.append(data[mask].min())
+        elif method == 'mode':
+            values, counts = np.unique(data[mask], return_counts=True)
+            out.append(values[np.argmax(counts)])
+        else:
+            values = np.unique(data[mask])
+            out.append(json.dumps({str(v): float(excl_mult[mask][
+                data[mask] == v].sum()) for v in values}))
+
+    return out
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.int16, np.float32])
+@pytest.mark.parametrize('method', DataLayerAggregation.METHODS)
+def test_grouped_methods(dtype, method):
+    """Test grouped aggregation against the per group aggregation"""
+    groups, data, excl_mult, n_groups = make_groups(dtype)
+    out = DataLayerAggregation.run(groups, data, excl_mult, n_groups,
+                                   method)
+    baseline = loop_agg(groups, data, excl_mult, n_groups, method)
+
+    assert len(out) == n_groups
+    for test, truth in zip(out, baseline):
+        if truth is None:
+            assert test is None
+        elif method == 'category':
+            test = json.loads(test)
+            truth = json.loads(truth)
+            assert sorted(test) == sorted(truth)
+            for k, v in truth.items():
+                assert np.isclose(test[k], v, rtol=1e-5)
+        else:
+            assert np.isclose(test, truth, rtol=1e-5)
+
+
+def test_mode_ties():
+    """Test that the smallest value is the mode on ties"""
+    groups = np.array([0, 0, 0, 0, 2, 2])
+    data = np.array([5, 3, 5, 3, 9, 1])
+    out = DataLayerAggregation.run(groups, data, np.ones(6), 3, 'mode')
+
+    assert list(out) == [3, None, 1]
+
+
+def test_large_value_range():
+    """Test aggregation of integer data with a value range that is too large
+    for offset coding and of more pairs than the dense count limit"""
+    groups = np.array([0, 0, 0, 1, 1])
+    data = np.array([-2 ** 40, 2 ** 40, 2 ** 40, 7, 7], dtype=np.int64)
+    excl_mult = np.array([1, 0.5, 0.25, 1, 1])
+    agg = DataLayerAggregation(groups, data, excl_mult, 2)
+    agg.MAX_DENSE_PAIRS = 0
+
+    assert list(agg.mode()) == [2 ** 40, 7]
+    cat = json.loads(agg.category()[0])
+    assert cat == {str(-2 ** 40): 1.0, str(2 ** 40): 0.75}
+
+
+def test_empty():
+    """Test aggregation without any data"""
+    for method in DataLayerAggregation.METHODS:
+        out = DataLayerAggregation.run(np.array([], dtype=int),
+                                       np.array([], dtype=np.float32),
+                                       np.array([], dtype=np.float32), 3,
+                                       method)
+        assert list(out) == [None] * 3
+
+
+def test_bad_method():
+    """Test an unknown aggregation method"""
+    with pytest.raises(ValueError):
+        DataLayerAggregation.run(np.zeros(2), np.ones(2), np.ones(2), 1,
+                                 'median')
+
+
+def execute_pytest(capture='all', flags='-rapP'):
+    """Execute module as pytest with detailed summary report.
+
+    Parameters
+    ----------
+    capture : str
+        Log or stdout/stderr capture option. ex: log (only logger),
+        all (includes stdout/stderr)
+    flags : str
+        Which tests to show logs and results for.
+    """
+
+    fname = os.path.basename(__file__)
+    pytest.main(['-q', '--show-capture={}'.format(capture), fname, flags])
+
+
+if __name__ == '__main__':
+    execute_pytest()
@@ -5,6 +5,8 @@ Exclusions unit test module
 import numpy as np
 import os
 import pytest
+import shutil
+import tempfile
 
 from reV import TESTDATADIR
 from reV.handlers.exclusions import ExclusionLayers
@@ -335,6 +337,82 @@ def test_force_inclusion():
     assert np.allclose(test, truth)
 
 
+@pytest.mark.parametrize(('kernel', 'band_size'),
+                         [('queen', 7), ('queen', 64), ('rook', 50),
+                          ('rook', 10000)])
+def test_global_area_filter(kernel, band_size):
+    """
+    Test the row band streamed contiguous area filter against the area
+    filter applied to the full inclusion mask at once
+    """
+    excl_h5 = os.path.join(TESTDATADIR, 'ri_exclusions', 'ri_exclusions.h5')
+    excl_dict = {'ri_padus': {'exclude_values': [1, ],
+                              'exclude_nodata': True},
+                 'ri_srtm_slope': {'inclusion_range': (0, 5),
+                                   'exclude_nodata': True}}
+    min_area = 0.1
+    with ExclusionMaskFromDict(excl_h5, layers_dict=excl_dict) as f:
+        truth = ExclusionMask._area_filter(f.mask, min_area=min_area,
+                                           kernel=kernel)
+
+    band_size_0 = ExclusionMask.AREA_FILTER_BAND_SIZE
+    ExclusionMask.AREA_FILTER_BAND_SIZE = band_size
+    try:
+        with ExclusionMaskFromDict(excl_h5, layers_dict=excl_dict,
+                                   min_area=min_area, kernel=kernel) as f:
+            assert np.allclose(f.mask, truth)
+            for ds_slice in [(slice(0, 64), slice(64, 128)),
+                             (slice(100, 300), slice(None)),
+                             (slice(None, None, -3), 7),
+                             ([5, 100, 2], [7, 1, 30]),
+                             (10, slice(0, 100, 2))]:
+                assert np.allclose(f[ds_slice], truth[ds_slice])
+    finally:
+        ExclusionMask.AREA_FILTER_BAND_SIZE = band_size_0
+
+
+@pytest.mark.parametrize(('min_area', 'max_workers'),
+                         [(None, 1), (None, 2), (1, 1)])
+def test_build_mask(min_area, max_workers):
+    """
+    Test the persisted inclusion mask against the mask computed on the fly
+    """
+    excl_dict = {'ri_padus': {'exclude_values': [1, ], 'weight': 0.5,
+                              'exclude_nodata': True},
+                 'ri_srtm_slope': {'inclusion_range': (0, 5),
+                                   'exclude_nodata': True}}
+    with tempfile.TemporaryDirectory() as td:
+        excl_h5 = os.path.join(td, 'ri_exclusions.h5')
+        shutil.copy(os.path.join(TESTDATADIR, 'ri_exclusions',
+                                 'ri_exclusions.h5'), excl_h5)
+
+        mask_dset = ExclusionMaskFromDict.build_mask(
+            excl_h5, excl_dict, min_area=min_area, tile_size=64,
+            max_workers=max_workers)
+        with ExclusionLayers(excl_h5) as f:
+            assert mask_dset in f.layers
+
+        # the persisted mask is only read if requested
+        with ExclusionMaskFromDict(excl_h5, layers_dict=excl_dict,
+                                   min_area=min_area) as f:
+            assert f.mask_dset is None
+            truth = f.mask
+
+        with ExclusionMaskFromDict(excl_h5, layers_dict=excl_dict,
+                                   min_area=min_area,
+                                   use_precomputed=True) as f:
+            assert f.mask_dset == mask_dset
+            test = f.mask
+            assert np.allclose(test[10:74, 20:84],
+                               f[slice(10, 74), slice(20, 84)])
+
+        assert np.allclose(test, truth)
+
+        with ExclusionMaskFromDict(excl_h5, layers_dict=excl_dict,
+                                   min_area=2, use_precomputed=True) as f:
+            assert f.mask_dset is None
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -6,6 +6,7 @@ Created on Wed Jun 19 15:37:05 2019
 """
 # pylint: disable=no-member
 import os
+from collections import OrderedDict
 import numpy as np
 import pytest
 
@@ -58,6 +59,48 @@ def test_slicer(gids, resolution):
             assert col_slice0 == col_slice1, msg
 
 
+@pytest.mark.parametrize('resolution', [7, 64, 163])
+def test_valid_sc_points(resolution):
+    """Test the block reduction of the valid sc points against a check of
+    each sc point's techmap slice."""
+
+    with SupplyCurveExtent(F_EXCL, resolution=resolution) as sc:
+        tm = sc.exclusions[TM_DSET]
+        truth = [gid for gid in range(len(sc))
+                 if (tm[sc.get_excl_slices(gid)] != -1).any()]
+
+        valid = sc.valid_sc_points(TM_DSET)
+        assert valid.tolist() == truth
+        assert np.array_equal(sc.valid_sc_points(TM_DSET), valid)
+
+
+def test_valid_sc_points_cache(monkeypatch):
+    """Test that the valid sc point cache stays within its byte limit."""
+    monkeypatch.setattr(SupplyCurveExtent, '_VALID_SC_POINTS', OrderedDict())
+    cache = SupplyCurveExtent._VALID_SC_POINTS
+
+    with SupplyCurveExtent(F_EXCL, resolution=64) as sc:
+        valid = sc.valid_sc_points(TM_DSET)
+        nbytes = valid.nbytes
+
+    monkeypatch.setattr(SupplyCurveExtent, '_VALID_SC_POINTS_NBYTES',
+                        nbytes * 2)
+    for res in (64, 64, 65, 66):
+        with SupplyCurveExtent(F_EXCL, resolution=res) as sc:
+            sc.valid_sc_points(TM_DSET)
+
+        assert sum(v.nbytes for v in cache.values()) <= nbytes * 2
+        assert len(cache) <= 2
+
+    monkeypatch.setattr(SupplyCurveExtent, '_VALID_SC_POINTS_NBYTES',
+                        nbytes - 1)
+    cache.clear()
+    with SupplyCurveExtent(F_EXCL, resolution=64) as sc:
+        assert np.array_equal(sc.valid_sc_points(TM_DSET), valid)
+
+    assert not cache
+
+
 @pytest.mark.parametrize(('gid', 'resolution', 'excl_dict', 'time_series'),
                          [(37, 64, None, None),
                           (37, 64, EXCL_DICT, None),
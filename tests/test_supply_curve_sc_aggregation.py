@@ -5,14 +5,24 @@ Created on Wed Jun 19 15:37:05 2019
 
 @author: gbuster
 """
+import h5py
 import json
 import os
 import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
 import pytest
-
+import shutil
+import tempfile
+
+from reV.handlers.exclusions import ExclusionLayers
+from reV.handlers.tables import ColumnarTableSink
+from reV.supply_curve.block_summary import SupplyCurveBlockSummary
+from reV.supply_curve.exclusions import (ExclusionMask,
+                                         ExclusionMaskFromDict)
+from reV.supply_curve.points import SupplyCurveExtent
 from reV.supply_curve.sc_aggregation import SupplyCurveAggregation
+from reV.utilities.exceptions import InputWarning
 from reV import TESTDATADIR
 
 EXCL = os.path.join(TESTDATADIR, 'ri_exclusions/ri_exclusions.h5')
@@ -80,6 +90,195 @@ def test_parallel_agg(resolution=64):
     assert all(summary_serial == summary_parallel)
 
 
+@pytest.mark.parametrize('engine', ['point', 'sparse'])
+def test_shared_inputs(engine, resolution=64):
+    """Test that parallel aggregation with gen/econ input data shared with
+    the workers matches serial aggregation."""
+
+    kwargs = dict(excl_dict=EXCL_DICT, res_class_dset=RES_CLASS_DSET,
+                  res_class_bins=RES_CLASS_BINS, h5_dsets=['lcoe_fcr-2012'],
+                  resolution=resolution, gids=list(range(50, 70)),
+                  engine=engine)
+    summary_serial = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                                    max_workers=1, **kwargs)
+    summary_shared = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                                    max_workers=2,
+                                                    points_per_worker=5,
+                                                    shared_inputs=True,
+                                                    **kwargs)
+
+    assert_frame_equal(summary_serial, summary_shared)
+
+
+@pytest.mark.parametrize('tile_cache_size', [None, 16 * 1024])
+def test_tile_cache_size(tile_cache_size, resolution=64):
+    """Test that aggregation without or with a small exclusion tile cache
+    matches aggregation with the default tile cache."""
+
+    kwargs = dict(excl_dict=EXCL_DICT, data_layers=DATA_LAYERS,
+                  resolution=resolution, gids=list(range(50, 70)),
+                  max_workers=1)
+    baseline = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET, **kwargs)
+    summary = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                             tile_cache_size=tile_cache_size,
+                                             **kwargs)
+
+    assert_frame_equal(baseline, summary)
+
+
+def test_precomputed_mask(resolution=64):
+    """Test that aggregation only reads the persisted inclusion mask if it
+    is requested."""
+
+    kwargs = dict(excl_dict=EXCL_DICT, resolution=resolution,
+                  gids=list(range(50, 70)), max_workers=1)
+    with tempfile.TemporaryDirectory() as td:
+        excl_h5 = os.path.join(td, 'ri_exclusions.h5')
+        shutil.copy(EXCL, excl_h5)
+        baseline = SupplyCurveAggregation.summary(excl_h5, GEN, TM_DSET,
+                                                  **kwargs)
+        mask_dset = ExclusionMaskFromDict.build_mask(excl_h5, EXCL_DICT,
+                                                     max_workers=1)
+        summary = SupplyCurveAggregation.summary(excl_h5, GEN, TM_DSET,
+                                                 use_precomputed_mask=True,
+                                                 **kwargs)
+        assert_frame_equal(baseline, summary)
+
+        # a stale persisted mask is ignored unless it is requested
+        with h5py.File(excl_h5, 'a') as f:
+            f[mask_dset][...] = 1
+
+        summary = SupplyCurveAggregation.summary(excl_h5, GEN, TM_DSET,
+                                                 **kwargs)
+        assert_frame_equal(baseline, summary)
+
+        summary = SupplyCurveAggregation.summary(excl_h5, GEN, TM_DSET,
+                                                 use_precomputed_mask=True,
+                                                 **kwargs)
+        assert (summary['area_sq_km'] >= baseline['area_sq_km']).all()
+        assert (summary['area_sq_km'] > baseline['area_sq_km']).any()
+
+
+def test_stream_summary(resolution=64):
+    """Test that streaming parallel aggregation results to disk matches
+    serial aggregation and leaves the results on disk."""
+
+    kwargs = dict(excl_dict=EXCL_DICT, res_class_dset=RES_CLASS_DSET,
+                  res_class_bins=RES_CLASS_BINS, resolution=resolution,
+                  gids=list(range(50, 70)), engine='sparse')
+    summary_serial = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                                    max_workers=1, **kwargs)
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'stream.h5')
+        summary_stream = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                                        max_workers=2,
+                                                        points_per_worker=5,
+                                                        stream_fpath=fp,
+                                                        **kwargs)
+        streamed = ColumnarTableSink.read(fp)
+
+    assert_frame_equal(summary_serial, summary_stream)
+    assert len(streamed) == len(summary_serial)
+    assert sorted(streamed['sc_point_gid']) == list(
+        summary_serial['sc_point_gid'])
+    assert all(isinstance(gids, list) for gids in streamed['res_gids'])
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_resume_summary(max_workers, resolution=64):
+    """Test resuming a serial or parallel aggregation from the SC point
+    blocks checkpointed by a previous (partial) run."""
+
+    kwargs = dict(excl_dict=EXCL_DICT, res_class_dset=RES_CLASS_DSET,
+                  res_class_bins=RES_CLASS_BINS, resolution=resolution,
+                  engine='sparse', max_workers=max_workers,
+                  points_per_worker=5)
+    summary = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                             gids=list(range(50, 70)),
+                                             **kwargs)
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'checkpoint.h5')
+        SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                       gids=list(range(50, 60)),
+                                       stream_fpath=fp, **kwargs)
+        completed = ColumnarTableSink.read_completed(fp)
+        assert sorted(completed) == list(range(50, 60))
+
+        summary_resume = SupplyCurveAggregation.summary(
+            EXCL, GEN, TM_DSET, gids=list(range(50, 70)), stream_fpath=fp,
+            resume=True, **kwargs)
+        completed = ColumnarTableSink.read_completed(fp)
+
+    assert_frame_equal(summary, summary_resume)
+    assert sorted(completed) == list(range(50, 70))
+
+
+def test_resume_changed_inputs(resolution=64):
+    """Test that a checkpoint written with different inputs is discarded
+    instead of being merged into the resumed summary."""
+
+    kwargs = dict(resolution=resolution, max_workers=1, points_per_worker=5,
+                  gids=list(range(50, 60)))
+    summary = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET,
+                                             excl_dict=EXCL_DICT, **kwargs)
+
+    with tempfile.TemporaryDirectory() as td:
+        fp = os.path.join(td, 'checkpoint.h5')
+        SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET, stream_fpath=fp,
+                                       **kwargs)
+        signature = ColumnarTableSink.read_signature(fp)
+
+        with pytest.warns(InputWarning):
+            summary_resume = SupplyCurveAggregation.summary(
+                EXCL, GEN, TM_DSET, excl_dict=EXCL_DICT, stream_fpath=fp,
+                resume=True, **kwargs)
+
+        assert ColumnarTableSink.read_signature(fp) != signature
+
+    assert_frame_equal(summary, summary_resume)
+
+
+@pytest.mark.parametrize(('points_per_worker', 'min_area'),
+                         [(1, None), (10, None), (10, 0.5), (1000, None)])
+def test_gid_blocks(points_per_worker, min_area, resolution=16):
+    """Test the spatially blocked scheduling of SC points for parallel
+    aggregation."""
+
+    sca = SupplyCurveAggregation(EXCL, GEN, TM_DSET, excl_dict=EXCL_DICT,
+                                 resolution=resolution, min_area=min_area)
+    blocks = sca._get_gid_blocks(points_per_worker=points_per_worker)
+
+    gids = np.concatenate(blocks)
+    assert len(gids) == len(sca._gids)
+    assert sorted(gids) == sorted(sca._gids)
+    assert all(len(b1) >= len(b2) for b1, b2 in zip(blocks[:-1], blocks[1:]))
+
+    with ExclusionLayers(EXCL) as f:
+        chunks = f.chunks[-2:]
+
+    # blocks are aligned to the exclusion chunks so no two blocks share the
+    # exclusion chunk at the origin of any of their SC points
+    with SupplyCurveExtent(EXCL, resolution=resolution) as sc:
+        points = sc.points
+
+    block_chunks = set()
+    for block in blocks:
+        rows = points.loc[block, 'row_ind'].values * resolution // chunks[0]
+        cols = points.loc[block, 'col_ind'].values * resolution // chunks[1]
+        keys = set(zip(rows, cols))
+        assert not keys & block_chunks
+        block_chunks |= keys
+
+    # with min_area each area filter band is read by a single block
+    if min_area is not None:
+        band_size = ExclusionMask.AREA_FILTER_BAND_SIZE
+        bands = [set(points.loc[b, 'row_ind'] * resolution // band_size)
+                 for b in blocks]
+        assert sum(len(b) for b in bands) == len(set.union(*bands))
+
+
 def test_aggregation_summary():
     """Test the aggregation summary method against a baseline file."""
 
@@ -238,6 +437,60 @@ def test_data_layer_methods():
             assert slope_min <= slope_mean <= slope_max
 
 
+@pytest.mark.parametrize('block_size', [1, 7, 1024])
+def test_sparse_engine(block_size):
+    """Test the sparse block summary engine against the per point engine"""
+    kwargs = dict(excl_dict=EXCL_DICT, res_class_dset=RES_CLASS_DSET,
+                  res_class_bins=RES_CLASS_BINS, data_layers=DATA_LAYERS,
+                  h5_dsets=['lcoe_fcr-2012'], gids=list(range(10, 60)),
+                  max_workers=1)
+    s1 = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET, engine='point',
+                                        **kwargs)
+    s2 = SupplyCurveAggregation.summary(EXCL, GEN, TM_DSET, engine='sparse',
+                                        block_size=block_size, **kwargs)
+
+    for c in ['res_gids', 'gen_gids']:
+        assert s1[c].tolist() == s2[c].tolist()
+
+    for c1, c2 in zip(s1['gid_counts'], s2['gid_counts']):
+        assert np.allclose(c1, c2, rtol=RTOL)
+
+    s1 = s1.drop(columns=['res_gids', 'gen_gids', 'gid_counts'])
+    s2 = s2.drop(columns=['res_gids', 'gen_gids', 'gid_counts'])
+    assert_frame_equal(s1, s2, check_dtype=False, rtol=RTOL)
+
+
+@pytest.mark.parametrize('block_size', [1, 7, 64, 1024])
+def test_sparse_blocks(block_size):
+    """Test that the sparse engine blocks cover all gids and that their
+    bounding boxes span at most block_size SC points"""
+    n_sc_cols = 300
+    rng = np.random.default_rng(0)
+    gids = np.unique(rng.integers(0, 200 * n_sc_cols, 5000))
+    gids = np.append(gids, [200 * n_sc_cols, 201 * n_sc_cols - 1])
+
+    blocks = SupplyCurveBlockSummary.get_blocks(gids, n_sc_cols,
+                                                block_size=block_size)
+
+    assert np.array_equal(np.concatenate(blocks), gids)
+    for block in blocks:
+        rows = block // n_sc_cols
+        cols = block % n_sc_cols
+        n_box = (np.ptp(rows) + 1) * (np.ptp(cols) + 1)
+        assert n_box <= block_size
+
+
+def test_sparse_blocks_bbox():
+    """Test the sparse engine blocks of a small synthetic SC extent against
+    blocks split by hand at the bounding box limit"""
+    gids = [20, 12, 0, 9, 1, 11, 2, 1]
+    blocks = SupplyCurveBlockSummary.get_blocks(gids, 10, block_size=6)
+
+    assert [block.tolist() for block in blocks] == [[0, 1, 2], [9],
+                                                    [11, 12, 20]]
+    assert not SupplyCurveBlockSummary.get_blocks([], 10)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -9,11 +9,14 @@ import numpy as np
 import pandas as pd
 import pytest
 import os
+import shutil
+import tempfile
 
 from reV import TESTDATADIR
 from reV.handlers.outputs import Outputs
 from reV.supply_curve.tech_mapping import TechMapping
 from reV.handlers.exclusions import ExclusionLayers
+from reV.utilities.exceptions import InputError, SupplyCurveInputError
 
 EXCL = os.path.join(TESTDATADIR, 'ri_exclusions/ri_exclusions.h5')
 RES = os.path.join(TESTDATADIR, 'nsrdb/ri_100_nsrdb_2012.h5')
@@ -41,6 +44,142 @@ def test_resource_tech_mapping():
     assert len(set(ind.flatten())) == 101, msg
 
 
+@pytest.mark.parametrize('map_chunk', [64, 2560])
+def test_tech_mapping_engines(map_chunk):
+    """Test that the band-streamed tech mapping engine matches the chunked
+    parallel engine"""
+
+    out = {}
+    for engine in TechMapping.ENGINES:
+        out[engine] = TechMapping.run(EXCL, RES, TM_DSET, max_workers=2,
+                                      save_flag=False, map_chunk=map_chunk,
+                                      engine=engine)
+
+    for band, chunk in zip(out['band'], out['chunk']):
+        assert band.dtype == chunk.dtype
+        assert np.array_equal(band, chunk)
+
+    with pytest.raises(SupplyCurveInputError):
+        TechMapping(EXCL, RES, TM_DSET, engine='bad')
+
+    with pytest.raises(InputError):
+        TechMapping(EXCL, RES, TM_DSET, projection='bad')
+
+
+@pytest.mark.parametrize('projection', ['ecef', 'equal_area'])
+def test_tech_mapping_projections(projection):
+    """Test projected tech mapping with distance bounds in km"""
+
+    kwargs = dict(max_workers=2, save_flag=False, map_chunk=64,
+                  projection=projection, distance_upper_bound=3)
+    out = {}
+    for engine in TechMapping.ENGINES:
+        out[engine] = TechMapping.run(EXCL, RES, TM_DSET, engine=engine,
+                                      **kwargs)
+
+    for band, chunk in zip(out['band'], out['chunk']):
+        assert np.array_equal(band, chunk)
+
+    _, _, ind = TechMapping.run(EXCL, RES, TM_DSET, max_workers=2,
+                                save_flag=False)
+    assert (out['band'][2] != ind).mean() < 0.05
+
+    with TechMapping(EXCL, RES, TM_DSET, distance_upper_bound=None,
+                     projection=projection) as tm:
+        assert 1 < tm.distance_upper_bound < 5
+
+
+def test_incremental_tech_mapping():
+    """Test incremental tech mapping updates against full tech mapping"""
+
+    with tempfile.TemporaryDirectory() as td:
+        excl_fp = os.path.join(td, 'excl.h5')
+        res_fp = os.path.join(td, 'res.h5')
+        shutil.copy(EXCL, excl_fp)
+        shutil.copy(RES, res_fp)
+
+        kwargs = dict(max_workers=2, map_chunk=32)
+        TechMapping.run(excl_fp, RES, 'tm', **kwargs)
+
+        with h5py.File(res_fp, 'a') as f:
+            meta = f['meta'][...]
+            meta['latitude'][[3, 40, 77]] += 0.02
+            meta['longitude'][[3, 40, 77]] -= 0.015
+            del f['meta']
+            f.create_dataset('meta', data=meta[:-4])
+
+        truth = TechMapping.run(excl_fp, res_fp, 'tm', save_flag=False,
+                                **kwargs)
+        out = TechMapping.run(excl_fp, res_fp, 'tm', incremental=True,
+                              prev_res_fpath=RES, **kwargs)
+        for test, true in zip(out, truth):
+            assert test.dtype == true.dtype
+            assert np.array_equal(test, true)
+
+        with h5py.File(excl_fp, 'r') as f:
+            assert np.array_equal(f['tm'][...], truth[2])
+            assert f['tm'].attrs['fpath'] == res_fp
+
+
+def test_diff_res_meta():
+    """Test that resource meta changes are matched by coordinates so that an
+    inserted or removed site does not mark every later gid as changed."""
+
+    prev_meta = np.array([[41.0, -71.0], [41.1, -71.0], [41.2, -71.0],
+                          [41.3, -71.0], [41.3, -71.0], [41.4, -71.0]])
+    res_meta = np.array([[40.9, -71.0], [41.0, -71.0], [41.2, -71.0],
+                         [41.3, -71.0], [41.3, -71.0], [41.45, -71.0]])
+
+    gid_map, added_meta = TechMapping._diff_res_meta(prev_meta, res_meta)
+    assert gid_map.tolist() == [1, -2, 2, 3, 4, -2]
+    assert added_meta.tolist() == [[40.9, -71.0], [41.45, -71.0]]
+
+    gid_map, added_meta = TechMapping._diff_res_meta(prev_meta, prev_meta)
+    assert gid_map.tolist() == list(range(len(prev_meta)))
+    assert not len(added_meta)
+
+
+def test_incremental_tech_mapping_insert(monkeypatch):
+    """Test that inserting a resource site at the start of the meta only
+    re-maps the exclusion tiles near that site."""
+
+    with tempfile.TemporaryDirectory() as td:
+        excl_fp = os.path.join(td, 'excl.h5')
+        res_fp = os.path.join(td, 'res.h5')
+        shutil.copy(EXCL, excl_fp)
+        shutil.copy(RES, res_fp)
+
+        kwargs = dict(max_workers=2, map_chunk=32)
+        TechMapping.run(excl_fp, RES, 'tm', **kwargs)
+
+        with h5py.File(res_fp, 'a') as f:
+            meta = f['meta'][...]
+            new = meta[:1].copy()
+            new['latitude'] += 0.01
+            del f['meta']
+            f.create_dataset('meta', data=np.concatenate((new, meta)))
+
+        truth = TechMapping.run(excl_fp, res_fp, 'tm', save_flag=False,
+                                **kwargs)
+
+        n_tiles = []
+        query = TechMapping._query_res_tree
+
+        def _count_query(self, *args):
+            n_tiles.append(1)
+            return query(self, *args)
+
+        monkeypatch.setattr(TechMapping, '_query_res_tree', _count_query)
+        out = TechMapping.run(excl_fp, res_fp, 'tm', incremental=True,
+                              prev_res_fpath=RES, **kwargs)
+        assert np.array_equal(out[2], truth[2])
+
+        with ExclusionLayers(excl_fp) as ex:
+            n_total = np.prod([np.ceil(n / 32) for n in ex.shape])
+
+        assert 0 < len(n_tiles) < n_total / 2
+
+
 def plot_tech_mapping():
     """Run the supply curve technology mapping and plot the resulting mapped
     points."""
@@ -2,12 +2,14 @@
 """
 Supply Curve computation integrated tests
 """
+import numpy as np
 import os
 import pandas as pd
 from pandas.testing import assert_frame_equal
 import pytest
 
 from reV import TESTDATADIR
+from reV.supply_curve import full_sort
 from reV.supply_curve.supply_curve import CompetitiveWindFarms, SupplyCurve
 
 TRANS_COSTS = {'line_tie_in_cost': 200, 'line_cost': 1000,
@@ -137,6 +139,76 @@ def test_upwind_downwind_exclusion():
             assert gid not in sc_point_gids, msg
 
 
+def test_cwf_arrays():
+    """Test the array based CompetitiveWindFarms mappings and exclusion"""
+    cwf = CompetitiveWindFarms(WIND_DIRS, SC_POINTS, n_dirs=2)
+    sc_points = pd.read_csv(SC_POINTS)
+
+    ptr, sc_gids = cwf.sc_point_gid_csr
+    assert len(ptr) == len(cwf.mask) + 1
+    assert np.array_equal(np.sort(sc_gids), np.sort(sc_points['sc_gid']))
+    for sc_gid, gid in sc_points[['sc_gid', 'sc_point_gid']].values:
+        assert cwf.sc_gid_map[sc_gid] == gid
+        assert cwf['sc_point_gid', sc_gid] == gid
+        assert sc_gid in cwf['sc_gid', gid]
+
+    assert cwf.check_sc_gid(len(cwf.sc_gid_map) + 10) is None
+    with pytest.raises(KeyError):
+        cwf['sc_gid', len(cwf.mask) + 10]
+
+    gid = cwf.sc_point_gids[0]
+    neighbors = cwf.get_neighbors(downwind=True)
+    assert neighbors.shape == (len(cwf.mask), 4)
+    assert np.array_equal(neighbors[gid, :2], cwf['upwind', gid])
+    assert np.array_equal(neighbors[gid, 2:], cwf['downwind', gid])
+
+    flags = cwf.exclude_sc_point_gid([gid, -1, len(cwf.mask) + 10])
+    assert flags.tolist() == [True, False, False]
+    assert not cwf.mask[gid]
+    assert gid not in cwf.sc_point_gids
+    assert not np.isin(cwf['sc_gid', gid], cwf.sc_gids).any()
+
+
+@pytest.mark.parametrize(('downwind', 'line_limited'),
+                         [(False, False), (True, True)])
+def test_full_sort_engines(downwind, line_limited, monkeypatch):
+    """Compare the array kernel and python full sort engines"""
+    kwargs = {'sc_features': MULTIPLIERS, 'transmission_costs': TRANS_COSTS,
+              'wind_dirs': WIND_DIRS, 'downwind': downwind,
+              'line_limited': line_limited}
+
+    monkeypatch.setattr(full_sort, 'NUMBA', False)
+    truth = SupplyCurve.full(SC_POINTS, TRANS_TABLE, fcr=0.1, **kwargs)
+
+    # run the array kernel un-compiled so that it runs without numba
+    kernel = getattr(full_sort.full_sort_kernel, 'py_func',
+                     full_sort.full_sort_kernel)
+    monkeypatch.setattr(full_sort, 'NUMBA', True)
+    monkeypatch.setattr(full_sort, 'full_sort_kernel', kernel)
+    test = SupplyCurve.full(SC_POINTS, TRANS_TABLE, fcr=0.1, **kwargs)
+
+    assert_frame_equal(truth, test)
+
+
+@pytest.mark.parametrize(('downwind', 'line_limited'),
+                         [(False, False), (True, True)])
+def test_full_sort_numba(downwind, line_limited, monkeypatch):
+    """Compare the numba compiled array kernel and python full sort
+    engines"""
+    pytest.importorskip('numba')
+    assert full_sort.NUMBA
+    kwargs = {'sc_features': MULTIPLIERS, 'transmission_costs': TRANS_COSTS,
+              'wind_dirs': WIND_DIRS, 'downwind': downwind,
+              'line_limited': line_limited}
+
+    test = SupplyCurve.full(SC_POINTS, TRANS_TABLE, fcr=0.1, **kwargs)
+
+    monkeypatch.setattr(full_sort, 'NUMBA', False)
+    truth = SupplyCurve.full(SC_POINTS, TRANS_TABLE, fcr=0.1, **kwargs)
+
+    assert_frame_equal(truth, test)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 